@@ -1,12 +1,19 @@
+import atexit
+import cProfile
 import getopt
 import logging
 import os
 import sys
 
 from pcs import settings, usage, utils
-from pcs.cli.common import completion, errors, parse_args, routing
+from pcs.cli.common import completion, errors, local_pcsd, parse_args, routing
 from pcs.cli.reports import process_library_reports
-from pcs.cli.reports.output import deprecation_warning, error, print_to_stderr
+from pcs.cli.reports.output import (
+    deprecation_warning,
+    error,
+    print_to_stderr,
+    warn,
+)
 from pcs.cli.routing import (
     acl,
     alert,
@@ -28,7 +35,7 @@ from pcs.cli.routing import (
     stonith,
     tag,
 )
-from pcs.common import capabilities
+from pcs.common import capabilities, timing
 from pcs.lib.errors import LibraryError
 
 
@@ -40,6 +47,9 @@ def _non_root_run(argv_cmd):  # noqa: PLR0912 Too many branches
     """
     options = []
     for option, value in utils.pcs_options.items():
+        if option in ("--timing", "--timing-profile"):
+            # the command is measured by this process, not by pcsd
+            continue
         if parse_args.is_option_expecting_value(option):
             options.extend([option, value])
         else:
@@ -93,6 +103,8 @@ def _non_root_run(argv_cmd):  # noqa: PLR0912 Too many branches
                     "in a future release"
                 )
 
+            _run_library_command_in_pcsd(argv_cmd)
+
             # call the local pcsd
             err_msgs, exitcode, std_out, std_err = utils.call_local_pcsd(
                 argv_cmd, options
@@ -108,10 +120,63 @@ def _non_root_run(argv_cmd):  # noqa: PLR0912 Too many branches
             sys.exit(exitcode)
 
 
+def _run_library_command_in_pcsd(argv_cmd):
+    """
+    Run a command as a library command in the local pcsd and exit. Return if
+    the command is not supported that way or pcsd cannot be contacted over
+    its unix socket.
+    """
+    command = local_pcsd.get_library_command(
+        argv_cmd,
+        {
+            option: value
+            for option, value in utils.pcs_options.items()
+            if option not in ("--timing", "--timing-profile")
+        },
+    )
+    if command is None:
+        return
+    try:
+        task_result = local_pcsd.run_library_command(
+            command,
+            timeout=utils.pcs_options.get("--request-timeout"),
+            token=utils.get_local_pcsd_token(),
+        )
+    except local_pcsd.LocalPcsdUnavailable:
+        return
+    sys.exit(
+        local_pcsd.print_library_command_result(
+            task_result, debug="--debug" in utils.pcs_options
+        )
+    )
+
+
 usefile = False
 filename = ""
 
 
+def _print_timing(collector: timing.TimingCollector) -> None:
+    print_to_stderr("\n".join(timing.format_breakdown(collector)))
+
+
+def _dump_profile(profiler: cProfile.Profile, path: str) -> None:
+    profiler.disable()
+    try:
+        profiler.dump_stats(path)
+    except OSError as e:
+        warn(f"Unable to write profile to '{path}': {e.strerror}")
+
+
+def _setup_timing(options):
+    # atexit handlers run even when a command ends by calling sys.exit
+    if "--timing" in options:
+        atexit.register(_print_timing, timing.enable())
+    if "--timing-profile" in options:
+        profiler = cProfile.Profile()
+        atexit.register(_dump_profile, profiler, options["--timing-profile"])
+        profiler.enable()
+
+
 def main(argv=None):  # noqa: PLR0912, PLR0915
     if completion.has_applicable_environment(os.environ):
         print(
@@ -230,6 +295,8 @@ def main(argv=None):  # noqa: PLR0912, PLR0915
                     "a positive integer"
                 )
 
+    _setup_timing(utils.pcs_options)
+
     # initialize logger
     logging.getLogger("pcs")
 
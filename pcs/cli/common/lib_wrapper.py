@@ -452,6 +452,7 @@ def load_module(env, middleware_factory, name):  # noqa: PLR0911, PLR0912
                 "disable": resource.disable,
                 "disable_safe": resource.disable_safe,
                 "disable_simulate": resource.disable_simulate,
+                "disable_simulate_bulk": resource.disable_simulate_bulk,
                 "enable": resource.enable,
                 "get_cibsecrets": resource.get_cibsecrets,
                 "get_configured_resources": resource.get_configured_resources,
@@ -0,0 +1,175 @@
+"""
+Communication of pcs run by a non-root user with the local pcsd over the pcsd
+unix socket, so that no TLS connection is needed. A token of the local pcsd
+obtained by 'pcs client local-auth' is sent if there is one, so that the user
+is authenticated the same way as over the network. Otherwise, pcsd
+authenticates the user by credentials of the process on the other end of the
+socket.
+"""
+
+import io
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from pcs import settings
+from pcs.cli.reports.output import error
+from pcs.cli.reports.processor import print_report
+from pcs.common import pcs_pycurl as pycurl
+from pcs.common import timing
+from pcs.common.async_tasks.dto import (
+    CommandDto,
+    CommandOptionsDto,
+    TaskResultDto,
+)
+from pcs.common.async_tasks.types import TaskFinishType
+from pcs.common.interface.dto import from_dict, to_dict
+from pcs.common.reports import ReportItemSeverity
+from pcs.common.types import StringSequence
+
+
+class LocalPcsdUnavailable(Exception):
+    """
+    The request cannot be sent over the unix socket or pcsd refused to
+    authenticate the user by the socket, another way of contacting pcsd
+    should be used
+    """
+
+
+def get_library_command(
+    argv: StringSequence, options: Mapping[str, Any]
+) -> CommandDto | None:
+    """
+    Return a library command equivalent to a pcs command or None if the pcs
+    command must be run by pcs in pcsd
+
+    Only commands which do not change anything are supported, so that they can
+    be run again in another way if running them in pcsd fails.
+
+    argv -- pcs command with its arguments
+    options -- pcs command line options
+    """
+    supported_options = {"--debug", "--request-timeout"}
+    params: dict[str, Any]
+    if list(argv) in (["status"], ["status", "status"]):
+        supported_options |= {"--full", "--hide-inactive"}
+        command_name = "status.full_cluster_status_plaintext"
+        params = {
+            "hide_inactive_resources": "--hide-inactive" in options,
+            "verbose": "--full" in options,
+        }
+    elif list(argv) in (["quorum", "status"], ["status", "quorum"]):
+        command_name = "quorum.status_text"
+        params = {}
+    else:
+        return None
+    if not set(options) <= supported_options:
+        return None
+    return CommandDto(
+        command_name=command_name,
+        params=params,
+        options=CommandOptionsDto(
+            request_timeout=options.get("--request-timeout")
+        ),
+    )
+
+
+def run_library_command(
+    command: CommandDto,
+    timeout: int | None = None,
+    token: str | None = None,
+) -> TaskResultDto:
+    """
+    Run a library command in pcsd and return its result, raise
+    LocalPcsdUnavailable if pcsd cannot be contacted over the unix socket
+
+    command -- the command to run
+    timeout -- timeout of the request in seconds
+    token -- token for authentication to the local pcsd
+    """
+    status, body = send_request(
+        "api/v2/task/run",
+        json.dumps(to_dict(command)),
+        content_type="application/json",
+        timeout=timeout,
+        token=token,
+    )
+    if status != 200:
+        raise LocalPcsdUnavailable(f"HTTP error: {status}")
+    try:
+        return from_dict(TaskResultDto, json.loads(body))
+    except (ValueError, TypeError) as e:
+        raise LocalPcsdUnavailable("Unable to communicate with pcsd") from e
+
+
+def print_library_command_result(
+    task_result: TaskResultDto, debug: bool = False
+) -> int:
+    """
+    Print reports and output of a library command run in pcsd the same way
+    pcs prints them when it runs the command itself, return an exit code
+
+    task_result -- result of the command
+    debug -- print debug reports
+    """
+    for report_dto in task_result.reports:
+        if debug or report_dto.severity.level != ReportItemSeverity.DEBUG:
+            print_report(report_dto)
+    if task_result.task_finish_type == TaskFinishType.SUCCESS:
+        print(task_result.result)
+        return 0
+    if not any(
+        report_dto.severity.level == ReportItemSeverity.ERROR
+        for report_dto in task_result.reports
+    ):
+        # pcsd logs details of the failure
+        error(
+            "Command was terminated by pcsd"
+            if task_result.task_finish_type == TaskFinishType.KILL
+            else "Errors have occurred, therefore pcs is unable to continue"
+        )
+    return 1
+
+
+def send_request(
+    path: str,
+    data: str,
+    content_type: str = "application/x-www-form-urlencoded",
+    timeout: int | None = None,
+    token: str | None = None,
+) -> tuple[int, str]:
+    """
+    Send a request to the local pcsd over its unix socket, return HTTP status
+    and body of the response, raise LocalPcsdUnavailable if the request cannot
+    be sent or pcsd does not accept the user
+
+    path -- URL path of the request
+    data -- body of the request
+    content_type -- content type of the body
+    timeout -- timeout of the request in seconds
+    token -- token for authentication to the local pcsd, None to let pcsd
+        authenticate the user by the socket
+    """
+    output = io.BytesIO()
+    handler = pycurl.Curl()
+    handler.setopt(pycurl.UNIX_SOCKET_PATH, settings.pcsd_unix_socket)
+    handler.setopt(pycurl.URL, f"http://localhost/{path}")
+    handler.setopt(pycurl.POSTFIELDS, data.encode())
+    handler.setopt(pycurl.HTTPHEADER, [f"Content-Type: {content_type}"])
+    if token:
+        handler.setopt(pycurl.COOKIE, f"token={token}".encode("utf-8"))
+    handler.setopt(pycurl.WRITEFUNCTION, output.write)
+    handler.setopt(pycurl.TIMEOUT, timeout or settings.default_request_timeout)
+    try:
+        with timing.span(timing.HTTP_TOTAL, "local pcsd"):
+            handler.perform()
+        status = handler.getinfo(pycurl.RESPONSE_CODE)
+    except pycurl.error as e:
+        raise LocalPcsdUnavailable(str(e)) from e
+    finally:
+        handler.close()
+    if status == 401:
+        # the user is not allowed to use the socket, another way of
+        # authentication may succeed
+        raise LocalPcsdUnavailable("Not authorized")
+    return status, output.getvalue().decode("utf-8", errors="replace")
@@ -76,6 +76,7 @@ MODIFIER_OPTIONS_BOOL: Final[frozenset[str]] = frozenset(
         "--skip-offline",
         "--start",
         "--strict",
+        "--timing",
         "--yes",
     )
 )
@@ -94,6 +95,8 @@ MODIFIER_OPTIONS_VAL: Final[frozenset[str]] = frozenset(
         "--name",
         "--node",
         "--request-timeout",
+        "--since",
+        "--timing-profile",
         "--to",
         "--token",
         "-f",
@@ -126,6 +129,9 @@ PCS_LONG_OPTIONS: Final = [
     "disabled",
     "off",
     "request-timeout=",
+    # print time spent in external processes, requests, etc.
+    "timing",
+    "timing-profile=",
     "brief",
     _FUTURE_OPTION_STR,
     # resource (safe-)disable
@@ -180,6 +186,8 @@ PCS_LONG_OPTIONS: Final = [
     "yes",
     # retrieve and display cibsecret values / used in CLI only
     "show-secrets",
+    # pcs config checkpoint - only checkpoints created since specified time
+    "since=",
 ]
 
 
@@ -614,8 +622,12 @@ class InputModifiers:
         hint_syntax_changed: str | None = None,
         output_format_supported: bool = False,
     ) -> None:
-        # --debug is supported in all commands
-        supported_options_set = set(supported_options) | {"--debug"}
+        # --debug and timing options are supported in all commands
+        supported_options_set = set(supported_options) | {
+            "--debug",
+            "--timing",
+            "--timing-profile",
+        }
         if output_format_supported:
             supported_options_set.add(OUTPUT_FORMAT_OPTION)
         unsupported_options = self._defined_options - supported_options_set
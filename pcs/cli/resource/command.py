@@ -15,11 +15,13 @@ from pcs.cli.common.parse_args import (
     ensure_unique_args,
     wait_to_timeout,
 )
+from pcs.cli.reports.messages import report_item_msg_from_dto
 from pcs.cli.reports.output import (
     deprecation_warning,
     process_library_reports,
     warn,
 )
+from pcs.cli.reports.processor import has_errors
 from pcs.cli.resource.common import (
     check_is_not_stonith,
     get_resource_status_msg,
@@ -31,12 +33,17 @@ from pcs.cli.resource.output import (
 )
 from pcs.common import reports
 from pcs.common.interface import dto
+from pcs.common.pacemaker.resource.disable_impact import (
+    ResourceDisableImpactDto,
+)
 from pcs.common.pacemaker.resource.list import (
     CibResourcesDto,
     get_all_resources_ids,
     get_stonith_resources_ids,
 )
 from pcs.common.str_tools import format_list, format_plural
+from pcs.common.tools import timeout_to_seconds
+from pcs.common.validate import is_integer
 from pcs.lib.errors import LibraryError
 
 
@@ -260,3 +267,94 @@ def remove(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     lib.cluster.wait_for_pcmk_idle(None)
 
     lib.cib.remove_elements(resources_to_remove, force_flags)
+
+
+def disable_impact(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
+    """
+    Options:
+      * --no-strict - allow other resources to be migrated
+      * --output-format - supported formats: text, json
+    """
+    modifiers.ensure_only_supported("--no-strict", output_format_supported=True)
+    output_format = modifiers.get_output_format(
+        supported_formats={OUTPUT_FORMAT_VALUE_TEXT, OUTPUT_FORMAT_VALUE_JSON}
+    )
+    option_args = [arg for arg in argv if "=" in arg]
+    candidate_args = [arg for arg in argv if "=" not in arg]
+    if not candidate_args:
+        raise CmdLineInputError()
+    ensure_unique_args(candidate_args)
+    parser = KeyValueParser(option_args)
+    parser.check_allowed_keys(["max-concurrency", "timeout"])
+    options = parser.get_unique()
+
+    max_concurrency = None
+    if "max-concurrency" in options:
+        if not is_integer(options["max-concurrency"], 1):
+            raise CmdLineInputError(
+                "'{0}' is not a valid max-concurrency value, use a positive "
+                "integer".format(options["max-concurrency"])
+            )
+        max_concurrency = int(options["max-concurrency"])
+    timeout = None
+    if "timeout" in options:
+        timeout = timeout_to_seconds(options["timeout"])
+        if not timeout:
+            raise CmdLineInputError(
+                "'{0}' is not a valid timeout value, use a positive integer "
+                "or a time interval".format(options["timeout"])
+            )
+
+    result = lib.resource.disable_simulate_bulk(
+        [candidate.split(",") for candidate in candidate_args],
+        not modifiers.get("--no-strict"),
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+    )
+    if output_format == OUTPUT_FORMAT_VALUE_JSON:
+        print(json.dumps(dto.to_dict(result)))
+    else:
+        print(
+            lines_to_str(
+                [
+                    line
+                    for candidate_dto in result.candidates
+                    for line in _disable_impact_to_lines(candidate_dto)
+                ]
+            )
+        )
+    # let scripts distinguish sets which have not been evaluated
+    if any(
+        candidate_dto.timed_out or has_errors(candidate_dto.reports)
+        for candidate_dto in result.candidates
+    ):
+        raise SystemExit(1)
+
+
+def _disable_impact_to_lines(
+    candidate_dto: ResourceDisableImpactDto,
+) -> list[str]:
+    label = ",".join(candidate_dto.resource_or_tag_ids)
+    report_lines = [
+        "  {severity}: {message}".format(
+            severity=report_dto.severity.level.capitalize(),
+            message=report_item_msg_from_dto(report_dto.message).message,
+        )
+        for report_dto in candidate_dto.reports
+        if report_dto.severity.level
+        in (
+            reports.ReportItemSeverity.ERROR,
+            reports.ReportItemSeverity.WARNING,
+        )
+    ]
+    if has_errors(candidate_dto.reports):
+        status = "unable to simulate"
+    elif candidate_dto.timed_out:
+        status = "simulation timed out"
+    elif candidate_dto.other_affected_resource_ids:
+        status = "affects {0}".format(
+            format_list(candidate_dto.other_affected_resource_ids)
+        )
+    else:
+        status = "no other resources affected"
+    return [f"{label}: {status}"] + report_lines
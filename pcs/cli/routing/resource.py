@@ -47,6 +47,7 @@ resource_cmd = create_router(
         "enable": resource.resource_enable_cmd,
         "disable": resource.resource_disable_cmd,
         "safe-disable": resource.resource_safe_disable_cmd,
+        "disable-impact": resource_cli.disable_impact,
         "restart": resource.resource_restart_cmd,
         "debug-start": partial(
             resource.resource_force_action, action="debug-start"
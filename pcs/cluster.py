@@ -8,8 +8,9 @@ import sys
 import tempfile
 import time
 import xml.dom.minidom
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any, cast
+from urllib.parse import urlencode
 from xml.parsers.expat import ExpatError
 
 import pcs.lib.pacemaker.live as lib_pacemaker
@@ -54,7 +55,11 @@ from pcs.lib.file.instance import FileInstance
 from pcs.lib.file.raw_file import raw_file_error_report
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.pcs_cfgsync.const import SYNCED_CONFIGS
-from pcs.utils import parallel_for_nodes
+
+# bounds of intervals between checks of node status when waiting for nodes to
+# start, in seconds
+_WAIT_INTERVAL_MIN = 0.5
+_WAIT_INTERVAL_MAX = 4.0
 
 
 def _corosync_conf_local_cmd_call(
@@ -246,8 +251,17 @@ def sync_nodes(lib: Any, argv: Argv, modifiers: InputModifiers) -> None:
     if report_list:
         process_library_reports(report_list)
 
-    for node in nodes:
-        utils.setCorosyncConfig(node, config)
+    node_errors = utils.run_for_nodes(
+        nodes,
+        "remote/set_corosync_conf",
+        urlencode({"corosync_conf": config}),
+    )
+    if node_errors:
+        utils.err(
+            "Unable to set corosync config on {0}".format(
+                format_list(list(node_errors))
+            )
+        )
 
     warn(
         "Corosync configuration has been synchronized, please reload corosync "
@@ -334,9 +348,8 @@ def start_cluster_nodes(nodes: StringCollection) -> None:
     timeout = int(
         settings.default_request_timeout * math.ceil(len(nodes) / 8.0)
     )
-    utils.read_known_hosts_file()  # cache known hosts
-    node_errors = parallel_for_nodes(
-        utils.startCluster, nodes, quiet=True, timeout=timeout
+    node_errors = utils.run_for_nodes(
+        nodes, "remote/cluster_start", timeout=timeout
     )
     if node_errors:
         utils.err(
@@ -356,15 +369,27 @@ def is_node_fully_started(node_status) -> bool:
     )
 
 
-def wait_for_local_node_started(
-    stop_at: datetime.datetime, interval: float
-) -> tuple[int, str]:
+def _wait_intervals() -> Iterator[float]:
+    """
+    Commandline options: no options
+
+    Yield intervals between checks of a node status. Nodes which are about to
+    start are noticed quickly while long starts do not produce many requests.
+    """
+    interval = _WAIT_INTERVAL_MIN
+    while True:
+        yield interval
+        interval = min(interval * 2, _WAIT_INTERVAL_MAX)
+
+
+def wait_for_local_node_started(stop_at: datetime.datetime) -> tuple[int, str]:
     """
     Commandline options: no options
     """
+    intervals = _wait_intervals()
     try:
         while True:
-            time.sleep(interval)
+            time.sleep(next(intervals))
             node_status = lib_pacemaker.get_local_node_status(
                 utils.cmd_runner()
             )
@@ -386,30 +411,62 @@ def wait_for_local_node_started(
         )
 
 
-def wait_for_remote_node_started(
-    node: str, stop_at: datetime.datetime, interval: float
-) -> tuple[int, str]:
+def _remote_node_start_result(code: int, output: str) -> tuple[int, str] | None:
+    """
+    Commandline options: no options
+
+    Return a final result of waiting for a node to start, None if the node has
+    not started yet
+    """
+    # HTTP error, permission denied or unable to auth
+    # there is no point in trying again as it won't get magically fixed
+    if code in [1, 3, 4]:
+        return 1, output
+    if code == 0:
+        try:
+            if is_node_fully_started(json.loads(output)):
+                return 0, "Started"
+        except (ValueError, KeyError):
+            # this won't get fixed either
+            return 1, "Unable to get node status"
+    return None
+
+
+def wait_for_remote_nodes_started(
+    node_list: StringIterable, stop_at: datetime.datetime
+) -> dict[str, str]:
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
+
+    Check status of all not yet started nodes at once, print a result for
+    each node once it is known and return error messages of nodes which
+    failed to start
     """
-    while True:
+    node_errors = {}
+    waiting_nodes = list(node_list)
+    for interval in _wait_intervals():
         time.sleep(interval)
-        code, output = utils.getPacemakerNodeStatus(node)
-        # HTTP error, permission denied or unable to auth
-        # there is no point in trying again as it won't get magically fixed
-        if code in [1, 3, 4]:
-            return 1, output
-        if code == 0:
-            try:
-                node_status = json.loads(output)
-                if is_node_fully_started(node_status):
-                    return 0, "Started"
-            except (ValueError, KeyError):
-                # this won't get fixed either
-                return 1, "Unable to get node status"
+        for node, (code, output) in utils.send_http_request_to_nodes(
+            waiting_nodes, "remote/pacemaker_node_status"
+        ):
+            result = _remote_node_start_result(code, output)
+            if result is None:
+                continue
+            waiting_nodes.remove(node)
+            message = f"{node}: {result[1]}"
+            print_to_stderr(message)
+            if result[0] != 0:
+                node_errors[node] = message
+        if not waiting_nodes:
+            break
         if datetime.datetime.now() > stop_at:
-            return 1, "Waiting timeout"
+            for node in waiting_nodes:
+                message = f"{node}: Waiting timeout"
+                print_to_stderr(message)
+                node_errors[node] = message
+            break
+    return node_errors
 
 
 def wait_for_nodes_started(
@@ -421,22 +478,16 @@ def wait_for_nodes_started(
         node_list is not empty list
     """
     timeout = 60 * 15 if timeout is None else timeout
-    interval = 2
     stop_at = datetime.datetime.now() + datetime.timedelta(seconds=timeout)
     print_to_stderr("Waiting for node(s) to start...")
     if not node_list:
-        code, output = wait_for_local_node_started(stop_at, interval)
+        code, output = wait_for_local_node_started(stop_at)
         if code != 0:
             utils.err(output)
         else:
             print_to_stderr(output)
-    else:
-        utils.read_known_hosts_file()  # cache known hosts
-        node_errors = parallel_for_nodes(
-            wait_for_remote_node_started, node_list, stop_at, interval
-        )
-        if node_errors:
-            utils.err("unable to verify all nodes have started")
+    elif wait_for_remote_nodes_started(node_list, stop_at):
+        utils.err("unable to verify all nodes have started")
 
 
 def stop_cluster_all() -> None:
@@ -478,7 +529,6 @@ def stop_cluster_nodes(nodes: StringCollection) -> None:  # noqa: PLR0912
             % "', '".join(sorted(unknown_nodes))
         )
 
-    utils.read_known_hosts_file()  # cache known hosts
     stopping_all = set(nodes) >= set(all_nodes)
     if "--force" not in utils.pcs_options and not stopping_all:
         error_list = []
@@ -516,9 +566,7 @@ def stop_cluster_nodes(nodes: StringCollection) -> None:  # noqa: PLR0912
             )
 
     was_error = False
-    node_errors = parallel_for_nodes(
-        utils.repeat_if_timeout(utils.stopPacemaker), nodes, quiet=True
-    )
+    node_errors = utils.stop_cluster_on_nodes(nodes, corosync=False)
     accessible_nodes = [node for node in nodes if node not in node_errors]
     if node_errors:
         utils.err(
@@ -532,9 +580,7 @@ def stop_cluster_nodes(nodes: StringCollection) -> None:  # noqa: PLR0912
             "{0}: Not stopping cluster - node is unreachable".format(node)
         )
 
-    node_errors = parallel_for_nodes(
-        utils.stopCorosync, accessible_nodes, quiet=True
-    )
+    node_errors = utils.stop_cluster_on_nodes(accessible_nodes, pacemaker=False)
     if node_errors:
         utils.err(
             "unable to stop all nodes\n" + "\n".join(node_errors.values())
@@ -615,12 +661,30 @@ def disable_cluster_all() -> None:
     disable_cluster_nodes(all_nodes)
 
 
+def _run_for_nodes_print_success(
+    nodes: StringIterable, request: str
+) -> list[str]:
+    """
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+    """
+    error_list = []
+    for node, (retval, output) in utils.send_http_request_to_nodes(
+        nodes, request
+    ):
+        if retval == 0:
+            print_to_stderr(f"{node}: {output.strip()}")
+        else:
+            error_list.append(output)
+    return error_list
+
+
 def enable_cluster_nodes(nodes: StringIterable) -> None:
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    error_list = utils.map_for_error_list(utils.enableCluster, nodes)
+    error_list = _run_for_nodes_print_success(nodes, "remote/cluster_enable")
     if error_list:
         utils.err("unable to enable all nodes\n" + "\n".join(error_list))
 
@@ -630,7 +694,7 @@ def disable_cluster_nodes(nodes: StringIterable) -> None:
     Commandline options:
       * --request-timeout - timeout for HTTP requests
     """
-    error_list = utils.map_for_error_list(utils.disableCluster, nodes)
+    error_list = _run_for_nodes_print_success(nodes, "remote/cluster_disable")
     if error_list:
         utils.err("unable to disable all nodes\n" + "\n".join(error_list))
 
@@ -641,17 +705,12 @@ def destroy_cluster(argv: Argv) -> None:
       * --request-timeout - timeout for HTTP requests
     """
     if argv:
-        utils.read_known_hosts_file()  # cache known hosts
         # stop pacemaker and resources while cluster is still quorate
         nodes = argv
-        node_errors = parallel_for_nodes(
-            utils.repeat_if_timeout(utils.stopPacemaker), nodes, quiet=True
-        )
+        node_errors = utils.stop_cluster_on_nodes(nodes, corosync=False)
         # proceed with destroy regardless of errors
         # destroy will stop any remaining cluster daemons
-        node_errors = parallel_for_nodes(
-            utils.destroyCluster, nodes, quiet=True
-        )
+        node_errors = utils.run_for_nodes(nodes, "remote/cluster_destroy")
         if node_errors:
             utils.err(
                 "unable to destroy cluster\n" + "\n".join(node_errors.values())
@@ -1,7 +1,20 @@
+import collections.abc
+import copy
+import dataclasses
+import json
+import types as python_types
 from collections.abc import Callable, Iterable
-from dataclasses import asdict
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    NewType,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import dacite
 
@@ -91,21 +104,428 @@ DTO_TYPE_HOOKS_MAP: dict[type[Any], Callable[[Any], Any]] = {
 }
 
 
+# Converting payloads by dacite is generic and therefore slow: it inspects
+# type hints of each value over and over again. Converters below are compiled
+# once for each DTO class. They only handle the most common cases and they are
+# strict, any data which they are not sure about is passed to dacite. Dacite
+# thus remains the authority validating payloads and producing error messages.
+
+_Converter = Callable[[Any], Any]
+
+
+class _NotConvertible(Exception):
+    """
+    Data may be valid but a compiled converter cannot convert them
+    """
+
+
+class _InvalidData(Exception):
+    """
+    Data are not valid, dacite would fail to convert them as well
+    """
+
+
+_NUMERIC_TOWER: dict[Any, tuple[type, ...]] = {
+    # same as dacite, ints are accepted where floats are expected
+    float: (int, float),
+    complex: (int, float, complex),
+}
+_LIST_ORIGINS = frozenset(
+    [
+        list,
+        collections.abc.Collection,
+        collections.abc.MutableSequence,
+        collections.abc.Sequence,
+    ]
+)
+_DICT_ORIGINS = frozenset(
+    [dict, collections.abc.Mapping, collections.abc.MutableMapping]
+)
+_UNION_ORIGINS = frozenset([Union, python_types.UnionType])
+_IMMUTABLE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+_DACITE_CONFIG = dacite.Config(type_hooks=DTO_TYPE_HOOKS_MAP, strict=False)
+_DACITE_CONFIG_STRICT = dacite.Config(
+    type_hooks=DTO_TYPE_HOOKS_MAP, strict=True
+)
+_from_dict_converters: dict[tuple[type[Any], bool], _Converter | None] = {}
+_field_names: dict[type[Any], tuple[str, ...] | None] = {}
+
+
+def _is_plain_class(type_hint: Any) -> bool:
+    return (
+        isinstance(type_hint, type)
+        and get_origin(type_hint) is None
+        and not dataclasses.is_dataclass(type_hint)
+    )
+
+
+def _is_optional(type_hint: Any) -> bool:
+    return get_origin(type_hint) in _UNION_ORIGINS and type(None) in get_args(
+        type_hint
+    )
+
+
+def _convert_identity(data: Any) -> Any:
+    return data
+
+
+def _compile_isinstance(type_hint: type[Any]) -> _Converter:
+    allowed_types = _NUMERIC_TOWER.get(type_hint, (type_hint,))
+
+    def _convert(data: Any) -> Any:
+        if isinstance(data, allowed_types):
+            return data
+        raise _InvalidData()
+
+    return _convert
+
+
+def _compile_hook(
+    hook: Callable[[Any], Any], converter: _Converter
+) -> _Converter:
+    def _convert(data: Any) -> Any:
+        return converter(hook(data))
+
+    return _convert
+
+
+def _compile_union(members: tuple[Any, ...], strict: bool) -> _Converter | None:
+    none_type = type(None)
+    member_converters = []
+    for member in members:
+        if member is not none_type:
+            converter = _compile_type(member, strict)
+            if converter is None:
+                return None
+            member_converters.append(converter)
+
+    if len(member_converters) == 1:
+        member_converter = member_converters[0]
+
+        def _convert_optional(data: Any) -> Any:
+            if data is None:
+                return None
+            return member_converter(data)
+
+        return _convert_optional
+
+    optional = len(member_converters) != len(members)
+
+    def _convert_union(data: Any) -> Any:
+        if optional and data is None:
+            return None
+        # Same as dacite, the first member which accepts the data is used.
+        # If it is not certain that a member rejects the data, dacite must
+        # decide.
+        for converter in member_converters:
+            try:
+                return converter(data)
+            except _NotConvertible:
+                raise
+            except Exception:
+                continue
+        raise _InvalidData()
+
+    return _convert_union
+
+
+def _compile_list(item_type: Any, strict: bool) -> _Converter | None:
+    item_converter = _compile_type(item_type, strict)
+    if item_converter is None:
+        return None
+
+    def _convert(data: Any) -> Any:
+        if type(data) is not list:
+            raise _NotConvertible()
+        return [item_converter(item) for item in data]
+
+    return _convert
+
+
+def _compile_dict(
+    key_type: Any, value_type: Any, strict: bool
+) -> _Converter | None:
+    # dacite only checks types of keys, it never converts them
+    if isinstance(key_type, NewType):
+        key_type = key_type.__supertype__
+    if key_type is Any:
+        key_types: tuple[type, ...] = (object,)
+    elif _is_plain_class(key_type) and key_type not in DTO_TYPE_HOOKS_MAP:
+        key_types = _NUMERIC_TOWER.get(key_type, (key_type,))
+    else:
+        return None
+    value_converter = _compile_type(value_type, strict)
+    if value_converter is None:
+        return None
+
+    def _convert(data: Any) -> Any:
+        if type(data) is not dict:
+            raise _NotConvertible()
+        result = {}
+        for key, value in data.items():
+            if not isinstance(key, key_types):
+                raise _InvalidData()
+            result[key] = value_converter(value)
+        return result
+
+    return _convert
+
+
+def _compile_tuple(
+    item_types: tuple[Any, ...], strict: bool
+) -> _Converter | None:
+    if len(item_types) == 2 and item_types[1] is Ellipsis:
+        item_converter = _compile_type(item_types[0], strict)
+        if item_converter is None:
+            return None
+
+        def _convert_variadic(data: Any) -> Any:
+            if type(data) is not tuple:
+                raise _NotConvertible()
+            return tuple(item_converter(item) for item in data)
+
+        return _convert_variadic
+
+    item_converters = []
+    for item_type in item_types:
+        converter = _compile_type(item_type, strict)
+        if converter is None:
+            return None
+        item_converters.append(converter)
+    if not item_converters:
+        return None
+
+    def _convert_fixed(data: Any) -> Any:
+        if type(data) is not tuple or len(data) != len(item_converters):
+            raise _NotConvertible()
+        return tuple(
+            converter(item)
+            for converter, item in zip(item_converters, data, strict=True)
+        )
+
+    return _convert_fixed
+
+
+def _compile_nested_dataclass(cls: type[Any], strict: bool) -> _Converter:
+    def _convert(data: Any) -> Any:
+        if type(data) is dict:
+            # looked up when used, so that recursive DTOs can be compiled
+            return _from_dict_nested(cls, data, strict)
+        if isinstance(data, cls):
+            return data
+        if isinstance(data, collections.abc.Mapping):
+            raise _NotConvertible()
+        raise _InvalidData()
+
+    return _convert
+
+
+def _compile_type(type_hint: Any, strict: bool) -> _Converter | None:
+    """
+    Compile a converter of data to the specified type, None if not supported
+    """
+    try:
+        hook = DTO_TYPE_HOOKS_MAP.get(type_hint)
+    except TypeError:
+        # unhashable type hint
+        return None
+    converter = _compile_type_without_hook(type_hint, strict)
+    if converter is None or hook is None:
+        return converter
+    if isinstance(type_hint, type) and issubclass(type_hint, Enum):
+        # the hook returns an instance of the enum or raises an exception
+        return hook
+    return _compile_hook(hook, converter)
+
+
+def _compile_type_without_hook(  # noqa: PLR0911
+    type_hint: Any, strict: bool
+) -> _Converter | None:
+    if type_hint is Any:
+        return _convert_identity
+    if isinstance(type_hint, NewType):
+        # dacite only checks the type of new types
+        supertype = type_hint.__supertype__
+        if isinstance(supertype, type) and _is_plain_class(supertype):
+            return _compile_isinstance(supertype)
+        return None
+    origin = get_origin(type_hint)
+    if origin is None:
+        if isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint):
+            return _compile_nested_dataclass(type_hint, strict)
+        if _is_plain_class(type_hint):
+            return _compile_isinstance(type_hint)
+        return None
+    args = get_args(type_hint)
+    if origin in _UNION_ORIGINS:
+        return _compile_union(args, strict)
+    if origin in _LIST_ORIGINS and len(args) == 1:
+        return _compile_list(args[0], strict)
+    if origin in _DICT_ORIGINS and len(args) == 2:
+        return _compile_dict(args[0], args[1], strict)
+    if origin is tuple:
+        return _compile_tuple(args, strict)
+    return None
+
+
+def _compile_dataclass(cls: type[Any], strict: bool) -> _Converter | None:
+    try:
+        type_hints = get_type_hints(cls)
+    except Exception:
+        # let dacite report unresolvable type hints
+        return None
+    field_list = dataclasses.fields(cls)
+    if len(field_list) != len(cls.__dataclass_fields__) or any(
+        not field.init for field in field_list
+    ):
+        # InitVars and fields excluded from __init__ are not used in DTOs
+        return None
+
+    field_plans = []
+    for field in field_list:
+        converter = _compile_type(type_hints[field.name], strict)
+        if converter is None:
+            return None
+        field_plans.append(
+            (
+                field.name,
+                converter,
+                field.default,
+                field.default_factory,
+                _is_optional(type_hints[field.name]),
+            )
+        )
+    field_names = frozenset(field.name for field in field_list)
+    missing = dataclasses.MISSING
+
+    def _convert(data: dict[str, Any]) -> Any:
+        if strict and not field_names.issuperset(data):
+            raise _InvalidData()
+        init_values = {}
+        for name, converter, default, default_factory, optional in field_plans:
+            if name in data:
+                init_values[name] = converter(data[name])
+            elif default is not missing:
+                init_values[name] = default
+            elif default_factory is not missing:
+                init_values[name] = default_factory()
+            elif optional:
+                init_values[name] = None
+            else:
+                raise _InvalidData()
+        return cls(**init_values)
+
+    return _convert
+
+
+def _get_from_dict_converter(cls: type[Any], strict: bool) -> _Converter | None:
+    key = (cls, strict)
+    try:
+        return _from_dict_converters[key]
+    except KeyError:
+        converter = _from_dict_converters[key] = _compile_dataclass(cls, strict)
+        return converter
+
+
+def _get_dacite_config(strict: bool) -> dacite.Config:
+    return _DACITE_CONFIG_STRICT if strict else _DACITE_CONFIG
+
+
+def _from_dict_nested(cls: type[Any], data: Any, strict: bool) -> Any:
+    converter = _get_from_dict_converter(cls, strict)
+    if converter is None:
+        return dacite.from_dict(
+            data_class=cls, data=data, config=_get_dacite_config(strict)
+        )
+    return converter(data)
+
+
 def from_dict(
     cls: type[DTOTYPE], data: DtoPayload, strict: bool = False
 ) -> DTOTYPE:
+    converter = _get_from_dict_converter(cls, strict)
+    if converter is not None and type(data) is dict:
+        try:
+            return converter(data)
+        except Exception:
+            # The data are either invalid or not covered by the compiled
+            # converter. Dacite produces the same result or error as if the
+            # converter was never used.
+            pass
     return dacite.from_dict(
-        data_class=cls,
-        data=data,
-        config=dacite.Config(
-            type_hooks=DTO_TYPE_HOOKS_MAP,
-            strict=strict,
-        ),
+        data_class=cls, data=data, config=_get_dacite_config(strict)
     )
 
 
+@dataclasses.dataclass
+class _AsdictWrapper:
+    value: Any
+
+
+def _get_field_names(cls: type[Any]) -> tuple[str, ...] | None:
+    try:
+        return _field_names[cls]
+    except KeyError:
+        field_names = _field_names[cls] = (
+            tuple(field.name for field in dataclasses.fields(cls))
+            if dataclasses.is_dataclass(cls)
+            else None
+        )
+        return field_names
+
+
+def _to_dict_value(value: Any) -> Any:  # noqa: PLR0911
+    # Produces the same result as dataclasses.asdict. The most common types
+    # are checked first and values which asdict would copy without any change
+    # are not copied.
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    field_names = _get_field_names(value_type)
+    if field_names is not None:
+        return {
+            name: _to_dict_value(getattr(value, name)) for name in field_names
+        }
+    if value_type is list:
+        return [_to_dict_value(item) for item in value]
+    if value_type is dict:
+        return {
+            _to_dict_value(key): _to_dict_value(item)
+            for key, item in value.items()
+        }
+    if value_type is tuple:
+        return tuple(_to_dict_value(item) for item in value)
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        # namedtuples and subclasses of builtin collections
+        return dataclasses.asdict(_AsdictWrapper(value))["value"]
+    return copy.deepcopy(value)
+
+
 def to_dict(obj: DataTransferObject) -> DtoPayload:
-    return asdict(obj)
+    return _to_dict_value(obj)
+
+
+def _json_default(obj: Any) -> Any:
+    field_names = _get_field_names(type(obj))
+    if field_names is None:
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
+    return {name: getattr(obj, name) for name in field_names}
+
+
+def to_json(obj: DataTransferObject, **kwargs: Any) -> str:
+    """
+    Serialize a DTO to JSON, same as json.dumps(to_dict(obj), **kwargs)
+
+    The DTO is serialized directly without building its dict copy first.
+
+    kwargs -- keyword arguments of json.dumps
+    """
+    return json.dumps(obj, default=_json_default, **kwargs)
 
 
 class ImplementsToDto:
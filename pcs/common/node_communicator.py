@@ -1,4 +1,5 @@
 import base64
+import gzip
 import io
 import re
 from collections.abc import Generator, Iterable, Mapping, Sequence
@@ -16,9 +17,16 @@ except ImportError:
 
 from pcs import settings
 from pcs.common import pcs_pycurl as pycurl
+from pcs.common import timing
 from pcs.common.host import Destination, PcsKnownHost
 from pcs.common.types import StringIterable
 
+# Request data are only compressed if they are large enough to benefit from it
+# and only for nodes which announced that they accept compressed requests
+# (RFC 7694). Older pcsd does not decompress requests.
+_REQUEST_COMPRESSION_MIN_LENGTH = 1024
+_REQUEST_COMPRESSION_LEVEL = 6
+
 
 class HostNotFound(Exception):
     def __init__(self, name: str):
@@ -246,6 +254,13 @@ class Response:
             return None
         return self._handle.getinfo(pycurl.RESPONSE_CODE)
 
+    @property
+    def accepts_compressed_request(self) -> bool:
+        """
+        Does the remote side accept gzip compressed requests
+        """
+        return self._handle.accepts_compressed_request  # type: ignore[attr-defined]
+
     def __repr__(self) -> str:
         return (
             "Response({0} data='{1}' was_connected={2}) errno='{3}'"
@@ -289,7 +304,12 @@ class Communicator:
         user: str | None,
         groups: StringIterable | None,
         request_timeout: int | None = None,
+        dests_accepting_compression: set[Destination] | None = None,
     ) -> None:
+        """
+        dests_accepting_compression -- destinations known to accept
+            compressed requests, communicators may share it
+        """
         self._logger = communicator_logger
         self._auth_cookies = _get_auth_cookies(user, groups)
         self._request_timeout = (
@@ -298,11 +318,35 @@ class Communicator:
             else settings.default_request_timeout
         )
         self._multi_handle = pycurl.CurlMulti()
+        # Connections are kept open and reused by the multi handle. Share TLS
+        # sessions and resolved names among easy handles as well, so that
+        # opening another connection to the same node is cheaper.
+        self._share_handle = pycurl.CurlShare()
+        for share_data in (
+            pycurl.LOCK_DATA_SSL_SESSION,
+            pycurl.LOCK_DATA_DNS,
+        ):
+            self._share_handle.setopt(pycurl.SH_SHARE, share_data)
         self._is_running = False
         # This is used just for storing references of curl easy handles.
         # We need to have references for all the handles, so they don't be
         # cleaned up by the garbage collector.
         self._easy_handle_list: list[pycurl.Curl] = []
+        self._dests_accepting_compression = (
+            dests_accepting_compression
+            if dests_accepting_compression is not None
+            else set()
+        )
+
+    def set_request_timeout(self, request_timeout: int) -> None:
+        """
+        Set timeout of requests added to the queue from now on. Reusing one
+        instance for requests with different timeouts allows curl to reuse
+        connections opened by previous requests.
+
+        request_timeout -- timeout in seconds
+        """
+        self._request_timeout = request_timeout
 
     def add_requests(self, request_list: Iterable[Request]) -> None:
         """
@@ -321,6 +365,12 @@ class Communicator:
                 self._auth_cookies,
                 self._request_timeout,
             )
+            handle.setopt(pycurl.SHARE, self._share_handle)
+            if (
+                request.dest in self._dests_accepting_compression
+                and len(request.data) >= _REQUEST_COMPRESSION_MIN_LENGTH
+            ):
+                _compress_request_data(handle, request.data)
             self._easy_handle_list.append(handle)
             self._multi_handle.add_handle(handle)
             if self._is_running:
@@ -363,6 +413,10 @@ class Communicator:
             for response in response_list:
                 # free up memory for next usage of this Communicator instance
                 self._multi_handle.remove_handle(response.handle)
+                if response.was_connected:
+                    self.__update_dests_accepting_compression(response)
+                if timing.is_enabled():
+                    self.__record_timing(response)
                 self._logger.log_response(response)
                 yield response
                 # if something was added to the queue in the meantime, run it
@@ -373,6 +427,35 @@ class Communicator:
         self._easy_handle_list = []
         self._is_running = False
 
+    def __update_dests_accepting_compression(self, response: Response) -> None:
+        # the set is updated with each response, so that compression is
+        # stopped being used for nodes which have been downgraded
+        if response.accepts_compressed_request:
+            self._dests_accepting_compression.add(response.request.dest)
+        else:
+            self._dests_accepting_compression.discard(response.request.dest)
+
+    @staticmethod
+    def __record_timing(response: Response) -> None:
+        # curl measures all the times from the start of the request
+        handle = response.handle
+        name = response.request.action
+        connect_time = handle.getinfo(pycurl.CONNECT_TIME)
+        timing.record(timing.HTTP_CONNECT, name, connect_time)
+        timing.record(
+            timing.HTTP_TLS,
+            name,
+            max(0.0, handle.getinfo(pycurl.APPCONNECT_TIME) - connect_time),
+        )
+        timing.record(
+            timing.HTTP_FIRST_BYTE,
+            name,
+            handle.getinfo(pycurl.STARTTRANSFER_TIME),
+        )
+        timing.record(
+            timing.HTTP_TOTAL, name, handle.getinfo(pycurl.TOTAL_TIME)
+        )
+
     def __get_all_ready_responses(self) -> list[Response]:
         response_list = []
         repeat = True
@@ -452,6 +535,8 @@ class NodeCommunicatorFactory:
         self._user = user
         self._groups = groups
         self._request_timeout = request_timeout
+        # shared by all communicators created by the factory
+        self._dests_accepting_compression: set[Destination] = set()
 
     def get_communicator(
         self, request_timeout: int | None = None
@@ -463,7 +548,11 @@ class NodeCommunicatorFactory:
     ) -> Communicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return Communicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            dests_accepting_compression=self._dests_accepting_compression,
         )
 
     def get_communicator_no_privilege_transition(
@@ -482,6 +571,7 @@ class NodeCommunicatorFactory:
             user=None,
             groups=None,
             request_timeout=timeout,
+            dests_accepting_compression=self._dests_accepting_compression,
         )
 
     def get_multiaddress_communicator(
@@ -489,7 +579,11 @@ class NodeCommunicatorFactory:
     ) -> MultiaddressCommunicator:
         timeout = request_timeout if request_timeout else self._request_timeout
         return MultiaddressCommunicator(
-            self._logger, self._user, self._groups, request_timeout=timeout
+            self._logger,
+            self._user,
+            self._groups,
+            request_timeout=timeout,
+            dests_accepting_compression=self._dests_accepting_compression,
         )
 
 
@@ -541,11 +635,30 @@ def _create_request_handle(
             pycurl.DEBUG_DATA_OUT: b">> ",  # type: ignore[attr-defined]
         }
         if data_type in prefixes:
+            if (
+                data_type == pycurl.DEBUG_DATA_IN  # type: ignore[attr-defined]
+                and handle.response_compressed  # type: ignore[attr-defined]
+            ) or (
+                data_type == pycurl.DEBUG_DATA_OUT  # type: ignore[attr-defined]
+                and handle.request_compressed  # type: ignore[attr-defined]
+            ):
+                debug_data = (
+                    f"[{len(debug_data)} bytes of compressed data]".encode()
+                )
             debug_output.write(prefixes[data_type])
             debug_output.write(debug_data)
             if not debug_data.endswith(b"\n"):
                 debug_output.write(b"\n")
 
+    def __header_callback(header_line: bytes) -> None:
+        name, _, value = header_line.partition(b":")
+        name = name.strip().lower()
+        if name == b"accept-encoding":
+            # RFC 7694: the server announces encodings of requests it accepts
+            handle.accepts_compressed_request = b"gzip" in value.lower()  # type: ignore[attr-defined]
+        elif name == b"content-encoding":
+            handle.response_compressed = True  # type: ignore[attr-defined]
+
     output = io.BytesIO()
     debug_output = io.BytesIO()
     handle_cookies = dict(cookies.items())
@@ -561,6 +674,9 @@ def _create_request_handle(
     handle.setopt(pycurl.SSL_VERIFYPEER, 0)
     handle.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
     handle.setopt(pycurl.HTTPHEADER, ["Expect: "])
+    # let curl request any compression it supports and decode responses
+    handle.setopt(pycurl.ACCEPT_ENCODING, "")
+    handle.setopt(pycurl.HEADERFUNCTION, __header_callback)
     if handle_cookies:
         handle.setopt(
             pycurl.COOKIE, _dict_to_cookies(handle_cookies).encode("utf-8")
@@ -575,9 +691,23 @@ def _create_request_handle(
     handle.request_obj = request  # type: ignore[attr-defined]
     handle.output_buffer = output  # type: ignore[attr-defined]
     handle.debug_buffer = debug_output  # type: ignore[attr-defined]
+    handle.accepts_compressed_request = False  # type: ignore[attr-defined]
+    handle.request_compressed = False  # type: ignore[attr-defined]
+    handle.response_compressed = False  # type: ignore[attr-defined]
     return handle
 
 
+def _compress_request_data(handle: pycurl.Curl, data: str) -> None:
+    # COPYPOSTFIELDS does not accept data containing null bytes. Data set by
+    # POSTFIELDS are not copied by curl, keep a reference to them.
+    handle.compressed_data = gzip.compress(  # type: ignore[attr-defined]
+        data.encode("utf-8"), compresslevel=_REQUEST_COMPRESSION_LEVEL
+    )
+    handle.setopt(pycurl.POSTFIELDS, handle.compressed_data)  # type: ignore[attr-defined]
+    handle.setopt(pycurl.HTTPHEADER, ["Expect: ", "Content-Encoding: gzip"])
+    handle.request_compressed = True  # type: ignore[attr-defined]
+
+
 def _dict_to_cookies(cookies_dict: Mapping[str, str]) -> str:
     return ";".join(
         [f"{key}={value}" for key, value in sorted(cookies_dict.items())]
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from pcs.common.interface.dto import DataTransferObject
+from pcs.common.reports.dto import ReportItemDto
+
+
+@dataclass(frozen=True)
+class SimulatedOperationDto(DataTransferObject):
+    resource_id: str
+    operation: str
+    node: str
+
+
+@dataclass(frozen=True)
+class ResourceDisableImpactDto(DataTransferObject):
+    resource_or_tag_ids: list[str]
+    disabled_resource_ids: list[str]
+    other_affected_resource_ids: list[str]
+    operations: list[SimulatedOperationDto]
+    timed_out: bool
+    reports: list[ReportItemDto]
+
+
+@dataclass(frozen=True)
+class ResourceDisableImpactListDto(DataTransferObject):
+    candidates: list[ResourceDisableImpactDto]
@@ -328,6 +328,7 @@ FILES_REMOVE_FROM_NODES_STARTED = M("FILES_REMOVE_FROM_NODES_STARTED")
 FILES_REMOVE_FROM_NODES_SKIPPED = M("FILES_REMOVE_FROM_NODES_SKIPPED")
 FILE_ALREADY_EXISTS = M("FILE_ALREADY_EXISTS")
 FILE_DISTRIBUTION_ERROR = M("FILE_DISTRIBUTION_ERROR")
+FILE_DISTRIBUTION_SKIPPED_UNCHANGED = M("FILE_DISTRIBUTION_SKIPPED_UNCHANGED")
 FILE_DISTRIBUTION_SUCCESS = M("FILE_DISTRIBUTION_SUCCESS")
 FILE_DOES_NOT_EXIST_USING_DEFAULT = M("FILE_DOES_NOT_EXIST_USING_DEFAULT")
 FILE_IO_ERROR = M("FILE_IO_ERROR")
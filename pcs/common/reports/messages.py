@@ -4507,6 +4507,28 @@ class FileDistributionSuccess(ReportItemMessage):
         )
 
 
+@dataclass(frozen=True)
+class FileDistributionSkippedUnchanged(ReportItemMessage):
+    """
+    A node already has a file with the same content, the file has not been
+    sent to the node
+
+    node -- name of a destination node
+    file_description -- name (code) of the file
+    """
+
+    node: str
+    file_description: str
+    _code = codes.FILE_DISTRIBUTION_SKIPPED_UNCHANGED
+
+    @property
+    def message(self) -> str:
+        return (
+            f"{self.node}: file '{self.file_description}' unchanged, "
+            "distribution skipped"
+        )
+
+
 @dataclass(frozen=True)
 class FileDistributionError(ReportItemMessage):
     """
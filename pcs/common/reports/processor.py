@@ -1,6 +1,7 @@
 import abc
 from logging import Logger
 
+from pcs.common import timing
 from pcs.common.reports.utils import add_context_to_message
 
 from .item import ReportItem, ReportItemList, ReportItemSeverity
@@ -17,7 +18,8 @@ class ReportProcessor(abc.ABC):
     def report(self, report_item: ReportItem) -> "ReportProcessor":
         if _is_error(report_item):
             self._has_errors = True
-        self._do_report(report_item)
+        with timing.span(timing.REPORTS):
+            self._do_report(report_item)
         return self
 
     def report_list(self, report_list: ReportItemList) -> "ReportProcessor":
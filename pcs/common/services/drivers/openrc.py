@@ -1,7 +1,10 @@
 import os.path
 
+from pcs.common.types import StringIterable
+
 from .. import errors
 from ..interfaces import ExecutorInterface, ServiceManagerInterface
+from ..types import ServiceState
 
 
 class OpenRcDriver(ServiceManagerInterface):
@@ -57,11 +60,13 @@ class OpenRcDriver(ServiceManagerInterface):
 
     def is_enabled(self, service: str, instance: str | None = None) -> bool:
         del instance
+        return service in self._get_enabled_services()
+
+    def _get_enabled_services(self) -> set[str]:
         result = self._executor.run([self._rc_update_bin, "show", "default"])
-        for line in result.stdout.splitlines():
-            if service == line.strip().split(" ")[0]:
-                return True
-        return False
+        return {
+            line.strip().split(" ")[0] for line in result.stdout.splitlines()
+        }
 
     def is_running(self, service: str, instance: str | None = None) -> bool:
         del instance
@@ -73,6 +78,23 @@ class OpenRcDriver(ServiceManagerInterface):
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
+    def get_states(self, services: StringIterable) -> dict[str, ServiceState]:
+        # OpenRC is not able to provide running state of several services at
+        # once, the other states are read for all services by one call
+        service_list = list(services)
+        if not service_list:
+            return {}
+        available_services = set(self.get_available_services())
+        enabled_services = self._get_enabled_services()
+        return {
+            service: ServiceState(
+                installed=service in available_services,
+                enabled=service in enabled_services,
+                running=self.is_running(service),
+            )
+            for service in service_list
+        }
+
     def get_available_services(self) -> list[str]:
         if not self._available_services:
             self._available_services = self._get_available_services()
@@ -5,6 +5,21 @@ from pcs.common.types import StringIterable
 
 from .. import errors
 from ..interfaces import ExecutorInterface, ServiceManagerInterface
+from ..types import ServiceState
+
+# states for which 'systemctl is-enabled' and 'systemctl is-active' return 0
+_ENABLED_UNIT_FILE_STATES = frozenset(
+    (
+        "alias",
+        "enabled",
+        "enabled-runtime",
+        "generated",
+        "indirect",
+        "static",
+        "transient",
+    )
+)
+_ACTIVE_STATES = frozenset(("active", "reloading", "refreshing"))
 
 
 class SystemdDriver(ServiceManagerInterface):
@@ -105,6 +120,49 @@ class SystemdDriver(ServiceManagerInterface):
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
+    def get_states(self, services: StringIterable) -> dict[str, ServiceState]:
+        service_list = list(services)
+        if not service_list:
+            return {}
+        result = self._executor.run(
+            [
+                self._systemctl_bin,
+                "show",
+                "--property=LoadState,ActiveState,UnitFileState",
+                *[
+                    _format_service_name(service, None)
+                    for service in service_list
+                ],
+            ]
+        )
+        property_list = (
+            _parse_show_output(result.stdout) if result.retval == 0 else []
+        )
+        if len(property_list) != len(service_list):
+            # systemctl prints properties of units in the order they were
+            # specified, we cannot pair them with services otherwise
+            return {
+                service: ServiceState(
+                    installed=self.is_installed(service),
+                    enabled=self.is_enabled(service),
+                    running=self.is_running(service),
+                )
+                for service in service_list
+            }
+        return {
+            service: ServiceState(
+                installed=properties.get("LoadState", "not-found")
+                != "not-found",
+                enabled=(
+                    properties.get("UnitFileState") in _ENABLED_UNIT_FILE_STATES
+                ),
+                running=properties.get("ActiveState") in _ACTIVE_STATES,
+            )
+            for service, properties in zip(
+                service_list, property_list, strict=True
+            )
+        }
+
     def get_available_services(self) -> list[str]:
         if not self._available_services:
             self._available_services = self._get_available_services()
@@ -136,3 +194,20 @@ class SystemdDriver(ServiceManagerInterface):
 def _format_service_name(service: str, instance: str | None) -> str:
     instance_str = f"@{instance}" if instance else ""
     return f"{service}{instance_str}.service"
+
+
+def _parse_show_output(output: str) -> list[dict[str, str]]:
+    # properties of each unit are separated by an empty line
+    property_list: list[dict[str, str]] = []
+    properties: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if properties:
+                property_list.append(properties)
+            properties = {}
+            continue
+        name, _, value = line.partition("=")
+        properties[name] = value
+    if properties:
+        property_list.append(properties)
+    return property_list
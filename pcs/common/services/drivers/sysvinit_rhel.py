@@ -1,7 +1,10 @@
 import os.path
 
+from pcs.common.types import StringIterable
+
 from .. import errors
 from ..interfaces import ExecutorInterface, ServiceManagerInterface
+from ..types import ServiceState
 
 
 class SysVInitRhelDriver(ServiceManagerInterface):
@@ -61,6 +64,20 @@ class SysVInitRhelDriver(ServiceManagerInterface):
     def is_installed(self, service: str) -> bool:
         return service in self.get_available_services()
 
+    def get_states(self, services: StringIterable) -> dict[str, ServiceState]:
+        # Enabled and running states depend on the current runlevel and on
+        # init scripts, they cannot be read for several services at once.
+        # Installed services are read only once and cached.
+        available_services = set(self.get_available_services())
+        return {
+            service: ServiceState(
+                installed=service in available_services,
+                enabled=self.is_enabled(service),
+                running=self.is_running(service),
+            )
+            for service in services
+        }
+
     def get_available_services(self) -> list[str]:
         if not self._available_services:
             self._available_services = self._get_available_services()
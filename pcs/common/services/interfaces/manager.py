@@ -1,3 +1,8 @@
+from pcs.common.types import StringIterable
+
+from ..types import ServiceState
+
+
 class ServiceManagerInterface:
     def start(self, service: str, instance: str | None = None) -> None:
         """
@@ -68,6 +73,17 @@ class ServiceManagerInterface:
         """
         raise NotImplementedError()
 
+    def get_states(self, services: StringIterable) -> dict[str, ServiceState]:
+        """
+        services -- names of services to be checked
+
+        Returns installed, enabled and running state of all specified services
+        at once. Use this instead of calling is_installed, is_enabled and
+        is_running for each service, as it may need much less external
+        processes to be run.
+        """
+        raise NotImplementedError()
+
     def get_available_services(self) -> list[str]:
         """
         Returns list of service names recognized by init system.
@@ -0,0 +1,164 @@
+"""
+Lightweight instrumentation of time spent in expensive operations
+
+Instrumented code wraps operations in spans:
+    with timing.span(timing.PROCESS, "crm_mon"):
+        ...
+or records durations measured elsewhere:
+    timing.record(timing.HTTP_TOTAL, "remote/status", duration)
+
+Nothing is measured unless a collector has been enabled by calling enable.
+When disabled, a span costs one global lookup and entering a shared no-op
+context manager.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+
+PROCESS = "process"
+HTTP_TOTAL = "http"
+HTTP_CONNECT = "http connect"
+HTTP_TLS = "http tls handshake"
+HTTP_FIRST_BYTE = "http first byte"
+XML_PARSE = "xml parse"
+XML_SERIALIZE = "xml serialize"
+XML_VALIDATE = "xml validate"
+REPORTS = "reports"
+
+_NOOP_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass
+class TimingStat:
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.maximum = max(self.maximum, duration)
+
+
+class TimingCollector:
+    """
+    Aggregate durations by a category and a name within the category
+    """
+
+    def __init__(self) -> None:
+        self._started_at = time.perf_counter()
+        self._stats: dict[str, dict[str, TimingStat]] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def add(self, category: str, name: str, duration: float) -> None:
+        category_stats = self._stats.setdefault(category, {})
+        stat = category_stats.get(name)
+        if stat is None:
+            stat = category_stats[name] = TimingStat()
+        stat.add(duration)
+
+    def get_stats(self) -> dict[str, dict[str, TimingStat]]:
+        return self._stats
+
+
+_collector: TimingCollector | None = None
+
+
+def enable() -> TimingCollector:
+    """
+    Start collecting timing data, return the collector
+    """
+    global _collector  # noqa: PLW0603
+    _collector = TimingCollector()
+    return _collector
+
+
+def disable() -> None:
+    global _collector  # noqa: PLW0603
+    _collector = None
+
+
+def is_enabled() -> bool:
+    return _collector is not None
+
+
+@contextmanager
+def _span(
+    collector: TimingCollector, category: str, name: str
+) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        collector.add(category, name, time.perf_counter() - start)
+
+
+def span(category: str, name: str = "") -> AbstractContextManager[None]:
+    """
+    Measure the time spent in a with block
+
+    category -- kind of the operation, e.g. PROCESS
+    name -- specific operation within the category, e.g. a process name
+    """
+    collector = _collector
+    if collector is None:
+        return _NOOP_SPAN
+    return _span(collector, category, name)
+
+
+def record(category: str, name: str, duration: float) -> None:
+    """
+    Store a duration measured outside of a span
+    """
+    collector = _collector
+    if collector is not None:
+        collector.add(category, name, duration)
+
+
+def format_breakdown(
+    collector: TimingCollector, max_names: int = 5
+) -> list[str]:
+    """
+    Return lines describing time spent in each category, categories and names
+    in them are sorted from the most expensive ones
+
+    max_names -- show at most this number of names in each category
+    """
+
+    def _format(indent: int, label: str, stat: TimingStat) -> str:
+        width = 32 - indent
+        return (
+            f"{' ' * indent}{label[:width]:<{width}} {stat.count:>6}x "
+            f"{stat.total:>9.3f}s (max {stat.maximum:.3f}s)"
+        )
+
+    lines = [f"Timing breakdown, total {collector.elapsed:.3f}s:"]
+    category_list = []
+    for category, name_stats in collector.get_stats().items():
+        category_stat = TimingStat()
+        for stat in name_stats.values():
+            category_stat.count += stat.count
+            category_stat.total += stat.total
+            category_stat.maximum = max(category_stat.maximum, stat.maximum)
+        category_list.append((category, category_stat, name_stats))
+
+    for category, category_stat, name_stats in sorted(
+        category_list, key=lambda item: item[1].total, reverse=True
+    ):
+        lines.append(_format(2, category, category_stat))
+        named_stats = sorted(
+            ((name, stat) for name, stat in name_stats.items() if name),
+            key=lambda item: item[1].total,
+            reverse=True,
+        )
+        lines.extend(
+            _format(4, name, stat) for name, stat in named_stats[:max_names]
+        )
+        if len(named_stats) > max_names:
+            lines.append(f"    ... {len(named_stats) - max_names} more")
+    return lines
@@ -7,6 +7,7 @@ from typing import TypeVar
 from lxml import etree
 from lxml.etree import _Element
 
+from pcs.common import timing
 from pcs.common.types import StringCollection
 from pcs.common.validate import is_integer
 
@@ -51,12 +52,13 @@ def xml_fromstring(xml: str) -> _Element:
     # ValueError: Unicode strings with encoding declaration are not supported.
     # Please use bytes input or XML fragments without declaration.
     # So we encode the string to bytes.
-    return etree.fromstring(
-        xml.encode("utf-8"),
-        # it raises on a huge xml without the flag huge_tree=True
-        # see https://bugzilla.redhat.com/show_bug.cgi?id=1506864
-        etree.XMLParser(huge_tree=True),
-    )
+    with timing.span(timing.XML_PARSE):
+        return etree.fromstring(
+            xml.encode("utf-8"),
+            # it raises on a huge xml without the flag huge_tree=True
+            # see https://bugzilla.redhat.com/show_bug.cgi?id=1506864
+            etree.XMLParser(huge_tree=True),
+        )
 
 
 def timeout_to_seconds(timeout: int | str) -> int | None:
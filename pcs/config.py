@@ -5,16 +5,18 @@ import json
 import os
 import os.path
 import pwd
-import re
 import shutil
 import sys
 import tarfile
 import tempfile
 import time
 from io import BytesIO
-from typing import cast
+from typing import NamedTuple, cast
+from urllib.parse import urlencode
 from xml.dom.minidom import parse
 
+from lxml import etree
+
 from pcs import cluster, quorum, settings, status, usage, utils
 from pcs.cli.alert.output import config_dto_to_lines as alerts_to_lines
 from pcs.cli.cluster_property.output import (
@@ -37,6 +39,8 @@ from pcs.cli.tag.output import tags_to_text
 from pcs.common.interface import dto
 from pcs.common.pacemaker.constraint import CibConstraintsDto
 from pcs.common.str_tools import indent
+from pcs.common.tools import xml_fromstring
+from pcs.lib.cib import checkpoint
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
 
@@ -320,7 +324,7 @@ def config_restore(lib, argv, modifiers):
         sys.exit(exitcode)
 
 
-def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912
+def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912, PLR0915
     """
     Commandline options:
       * --request-timeout - timeout for HTTP requests
@@ -356,9 +360,14 @@ def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912
         utils.err("no nodes found in the tarball")
 
     err_msgs = []
+    status_results = dict(
+        utils.send_http_request_to_nodes(
+            node_list, "remote/status", urlencode({"version": "2"})
+        )
+    )
     for node in node_list:
         try:
-            retval, output = utils.checkStatus(node)
+            retval, output = status_results[node]
             if retval != 0:
                 err_msgs.append(output)
                 continue
@@ -386,8 +395,15 @@ def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912
     # Temporarily disable config files syncing thread in pcsd so it will not
     # rewrite restored files. 10 minutes should be enough time to restore.
     # If node returns HTTP 404 it does not support config syncing at all.
+    pause_results = dict(
+        utils.send_http_request_to_nodes(
+            node_list,
+            "remote/set_sync_options",
+            urlencode({"sync_thread_pause": 10 * 60}),
+        )
+    )
     for node in node_list:
-        retval, output = utils.pauseConfigSyncing(node, 10 * 60)
+        retval, output = pause_results[node]
         if not (retval == 0 or "(HTTP error: 404)" in output):
             utils.err(output)
 
@@ -399,10 +415,13 @@ def config_restore_remote(infile_name, infile_obj):  # noqa: PLR0912
             tarball_data = tarball.read()
 
     error_list = []
-    for node in node_list:
-        retval, error = utils.restoreConfig(node, tarball_data)
+    for node, (retval, output) in utils.send_http_request_to_nodes(
+        node_list, "remote/config_restore", urlencode({"tarball": tarball_data})
+    ):
         if retval != 0:
-            error_list.append(error)
+            error_list.append(output)
+            continue
+        print_to_stderr(f"{node}: {output.strip()}")
     if error_list:
         utils.err("unable to restore all nodes\n" + "\n".join(error_list))
 
@@ -673,41 +692,57 @@ def config_backup_version():
     return 1
 
 
+def _parse_since(value):
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError as e:
+        raise CmdLineInputError(
+            f"'{value}' is not a valid date and time, use format "
+            "'YYYY-MM-DD [HH:MM[:SS]]'"
+        ) from e
+
+
+def _get_checkpoint_list():
+    try:
+        return checkpoint.get_checkpoint_index(
+            settings.cib_dir, settings.cib_checkpoint_index_location
+        )
+    except OSError as e:
+        return utils.err("unable to list checkpoints: %s" % e)
+
+
 def config_checkpoint_list(lib, argv, modifiers):
     """
-    Options: no options
+    Options:
+      * --full - show epoch and size of checkpoints
+      * --since - list only checkpoints created since specified time
     """
     del lib
-    modifiers.ensure_only_supported()
+    modifiers.ensure_only_supported("--full", "--since")
     if argv:
         raise CmdLineInputError()
-    try:
-        file_list = os.listdir(settings.cib_dir)
-    except OSError as e:
-        utils.err("unable to list checkpoints: %s" % e)
-    cib_list = []
-    cib_name_re = re.compile(r"^cib-(\d+)\.raw$")
-    for filename in file_list:
-        match = cib_name_re.match(filename)
-        if not match:
-            continue
-        file_path = os.path.join(settings.cib_dir, filename)
-        try:
-            if os.path.isfile(file_path):
-                cib_list.append(
-                    (float(os.path.getmtime(file_path)), match.group(1))
-                )
-        except OSError:
-            pass
-    cib_list.sort()
-    if not cib_list:
+    since = None
+    if modifiers.get("--since"):
+        since = _parse_since(modifiers.get("--since"))
+    checkpoint_list = [
+        info
+        for info in _get_checkpoint_list()
+        if since is None or info.timestamp >= since
+    ]
+    if not checkpoint_list:
         print_to_stderr("No checkpoints available")
         return
-    for cib_info in cib_list:
-        print(
-            "checkpoint %s: date %s"
-            % (cib_info[1], datetime.datetime.fromtimestamp(round(cib_info[0])))
+    for info in checkpoint_list:
+        line = "checkpoint %s: date %s" % (
+            info.number,
+            datetime.datetime.fromtimestamp(round(info.timestamp)),
         )
+        if modifiers.get("--full"):
+            line += ", epoch %s, size %s" % (
+                ".".join(str(part) for part in info.epoch),
+                info.size,
+            )
+        print(line)
 
 
 def _checkpoint_to_lines(lib, checkpoint_number):
@@ -753,62 +788,249 @@ def config_checkpoint_view(lib, argv, modifiers):
     print("\n".join(lines))
 
 
-def config_checkpoint_diff(lib, argv, modifiers):
+class _DiffSource(NamedTuple):
+    # None stands for the live configuration
+    number: str | None
+    # known for indexed checkpoints, equal hashes mean equal checkpoints
+    content_hash: str | None = None
+
+    @property
+    def label(self):
+        if self.number is None:
+            return "live configuration"
+        return f"checkpoint {self.number}"
+
+
+def _load_configuration_snapshot(source):
     """
     Commandline options:
-      * -f - CIB file
+      * -f - CIB file, used as the live configuration
     """
-    modifiers.ensure_only_supported("-f")
-    if len(argv) != 2:
-        print_to_stderr(usage.config(["checkpoint diff"]))
-        sys.exit(1)
+    if source.number is None:
+        try:
+            return checkpoint.get_configuration_snapshot(
+                xml_fromstring(utils.get_cib())
+            )
+        except (etree.XMLSyntaxError, LibraryError):
+            return utils.err("unable to read live configuration")
+    try:
+        return checkpoint.get_configuration_snapshot(
+            checkpoint.load_checkpoint(
+                checkpoint.get_checkpoint_path(settings.cib_dir, source.number)
+            )
+        )
+    except (OSError, etree.XMLSyntaxError, LibraryError):
+        return utils.err(
+            "unable to read checkpoint '{0}'".format(source.number)
+        )
+
+
+def _diff_item_to_lines(label, change, old_lines, new_lines):
+    return [f"{label} {change}:"] + indent(
+        [
+            line.rstrip()
+            for line in difflib.Differ().compare(old_lines, new_lines)
+        ]
+    )
 
-    if argv[0] == argv[1]:
-        utils.err("cannot diff a checkpoint against itself")
-
-    errors = []
-    checkpoints_lines = []
-    for checkpoint in argv:
-        if checkpoint == "live":
-            lines = _config_show_cib_lines(lib)
-            if not lines:
-                errors.append("unable to read live configuration")
-            else:
-                checkpoints_lines.append(lines)
-        else:
-            loaded, lines = _checkpoint_to_lines(lib, checkpoint)
-            if not loaded:
-                errors.append(
-                    "unable to read checkpoint '{0}'".format(checkpoint)
-                )
-            else:
-                checkpoints_lines.append(lines)
 
-    if errors:
-        utils.err("\n".join(errors))
+def _configuration_diff_to_lines(old_snapshot, new_snapshot):
+    # Only changed items are rendered and compared as text, which keeps
+    # comparing big configurations with a few changes fast.
+    diff = checkpoint.diff_snapshots(old_snapshot, new_snapshot)
+    lines = []
 
-    print(
-        "Differences between {0} (-) and {1} (+):".format(
-            *[
+    if diff.resources:
+        old_facade = ResourcesConfigurationFacade.from_resources_dto(
+            old_snapshot.resources
+        )
+        new_facade = ResourcesConfigurationFacade.from_resources_dto(
+            new_snapshot.resources
+        )
+    for resource_id, change in diff.resources:
+        lines.extend(
+            _diff_item_to_lines(
+                f"Resource '{resource_id}'",
+                change,
                 (
-                    "live configuration"
-                    if label == "live"
-                    else f"checkpoint {label}"
-                )
-                for label in argv
-            ]
+                    []
+                    if change == checkpoint.CHANGE_ADDED
+                    else resources_to_text(
+                        old_facade.filter_resources([resource_id])
+                    )
+                ),
+                (
+                    []
+                    if change == checkpoint.CHANGE_REMOVED
+                    else resources_to_text(
+                        new_facade.filter_resources([resource_id])
+                    )
+                ),
+            )
         )
-    )
-    print(
-        "\n".join(
-            [
-                line.rstrip()
-                for line in difflib.Differ().compare(
-                    checkpoints_lines[0], checkpoints_lines[1]
-                )
-            ]
+
+    old_constraints = checkpoint.get_constraints_map(old_snapshot.constraints)
+    new_constraints = checkpoint.get_constraints_map(new_snapshot.constraints)
+    for constraint_id, change in diff.constraints:
+        lines.extend(
+            _diff_item_to_lines(
+                f"Constraint '{constraint_id}'",
+                change,
+                (
+                    []
+                    if change == checkpoint.CHANGE_ADDED
+                    else constraints_to_text(
+                        old_constraints[constraint_id], with_id=True
+                    )
+                ),
+                (
+                    []
+                    if change == checkpoint.CHANGE_REMOVED
+                    else constraints_to_text(
+                        new_constraints[constraint_id], with_id=True
+                    )
+                ),
+            )
         )
-    )
+
+    for name, old_value, new_value in diff.properties:
+        if old_value is None:
+            change = checkpoint.CHANGE_ADDED
+        elif new_value is None:
+            change = checkpoint.CHANGE_REMOVED
+        else:
+            change = checkpoint.CHANGE_CHANGED
+        lines.extend(
+            _diff_item_to_lines(
+                f"Cluster property '{name}'",
+                change,
+                [] if old_value is None else [old_value],
+                [] if new_value is None else [new_value],
+            )
+        )
+
+    for section, change in diff.other_sections:
+        lines.extend(
+            _diff_item_to_lines(
+                f"Configuration section '{section}'",
+                change,
+                (
+                    []
+                    if change == checkpoint.CHANGE_ADDED
+                    else checkpoint.section_to_lines(
+                        old_snapshot.other_sections[section]
+                    )
+                ),
+                (
+                    []
+                    if change == checkpoint.CHANGE_REMOVED
+                    else checkpoint.section_to_lines(
+                        new_snapshot.other_sections[section]
+                    )
+                ),
+            )
+        )
+    return lines
+
+
+def _print_checkpoints_diff(source_list):
+    """
+    Print differences between each two consecutive configurations
+
+    Commandline options:
+      * -f - CIB file, used as the live configuration
+    """
+    old_source = source_list[0]
+    old_snapshot = None
+    for pair_index, new_source in enumerate(source_list[1:]):
+        if (
+            old_source.content_hash is not None
+            and old_source.content_hash == new_source.content_hash
+        ):
+            # identical checkpoints, no need to load them
+            diff_lines = []
+        else:
+            if old_snapshot is None:
+                old_snapshot = _load_configuration_snapshot(old_source)
+            new_snapshot = _load_configuration_snapshot(new_source)
+            diff_lines = _configuration_diff_to_lines(
+                old_snapshot, new_snapshot
+            )
+            old_snapshot = new_snapshot
+        if pair_index:
+            print()
+        print(
+            "Differences between {0} (-) and {1} (+):".format(
+                old_source.label, new_source.label
+            )
+        )
+        print("\n".join(diff_lines) or "No differences")
+        old_source = new_source
+
+
+def _get_indexed_diff_sources(argv, modifiers):
+    """
+    Commandline options:
+      * --since - checkpoints created since specified time
+    """
+    checkpoint_list = _get_checkpoint_list()
+    if modifiers.get("--since"):
+        since = _parse_since(modifiers.get("--since"))
+        first_index = len(checkpoint_list)
+        for index, info in enumerate(checkpoint_list):
+            if info.timestamp >= since:
+                first_index = index
+                break
+        if first_index == len(checkpoint_list):
+            return []
+        # compare the first checkpoint to the one preceding it
+        selected_list = checkpoint_list[max(first_index - 1, 0) :]
+    else:
+        number_index_map = {
+            str(info.number): index
+            for index, info in enumerate(checkpoint_list)
+        }
+        range_index_list = []
+        for number in argv[0].split("..", 1):
+            if number not in number_index_map:
+                utils.err("unable to read checkpoint '{0}'".format(number))
+            range_index_list.append(number_index_map[number])
+        first_index, last_index = sorted(range_index_list)
+        if first_index == last_index:
+            utils.err("cannot diff a checkpoint against itself")
+        selected_list = checkpoint_list[first_index : last_index + 1]
+    return [
+        _DiffSource(str(info.number), info.content_hash)
+        for info in selected_list
+    ]
+
+
+def config_checkpoint_diff(lib, argv, modifiers):
+    """
+    Commandline options:
+      * -f - CIB file
+      * --since - compare checkpoints created since specified time
+    """
+    del lib
+    modifiers.ensure_only_supported("-f", "--since")
+    if modifiers.get("--since") or (len(argv) == 1 and ".." in argv[0]):
+        if argv and modifiers.get("--since"):
+            raise CmdLineInputError()
+        source_list = _get_indexed_diff_sources(argv, modifiers)
+        if len(source_list) < 2:
+            print_to_stderr("No checkpoints to compare")
+            return
+    elif len(argv) == 2:
+        if argv[0] == argv[1]:
+            utils.err("cannot diff a checkpoint against itself")
+        source_list = [
+            _DiffSource(None if number == "live" else number) for number in argv
+        ]
+    else:
+        print_to_stderr(usage.config(["checkpoint diff"]))
+        sys.exit(1)
+
+    _print_checkpoints_diff(source_list)
 
 
 def config_checkpoint_restore(lib, argv, modifiers):
@@ -35,6 +35,7 @@ from pcs.daemon.app.common import (
     get_legacy_desired_user_from_request,
 )
 from pcs.daemon.async_tasks.scheduler import Scheduler
+from pcs.daemon.pcs_cfgsync import CfgSyncScheduler
 from pcs.lib.auth.tools import DesiredUser
 from pcs.lib.auth.types import AuthUser
 from pcs.lib.pcs_cfgsync.const import SYNCED_CONFIGS
@@ -522,15 +523,18 @@ class GetConfigsHandler(_BaseApiV0Handler):
 
 class SetSyncOptionsHandler(_BaseApiV0Handler):
     _sync_config_lock: Lock
+    _cfgsync_scheduler: CfgSyncScheduler
 
     def initialize(  # type: ignore[override]
         self,
         api_auth_provider_factory: ApiAuthProviderFactoryInterface,
         scheduler: Scheduler,
         sync_config_lock: Lock,
+        cfgsync_scheduler: CfgSyncScheduler,
     ) -> None:
         super().initialize(api_auth_provider_factory, scheduler)
         self._sync_config_lock = sync_config_lock
+        self._cfgsync_scheduler = cfgsync_scheduler
 
     async def _handle_request(self) -> None:
         options = {
@@ -544,6 +548,8 @@ class SetSyncOptionsHandler(_BaseApiV0Handler):
 
         if not result.success:
             raise self._error(reports_to_str(result.reports))
+        # apply the new options right away
+        self._cfgsync_scheduler.request_sync()
         self.write("Sync thread options updated successfully")
 
 
@@ -564,15 +570,18 @@ class SetConfigsHandler(_BaseApiV0Handler):
     }
 
     _sync_config_lock: Lock
+    _cfgsync_scheduler: CfgSyncScheduler
 
     def initialize(  # type: ignore[override]
         self,
         api_auth_provider_factory: ApiAuthProviderFactoryInterface,
         scheduler: Scheduler,
         sync_config_lock: Lock,
+        cfgsync_scheduler: CfgSyncScheduler,
     ) -> None:
         super().initialize(api_auth_provider_factory, scheduler)
         self._sync_config_lock = sync_config_lock
+        self._cfgsync_scheduler = cfgsync_scheduler
 
     async def _handle_request(self) -> None:
         try:
@@ -636,6 +645,12 @@ class SetConfigsHandler(_BaseApiV0Handler):
             if legacy_name not in real_results:
                 real_results[legacy_name] = "error"
 
+        if "accepted" in real_results.values():
+            # The pushing node has just saved a new config version. Other
+            # configs may have changed in the cluster as well, so fetch them
+            # now instead of waiting for the next periodic sync.
+            self._cfgsync_scheduler.request_sync()
+
         self.write({"status": "ok", "result": not_file_results | real_results})
 
 
@@ -938,6 +953,7 @@ def get_routes(
     api_auth_provider_factory: ApiAuthProviderFactoryInterface,
     scheduler: Scheduler,
     sync_config_lock: Lock,
+    cfgsync_scheduler: CfgSyncScheduler,
 ) -> RoutesType:
     def r(url: str) -> str:
         return f"/remote/{url}"
@@ -993,12 +1009,20 @@ def get_routes(
         (
             r("set_configs"),
             SetConfigsHandler,
-            {**params, "sync_config_lock": sync_config_lock},
+            {
+                **params,
+                "sync_config_lock": sync_config_lock,
+                "cfgsync_scheduler": cfgsync_scheduler,
+            },
         ),
         (
             r("set_sync_options"),
             SetSyncOptionsHandler,
-            {**params, "sync_config_lock": sync_config_lock},
+            {
+                **params,
+                "sync_config_lock": sync_config_lock,
+                "cfgsync_scheduler": cfgsync_scheduler,
+            },
         ),
         # permissions
         (r("set_permissions"), SetPermissionsHandler, params),
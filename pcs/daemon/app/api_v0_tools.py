@@ -47,12 +47,10 @@ async def run_library_command_in_scheduler(
     auth_user: AuthUser,
     error_handler: Callable[[str, int], Finish],
 ) -> SimplifiedResult:
-    task_ident = scheduler.new_task(
-        Command(command_dto, is_legacy_command=True), auth_user
-    )
-
     try:
-        task_result_dto = await scheduler.wait_for_task(task_ident, auth_user)
+        task_result_dto = await scheduler.run_task(
+            Command(command_dto, is_legacy_command=True), auth_user
+        )
     except TaskNotFoundError as e:
         raise error_handler("Internal server error", 500) from e
 
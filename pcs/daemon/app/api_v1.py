@@ -7,7 +7,7 @@ from tornado.web import HTTPError
 from pcs.common import communication, reports
 from pcs.common.async_tasks import types
 from pcs.common.async_tasks.dto import CommandDto, CommandOptionsDto
-from pcs.common.interface.dto import to_dict
+from pcs.common.interface.dto import to_dict, to_json
 from pcs.daemon import log
 from pcs.daemon.app.auth_provider import (
     ApiAuthProviderFactoryInterface,
@@ -172,7 +172,7 @@ class _BaseApiV1Handler(BaseHandler):
     def send_response(
         self, response: communication.dto.InternalCommunicationResultDto
     ) -> None:
-        self.finish(json.dumps(to_dict(response)))
+        self.finish(to_json(response))
 
     def write_error(self, status_code: int, **kwargs: Any) -> None:
         # Always return HTTP 200 to signal that the request got processed.
@@ -234,13 +234,9 @@ class _BaseApiV1Handler(BaseHandler):
                 else None,
             ),
         )
-        task_ident = self.scheduler.new_task(
-            Command(command_dto, is_legacy_command=True), self._real_user
-        )
-
         try:
-            task_result_dto = await self.scheduler.wait_for_task(
-                task_ident, self._real_user
+            task_result_dto = await self.scheduler.run_task(
+                Command(command_dto, is_legacy_command=True), self._real_user
             )
         except TaskNotFoundError as e:
             raise ApiError(
@@ -11,7 +11,7 @@ from pcs.common.interface.dto import (
     DTOTYPE,
     PayloadConversionError,
     from_dict,
-    to_dict,
+    to_json,
 )
 from pcs.daemon.app.auth_provider import (
     ApiAuthProviderFactoryInterface,
@@ -158,7 +158,7 @@ class NewTaskHandler(_BaseApiV2Handler):
         task_ident = self.scheduler.new_task(
             Command(command_dto), self._auth_user
         )
-        self.write(json.dumps(to_dict(TaskIdentDto(task_ident))))
+        self.write(to_json(TaskIdentDto(task_ident)))
 
 
 class RunTaskHandler(_BaseApiV2Handler):
@@ -169,16 +169,11 @@ class RunTaskHandler(_BaseApiV2Handler):
             raise RequestBodyMissingError()
 
         command_dto = self._from_dict_exc_handled(CommandDto, self.json)
-        task_ident = self.scheduler.new_task(
-            Command(command_dto), self._auth_user
-        )
         try:
             self.write(
-                json.dumps(
-                    to_dict(
-                        await self.scheduler.wait_for_task(
-                            task_ident, self._auth_user
-                        )
+                to_json(
+                    await self.scheduler.run_task(
+                        Command(command_dto), self._auth_user
                     )
                 )
             )
@@ -193,11 +188,9 @@ class TaskInfoHandler(_BaseApiV2Handler):
         try:
             task_ident = self.get_query_argument("task_ident")
             self.write(
-                json.dumps(
-                    to_dict(
-                        self.scheduler.get_task(
-                            cast(str, task_ident), self._auth_user
-                        )
+                to_json(
+                    self.scheduler.get_task(
+                        cast(str, task_ident), self._auth_user
                     )
                 )
             )
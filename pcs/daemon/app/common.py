@@ -158,6 +158,12 @@ class BaseHandler(EnhanceHeadersMixin, RequestHandler):
     BaseHandler modifies HTTP headers
     """
 
+    def set_default_headers(self) -> None:
+        super().set_default_headers()
+        # RFC 7694: let clients know they can send gzip compressed requests,
+        # HTTP servers decompress them
+        self.set_header("Accept-Encoding", "gzip")
+
     def data_received(self, chunk: bytes) -> None:
         # abstract method `data_received` does need to be overridden. This
         # method should be implemented to handle streamed request data.
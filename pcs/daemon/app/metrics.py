@@ -0,0 +1,83 @@
+import json
+from typing import Any
+
+from tornado.web import Application, HTTPError, RequestHandler
+
+from pcs.daemon.app.auth_provider import (
+    ApiAuthProviderFactoryInterface,
+    ApiAuthProviderInterface,
+    NotAuthorizedException,
+)
+from pcs.daemon.metrics import UNMATCHED_ENDPOINT, MetricsRegistry
+
+from .common import BaseHandler, RoutesType
+
+
+class MetricsApplication(Application):
+    """
+    Application recording the duration of each handled request
+    """
+
+    def __init__(
+        self, *args: Any, metrics: MetricsRegistry, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._metrics = metrics
+
+    def log_request(self, handler: RequestHandler) -> None:
+        super().log_request(handler)
+        endpoint = (
+            UNMATCHED_ENDPOINT
+            if handler.get_status() == 404
+            else handler.request.path
+        )
+        self._metrics.observe_request(
+            f"{handler.request.method} {endpoint}",
+            handler.request.request_time(),
+        )
+
+
+class MetricsHandler(BaseHandler):
+    _auth_provider: ApiAuthProviderInterface
+    _metrics: MetricsRegistry
+
+    def initialize(
+        self,
+        api_auth_provider_factory: ApiAuthProviderFactoryInterface,
+        metrics: MetricsRegistry,
+    ) -> None:
+        super().initialize()
+        self._auth_provider = api_auth_provider_factory.create(self)
+        self._metrics = metrics
+
+    async def prepare(self) -> None:
+        try:
+            await self._auth_provider.auth_user()
+        except NotAuthorizedException as e:
+            raise HTTPError(401) from e
+
+    async def get(self) -> None:
+        self.add_header("Content-Type", "application/json")
+        self.write(json.dumps(self._metrics.to_dict()))
+
+
+def get_routes(
+    api_auth_provider_factory: ApiAuthProviderFactoryInterface,
+    metrics: MetricsRegistry,
+) -> RoutesType:
+    """
+    Returns mapping of URL routes to functions
+
+    api_auth_provider_factory -- metrics are meant for local monitoring only,
+        provide a factory authenticating unix socket connections
+    """
+    return [
+        (
+            "/metrics",
+            MetricsHandler,
+            dict(
+                api_auth_provider_factory=api_auth_provider_factory,
+                metrics=metrics,
+            ),
+        ),
+    ]
@@ -1,6 +1,19 @@
+import heapq
+import json
+import os
 from time import time as now
+from typing import Any
 
 from pcs.common.tools import get_unique_uuid
+from pcs.daemon import log
+
+# Access times of sessions are saved to the session file at most once in this
+# number of seconds, so that the file is not written on every request.
+# Sessions loaded from the file expire at most this number of seconds sooner.
+_ACCESS_SAVE_INTERVAL = 60
+# The session file is rewritten with current sessions only once it contains
+# this many records and at least twice as many records as there are sessions
+_COMPACT_MIN_RECORDS = 1000
 
 
 class Session:
@@ -8,6 +21,7 @@ class Session:
         self,
         sid: str,
         username: str,
+        last_access: float | None = None,
     ) -> None:
         # Session id propagated via cookies.
         self.__sid = sid
@@ -15,7 +29,10 @@ class Session:
         # authentication succeeded.
         self.__username = username
         # The moment of the last access. The only muttable attribute.
-        self.refresh()
+        if last_access is None:
+            self.refresh()
+        else:
+            self.__last_access = last_access
 
     @property
     def username(self) -> str:
@@ -27,6 +44,10 @@ class Session:
         self.refresh()
         return self.__sid
 
+    @property
+    def last_access(self) -> float:
+        return self.__last_access
+
     def refresh(self) -> None:
         """
         Set the time of last access to now.
@@ -36,35 +57,205 @@ class Session:
     def was_unused_last(self, seconds: int) -> bool:
         return now() > self.__last_access + seconds
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export the session to be saved, the session is not refreshed
+        """
+        return {
+            "sid": self.__sid,
+            "username": self.__username,
+            "last_access": self.__last_access,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Session":
+        """
+        Create a session saved by to_dict, raise ValueError, KeyError or
+        TypeError for invalid data
+        """
+        return cls(
+            str(data["sid"]), str(data["username"]), float(data["last_access"])
+        )
+
 
 class Storage:
-    def __init__(self, lifetime_seconds: int) -> None:
+    """
+    Sessions of web UI users
+
+    Sessions expire when they have not been used for lifetime_seconds. Each
+    session is put to a heap ordered by the time it would expire if it was
+    not used anymore. Only sessions at the top of the heap are checked for
+    expiration, sessions which have been used meanwhile are put back with a
+    new expiration time.
+
+    If a session file is specified, sessions are loaded from it and all
+    changes are appended to it, so that sessions are kept when pcsd
+    restarts.
+    """
+
+    def __init__(
+        self, lifetime_seconds: int, session_file: str | None = None
+    ) -> None:
+        """
+        lifetime_seconds -- drop sessions unused for this number of seconds
+        session_file -- path to a file to keep sessions in, None to keep them
+            in memory only
+        """
         self.__sessions: dict[str, Session] = {}
         self.__lifetime_seconds = lifetime_seconds
+        # heap of (expiration time, sid), an entry may be outdated if the
+        # session has been used or destroyed since the entry was added
+        self.__expiration_heap: list[tuple[float, str]] = []
+        self.__session_file = session_file
+        self.__session_file_fd: int | None = None
+        self.__session_file_records = 0
+        # access times of sessions saved in the session file
+        self.__saved_access: dict[str, float] = {}
+        if session_file:
+            self.__load(session_file)
 
     def get(self, sid: str) -> Session | None:
         self.drop_expired()
         session = self.__sessions.get(sid)
         if session is not None:
             session.refresh()
+            if (
+                session.last_access - self.__saved_access.get(sid, 0)
+                >= _ACCESS_SAVE_INTERVAL
+            ):
+                self.__save_session(sid, session)
         return session
 
     def drop_expired(self) -> None:
-        obsolete_sid_list = [
-            sid
-            for sid, session in self.__sessions.items()
-            if session.was_unused_last(self.__lifetime_seconds)
-        ]
-        for sid in obsolete_sid_list:
-            self.destroy(sid)
+        current_time = now()
+        while (
+            self.__expiration_heap
+            and self.__expiration_heap[0][0] < current_time
+        ):
+            _, sid = heapq.heappop(self.__expiration_heap)
+            session = self.__sessions.get(sid)
+            if session is None:
+                # the session has been destroyed
+                continue
+            if session.was_unused_last(self.__lifetime_seconds):
+                # Expired sessions are not removed from the session file,
+                # they are dropped when the file is loaded.
+                del self.__sessions[sid]
+                self.__saved_access.pop(sid, None)
+            else:
+                self.__push_expiration(sid, session)
 
     def destroy(self, sid: str) -> None:
         if sid in self.__sessions:
             del self.__sessions[sid]
+            self.__saved_access.pop(sid, None)
+            self.__append_record({"sid": sid, "destroyed": True})
 
     def login(self, username: str) -> Session:
         self.drop_expired()
-        sid = get_unique_uuid(tuple(self.__sessions.keys()))
+        sid = get_unique_uuid(self.__sessions.keys())
         session = Session(sid, username)
         self.__sessions[sid] = session
+        self.__push_expiration(sid, session)
+        self.__save_session(sid, session)
         return session
+
+    def __push_expiration(self, sid: str, session: Session) -> None:
+        heapq.heappush(
+            self.__expiration_heap,
+            (session.last_access + self.__lifetime_seconds, sid),
+        )
+
+    def __save_session(self, sid: str, session: Session) -> None:
+        if self.__session_file_fd is None:
+            return
+        self.__saved_access[sid] = session.last_access
+        self.__append_record(session.to_dict())
+        if self.__session_file_records >= max(
+            _COMPACT_MIN_RECORDS, 2 * len(self.__sessions)
+        ):
+            self.__compact()
+
+    def __append_record(self, record: dict[str, Any]) -> None:
+        if self.__session_file_fd is None:
+            return
+        try:
+            # one write to a file opened for appending, so that the record is
+            # never split
+            os.write(
+                self.__session_file_fd,
+                (json.dumps(record) + "\n").encode("utf-8"),
+            )
+        except OSError as e:
+            self.__disable_session_file(e)
+            return
+        self.__session_file_records += 1
+
+    def __load(self, session_file: str) -> None:
+        try:
+            with open(session_file, encoding="utf-8") as file:
+                for line in file:
+                    self.__load_record(line)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.pcsd.warning("Unable to load web UI sessions: %s", e)
+        self.drop_expired()
+        self.__compact()
+
+    def __load_record(self, line: str) -> None:
+        try:
+            record = json.loads(line)
+            sid = str(record["sid"])
+            if record.get("destroyed"):
+                self.__sessions.pop(sid, None)
+                self.__saved_access.pop(sid, None)
+                return
+            session = Session.from_dict(record)
+        except (ValueError, KeyError, TypeError):
+            # a record not written completely when pcsd stopped
+            return
+        if sid not in self.__sessions:
+            self.__push_expiration(sid, session)
+        self.__sessions[sid] = session
+        self.__saved_access[sid] = session.last_access
+
+    def __compact(self) -> None:
+        """
+        Rewrite the session file with current sessions only
+        """
+        if self.__session_file is None:
+            return
+        if self.__session_file_fd is not None:
+            os.close(self.__session_file_fd)
+            self.__session_file_fd = None
+        tmp_path = f"{self.__session_file}.tmp"
+        try:
+            tmp_fd = os.open(
+                tmp_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600
+            )
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as tmp_file:
+                for session in self.__sessions.values():
+                    tmp_file.write(json.dumps(session.to_dict()) + "\n")
+            os.replace(tmp_path, self.__session_file)
+            self.__session_file_fd = os.open(
+                self.__session_file, os.O_WRONLY | os.O_APPEND
+            )
+        except OSError as e:
+            self.__disable_session_file(e)
+            return
+        self.__saved_access = {
+            sid: session.last_access for sid, session in self.__sessions.items()
+        }
+        self.__session_file_records = len(self.__sessions)
+
+    def __disable_session_file(self, error: OSError) -> None:
+        log.pcsd.warning(
+            "Unable to save web UI sessions, sessions will not be kept when "
+            "pcsd restarts: %s",
+            error,
+        )
+        if self.__session_file_fd is not None:
+            os.close(self.__session_file_fd)
+        self.__session_file_fd = None
+        self.__session_file = None
@@ -1,22 +1,32 @@
+import asyncio
+import datetime
+import json
 import multiprocessing as mp
+import queue
 import sys
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import handlers
 from multiprocessing.pool import worker as mp_worker_init  # type: ignore
-from queue import Empty
+
+from lxml import etree
 
 from pcs import settings
 from pcs.common.async_tasks.dto import TaskResultDto
-from pcs.common.async_tasks.types import TaskKillReason
-from pcs.common.tools import get_unique_uuid
+from pcs.common.async_tasks.types import TaskFinishType, TaskKillReason
+from pcs.common.interface.dto import to_dict
+from pcs.common.tools import get_unique_uuid, xml_fromstring
 from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.log import pcsd as pcsd_logger
+from pcs.daemon.metrics import MetricsRegistry
 from pcs.lib.auth.types import AuthUser
 
 from .task import Task, TaskConfig, TaskState, UnknownMessageError
-from .worker.executor import task_executor, worker_init
-from .worker.types import Message
+from .task_register import TaskRegister
+from .worker.command_mapping import COMMAND_MAP
+from .worker.communicator import WorkerCommunicator
+from .worker.executor import run_command, task_executor, worker_init
+from .worker.types import Message, TaskFinished
 
 
 class TaskNotFoundError(Exception):
@@ -37,21 +47,56 @@ class SchedulerConfig:
     )
     worker_reset_limit: int = settings.pcsd_worker_reset_limit
     deadlock_threshold_timeout: int = settings.pcsd_deadlock_threshold_timeout
+    inline_worker_count: int = settings.pcsd_inline_worker_count
+    inline_command_timeout: int = settings.pcsd_inline_command_timeout
+    shared_result_ttl: int = settings.pcsd_shared_result_ttl_seconds
     task_config: TaskConfig = TaskConfig()
 
 
+# command with its parameters and options, is_legacy_command, username, groups
+_ShareKey = tuple[str, bool, str, tuple[str, ...]]
+# admin_epoch, epoch, num_updates
+_CibVersion = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _SharedResult:
+    cib_version: _CibVersion
+    expires_at: datetime.datetime
+    result: TaskResultDto
+
+
+def _get_share_key(command: Command, auth_user: AuthUser) -> _ShareKey:
+    return (
+        json.dumps(to_dict(command.command_dto), sort_keys=True),
+        command.is_legacy_command,
+        auth_user.username,
+        tuple(sorted(auth_user.groups)),
+    )
+
+
 class Scheduler:
     """
     Task management core with an interface for the REST API
     """
 
-    def __init__(self, config: SchedulerConfig) -> None:
+    def __init__(
+        self, config: SchedulerConfig, metrics: MetricsRegistry | None = None
+    ) -> None:
         """
         worker_count -- number of worker processes to use
         worker_reset_limit -- number of tasks a worker will process
             before restarting itself
+        inline_worker_count -- number of threads running read-only commands
+            in pcsd, 0 to run all commands in worker processes
+        inline_command_timeout -- seconds after which external processes run
+            by read-only commands in pcsd threads are killed
+        shared_result_ttl -- seconds to reuse results of shareable commands
+            based on the CIB while the CIB does not change, 0 to not reuse them
+        metrics -- store durations of executed commands to the registry
         """
         self._config = config
+        self._metrics = metrics
         self._proc_pool_manager = mp.Manager()
         self._worker_message_q = self._proc_pool_manager.Queue()
         self._logger = pcsd_logger
@@ -64,7 +109,18 @@ class Scheduler:
             initializer=worker_init,
             initargs=[self._worker_message_q, self._logging_q],
         )
-        self._task_register: dict[str, Task] = {}
+        self._inline_pool = (
+            ThreadPoolExecutor(
+                max_workers=self._config.inline_worker_count,
+                thread_name_prefix="pcsd-inline",
+            )
+            if self._config.inline_worker_count > 0
+            else None
+        )
+        self._task_register = TaskRegister()
+        # running tasks of shareable commands
+        self._shared_tasks: dict[_ShareKey, str] = {}
+        self._shared_results: dict[_ShareKey, _SharedResult] = {}
         self._logger.info("Scheduler was successfully initialized.")
         self._logger.debug(
             "Scheduler initialized with config: %s", self._config
@@ -86,7 +142,7 @@ class Scheduler:
         task = self._return_task(task_ident)
         self._check_user(task, auth_user)
         if task.state == TaskState.FINISHED:
-            task.request_deletion()
+            self._request_deletion(task)
         return task.to_dto()
 
     @staticmethod
@@ -100,9 +156,128 @@ class Scheduler:
         task = self._return_task(task_ident)
         self._check_user(task, auth_user)
         await task.wait_until_finished()
-        task.request_deletion()
+        self._request_deletion(task)
         return task.to_dto()
 
+    async def run_task(
+        self, command: Command, auth_user: AuthUser
+    ) -> TaskResultDto:
+        """
+        Run a command and wait for its result
+
+        Identical requests of a shareable command, arriving while the command
+        is running, wait for the running task instead of creating new ones.
+        Results of shareable commands based on the CIB are reused for
+        shared_result_ttl seconds unless the CIB changes.
+        """
+        cmd = COMMAND_MAP.get(command.command_dto.command_name)
+        if cmd is None or not cmd.is_shareable:
+            return await self.wait_for_task(
+                self.new_task(command, auth_user), auth_user
+            )
+
+        key = _get_share_key(command, auth_user)
+        cib_version = None
+        if cmd.is_cib_based and self._config.shared_result_ttl > 0:
+            # The version is loaded before the command is run. If the CIB
+            # changes meanwhile, the result is stored with the old version and
+            # it is never reused.
+            cib_version = await self._get_cib_version()
+            shared_result = self._shared_results.get(key)
+            if (
+                cib_version is not None
+                and shared_result is not None
+                and shared_result.cib_version == cib_version
+                and shared_result.expires_at > datetime.datetime.now()
+            ):
+                self._logger.debug(
+                    "Reusing result of task %s",
+                    shared_result.result.task_ident,
+                )
+                return shared_result.result
+
+        shared_task_ident = self._shared_tasks.get(key)
+        if shared_task_ident is not None and self._is_shareable_task(
+            shared_task_ident
+        ):
+            self._logger.debug(
+                "Sharing task %s for command %s",
+                shared_task_ident,
+                command.command_dto.command_name,
+            )
+            task_ident = shared_task_ident
+            is_new_task = False
+        else:
+            task_ident = self.new_task(command, auth_user)
+            self._shared_tasks[key] = task_ident
+            is_new_task = True
+        try:
+            task_result = await self.wait_for_task(task_ident, auth_user)
+        finally:
+            if self._shared_tasks.get(key) == task_ident:
+                del self._shared_tasks[key]
+
+        # Only the request which has created the task knows the CIB version
+        # loaded before running the command.
+        if (
+            is_new_task
+            and cib_version is not None
+            and task_result.task_finish_type == TaskFinishType.SUCCESS
+        ):
+            self._store_shared_result(key, cib_version, task_result)
+        return task_result
+
+    def _is_shareable_task(self, task_ident: str) -> bool:
+        return (
+            task_ident in self._task_register
+            and not self._task_register[task_ident].is_kill_requested()
+        )
+
+    def _store_shared_result(
+        self, key: _ShareKey, cib_version: _CibVersion, result: TaskResultDto
+    ) -> None:
+        now = datetime.datetime.now()
+        self._shared_results = {
+            stored_key: shared_result
+            for stored_key, shared_result in self._shared_results.items()
+            if shared_result.expires_at > now
+        }
+        self._shared_results[key] = _SharedResult(
+            cib_version,
+            now + datetime.timedelta(seconds=self._config.shared_result_ttl),
+            result,
+        )
+
+    async def _get_cib_version(self) -> _CibVersion | None:
+        """
+        Return version of the live CIB, None if it cannot be loaded
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                settings.cibadmin_exec,
+                "--local",
+                "--query",
+                "--xpath=/cib",
+                "--no-children",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+        except OSError as e:
+            self._logger.debug("Unable to load CIB version: %s", e)
+            return None
+        if process.returncode != 0:
+            return None
+        try:
+            cib_el = xml_fromstring(stdout.decode("utf-8"))
+            return (
+                int(str(cib_el.get("admin_epoch"))),
+                int(str(cib_el.get("epoch"))),
+                int(str(cib_el.get("num_updates"))),
+            )
+        except (etree.XMLSyntaxError, UnicodeDecodeError, ValueError):
+            return None
+
     def kill_task(self, task_ident: str, auth_user: AuthUser) -> None:
         """
         Terminates the specified task
@@ -115,6 +290,11 @@ class Scheduler:
 
         self._logger.debug("User is killing a task %s.", task_ident)
         task.request_kill(TaskKillReason.USER)
+        self._task_register.touch(task)
+
+    def _request_deletion(self, task: Task) -> None:
+        task.request_deletion()
+        self._task_register.touch(task)
 
     def new_task(self, command: Command, auth_user: AuthUser) -> str:
         """
@@ -122,11 +302,10 @@ class Scheduler:
         :param command: Command and its parameters
         :return: Task identifier
         """
-        task_ident = get_unique_uuid(tuple(self._task_register.keys()))
+        task_ident = get_unique_uuid(self._task_register.keys())
 
-        self._task_register[task_ident] = Task(
-            task_ident, command, auth_user, self._config.task_config
-        )
+        task = Task(task_ident, command, auth_user, self._config.task_config)
+        self._task_register.add(task)
         self._logger.debug(
             (
                 "New task %s created (command: %s, parameters: %s, "
@@ -137,21 +316,91 @@ class Scheduler:
             command.command_dto.params,
             command.is_legacy_command,
         )
+        if self._is_inline_command(command):
+            self._run_task_inline(task)
         return task_ident
 
-    def _is_possibly_dead_locked(self) -> bool:
-        counter: dict[TaskState, list[Task]] = defaultdict(list)
-        for task in self._task_register.values():
-            counter[task.state].append(task)
-
+    def _is_inline_command(self, command: Command) -> bool:
+        cmd = COMMAND_MAP.get(command.command_dto.command_name)
         return (
-            len(counter[TaskState.CREATED]) + len(counter[TaskState.QUEUED]) > 0
-            and (self._config.worker_count + len(self._single_use_process_pool))
-            <= len(counter[TaskState.EXECUTED])
-            and all(
-                task.is_defunct(self._config.deadlock_threshold_timeout)
-                for task in counter[TaskState.EXECUTED]
+            self._inline_pool is not None
+            and cmd is not None
+            and cmd.is_read_only
+        )
+
+    def _run_task_inline(self, task: Task) -> None:
+        """
+        Run a read-only command in a thread right away instead of waiting for
+        the next scheduler pass and a free worker process
+        """
+        if self._inline_pool is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Results could not be delivered back to the loop, leave the task
+            # for a worker process.
+            return
+        message_q: queue.SimpleQueue[Message] = queue.SimpleQueue()
+        future = self._inline_pool.submit(
+            run_command,
+            self._logger,
+            WorkerCommunicator(message_q),
+            task.to_worker_command(),
+            # Inline tasks cannot be killed, make sure a hung process does not
+            # block the thread forever.
+            command_timeout=self._config.inline_command_timeout,
+        )
+        task.state = TaskState.EXECUTED
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(
+                self._finish_inline_task, task, message_q
+            )
+        )
+
+    def _finish_inline_task(
+        self, task: Task, message_q: queue.SimpleQueue[Message]
+    ) -> None:
+        while True:
+            try:
+                message = message_q.get_nowait()
+            except queue.Empty:
+                break
+            if task.state == TaskState.FINISHED:
+                # the task has been killed meanwhile, drop its results
+                return
+            self._deliver_message(task, message)
+        if task.state != TaskState.FINISHED:
+            # the thread ended without sending the final message
+            self._deliver_message(
+                task,
+                Message(
+                    task.task_ident,
+                    TaskFinished(TaskFinishType.UNHANDLED_EXCEPTION, None),
+                ),
             )
+
+    def _is_possibly_dead_locked(self) -> bool:
+        register = self._task_register
+        if (
+            register.count_by_state(TaskState.CREATED)
+            + register.count_by_state(TaskState.QUEUED)
+            == 0
+        ):
+            return False
+        # Inline tasks do not occupy worker processes, they cannot prevent
+        # waiting tasks from being executed.
+        worker_task_list = [
+            task
+            for task in register.get_by_state(TaskState.EXECUTED)
+            if task.is_executed_in_worker
+        ]
+        process_count = self._config.worker_count + len(
+            self._single_use_process_pool
+        )
+        return process_count <= len(worker_task_list) and all(
+            task.is_defunct(self._config.deadlock_threshold_timeout)
+            for task in worker_task_list
         )
 
     def _schedule_task(self, task: Task) -> None:
@@ -174,7 +423,11 @@ class Scheduler:
         task.state = TaskState.QUEUED
 
     async def _process_tasks(self) -> None:
-        for task in list(self._task_register.values()):
+        # Only tasks which have changed or whose timeouts may have run out are
+        # processed, nothing can happen to the other tasks until then.
+        for task in self._task_register.pop_tasks_to_process(
+            datetime.datetime.now()
+        ):
             await self._process_task(task)
 
     async def _process_task(self, task: Task) -> None:
@@ -186,8 +439,15 @@ class Scheduler:
             task.request_deletion()
         if task.state != TaskState.FINISHED and task.is_kill_requested():
             task.kill()
+            if task.state == TaskState.EXECUTED:
+                # the worker has not been killed yet, try again next time
+                self._task_register.touch(task)
         if task.is_deletion_requested():
-            del self._task_register[task.task_ident]
+            self._task_register.remove(task.task_ident)
+            return
+        check_at = task.get_next_check_time()
+        if check_at is not None:
+            self._task_register.schedule_check(task, check_at)
 
     def _spawn_new_single_use_worker(self) -> None:
         additional_process = mp.Process(
@@ -250,7 +510,7 @@ class Scheduler:
         for _ in range(self._worker_message_q.qsize()):
             try:
                 message: Message = self._worker_message_q.get_nowait()
-            except Empty:
+            except queue.Empty:
                 # This may happen when messages are on the way but not quite
                 # delivered yet. We'll get them later.
                 return received_total
@@ -271,17 +531,28 @@ class Scheduler:
                     message.task_ident,
                 )
                 continue
-            try:
-                task.receive_message(message)
-            except UnknownMessageError as exc:
-                self._logger.critical(
-                    'Message with unknown payload type "%s" was received by '
-                    "the scheduler.",
-                    exc.payload_type,
-                )
-                task.request_kill(TaskKillReason.INTERNAL_MESSAGING_ERROR)
+            self._deliver_message(task, message)
         return received_total
 
+    def _deliver_message(self, task: Task, message: Message) -> None:
+        self._task_register.touch(task)
+        try:
+            task.receive_message(message)
+        except UnknownMessageError as exc:
+            self._logger.critical(
+                'Message with unknown payload type "%s" was received by '
+                "the scheduler.",
+                exc.payload_type,
+            )
+            task.request_kill(TaskKillReason.INTERNAL_MESSAGING_ERROR)
+            return
+        if self._metrics is not None and isinstance(
+            message.payload, TaskFinished
+        ):
+            duration = task.execution_duration
+            if duration is not None:
+                self._metrics.observe_command(task.command_name, duration)
+
     def _return_task(self, task_ident: str) -> Task:
         """
         Helper method for accessing tasks in the task register
@@ -299,4 +570,6 @@ class Scheduler:
         """
         self._worker_log_listener.stop()
         self._proc_pool.terminate()
+        if self._inline_pool is not None:
+            self._inline_pool.shutdown(wait=False, cancel_futures=True)
         self._logger.info("Scheduler is correctly terminated.")
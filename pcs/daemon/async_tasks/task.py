@@ -2,7 +2,7 @@ import datetime
 import os
 import signal
 from asyncio import Event
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -46,6 +46,9 @@ class TaskConfig:
     deletion_timeout: int = settings.task_deletion_timeout_seconds
 
 
+StateObserver = Callable[["Task", TaskState], None]
+
+
 class Task(ImplementsToDto):
     """
     Task's representation in the scheduler
@@ -69,9 +72,11 @@ class Task(ImplementsToDto):
         self._kill_reason: TaskKillReason | None = None
         self._last_message_at: datetime.datetime | None = None
         self._execution_started_at: datetime.datetime | None = None
-        self._worker_pid: int = -1
+        # None for tasks not running in a worker process
+        self._worker_pid: int | None = None
         self._finished_event = Event()
         self._to_delete_timestamp: datetime.datetime | None = None
+        self._state_observer: StateObserver | None = None
 
     @property
     def state(self) -> TaskState:
@@ -95,11 +100,21 @@ class Task(ImplementsToDto):
                 )
         except ValueError as e:
             raise AssertionError(f"Invalid Task state: {state}") from e
+        old_state = self._state
         self._state = state
         if self.state == TaskState.FINISHED:
             self._finished_event.set()
         elif self.state == TaskState.EXECUTED:
             self._execution_started_at = datetime.datetime.now()
+        if self._state_observer is not None:
+            self._state_observer(self, old_state)
+
+    def set_state_observer(self, observer: StateObserver | None) -> None:
+        """
+        Set a function to be called with the task and its previous state each
+        time the task state changes, None removes the observer
+        """
+        self._state_observer = observer
 
     @property
     def task_ident(self) -> str:
@@ -109,6 +124,36 @@ class Task(ImplementsToDto):
     def auth_user(self) -> AuthUser:
         return self._auth_user
 
+    @property
+    def command_name(self) -> str:
+        return self._command.command_dto.command_name
+
+    @property
+    def is_executed_in_worker(self) -> bool:
+        """
+        Return True if the task is being executed in a worker process, False
+        if it is not executed or runs inline in a pcsd thread
+        """
+        return (
+            self._state == TaskState.EXECUTED and self._worker_pid is not None
+        )
+
+    @property
+    def execution_duration(self) -> float | None:
+        """
+        Return seconds spent executing the task, None if the task has not been
+        executed and finished
+        """
+        if (
+            self._state != TaskState.FINISHED
+            or self._execution_started_at is None
+            or self._last_message_at is None
+        ):
+            return None
+        return (
+            self._last_message_at - self._execution_started_at
+        ).total_seconds()
+
     def wait_until_finished(self) -> Awaitable[Any]:
         return self._finished_event.wait()
 
@@ -140,6 +185,28 @@ class Task(ImplementsToDto):
             )
         return False
 
+    def get_next_check_time(self) -> datetime.datetime | None:
+        """
+        Return the earliest time at which the task may become defunct,
+        abandoned or due for deletion, None if that cannot happen without
+        the task receiving a message or changing its state
+        """
+        check_times = []
+        if self._to_delete_timestamp is not None:
+            check_times.append(self._to_delete_timestamp)
+        if self.state == TaskState.EXECUTED:
+            timeout = self._config.unresponsive_timeout
+        elif self.state == TaskState.FINISHED:
+            timeout = self._config.abandoned_timeout
+        else:
+            timeout = None
+        last_updated_at = self._get_last_updated_timestamp()
+        if timeout is not None and last_updated_at is not None:
+            check_times.append(
+                last_updated_at + datetime.timedelta(seconds=timeout)
+            )
+        return min(check_times, default=None)
+
     def is_abandoned(self) -> bool:
         """
         Checks that the task information were not queried after its finish
@@ -217,14 +284,16 @@ class Task(ImplementsToDto):
         CREATED tasks are already prevented from being scheduled by requesting
         to kill them, only their state gets corrected here.
         EXECUTED tasks are terminated by by sending SIGTERM to their worker
-        process and their state is changed here.
+        process and their state is changed here. Tasks running in pcsd
+        threads cannot be terminated, only their state is changed and their
+        result is dropped once they finish.
         """
         if self.state in (
             TaskState.QUEUED,
             TaskState.FINISHED,
         ):
             return
-        if self.state == TaskState.EXECUTED:
+        if self.state == TaskState.EXECUTED and self._worker_pid is not None:
             try:
                 os.kill(self._worker_pid, signal.SIGTERM)
             except ProcessLookupError:
@@ -266,7 +335,8 @@ class Task(ImplementsToDto):
         self._result = message_payload.result
         self._set_state(TaskState.FINISHED)
         self._task_finish_type = message_payload.task_finish_type
-        os.kill(self._worker_pid, signal.SIGCONT)
+        if self._worker_pid is not None:
+            os.kill(self._worker_pid, signal.SIGCONT)
 
     def _store_reports(self, message_payload: ReportItemDto) -> None:
         """
@@ -0,0 +1,108 @@
+import datetime
+import heapq
+from collections.abc import Iterable, Iterator, Mapping
+
+from pcs.common.async_tasks.types import TaskState
+
+from .task import Task
+
+
+class TaskRegister(Mapping[str, Task]):
+    """
+    Tasks of the scheduler indexed by their identifiers and states
+
+    The register also keeps track of tasks which need to be processed by the
+    scheduler, so that the scheduler does not need to check all tasks in each
+    pass. A task needs to be processed when something has happened to it
+    (touch) or when one of its timeouts may have run out (schedule_check).
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, Task] = {}
+        self._tasks_by_state: dict[TaskState, dict[str, Task]] = {
+            state: {} for state in TaskState
+        }
+        # dict is used as an ordered set
+        self._touched_tasks: dict[str, Task] = {}
+        # heap of (check time, task_ident), an entry is valid only if its time
+        # matches the time stored in _check_times for the task
+        self._check_heap: list[tuple[datetime.datetime, str]] = []
+        self._check_times: dict[str, datetime.datetime] = {}
+
+    def __getitem__(self, task_ident: str) -> Task:
+        return self._tasks[task_ident]
+
+    def __contains__(self, task_ident: object) -> bool:
+        return task_ident in self._tasks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, task: Task) -> None:
+        """
+        Put a new task to the register, the task gets processed in the next
+        scheduler pass
+        """
+        self._tasks[task.task_ident] = task
+        self._tasks_by_state[task.state][task.task_ident] = task
+        task.set_state_observer(self._on_state_changed)
+        self.touch(task)
+
+    def remove(self, task_ident: str) -> None:
+        task = self._tasks.pop(task_ident)
+        del self._tasks_by_state[task.state][task_ident]
+        task.set_state_observer(None)
+        self._touched_tasks.pop(task_ident, None)
+        # entries in the heap are dropped once they get to its top
+        self._check_times.pop(task_ident, None)
+
+    def _on_state_changed(self, task: Task, old_state: TaskState) -> None:
+        del self._tasks_by_state[old_state][task.task_ident]
+        self._tasks_by_state[task.state][task.task_ident] = task
+        self.touch(task)
+
+    def count_by_state(self, state: TaskState) -> int:
+        return len(self._tasks_by_state[state])
+
+    def get_by_state(self, state: TaskState) -> Iterable[Task]:
+        """
+        Return a live view of tasks in the specified state, the view must not
+        be iterated over while states of the tasks are being changed
+        """
+        return self._tasks_by_state[state].values()
+
+    def touch(self, task: Task) -> None:
+        """
+        Mark a task to be processed in the next scheduler pass
+        """
+        self._touched_tasks[task.task_ident] = task
+
+    def schedule_check(self, task: Task, check_at: datetime.datetime) -> None:
+        """
+        Mark a task to be processed in the first scheduler pass after check_at
+        """
+        scheduled_at = self._check_times.get(task.task_ident)
+        if scheduled_at is not None and scheduled_at <= check_at:
+            # The task gets processed sooner anyway, it is supposed to be
+            # scheduled again then.
+            return
+        self._check_times[task.task_ident] = check_at
+        heapq.heappush(self._check_heap, (check_at, task.task_ident))
+
+    def pop_tasks_to_process(self, now: datetime.datetime) -> list[Task]:
+        """
+        Return touched tasks and tasks with their check time due, the tasks
+        are not returned again until they are touched or scheduled again
+        """
+        task_dict = self._touched_tasks
+        self._touched_tasks = {}
+        while self._check_heap and self._check_heap[0][0] <= now:
+            check_at, task_ident = heapq.heappop(self._check_heap)
+            if self._check_times.get(task_ident) != check_at:
+                continue
+            del self._check_times[task_ident]
+            task_dict[task_ident] = self._tasks[task_ident]
+        return list(task_dict.values())
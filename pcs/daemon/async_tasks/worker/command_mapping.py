@@ -35,6 +35,16 @@ from pcs.lib.permissions.types import PermissionRequiredType as p
 class _Cmd:
     cmd: Callable[..., Any]
     required_permission: p
+    # Quick commands which do not change anything may be run in a thread of
+    # pcsd instead of a worker process. Do not set for commands which may run
+    # for a long time, they would block other quick commands.
+    is_read_only: bool = False
+    # Identical requests of commands which do not change anything, arriving
+    # while one of them is running, are run only once and share its result.
+    is_shareable: bool = False
+    # Results of shareable commands depend only on the CIB including its
+    # status section. They may be reused until the CIB changes.
+    is_cib_based: bool = False
 
 
 COMMAND_MAP: Mapping[str, _Cmd] = {
@@ -97,6 +107,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "alert.get_config_dto": _Cmd(
         cmd=alert.get_config_dto,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     "alert.remove_alert": _Cmd(
         cmd=alert.remove_alert,
@@ -153,10 +165,14 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.get_corosync_conf": _Cmd(
         cmd=cluster.get_corosync_conf,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "cluster.get_corosync_conf_struct": _Cmd(
         cmd=cluster.get_corosync_conf_struct,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "cluster.get_host_daemons_info": _Cmd(
         cmd=cluster.get_host_daemons_info,
@@ -165,10 +181,14 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster.get_permissions": _Cmd(
         cmd=cluster.get_permissions,
         required_permission=p.GRANT,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "cluster.get_permissions_metadata": _Cmd(
         cmd=cluster.get_permissions_metadata,
         required_permission=p.GRANT,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "cluster.node_clear": _Cmd(
         cmd=cluster.node_clear,
@@ -209,10 +229,13 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "cluster_property.get_properties": _Cmd(
         cmd=cluster_property.get_properties,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     "cluster_property.get_properties_metadata": _Cmd(
         cmd=cluster_property.get_properties_metadata,
         required_permission=p.READ,
+        is_shareable=True,
     ),
     "cluster_property.set_properties": _Cmd(
         cmd=cluster_property.set_properties,
@@ -273,6 +296,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "constraint.get_config": _Cmd(
         cmd=constraint.common.get_config,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     "fencing_topology.add_level": _Cmd(
         cmd=fencing_topology.add_level,
@@ -281,6 +306,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "fencing_topology.get_config_dto": _Cmd(
         cmd=fencing_topology.get_config_dto,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     "fencing_topology.remove_all_levels": _Cmd(
         cmd=fencing_topology.remove_all_levels,
@@ -329,6 +356,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "pcs_cfgsync.get_configs": _Cmd(
         cmd=pcs_cfgsync.get_configs,
         required_permission=p.FULL,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "pcs_cfgsync.set_configs": _Cmd(
         cmd=pcs_cfgsync.set_configs,
@@ -373,11 +402,14 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "quorum.status_text": _Cmd(
         cmd=quorum.status_text,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     # deprecated, API v0 compatibility
     "qdevice.qdevice_net_get_ca_certificate": _Cmd(
         cmd=qdevice.qdevice_net_get_ca_certificate,
         required_permission=p.READ,
+        is_read_only=True,
     ),
     "qdevice.qdevice_net_sign_certificate_request": _Cmd(
         cmd=qdevice.qdevice_net_sign_certificate_request,
@@ -414,11 +446,15 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource_agent.list_ocf_providers": _Cmd(
         cmd=resource_agent.list_ocf_providers,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     # deprecated, API v1 compatibility
     "resource_agent.list_standards": _Cmd(
         cmd=resource_agent.list_standards,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "resource.ban": _Cmd(
         cmd=resource.ban,
@@ -448,6 +484,10 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
         cmd=resource.disable_simulate,
         required_permission=p.READ,
     ),
+    "resource.disable_simulate_bulk": _Cmd(
+        cmd=resource.disable_simulate_bulk,
+        required_permission=p.READ,
+    ),
     "resource.enable": _Cmd(
         cmd=resource.enable,
         required_permission=p.WRITE,
@@ -459,6 +499,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "resource.get_configured_resources": _Cmd(
         cmd=resource.get_configured_resources,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     "resource.group_add": _Cmd(
         cmd=resource.group_add,
@@ -543,6 +585,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "sbd.get_node_sbd_config_text": _Cmd(
         cmd=sbd.get_node_sbd_config_text,
         required_permission=p.READ,
+        is_read_only=True,
+        is_shareable=True,
     ),
     "sbd.set_node_sbd_config_text": _Cmd(
         cmd=sbd.set_node_sbd_config_text,
@@ -560,10 +604,13 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "status.full_cluster_status_plaintext": _Cmd(
         cmd=status.full_cluster_status_plaintext,
         required_permission=p.READ,
+        is_shareable=True,
     ),
     "status.resources_status": _Cmd(
         cmd=status.resources_status,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     # deprecated, API v1 compatibility
     "stonith_agent.describe_agent": _Cmd(
@@ -582,6 +629,8 @@ COMMAND_MAP: Mapping[str, _Cmd] = {
     "tag.get_config_dto": _Cmd(
         cmd=tag.get_config_dto,
         required_permission=p.READ,
+        is_shareable=True,
+        is_cib_based=True,
     ),
     # CMDs allowed in pcs_internal but not exposed via REST API:
     # "services.get_services_info": _Cmd(services.get_services_info,
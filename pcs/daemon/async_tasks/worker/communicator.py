@@ -1,12 +1,16 @@
-import multiprocessing as mp
 from threading import Lock
+from typing import TYPE_CHECKING
 
 from .types import Message
 
+if TYPE_CHECKING:
+    import multiprocessing as mp
+    import queue
+
 
 class WorkerCommunicator:
-    def __init__(self, queue: mp.Queue):
-        self._queue = queue
+    def __init__(self, message_q: "mp.Queue | queue.SimpleQueue[Message]"):
+        self._queue = message_q
         self._lock = Lock()
         self._terminate = False
 
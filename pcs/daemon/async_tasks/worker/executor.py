@@ -3,6 +3,8 @@ import inspect
 import multiprocessing as mp
 import os
 import signal
+from collections.abc import Callable
+from functools import lru_cache
 from logging import Logger, getLogger
 from typing import Any
 
@@ -95,6 +97,26 @@ def task_executor(task: WorkerCommand) -> None:
             TaskExecuted(os.getpid()),
         )
     )
+    run_command(logger, worker_com, task)
+    _pause_worker()
+
+
+def run_command(
+    logger: Logger,
+    communicator: WorkerCommunicator,
+    task: WorkerCommand,
+    command_timeout: float | None = None,
+) -> None:
+    """
+    Run a library command of a task, send its reports and a TaskFinished
+    message through the communicator
+
+    logger -- logger for the command and for logging its execution
+    communicator -- communicator for sending messages to the scheduler
+    task -- task identifier, command and parameter object
+    command_timeout -- kill external processes run by the command if they do
+        not finish in this number of seconds, None to wait indefinitely
+    """
     logger.info(
         "Task '%s' executed by user '%s'.",
         task.task_ident,
@@ -118,11 +140,12 @@ def task_executor(task: WorkerCommand) -> None:
 
     env = LibraryEnvironment(
         logger,
-        WorkerReportProcessor(worker_com, task.task_ident),
+        WorkerReportProcessor(communicator, task.task_ident),
         known_hosts_getter=read_known_hosts_file_not_cached,
         user_login=auth_user.username,
         user_groups=auth_user.groups,
         request_timeout=request_timeout,
+        cmd_runner_timeout=command_timeout,
     )
 
     task_retval = None
@@ -149,18 +172,10 @@ def task_executor(task: WorkerCommand) -> None:
         # one
         try:
             data = dto.from_dict(
-                dataclasses.make_dataclass(
-                    f"{command_name}_params",
-                    [
-                        _param_to_field_tuple(param)
-                        for param in list(
-                            inspect.signature(cmd.cmd).parameters.values()
-                        )[1:]
-                    ],
-                ),
+                _get_params_dataclass(command_name, cmd.cmd),
                 command_dto.params,
                 strict=True,
-            ).__dict__  # type: ignore
+            ).__dict__
         except (dacite.DaciteError, dto.PayloadConversionError) as e:
             # TODO: make custom message from exception without mentioning
             # dataclasses and fields
@@ -176,19 +191,18 @@ def task_executor(task: WorkerCommand) -> None:
         # processor here
 
         for report in e.args:
-            worker_com.put(Message(task.task_ident, report.to_dto()))
-        worker_com.put(
+            communicator.put(Message(task.task_ident, report.to_dto()))
+        communicator.put(
             Message(
                 task.task_ident,
                 TaskFinished(TaskFinishType.FAIL, None),
             )
         )
         logger.error("Task %s raised a LibraryError: %s.", task.task_ident, e)
-        _pause_worker()
         return
     except Exception as e:
         # For unhandled exceptions during execution
-        worker_com.put(
+        communicator.put(
             Message(
                 task.task_ident,
                 TaskFinished(TaskFinishType.UNHANDLED_EXCEPTION, None),
@@ -197,16 +211,31 @@ def task_executor(task: WorkerCommand) -> None:
         logger.exception(
             "Task %s raised an unhandled exception: %s", task.task_ident, e
         )
-        _pause_worker()
         return
-    worker_com.put(
+    communicator.put(
         Message(
             task.task_ident,
             TaskFinished(TaskFinishType.SUCCESS, task_retval),
         )
     )
     logger.info("Task %s finished.", task.task_ident)
-    _pause_worker()
+
+
+@lru_cache
+def _get_params_dataclass(
+    command_name: str, command: Callable[..., Any]
+) -> type[Any]:
+    # The dataclass is created only once for each command. This saves time and
+    # lets DTO converters, which are compiled for each class, be reused.
+    return dataclasses.make_dataclass(
+        f"{command_name}_params",
+        [
+            _param_to_field_tuple(param)
+            for param in list(inspect.signature(command).parameters.values())[
+                1:
+            ]
+        ],
+    )
 
 
 def _param_to_field_tuple(
@@ -26,17 +26,21 @@ PCSD_BIND_ADDR = "PCSD_BIND_ADDR"
 NOTIFY_SOCKET = "NOTIFY_SOCKET"
 PCSD_DEBUG = "PCSD_DEBUG"
 PCSD_SESSION_LIFETIME = "PCSD_SESSION_LIFETIME"
+PCSD_SESSION_PERSISTENT = "PCSD_SESSION_PERSISTENT"
 PCSD_DEV = "PCSD_DEV"
 WEBUI_DIR = "WEBUI_DIR"
 WEBUI_FALLBACK = "WEBUI_FALLBACK"
 PCSD_WORKER_COUNT = "PCSD_WORKER_COUNT"
 PCSD_WORKER_RESET_LIMIT = "PCSD_WORKER_RESET_LIMIT"
 PCSD_MAX_WORKER_COUNT = "PCSD_MAX_WORKER_COUNT"
+PCSD_INLINE_WORKER_COUNT = "PCSD_INLINE_WORKER_COUNT"
+PCSD_SHARED_RESULT_TTL = "PCSD_SHARED_RESULT_TTL"
 PCSD_DEADLOCK_THRESHOLD_TIMEOUT = "PCSD_DEADLOCK_THRESHOLD_TIMEOUT"
 PCSD_CHECK_INTERVAL_MS = "PCSD_CHECK_INTERVAL_MS"
 PCSD_TASK_ABANDONED_TIMEOUT = "PCSD_TASK_ABANDONED_TIMEOUT"
 PCSD_TASK_UNRESPONSIVE_TIMEOUT = "PCSD_TASK_UNRESPONSIVE_TIMEOUT"
 PCSD_TASK_DELETION_TIMEOUT = "PCSD_TASK_DELETION_TIMEOUT"
+PCSD_FORK_SERVER_CHILD_COUNT = "PCSD_FORK_SERVER_CHILD_COUNT"
 
 Env = namedtuple(
     "Env",
@@ -48,17 +52,21 @@ Env = namedtuple(
         NOTIFY_SOCKET,
         PCSD_DEBUG,
         PCSD_SESSION_LIFETIME,
+        PCSD_SESSION_PERSISTENT,
         WEBUI_DIR,
         WEBUI_FALLBACK,
         PCSD_DEV,
         PCSD_WORKER_COUNT,
         PCSD_WORKER_RESET_LIMIT,
         PCSD_MAX_WORKER_COUNT,
+        PCSD_INLINE_WORKER_COUNT,
+        PCSD_SHARED_RESULT_TTL,
         PCSD_DEADLOCK_THRESHOLD_TIMEOUT,
         PCSD_CHECK_INTERVAL_MS,
         PCSD_TASK_ABANDONED_TIMEOUT,
         PCSD_TASK_UNRESPONSIVE_TIMEOUT,
         PCSD_TASK_DELETION_TIMEOUT,
+        PCSD_FORK_SERVER_CHILD_COUNT,
         "has_errors",
     ],
 )
@@ -75,17 +83,21 @@ def prepare_env(environ, logger=None):
         loader.notify_socket(),
         loader.pcsd_debug(),
         loader.session_lifetime(),
+        loader.session_persistent(),
         loader.webui_dir(),
         loader.webui_fallback(),
         loader.pcsd_dev(),
         loader.pcsd_worker_count(),
         loader.pcsd_worker_reset_limit(),
         loader.pcsd_max_worker_count(),
+        loader.pcsd_inline_worker_count(),
+        loader.pcsd_shared_result_ttl(),
         loader.pcsd_deadlock_threshold_timeout(),
         loader.pcsd_check_interval_ms(),
         loader.pcsd_task_abandoned_timeout(),
         loader.pcsd_task_unresponsive_timeout(),
         loader.pcsd_task_deletion_timeout(),
+        loader.pcsd_fork_server_child_count(),
         loader.has_errors(),
     )
     if logger:
@@ -184,6 +196,11 @@ class EnvLoader:
             )
             return session_lifetime
 
+    def session_persistent(self):
+        if PCSD_SESSION_PERSISTENT not in self.environ:
+            return settings.gui_session_persistent
+        return self.__has_true_in_environ(PCSD_SESSION_PERSISTENT)
+
     def pcsd_debug(self):
         return self.__has_true_in_environ(PCSD_DEBUG)
 
@@ -249,6 +266,18 @@ class EnvLoader:
             self.pcsd_worker_count() + settings.pcsd_temporary_workers,
         )
 
+    @lru_cache(maxsize=1)
+    def pcsd_inline_worker_count(self) -> int:
+        return self._get_non_negative_int(
+            PCSD_INLINE_WORKER_COUNT, settings.pcsd_inline_worker_count
+        )
+
+    @lru_cache(maxsize=1)
+    def pcsd_shared_result_ttl(self) -> int:
+        return self._get_non_negative_int(
+            PCSD_SHARED_RESULT_TTL, settings.pcsd_shared_result_ttl_seconds
+        )
+
     @lru_cache(maxsize=1)
     def pcsd_deadlock_threshold_timeout(self) -> int:
         return self._get_non_negative_int(
@@ -281,5 +310,11 @@ class EnvLoader:
             PCSD_TASK_DELETION_TIMEOUT, settings.task_deletion_timeout_seconds
         )
 
+    @lru_cache(maxsize=1)
+    def pcsd_fork_server_child_count(self) -> int:
+        return self._get_non_negative_int(
+            PCSD_FORK_SERVER_CHILD_COUNT, settings.pcsd_fork_server_child_count
+        )
+
     def __has_true_in_environ(self, environ_key):
         return self.environ.get(environ_key, "").lower() == "true"
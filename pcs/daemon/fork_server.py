@@ -0,0 +1,511 @@
+"""
+Fork server running pcs commands requested by pcsd
+
+The fork server is a process forked from pcsd when pcsd starts. It imports pcs
+once and then forks a new process for each command instead of starting a new
+python interpreter, which saves interpreter startup and imports of pcs and its
+dependencies.
+
+It listens on a unix socket accessible by root only. A client sends a request
+as one line of JSON:
+    {
+        "executable": "pcs" | "pcs_internal",
+        "argv": [arguments of the command],
+        "stdin": standard input of the command,
+        "env": {environment variables to set for the command},
+        "timeout": optional timeout of the command in seconds
+    }
+and gets one line of JSON as a response:
+    {"stdout": str, "stderr": str, "retval": int}
+or, if the command has not been run at all, {"error": str}. The client may
+run such a command another way.
+"""
+
+import contextlib
+import gc
+import importlib
+import json
+import locale
+import logging
+import os
+import selectors
+import signal
+import socket
+import struct
+import sys
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Final, NoReturn
+
+from pcs.daemon import log
+
+EntryPoints = Mapping[str, Callable[[], Any]]
+
+# modules providing main functions of commands which can be run
+ENTRY_POINT_MODULES: Final = {
+    "pcs": "pcs.app",
+    "pcs_internal": "pcs.pcs_internal",
+}
+_MAX_REQUEST_SIZE: Final = 16 * 1024 * 1024
+_READ_SIZE: Final = 64 * 1024
+_SEND_TIMEOUT: Final = 30
+# how often timeouts of commands and a termination of pcsd are checked
+_CHECK_INTERVAL: Final = 1
+
+
+class _InvalidRequest(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _Command:
+    executable: str
+    argv: list[str]
+    stdin: str
+    env: dict[str, str]
+    timeout: int | None
+
+
+@dataclass
+class _Job:
+    connection: socket.socket
+    command: _Command
+    pid: int = 0
+    deadline: float = 0.0
+    stdout: bytearray = field(default_factory=bytearray)
+    stderr: bytearray = field(default_factory=bytearray)
+    open_fds: set[int] = field(default_factory=set)
+    exit_code: int | None = None
+    timed_out: bool = False
+
+
+def start(
+    socket_path: str,
+    max_children: int,
+    max_queued: int,
+    command_timeout: int,
+    load_entry_points: Callable[[], EntryPoints] | None = None,
+) -> int:
+    """
+    Start the fork server in a new process, return pid of the process
+
+    This must be called before pcsd starts any threads, since the fork server
+    is forked from pcsd.
+
+    socket_path -- path of a unix socket the server listens on
+    max_children -- maximal number of commands running at once
+    max_queued -- maximal number of commands waiting for a run
+    command_timeout -- default timeout of commands in seconds
+    load_entry_points -- import modules and provide entry points of commands
+    """
+    server_socket = _create_socket(socket_path)
+    # Do not let buffered data be written twice
+    sys.stdout.flush()
+    sys.stderr.flush()
+    parent_pid = os.getpid()
+    pid = os.fork()
+    if pid:
+        server_socket.close()
+        return pid
+
+    exit_code = 1
+    try:
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signal_number, signal.SIG_DFL)
+        entry_points = (load_entry_points or _load_entry_points)()
+        # Objects imported so far are never released. Keeping them out of
+        # garbage collection prevents copying memory pages in forked children.
+        gc.freeze()
+        ForkServer(
+            server_socket,
+            entry_points,
+            max_children,
+            max_queued,
+            command_timeout,
+            parent_pid,
+        ).serve_forever()
+        exit_code = 0
+    except BaseException:
+        log.pcsd.exception("Fork server failed")
+    finally:
+        os._exit(exit_code)
+
+
+def stop(pid: int) -> None:
+    """
+    Stop the fork server, commands running at the time are not affected
+
+    pid -- pid of the fork server process
+    """
+    with contextlib.suppress(ProcessLookupError):
+        os.kill(pid, signal.SIGTERM)
+
+
+def _load_entry_points() -> EntryPoints:
+    return {
+        executable: importlib.import_module(module_name).main
+        for executable, module_name in ENTRY_POINT_MODULES.items()
+    }
+
+
+def _create_socket(socket_path: str) -> socket.socket:
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # only root is allowed to run commands
+    old_umask = os.umask(0o177)
+    try:
+        server_socket.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    server_socket.listen()
+    server_socket.setblocking(False)
+    return server_socket
+
+
+class ForkServer:
+    """
+    Accept requests, fork a child for each command and send back its output
+
+    All work is done in a single thread, as forking a process with more
+    threads is not safe.
+    """
+
+    def __init__(
+        self,
+        server_socket: socket.socket,
+        entry_points: EntryPoints,
+        max_children: int,
+        max_queued: int,
+        command_timeout: int,
+        parent_pid: int,
+    ):
+        self._socket = server_socket
+        self._entry_points = entry_points
+        self._max_children = max_children
+        self._max_queued = max_queued
+        self._command_timeout = command_timeout
+        self._parent_pid = parent_pid
+        self._selector = selectors.DefaultSelector()
+        self._requests: dict[socket.socket, bytearray] = {}
+        self._queue: deque[_Job] = deque()
+        self._running: dict[int, _Job] = {}
+
+    def serve_forever(self) -> None:
+        # SIGCHLD wakes up the server when a child exits
+        wakeup_read, wakeup_write = socket.socketpair()
+        for wakeup_socket in (wakeup_read, wakeup_write):
+            wakeup_socket.setblocking(False)
+        signal.set_wakeup_fd(wakeup_write.fileno(), warn_on_full_buffer=False)
+        signal.signal(signal.SIGCHLD, lambda *args: None)
+        self._selector.register(wakeup_read, selectors.EVENT_READ)
+        self._selector.register(self._socket, selectors.EVENT_READ)
+        # end together with pcsd
+        while os.getppid() == self._parent_pid:
+            for key, _ in self._selector.select(_CHECK_INTERVAL):
+                if key.fileobj is wakeup_read:
+                    _drain(wakeup_read)
+                elif key.fileobj is self._socket:
+                    self._accept()
+                elif isinstance(key.fileobj, socket.socket):
+                    self._read_request(key.fileobj)
+                else:
+                    job, buffer = key.data
+                    self._read_output(job, buffer, key.fd)
+            self._kill_expired()
+            self._finish_exited()
+            self._start_queued()
+
+    def _accept(self) -> None:
+        try:
+            connection, dummy_address = self._socket.accept()
+        except BlockingIOError:
+            return
+        dummy_pid, uid, dummy_gid = struct.unpack(
+            "3i",
+            connection.getsockopt(
+                socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+            ),
+        )
+        # only the user running pcsd, which is root, may run commands
+        if uid != os.getuid():
+            connection.close()
+            return
+        connection.setblocking(False)
+        self._requests[connection] = bytearray()
+        self._selector.register(connection, selectors.EVENT_READ)
+
+    def _read_request(self, connection: socket.socket) -> None:
+        buffer = self._requests[connection]
+        try:
+            data = connection.recv(_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        buffer.extend(data)
+        if b"\n" not in buffer:
+            if not data:
+                self._unregister_connection(connection)
+                connection.close()
+            elif len(buffer) > _MAX_REQUEST_SIZE:
+                self._unregister_connection(connection)
+                self._reject(connection, "Request is too large")
+            return
+        self._unregister_connection(connection)
+        try:
+            command = self._parse_request(bytes(buffer[: buffer.index(b"\n")]))
+        except _InvalidRequest as e:
+            self._reject(connection, f"Invalid request: {e}")
+            return
+        if len(self._queue) >= self._max_queued:
+            self._reject(connection, "Too many commands are waiting")
+            return
+        self._queue.append(_Job(connection, command))
+
+    def _parse_request(self, data: bytes) -> _Command:
+        try:
+            request = json.loads(data)
+        except ValueError as e:
+            raise _InvalidRequest(str(e)) from e
+        if not isinstance(request, dict):
+            raise _InvalidRequest("object expected")
+        executable = request.get("executable")
+        if (
+            not isinstance(executable, str)
+            or executable not in self._entry_points
+        ):
+            raise _InvalidRequest(f"unknown executable '{executable}'")
+        argv = request.get("argv", [])
+        stdin = request.get("stdin", "")
+        env = request.get("env", {})
+        timeout = request.get("timeout")
+        if (
+            not isinstance(argv, list)
+            or not all(isinstance(arg, str) for arg in argv)
+            or not isinstance(stdin, str)
+            or not isinstance(env, dict)
+            or not all(
+                isinstance(name, str) and isinstance(value, str)
+                for name, value in env.items()
+            )
+            or not (
+                timeout is None
+                or (isinstance(timeout, int) and int(timeout) > 0)
+            )
+        ):
+            raise _InvalidRequest("invalid arguments")
+        return _Command(executable, argv, stdin, env, timeout)
+
+    def _start_queued(self) -> None:
+        while self._queue and len(self._running) < self._max_children:
+            job = self._queue.popleft()
+            try:
+                self._start(job)
+            except OSError as e:
+                log.pcsd.error("Unable to run a command: %s", e)
+                self._reject(job.connection, f"Unable to run: {e}")
+
+    def _start(self, job: _Job) -> None:
+        command = job.command
+        # Standard input is provided in a file, so that writing it does not
+        # block the server.
+        stdin_fd = os.memfd_create("pcs-stdin")
+        try:
+            _write_all(stdin_fd, command.stdin.encode())
+            os.lseek(stdin_fd, 0, os.SEEK_SET)
+            stdout_read, stdout_write = os.pipe()
+            stderr_read, stderr_write = os.pipe()
+        except OSError:
+            os.close(stdin_fd)
+            raise
+        pid = os.fork()
+        if pid == 0:
+            _run_child(
+                self._entry_points[command.executable],
+                command,
+                stdin_fd,
+                stdout_write,
+                stderr_write,
+            )
+        for fd in (stdin_fd, stdout_write, stderr_write):
+            os.close(fd)
+        with contextlib.suppress(OSError):
+            # the child sets it as well, whichever runs first
+            os.setpgid(pid, pid)
+        job.pid = pid
+        job.deadline = time.monotonic() + (
+            command.timeout or self._command_timeout
+        )
+        for fd, buffer in (
+            (stdout_read, job.stdout),
+            (stderr_read, job.stderr),
+        ):
+            os.set_blocking(fd, False)
+            job.open_fds.add(fd)
+            self._selector.register(fd, selectors.EVENT_READ, (job, buffer))
+        self._running[pid] = job
+
+    def _read_output(self, job: _Job, buffer: bytearray, fd: int) -> None:
+        try:
+            data = os.read(fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if data:
+            buffer.extend(data)
+            return
+        # the child and all its children closed the pipe
+        self._close_output(job, fd)
+
+    def _close_output(self, job: _Job, fd: int) -> None:
+        self._selector.unregister(fd)
+        os.close(fd)
+        job.open_fds.discard(fd)
+
+    def _kill_expired(self) -> None:
+        now = time.monotonic()
+        for job in self._running.values():
+            if not job.timed_out and job.deadline <= now:
+                job.timed_out = True
+                with contextlib.suppress(OSError):
+                    os.killpg(job.pid, signal.SIGKILL)
+
+    def _finish_exited(self) -> None:
+        for pid, job in list(self._running.items()):
+            if job.exit_code is None:
+                try:
+                    waited_pid, status = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    waited_pid, status = pid, 1 << 8
+                if waited_pid == 0:
+                    continue
+                # signal number if killed, the same way ruby reports it
+                job.exit_code = (
+                    os.WTERMSIG(status)
+                    if os.WIFSIGNALED(status)
+                    else os.WEXITSTATUS(status)
+                )
+            if job.open_fds:
+                if not job.timed_out:
+                    # processes started by the command may still write output
+                    continue
+                for fd in list(job.open_fds):
+                    self._close_output(job, fd)
+            del self._running[pid]
+            self._send_result(job)
+
+    def _send_result(self, job: _Job) -> None:
+        stdout = job.stdout.decode("utf-8", errors="replace")
+        stderr = job.stderr.decode("utf-8", errors="replace")
+        if job.timed_out:
+            stderr += (
+                "Error: Command has been terminated after "
+                f"{job.command.timeout or self._command_timeout} seconds\n"
+            )
+        self._respond(
+            job.connection,
+            {"stdout": stdout, "stderr": stderr, "retval": job.exit_code},
+        )
+
+    def _reject(self, connection: socket.socket, reason: str) -> None:
+        self._respond(connection, {"error": reason})
+
+    def _respond(
+        self, connection: socket.socket, response: Mapping[str, Any]
+    ) -> None:
+        try:
+            connection.settimeout(_SEND_TIMEOUT)
+            connection.sendall(json.dumps(response).encode() + b"\n")
+        except OSError as e:
+            log.pcsd.warning("Unable to send a command result: %s", e)
+        finally:
+            connection.close()
+
+    def _unregister_connection(self, connection: socket.socket) -> None:
+        self._selector.unregister(connection)
+        del self._requests[connection]
+
+
+def _drain(wakeup_socket: socket.socket) -> None:
+    try:
+        while wakeup_socket.recv(_READ_SIZE):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _run_child(
+    entry_point: Callable[[], Any],
+    command: _Command,
+    stdin_fd: int,
+    stdout_fd: int,
+    stderr_fd: int,
+) -> NoReturn:
+    exit_code = 1
+    try:
+        # own process group allows to kill the command with its children
+        os.setpgid(0, 0)
+        signal.set_wakeup_fd(-1)
+        for signal_number in (signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(signal_number, signal.SIG_DFL)
+        os.dup2(stdin_fd, 0)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        # the command gets no file descriptors of the server or other commands
+        os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+        for logger_name in log.LOGGER_NAMES:
+            logging.getLogger(logger_name).handlers.clear()
+        os.environ.update(command.env)
+        with contextlib.suppress(locale.Error):
+            locale.setlocale(locale.LC_CTYPE, "")
+        # the same settings as python uses for standard streams in UTF-8 mode
+        sys.stdin = open(  # noqa: SIM115
+            0, encoding="utf-8", errors="surrogateescape", closefd=False
+        )
+        sys.stdout = open(  # noqa: SIM115
+            1, "w", encoding="utf-8", errors="surrogateescape", closefd=False
+        )
+        sys.stderr = open(  # noqa: SIM115
+            2,
+            "w",
+            buffering=1,
+            encoding="utf-8",
+            errors="backslashreplace",
+            closefd=False,
+        )
+        sys.argv = [command.executable, *command.argv]
+        exit_code = _call_main(entry_point)
+    finally:
+        os._exit(exit_code)
+
+
+def _call_main(entry_point: Callable[[], Any]) -> int:
+    try:
+        entry_point()
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(OSError):
+            stream.flush()
+    return exit_code
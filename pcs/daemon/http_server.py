@@ -59,11 +59,14 @@ class HttpsServerManage:
         log.pcsd.info("Starting server...")
 
         app = self.__make_app(self)
+        # Handlers announce that they accept gzip compressed requests, so the
+        # servers must decompress them
         self.__tcp_server = HTTPServer(
             app,
             ssl_options=self.__ssl.create_context(),
+            decompress_request=True,
         )
-        self.__unix_socket_server = HTTPServer(app)
+        self.__unix_socket_server = HTTPServer(app, decompress_request=True)
 
         # It is necessary to bind sockets for every new HTTPServer since
         # HTTPServer.stop calls sock.close() inside.
@@ -0,0 +1,117 @@
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# upper bounds of histogram buckets in seconds
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+# requests to paths which do not match any route are not tracked one by one
+UNMATCHED_ENDPOINT = "unmatched"
+OTHER_ENDPOINTS = "other"
+
+
+class Histogram:
+    """
+    Distribution of durations in fixed buckets
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        # the last item counts values greater than all the bucket bounds
+        self._bucket_counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, value: float) -> None:
+        self._bucket_counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def to_dict(self) -> dict[str, Any]:
+        # buckets are cumulative, each one counts values lower or equal to its
+        # bound, the same way as prometheus does it
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(
+            [str(bound) for bound in self._buckets] + ["+Inf"],
+            self._bucket_counts,
+            strict=True,
+        ):
+            cumulative += bucket_count
+            buckets[bound] = cumulative
+        return dict(count=self._count, sum=self._sum, buckets=buckets)
+
+
+class MetricsRegistry:
+    """
+    Durations of HTTP requests handled by pcsd and of API commands executed by
+    pcsd workers, and metrics provided by other pcsd components
+    """
+
+    def __init__(self, max_endpoints: int = 500) -> None:
+        """
+        max_endpoints -- limit of tracked endpoints, requests to any other
+            endpoints are aggregated together, this prevents the registry from
+            growing infinitely when clients request random paths
+        """
+        self._max_endpoints = max_endpoints
+        self._requests: dict[str, Histogram] = {}
+        self._commands: dict[str, Histogram] = {}
+        self._sources: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register_source(
+        self, name: str, source: Callable[[], dict[str, Any]]
+    ) -> None:
+        """
+        Include metrics of a pcsd component in the exported metrics
+
+        name -- key of the component's metrics in the exported metrics
+        source -- returns current metrics of the component
+        """
+        self._sources[name] = source
+
+    def observe_request(self, endpoint: str, duration: float) -> None:
+        histogram = self._requests.get(endpoint)
+        if histogram is None:
+            if len(self._requests) >= self._max_endpoints:
+                endpoint = OTHER_ENDPOINTS
+            histogram = self._requests.setdefault(endpoint, Histogram())
+        histogram.observe(duration)
+
+    def observe_command(self, command_name: str, duration: float) -> None:
+        histogram = self._commands.get(command_name)
+        if histogram is None:
+            histogram = self._commands[command_name] = Histogram()
+        histogram.observe(duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(
+            requests={
+                endpoint: histogram.to_dict()
+                for endpoint, histogram in sorted(self._requests.items())
+            },
+            commands={
+                command: histogram.to_dict()
+                for command, histogram in sorted(self._commands.items())
+            },
+            **{
+                name: source() for name, source in sorted(self._sources.items())
+            },
+        )
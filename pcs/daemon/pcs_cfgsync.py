@@ -1,6 +1,18 @@
+import random
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import timedelta
 from logging import Logger
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from tornado import gen
+from tornado.ioloop import IOLoop
+from tornado.locks import Event, Lock
+from tornado.util import TimeoutError as TornadoTimeoutError
+
+from pcs import settings
+from pcs.common.file_type_codes import FileTypeCode
 from pcs.common.node_communicator import Communicator, RequestTarget
 from pcs.common.reports.processor import ReportProcessor
 from pcs.common.reports.utils import format_file_role
@@ -18,6 +30,30 @@ if TYPE_CHECKING:
     from pcs.lib.host.config.facade import Facade as KnownHostsFacade
 
 
+@dataclass
+class CfgSyncMetrics:
+    # time of the last finished fetch of configs from the cluster
+    last_sync_time: float | None = None
+    # whether the last fetch brought any new config
+    last_sync_changed: bool = False
+    # whether the last fetch got configs from at least 2 nodes
+    last_sync_connected: bool = False
+    sync_count: int = 0
+    received_bytes: int = 0
+    # data versions of configs saved by cfgsync
+    config_versions: dict[FileTypeCode, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(
+            last_sync_time=self.last_sync_time,
+            last_sync_changed=self.last_sync_changed,
+            last_sync_connected=self.last_sync_connected,
+            sync_count=self.sync_count,
+            received_bytes=self.received_bytes,
+            config_versions=dict(sorted(self.config_versions.items())),
+        )
+
+
 class CfgSyncPullManager:
     def __init__(
         self,
@@ -31,6 +67,11 @@ class CfgSyncPullManager:
         self._fetcher = ConfigFetcher(
             self._node_communicator, self._report_processor
         )
+        self._metrics = CfgSyncMetrics()
+
+    @property
+    def metrics(self) -> CfgSyncMetrics:
+        return self._metrics
 
     def run_cfgsync(self) -> int:
         self._logger.info("Config files sync started")
@@ -74,9 +115,16 @@ class CfgSyncPullManager:
                     instance.raw_file.metadata.path,
                 )
                 instance.write_facade(facade, can_overwrite=True)
+                self._metrics.config_versions[file_code] = facade.data_version
             except RawFileError as e:
                 self._report_processor.report(raw_file_error_report(e))
 
+        self._metrics.last_sync_time = time.time()
+        self._metrics.last_sync_changed = bool(configs)
+        self._metrics.last_sync_connected = was_connected
+        self._metrics.sync_count += 1
+        self._metrics.received_bytes = self._fetcher.received_bytes
+
         self._logger.info("Config files sync finished")
         if was_connected:
             return ctl_facade.sync_interval
@@ -146,3 +194,97 @@ class CfgSyncPullManager:
                 file_instance.parser_exception_to_report_list(e)
             )
         return None
+
+
+class CfgSyncScheduler:
+    """
+    Runs cfgsync periodically. The configured interval is prolonged
+    exponentially while the syncs bring no changes, a random jitter is added
+    to it so that nodes do not send their requests at the same time. A sync
+    may be requested anytime, e.g. when another node pushes a new config
+    version to this node.
+    """
+
+    def __init__(
+        self,
+        pull_manager: CfgSyncPullManager,
+        sync_config_lock: Lock,
+        logger: Logger,
+    ):
+        self._pull_manager = pull_manager
+        self._sync_config_lock = sync_config_lock
+        self._logger = logger
+        self._backoff_factor = 1
+        self._sync_requested = Event()
+
+    @property
+    def metrics(self) -> CfgSyncMetrics:
+        return self._pull_manager.metrics
+
+    def request_sync(self) -> None:
+        """
+        Run the next sync as soon as possible and reset the backoff
+        """
+        self._backoff_factor = 1
+        self._sync_requested.set()
+
+    async def run(self) -> None:
+        while True:
+            await self._wait(await self._sync())
+            if self._sync_requested.is_set():
+                self._sync_requested.clear()
+                # a pushed config is received by all nodes at once, the delay
+                # spreads their subsequent requests
+                await gen.sleep(
+                    random.uniform(
+                        0, settings.pcs_cfgsync_push_trigger_delay_max
+                    )
+                )
+
+    async def _sync(self) -> float:
+        async with self._sync_config_lock:
+            sync_count = self._pull_manager.metrics.sync_count
+            # run_cfgsync sends requests to all cluster nodes, including the
+            # local one. However, this runs in the same IOLoop as the
+            # async_scheduler that handles these requests -> so run cfgsync
+            # waits for responses but the async scheduler cannot process
+            # them, resulting in timeout. So we need to run this blocking
+            # function in executor
+            base_interval = await IOLoop.current().run_in_executor(
+                None, self._pull_manager.run_cfgsync
+            )
+        return self.get_next_interval(
+            base_interval, self._pull_manager.metrics.sync_count != sync_count
+        )
+
+    def get_next_interval(self, base_interval: int, synced: bool) -> float:
+        """
+        Get number of seconds to wait before the next sync
+
+        base_interval -- interval set in the cfgsync configuration
+        synced -- True if configs were fetched from the cluster
+        """
+        metrics = self._pull_manager.metrics
+        interval = base_interval * self._backoff_factor
+        if (
+            synced
+            and metrics.last_sync_connected
+            and not metrics.last_sync_changed
+        ):
+            self._backoff_factor = min(
+                2 * self._backoff_factor,
+                settings.pcs_cfgsync_backoff_max_factor,
+            )
+        else:
+            self._backoff_factor = 1
+            interval = base_interval
+        jitter = interval * settings.pcs_cfgsync_jitter_ratio
+        next_interval = interval + random.uniform(-jitter, jitter)
+        self._logger.debug(
+            "Next config files sync in %d seconds", next_interval
+        )
+        return next_interval
+
+    async def _wait(self, seconds: float) -> None:
+        with suppress(TornadoTimeoutError):
+            await self._sync_requested.wait(timedelta(seconds=seconds))
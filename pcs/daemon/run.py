@@ -24,7 +24,7 @@ from tornado.web import Application
 from pcs import settings
 from pcs.common import capabilities
 from pcs.common.types import StringCollection
-from pcs.daemon import log, ruby_pcsd, ssl, systemd
+from pcs.daemon import fork_server, log, ruby_pcsd, ssl, systemd
 from pcs.daemon.app import (
     api_v0,
     api_v1,
@@ -36,6 +36,7 @@ from pcs.daemon.app import (
     ui_manage,
 )
 from pcs.daemon.app import capabilities as capabilities_app
+from pcs.daemon.app import metrics as metrics_app
 
 try:
     from pcs.daemon.app import webui
@@ -50,12 +51,14 @@ from pcs.daemon.async_tasks.scheduler import Scheduler, SchedulerConfig
 from pcs.daemon.async_tasks.task import TaskConfig
 from pcs.daemon.env import prepare_env
 from pcs.daemon.http_server import HttpsServerManage
-from pcs.daemon.pcs_cfgsync import CfgSyncPullManager
+from pcs.daemon.metrics import MetricsRegistry
+from pcs.daemon.pcs_cfgsync import CfgSyncPullManager, CfgSyncScheduler
 from pcs.lib.auth.provider import AuthProvider
 
 
 class SignalInfo:
     async_scheduler: Scheduler | None = None
+    fork_server_pid: int | None = None
     server_manage = None
     ioloop_started = False
 
@@ -67,6 +70,8 @@ def handle_signal(incoming_signal, frame):
         SignalInfo.server_manage.stop()
     if SignalInfo.async_scheduler:
         SignalInfo.async_scheduler.terminate_nowait()
+    if SignalInfo.fork_server_pid:
+        fork_server.stop(SignalInfo.fork_server_pid)
     if SignalInfo.ioloop_started:
         IOLoop.current().stop()
     raise SystemExit(0)
@@ -90,35 +95,20 @@ def create_pull_manager(logger: Logger) -> CfgSyncPullManager:
     return CfgSyncPullManager(log_report_processor, node_communicator, logger)
 
 
-async def config_sync(
-    sync_config_lock: Lock, config_puller: CfgSyncPullManager
-):
-    async with sync_config_lock:
-        # run_cfgsync sends requests to all cluster nodes, including the local
-        # one. However, this runs in the same IOLoop as the async_scheduler
-        # that handles these requests -> so run cfgsync waits for responses
-        # but the async scheduler cannot process them, resulting in timeout.
-        # So we need to run this blocking function in executor
-        next_run_after_seconds = await IOLoop.current().run_in_executor(
-            None, config_puller.run_cfgsync
-        )
-    IOLoop.current().call_later(
-        next_run_after_seconds,
-        lambda: config_sync(sync_config_lock, config_puller),
-    )
-
-
 def configure_app(  # noqa: PLR0913
     async_scheduler: Scheduler,
     lib_auth_provider: AuthProvider,
     session_lifetime: int,
     ruby_pcsd_wrapper: ruby_pcsd.Wrapper,
     sync_config_lock: Lock,
+    cfgsync_scheduler: CfgSyncScheduler,
     webui_dir: str,
     webui_fallback: str,
     pcsd_capabilities: Iterable[capabilities.Capability],
     *,
     debug: bool = False,
+    metrics: MetricsRegistry | None = None,
+    session_file: str | None = None,
 ):
     def make_app(https_server_manage: HttpsServerManage):
         """
@@ -142,7 +132,9 @@ def configure_app(  # noqa: PLR0913
         )
 
         if webui:
-            session_storage = webui.session.Storage(session_lifetime)
+            session_storage = webui.session.Storage(
+                session_lifetime, session_file
+            )
             session_auth_factory = (
                 webui.auth_provider.SessionAuthProviderFactory(
                     lib_auth_provider, session_storage
@@ -166,11 +158,17 @@ def configure_app(  # noqa: PLR0913
             [token_auth_factory, socket_auth_factory]
         )
 
-        routes = api_v2.get_routes(api_v2_auth_factory, async_scheduler)
+        routes = []
+        if metrics is not None:
+            routes.extend(metrics_app.get_routes(socket_auth_factory, metrics))
+        routes.extend(api_v2.get_routes(api_v2_auth_factory, async_scheduler))
         routes.extend(api_v1.get_routes(api_auth_factory, async_scheduler))
         routes.extend(
             api_v0.get_routes(
-                api_auth_factory, async_scheduler, sync_config_lock
+                api_auth_factory,
+                async_scheduler,
+                sync_config_lock,
+                cfgsync_scheduler,
             )
         )
         routes.extend(auth.get_routes(api_auth_factory, lib_auth_provider))
@@ -201,8 +199,21 @@ def configure_app(  # noqa: PLR0913
         routes.extend(ui_manage.get_routes(ui_auth_factory, async_scheduler))
         routes.extend(sinatra_ui.get_routes(ui_auth_factory, ruby_pcsd_wrapper))
 
+        # Responses are compressed if a client supports it and they are large
+        # enough to benefit from it
+        if metrics is not None:
+            return metrics_app.MetricsApplication(
+                routes,
+                debug=debug,
+                default_handler_class=Http404Handler,
+                compress_response=True,
+                metrics=metrics,
+            )
         return Application(
-            routes, debug=debug, default_handler_class=Http404Handler
+            routes,
+            debug=debug,
+            default_handler_class=Http404Handler,
+            compress_response=True,
         )
 
     return make_app
@@ -222,7 +233,19 @@ def _print_version(argv: StringCollection) -> None:
         raise SystemExit(1) from e
 
 
-def main(argv=None) -> None:
+def _start_fork_server(child_count: int) -> None:
+    try:
+        SignalInfo.fork_server_pid = fork_server.start(
+            settings.pcsd_fork_server_socket,
+            child_count,
+            settings.pcsd_fork_server_queue_size,
+            settings.pcsd_fork_server_command_timeout_seconds,
+        )
+    except OSError as e:
+        log.pcsd.error("Unable to start fork server: %s", e)
+
+
+def main(argv=None) -> None:  # noqa: PLR0915
     # set the way how processes are started
     # https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
     # avoid deadlock in multiprocessing.pool.Pool on terminate
@@ -251,10 +274,17 @@ def main(argv=None) -> None:
     if env.PCSD_DEBUG:
         log.enable_debug()
 
+    if env.PCSD_FORK_SERVER_CHILD_COUNT > 0:
+        # The fork server must be started before any threads are created.
+        _start_fork_server(env.PCSD_FORK_SERVER_CHILD_COUNT)
+
+    metrics = MetricsRegistry()
     async_scheduler = Scheduler(
         SchedulerConfig(
             worker_count=env.PCSD_WORKER_COUNT,
             max_worker_count=env.PCSD_MAX_WORKER_COUNT,
+            inline_worker_count=env.PCSD_INLINE_WORKER_COUNT,
+            shared_result_ttl=env.PCSD_SHARED_RESULT_TTL,
             worker_reset_limit=env.PCSD_WORKER_RESET_LIMIT,
             deadlock_threshold_timeout=env.PCSD_DEADLOCK_THRESHOLD_TIMEOUT,
             task_config=TaskConfig(
@@ -262,12 +292,17 @@ def main(argv=None) -> None:
                 unresponsive_timeout=env.PCSD_TASK_UNRESPONSIVE_TIMEOUT,
                 deletion_timeout=env.PCSD_TASK_DELETION_TIMEOUT,
             ),
-        )
+        ),
+        metrics,
     )
     lib_auth_provider = AuthProvider(log.pcsd)
     SignalInfo.async_scheduler = async_scheduler
 
     sync_config_lock = Lock()
+    cfgsync_scheduler = CfgSyncScheduler(
+        create_pull_manager(log.pcsd), sync_config_lock, log.pcsd
+    )
+    metrics.register_source("cfgsync", cfgsync_scheduler.metrics.to_dict)
     ruby_pcsd_wrapper = ruby_pcsd.Wrapper(
         settings.pcsd_ruby_socket,
         debug=env.PCSD_DEBUG,
@@ -285,10 +320,17 @@ def main(argv=None) -> None:
         env.PCSD_SESSION_LIFETIME,
         ruby_pcsd_wrapper,
         sync_config_lock,
+        cfgsync_scheduler,
         env.WEBUI_DIR,
         env.WEBUI_FALLBACK,
         pcsd_capabilities,
         debug=env.PCSD_DEV,
+        metrics=metrics,
+        session_file=(
+            settings.pcsd_sessions_location
+            if env.PCSD_SESSION_PERSISTENT
+            else None
+        ),
     )
     pcsd_ssl = ssl.PcsdSSL(
         server_name=socket.gethostname(),
@@ -328,8 +370,5 @@ def main(argv=None) -> None:
     if systemd.is_systemd() and env.NOTIFY_SOCKET:
         ioloop.add_callback(systemd.notify, env.NOTIFY_SOCKET)
 
-    cfgsync_pull_manager = create_pull_manager(log.pcsd)
-    ioloop.add_callback(
-        lambda: config_sync(sync_config_lock, cfgsync_pull_manager)
-    )
+    ioloop.add_callback(cfgsync_scheduler.run)
     ioloop.start()
@@ -0,0 +1,381 @@
+"""
+CIB checkpoints are CIB files pacemaker stores in its CIB directory every time
+it replaces its CIB file with a new configuration.
+"""
+
+import hashlib
+import json
+import os
+import os.path
+import re
+import stat
+from collections.abc import Mapping
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from io import BytesIO
+from typing import Any, Final
+
+from lxml import etree
+from lxml.etree import _Element
+
+from pcs.common import timing
+from pcs.common.pacemaker.constraint import CibConstraintsDto
+from pcs.common.pacemaker.nvset import ListCibNvsetDto
+from pcs.common.pacemaker.resource.list import CibResourcesDto
+from pcs.lib.cib import const as cib_const
+from pcs.lib.cib import nvpair_multi, resource
+from pcs.lib.cib.constraint import colocation, location, order, ticket
+from pcs.lib.cib.rule.in_effect import RuleInEffectEvalDummy
+from pcs.lib.cib.tools import (
+    get_configuration,
+    get_constraints,
+    get_crm_config,
+    get_resources,
+)
+
+CHANGE_ADDED: Final = "added"
+CHANGE_CHANGED: Final = "changed"
+CHANGE_REMOVED: Final = "removed"
+
+_CHECKPOINT_NAME_RE: Final = re.compile(r"^cib-(\d+)\.raw$")
+_INDEX_VERSION: Final = 1
+# sections with their own structured comparison
+_DTO_SECTIONS: Final = frozenset(
+    (cib_const.TAG_CRM_CONFIG, "resources", "constraints")
+)
+
+
+@dataclass(frozen=True)
+class CheckpointInfo:
+    number: int
+    path: str
+    timestamp: float
+    # admin_epoch, epoch, num_updates
+    epoch: tuple[int, int, int]
+    size: int
+    content_hash: str
+
+
+def get_checkpoint_path(cib_dir: str, number: int | str) -> str:
+    return os.path.join(cib_dir, f"cib-{number}.raw")
+
+
+def get_checkpoint_index(
+    cib_dir: str, index_path: str | None = None
+) -> list[CheckpointInfo]:
+    """
+    Return info about all checkpoints ordered from the oldest to the newest
+
+    Only checkpoints not present in the saved index or modified since the
+    index was saved are read. The index is saved back if it has changed,
+    failures to load or save it are ignored. OSError is raised if the
+    directory cannot be listed.
+
+    cib_dir -- directory containing the checkpoints
+    index_path -- file to keep the index in between runs, None to not keep it
+    """
+    saved_index = _load_index(index_path) if index_path else {}
+    index: dict[str, dict[str, Any]] = {}
+    for filename in os.listdir(cib_dir):
+        if not _CHECKPOINT_NAME_RE.match(filename):
+            continue
+        path = os.path.join(cib_dir, filename)
+        try:
+            file_stat = os.stat(path)
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            entry = saved_index.get(filename)
+            if (
+                entry is None
+                or entry.get("mtime_ns") != file_stat.st_mtime_ns
+                or entry.get("size") != file_stat.st_size
+            ):
+                entry = _read_index_entry(path, file_stat)
+        except (OSError, etree.XMLSyntaxError):
+            # unreadable checkpoints are skipped as if they did not exist
+            continue
+        index[filename] = entry
+
+    if index_path and index != saved_index:
+        _save_index(index_path, index)
+
+    return sorted(
+        (
+            CheckpointInfo(
+                number=int(filename[len("cib-") : -len(".raw")]),
+                path=os.path.join(cib_dir, filename),
+                timestamp=entry["mtime_ns"] / 1e9,
+                epoch=(entry["epoch"][0], entry["epoch"][1], entry["epoch"][2]),
+                size=entry["size"],
+                content_hash=entry["hash"],
+            )
+            for filename, entry in index.items()
+        ),
+        key=lambda info: (info.timestamp, info.number),
+    )
+
+
+def _read_index_entry(path: str, file_stat: os.stat_result) -> dict[str, Any]:
+    with open(path, "rb") as checkpoint_file:
+        content = checkpoint_file.read()
+    # only the root element is needed for the epoch, do not parse the rest
+    _, root_el = next(
+        etree.iterparse(BytesIO(content), events=("start",), huge_tree=True)
+    )
+    return {
+        "mtime_ns": file_stat.st_mtime_ns,
+        "size": file_stat.st_size,
+        "epoch": [
+            _get_int_attr(root_el, "admin_epoch"),
+            _get_int_attr(root_el, "epoch"),
+            _get_int_attr(root_el, "num_updates"),
+        ],
+        "hash": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def _get_int_attr(element: _Element, name: str) -> int:
+    try:
+        return int(str(element.get(name, "0")))
+    except ValueError:
+        return 0
+
+
+def _load_index(index_path: str) -> dict[str, dict[str, Any]]:
+    try:
+        with open(index_path, "r") as index_file:
+            data = json.load(index_file)
+        if data.get("version") == _INDEX_VERSION:
+            return dict(data["checkpoints"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return {}
+
+
+def _save_index(index_path: str, index: Mapping[str, Any]) -> None:
+    tmp_path = f"{index_path}.tmp"
+    try:
+        with open(tmp_path, "w") as index_file:
+            json.dump(
+                {"version": _INDEX_VERSION, "checkpoints": index}, index_file
+            )
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # the index is only a cache, it will be rebuilt next time
+        pass
+
+
+@dataclass(frozen=True)
+class ConfigurationSnapshot:
+    resources: CibResourcesDto
+    constraints: CibConstraintsDto
+    properties: ListCibNvsetDto
+    # remaining configuration sections in a canonical form, keyed by tag
+    other_sections: Mapping[str, bytes]
+
+
+@dataclass(frozen=True)
+class ConfigurationDiff:
+    # (resource id, change)
+    resources: list[tuple[str, str]]
+    # (constraint id, change)
+    constraints: list[tuple[str, str]]
+    # (property name, old value, new value)
+    properties: list[tuple[str, str | None, str | None]]
+    # (tag of other configuration section, change)
+    other_sections: list[tuple[str, str]]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.resources
+            or self.constraints
+            or self.properties
+            or self.other_sections
+        )
+
+
+def load_checkpoint(path: str) -> _Element:
+    """
+    Parse a checkpoint file, raise OSError or etree.XMLSyntaxError on failure
+
+    path -- path to the checkpoint
+    """
+    with timing.span(timing.XML_PARSE):
+        return etree.parse(path, etree.XMLParser(huge_tree=True)).getroot()
+
+
+def get_configuration_snapshot(cib: _Element) -> ConfigurationSnapshot:
+    """
+    Export configuration parts of a CIB to be compared with another CIB
+
+    cib -- the whole CIB
+    """
+    resources_el = get_resources(cib)
+    constraints_el = get_constraints(cib)
+    rule_evaluator = RuleInEffectEvalDummy()
+    location_list, location_set_list = location.get_all_as_dtos(
+        constraints_el, rule_evaluator
+    )
+    colocation_list, colocation_set_list = colocation.get_all_as_dtos(
+        constraints_el, rule_evaluator
+    )
+    order_list, order_set_list = order.get_all_as_dtos(constraints_el)
+    ticket_list, ticket_set_list = ticket.get_all_as_dtos(constraints_el)
+    return ConfigurationSnapshot(
+        resources=CibResourcesDto(
+            primitives=[
+                resource.primitive.primitive_element_to_dto(el)
+                for el in resources_el.findall(
+                    f".//{cib_const.TAG_RESOURCE_PRIMITIVE}"
+                )
+            ],
+            clones=[
+                resource.clone.clone_element_to_dto(el)
+                for el in resources_el.findall(cib_const.TAG_RESOURCE_CLONE)
+            ]
+            + [
+                resource.clone.master_element_to_dto(el)
+                for el in resources_el.findall(cib_const.TAG_RESOURCE_MASTER)
+            ],
+            groups=[
+                resource.group.group_element_to_dto(el)
+                for el in resources_el.findall(
+                    f".//{cib_const.TAG_RESOURCE_GROUP}"
+                )
+            ],
+            bundles=[
+                resource.bundle.bundle_element_to_dto(el)
+                for el in resources_el.findall(cib_const.TAG_RESOURCE_BUNDLE)
+            ],
+        ),
+        constraints=CibConstraintsDto(
+            location=location_list,
+            location_set=location_set_list,
+            colocation=colocation_list,
+            colocation_set=colocation_set_list,
+            order=order_list,
+            order_set=order_set_list,
+            ticket=ticket_list,
+            ticket_set=ticket_set_list,
+        ),
+        properties=ListCibNvsetDto(
+            nvsets=[
+                nvpair_multi.nvset_element_to_dto(nvset_el, rule_evaluator)
+                for nvset_el in nvpair_multi.find_nvsets(
+                    get_crm_config(cib), nvpair_multi.NVSET_PROPERTY
+                )
+            ]
+        ),
+        other_sections={
+            str(section_el.tag): _get_canonical_section(section_el)
+            for section_el in get_configuration(cib)
+            if isinstance(section_el.tag, str)
+            and section_el.tag not in _DTO_SECTIONS
+        },
+    )
+
+
+def _get_canonical_section(section_el: _Element) -> bytes:
+    # whitespace between elements is not a change in the configuration
+    section_el = deepcopy(section_el)
+    for element in section_el.iter():
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+    return etree.tostring(section_el, method="c14n")
+
+
+def get_resources_map(resources: CibResourcesDto) -> dict[str, Any]:
+    """
+    Return resource DTOs of all types keyed by their ids
+    """
+    return {
+        resource_dto.id: resource_dto
+        for resource_list in (
+            resources.primitives,
+            resources.groups,
+            resources.clones,
+            resources.bundles,
+        )
+        for resource_dto in resource_list
+    }
+
+
+def get_constraints_map(
+    constraints: CibConstraintsDto,
+) -> dict[str, CibConstraintsDto]:
+    """
+    Split constraints to DTOs containing one constraint each, keyed by ids
+    """
+    empty_lists: dict[str, list[Any]] = {
+        field.name: [] for field in fields(constraints)
+    }
+    return {
+        constraint_dto.attributes.constraint_id: CibConstraintsDto(
+            **{**empty_lists, field.name: [constraint_dto]}
+        )
+        for field in fields(constraints)
+        for constraint_dto in getattr(constraints, field.name)
+    }
+
+
+def _get_properties_map(properties: ListCibNvsetDto) -> dict[str, str]:
+    properties_map: dict[str, str] = {}
+    for nvset_dto in properties.nvsets:
+        for nvpair_dto in nvset_dto.nvpairs:
+            properties_map.setdefault(nvpair_dto.name, nvpair_dto.value)
+    return properties_map
+
+
+def _diff_maps(
+    old: Mapping[str, Any], new: Mapping[str, Any]
+) -> list[tuple[str, str]]:
+    result = []
+    for item_id in sorted(old.keys() | new.keys()):
+        if item_id not in new:
+            result.append((item_id, CHANGE_REMOVED))
+        elif item_id not in old:
+            result.append((item_id, CHANGE_ADDED))
+        elif old[item_id] != new[item_id]:
+            result.append((item_id, CHANGE_CHANGED))
+    return result
+
+
+def diff_snapshots(
+    old: ConfigurationSnapshot, new: ConfigurationSnapshot
+) -> ConfigurationDiff:
+    """
+    Compare two configuration snapshots item by item
+
+    old -- the original configuration
+    new -- the changed configuration
+    """
+    old_properties = _get_properties_map(old.properties)
+    new_properties = _get_properties_map(new.properties)
+    return ConfigurationDiff(
+        resources=_diff_maps(
+            get_resources_map(old.resources), get_resources_map(new.resources)
+        ),
+        constraints=_diff_maps(
+            get_constraints_map(old.constraints),
+            get_constraints_map(new.constraints),
+        ),
+        properties=[
+            (name, old_properties.get(name), new_properties.get(name))
+            for name, _ in _diff_maps(old_properties, new_properties)
+        ],
+        other_sections=_diff_maps(old.other_sections, new.other_sections),
+    )
+
+
+def section_to_lines(section_xml: bytes) -> list[str]:
+    """
+    Export a configuration section from a snapshot to indented XML lines
+
+    section_xml -- the section in the canonical form
+    """
+    return etree.tostring(
+        etree.fromstring(section_xml), encoding="unicode", pretty_print=True
+    ).splitlines()
@@ -1,5 +1,4 @@
-import abc
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
 from typing import TypedDict
 
 from lxml.etree import SubElement, _Element
@@ -131,16 +130,113 @@ def create_constraint_with_set(
     return constraint_el
 
 
+ConstraintSignature = Hashable
+
+
+class _ConstraintSignatureIndex:
+    """
+    Index of constraints of one type and setness by their signatures
+
+    The index is built incrementally. Constraints appended to the constraint
+    section since the last lookup are indexed on the next lookup, so creating
+    many constraints one by one does not rescan the whole section each time.
+    If constraints have been removed or inserted elsewhere, the index is
+    rebuilt from scratch. Constraints modified in place are not detected.
+    """
+
+    def __init__(
+        self,
+        constraint_section: _Element,
+        constraint_tag: str,
+        is_set: bool,
+        get_signature_list: Callable[[_Element], Iterable[ConstraintSignature]],
+    ):
+        self._section = constraint_section
+        self._tag = constraint_tag
+        self._is_set = is_set
+        self._get_signature_list = get_signature_list
+        self._index: dict[ConstraintSignature, list[_Element]] = {}
+        self._indexed_count = 0
+        self._last_indexed: _Element | None = None
+
+    def _reset(self) -> None:
+        self._index = {}
+        self._indexed_count = 0
+        self._last_indexed = None
+
+    def _add(self, element: _Element) -> None:
+        self._indexed_count += 1
+        self._last_indexed = element
+        if (
+            element.tag != self._tag
+            or is_set_constraint(element) != self._is_set
+        ):
+            return
+        for signature in set(self._get_signature_list(element)):
+            self._index.setdefault(signature, []).append(element)
+
+    def _add_following(self) -> None:
+        if self._last_indexed is None:
+            element = next(iter(self._section), None)
+        else:
+            element = self._last_indexed.getnext()
+        while element is not None:
+            self._add(element)
+            element = element.getnext()
+
+    def _update(self) -> None:
+        if (
+            self._last_indexed is not None
+            and self._last_indexed.getparent() is not self._section
+        ):
+            self._reset()
+        self._add_following()
+        # Constraints have been inserted or removed elsewhere than at the end
+        # of the section. This is not expected to happen often, so it is good
+        # enough to start over.
+        if self._indexed_count != len(self._section):
+            self._reset()
+            self._add_following()
+
+    def find(
+        self, signature_list: Iterable[ConstraintSignature]
+    ) -> list[_Element]:
+        """
+        Return constraints matching any of the signatures in document order
+        """
+        self._update()
+        signature_set = set(signature_list)
+        found: dict[_Element, None] = {}
+        for signature in signature_set:
+            for element in self._index.get(signature, []):
+                # the element may have been removed from the CIB in place
+                if element.getparent() is self._section:
+                    found[element] = None
+        if len(signature_set) < 2 or len(found) < 2:
+            # elements of one signature are indexed in document order already
+            return list(found)
+        position = {el: pos for pos, el in enumerate(self._section)}
+        return sorted(found, key=lambda el: position[el])
+
+
 class DuplicatesChecker:
     """
     Base class for finding duplicate constraints
 
-    To use it, create a subclass and implement _are_duplicate method to compare
-    constraints of a specific type
+    To use it, create a subclass and implement _get_signature_list method to
+    provide hashable signatures of constraints of a specific type. Constraints
+    sharing a signature are duplicate. Subclasses not able to express duplicity
+    by signatures implement _are_duplicate method to compare constraints
+    pairwise instead.
+
+    Indexes of constraints built by an instance are kept for further checks, so
+    reuse one instance when checking many constraints in one CIB, see
+    LibraryEnvironment.get_constraint_duplicates_checker.
     """
 
     def __init__(self) -> None:
-        pass
+        self._index_section: _Element | None = None
+        self._index_map: dict[tuple[str, bool], _ConstraintSignatureIndex] = {}
 
     def check(
         self,
@@ -155,17 +251,12 @@ class DuplicatesChecker:
         constraint_to_check -- search for duplicates of this constraint
         force_flags -- list of flags codes
         """
-        self._check_init(constraint_to_check)
         report_list: reports.ReportItemList = []
         duplication_allowed = reports.codes.FORCE in force_flags
 
-        duplicate_constraint_list = [
-            constraint_el
-            for constraint_el in find_constraints_of_same_type(
-                constraint_section, constraint_to_check
-            )
-            if self._are_duplicate(constraint_to_check, constraint_el)
-        ]
+        duplicate_constraint_list = self.find_duplicates(
+            constraint_section, constraint_to_check
+        )
 
         if duplicate_constraint_list:
             report_list.append(
@@ -184,12 +275,75 @@ class DuplicatesChecker:
 
         return report_list
 
+    def find_duplicates(
+        self,
+        constraint_section: _Element,
+        constraint_to_check: _Element,
+    ) -> list[_Element]:
+        """
+        Find existing constraints duplicate to a constraint in document order
+
+        constraint_section -- where to look for existing constraints
+        constraint_to_check -- search for duplicates of this constraint
+        """
+        self._check_init(constraint_to_check)
+        signature_list = self._get_signature_list(constraint_to_check)
+        if signature_list is None:
+            return [
+                constraint_el
+                for constraint_el in find_constraints_of_same_type(
+                    constraint_section, constraint_to_check
+                )
+                if self._are_duplicate(constraint_to_check, constraint_el)
+            ]
+        return [
+            constraint_el
+            for constraint_el in self._get_index(
+                constraint_section, constraint_to_check
+            ).find(signature_list)
+            if constraint_el is not constraint_to_check
+        ]
+
+    def _get_index(
+        self, constraint_section: _Element, constraint_to_check: _Element
+    ) -> _ConstraintSignatureIndex:
+        if constraint_section is not self._index_section:
+            self._index_section = constraint_section
+            self._index_map = {}
+        key = (
+            str(constraint_to_check.tag),
+            is_set_constraint(constraint_to_check),
+        )
+        if key not in self._index_map:
+            self._index_map[key] = _ConstraintSignatureIndex(
+                constraint_section,
+                key[0],
+                key[1],
+                self._get_existing_signatures,
+            )
+        return self._index_map[key]
+
+    def _get_existing_signatures(
+        self, constraint_el: _Element
+    ) -> Iterable[ConstraintSignature]:
+        return self._get_signature_list(constraint_el) or []
+
     def _check_init(self, constraint_to_check: _Element) -> None:
         """
         For descendants to do their initialization for each check
         """
 
-    @abc.abstractmethod
+    def _get_signature_list(
+        self, constraint_el: _Element
+    ) -> Sequence[ConstraintSignature] | None:
+        """
+        Return signatures of a constraint or None to compare pairwise
+
+        constraint_el -- a constraint to get signatures of
+        """
+        del constraint_el
+        return None
+
     def _are_duplicate(
         self,
         constraint_to_check: _Element,
@@ -204,32 +358,27 @@ class DuplicatesChecker:
         raise NotImplementedError()
 
 
-class DuplicatesCheckerSetConstraint(DuplicatesChecker):
-    _constraint_id_set_list: list[list[str]]
-
-    @staticmethod
-    def _get_id_set_list(constraint_el: _Element) -> list[list[str]]:
-        return [
-            resource_set.get_resource_id_set_list(resource_set_item)
-            for resource_set_item in constraint_el.findall(
-                f".//{resource_set.TAG_RESOURCE_SET}"
-            )
-        ]
+def get_resource_sets_signature(
+    constraint_el: _Element,
+) -> tuple[tuple[str, ...], ...]:
+    """
+    Return hashable representation of resources in sets of a constraint
 
-    def _check_init(self, constraint_to_check: _Element) -> None:
-        self._constraint_id_set_list = self._get_id_set_list(
-            constraint_to_check
+    constraint_el -- a constraint with resource sets
+    """
+    return tuple(
+        tuple(resource_set.get_resource_id_set_list(resource_set_item))
+        for resource_set_item in constraint_el.iterfind(
+            f".//{resource_set.TAG_RESOURCE_SET}"
         )
+    )
 
-    def _are_duplicate(
-        self,
-        constraint_to_check: _Element,
-        constraint_el: _Element,
-    ) -> bool:
-        del constraint_to_check
-        return (
-            self._get_id_set_list(constraint_el) == self._constraint_id_set_list
-        )
+
+class DuplicatesCheckerSetConstraint(DuplicatesChecker):
+    def _get_signature_list(
+        self, constraint_el: _Element
+    ) -> Sequence[ConstraintSignature] | None:
+        return [get_resource_sets_signature(constraint_el)]
 
 
 def validate_constrainable_elements(
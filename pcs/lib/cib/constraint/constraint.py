@@ -72,17 +72,6 @@ def create_id(cib, type_prefix, resource_set_list):
     return find_unique_id(cib, f"{type_prefix}_set_{id_part}")
 
 
-# DEPRECATED, replace with pcs.lib.cib.constraint.common.DuplicatesChecker
-def have_duplicate_resource_sets(element, other_element):
-    def get_id_set_list(element):
-        return [
-            resource_set.get_resource_id_set_list(resource_set_item)
-            for resource_set_item in element.findall(".//resource_set")
-        ]
-
-    return get_id_set_list(element) == get_id_set_list(other_element)
-
-
 # DEPRECATED, replace with pcs.lib.cib.constraints.duplicates
 def check_is_without_duplication(
     report_processor: reports.ReportProcessor,
@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
 from lxml import etree
 from lxml.etree import _Element
@@ -22,6 +22,7 @@ from pcs.lib.pacemaker.values import sanitize_id
 from pcs.lib.tools import get_optional_value
 
 from .common import (
+    ConstraintSignature,
     DuplicatesChecker,
     is_set_constraint,
     validate_constrainable_elements,
@@ -115,49 +116,30 @@ class DuplicatesCheckerLocationRulePlain(DuplicatesChecker):
     def __init__(self) -> None:
         super().__init__()
         self._rule_to_str = rule.RuleToStr(normalize=True)
-        self._constraint_to_check_rule: str | None = None
 
     def _check_init(self, constraint_to_check: _Element) -> None:
-        self._constraint_to_check_rule = None
         if len(constraint_to_check.findall(TAG_RULE)) != 1:
             raise RuntimeError(
                 "constraint_to_check must contain exactly one rule"
             )
 
-    def _are_duplicate(
-        self,
-        constraint_to_check: _Element,
-        constraint_el: _Element,
-    ) -> bool:
-        # simple node-score constraints are not duplicate to rule constraints
-        if not is_location_constraint_with_rule(constraint_el):
-            return False
-
-        # get the base constraint's rule as string
-        if self._constraint_to_check_rule is None:
-            rule_el = constraint_to_check.find(TAG_RULE)
-            if rule_el is not None:
-                self._constraint_to_check_rule = self._rule_to_str.get_str(
-                    rule_el
-                )
-
-        # get the tested constraint's rules as strings
-        rules = {
-            self._rule_to_str.get_str(rule_el)
+    def _get_signature_list(
+        self, constraint_el: _Element
+    ) -> Sequence[ConstraintSignature] | None:
+        # From pacemaker explained:
+        # A location constraint may contain one or more top-level rules.
+        # The cluster will act as if there is a separate location constraint
+        # for each rule that evaluates as true.
+        # Simple node-score constraints have no rules and therefore no
+        # signatures, so they are never duplicate to rule constraints.
+        return [
+            (
+                constraint_el.get("rsc"),
+                constraint_el.get("rsc-pattern"),
+                self._rule_to_str.get_str(rule_el),
+            )
             for rule_el in constraint_el.iterfind(TAG_RULE)
-        }
-
-        # compare the two constraints
-        return (
-            constraint_to_check.get("rsc") == constraint_el.get("rsc")
-            and constraint_to_check.get("rsc-pattern")
-            == constraint_el.get("rsc-pattern")
-            # From pacemaker explained:
-            # A location constraint may contain one or more top-level rules.
-            # The cluster will act as if there is a separate location
-            # constraint for each rule that evaluates as true.
-            and self._constraint_to_check_rule in rules
-        )
+        ]
 
 
 class ValidateCreatePlainWithRule:
@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import cast
 
 from lxml.etree import SubElement, _Element
@@ -24,9 +24,11 @@ from pcs.lib.xml_tools import remove_one_element, remove_when_pointless
 from .common import (
     CmdInputResourceSetList,
     CmdInputResourceSetLoadedList,
+    ConstraintSignature,
     DuplicatesChecker,
     DuplicatesCheckerSetConstraint,
     create_constraint_with_set,
+    get_resource_sets_signature,
     is_set_constraint,
     validate_constrainable_elements,
 )
@@ -300,31 +302,18 @@ class DuplicatesCheckerTicketPlain(DuplicatesChecker):
     Searcher of duplicate plain ticket constraints
     """
 
-    _constraint_characteristics: Mapping[str, str | None]
-
-    @staticmethod
-    def _characteristics(constraint_el: _Element) -> dict[str, str | None]:
-        return {
-            "ticket": constraint_el.get("ticket"),
-            "rsc": constraint_el.get("rsc"),
-            "rsc-role": get_optional_value(
-                role_constructor, constraint_el.get("rsc-role")
-            ),
-        }
-
-    def _check_init(self, constraint_to_check: _Element) -> None:
-        self._constraint_characteristics = self._characteristics(
-            constraint_to_check
-        )
-
-    def _are_duplicate(
-        self, constraint_to_check: _Element, constraint_el: _Element
-    ) -> bool:
-        del constraint_to_check
-        return (
-            self._characteristics(constraint_el)
-            == self._constraint_characteristics
-        )
+    def _get_signature_list(
+        self, constraint_el: _Element
+    ) -> Sequence[ConstraintSignature] | None:
+        return [
+            (
+                constraint_el.get("ticket"),
+                constraint_el.get("rsc"),
+                get_optional_value(
+                    role_constructor, constraint_el.get("rsc-role")
+                ),
+            )
+        ]
 
 
 class DuplicatesCheckerTicketWithSet(DuplicatesCheckerSetConstraint):
@@ -332,14 +321,15 @@ class DuplicatesCheckerTicketWithSet(DuplicatesCheckerSetConstraint):
     Searcher of duplicate ticket constraints with resource sets
     """
 
-    def _are_duplicate(
-        self,
-        constraint_to_check: _Element,
-        constraint_el: _Element,
-    ) -> bool:
-        return constraint_to_check.get("ticket") == constraint_el.get(
-            "ticket"
-        ) and super()._are_duplicate(constraint_to_check, constraint_el)
+    def _get_signature_list(
+        self, constraint_el: _Element
+    ) -> Sequence[ConstraintSignature] | None:
+        return [
+            (
+                constraint_el.get("ticket"),
+                get_resource_sets_signature(constraint_el),
+            )
+        ]
 
 
 def _element_to_attributes_dto(
@@ -41,8 +41,8 @@ from pcs.lib.cib.tools import (
 from pcs.lib.pacemaker.live import parse_cib_xml
 from pcs.lib.pacemaker.state import ensure_resource_state
 from pcs.lib.pacemaker.status import (
-    ClusterStatusParser,
     ClusterStatusParsingError,
+    ClusterStatusSnapshot,
     cluster_status_parsing_error_to_report,
 )
 from pcs.lib.xml_tools import get_root
@@ -214,7 +214,7 @@ class ElementsToRemove:
 
 
 def ensure_resources_stopped(
-    state: _Element,
+    state: ClusterStatusSnapshot,
     resource_ids: StringSequence,
     force_flags: reports.types.ForceFlags,
 ) -> reports.ReportItemList:
@@ -227,13 +227,12 @@ def ensure_resources_stopped(
     not_stopped_ids = []
     report_list: reports.ReportItemList = []
     try:
-        parser = ClusterStatusParser(state)
         try:
-            status_dto = parser.status_xml_to_dto()
+            status_dto, warnings = state.get_resources_status()
         except ClusterStatusParsingError as e:
             report_list.append(cluster_status_parsing_error_to_report(e))
             return report_list
-        report_list.extend(parser.get_warnings())
+        report_list.extend(warnings)
 
         status = ResourcesStatusFacade.from_resources_status_dto(status_dto)
         for r_id in resource_ids:
@@ -266,7 +265,9 @@ def ensure_resources_stopped(
         not_stopped_ids = [
             resource_id
             for resource_id in resource_ids
-            if ensure_resource_state(False, state, resource_id).severity.level
+            if ensure_resource_state(
+                False, state.status_dom, resource_id
+            ).severity.level
             == reports.item.ReportItemSeverity.ERROR
         ]
 
@@ -17,6 +17,7 @@ from pcs.lib.cib.nvpair import (
 from pcs.lib.cib.tools import IdProvider
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.digest import calculate_resource_digests
 from pcs.lib.pacemaker.live import get_resource_digests
 from pcs.lib.pacemaker.state import get_resource_state
 from pcs.lib.xml_tools import get_root
@@ -411,6 +412,105 @@ def _update_digest_attrs_in_transient_instance_attributes(
             )
 
 
+def _get_digest_params(resource_el: _Element) -> dict[str, str] | None:
+    """
+    Return instance attributes of a resource for in-process digest
+    calculation or None if pacemaker may evaluate them differently
+
+    resource_el -- resource element
+    """
+    nvset_list = resource_el.findall(INSTANCE_ATTRIBUTES_TAG)
+    if len(nvset_list) > 1 or any(
+        nvset_el.find("rule") is not None for nvset_el in nvset_list
+    ):
+        return None
+    params: dict[str, str] = {}
+    for nvset_el in nvset_list:
+        for nvpair_el in nvset_el.findall("nvpair"):
+            name = nvpair_el.get("name")
+            value = nvpair_el.get("value")
+            if name is None or value is None or str(name) in params:
+                return None
+            params[str(name)] = str(value)
+    return params
+
+
+def _calculate_digests_in_process(
+    params_before: Mapping[str, str] | None,
+    params_after: Mapping[str, str] | None,
+    lrm_rsc_op_el: _Element | None,
+    crm_meta_attributes: dict[str, str | None] | None,
+) -> dict[str, str | None] | None:
+    """
+    Calculate digests of updated resource parameters in-process, return None
+    if the calculation cannot be verified to match pacemaker
+
+    The calculation is verified by calculating digests of the parameters
+    before the update and comparing them to the digests recorded by pacemaker
+    in the lrm_rsc_op element.
+
+    params_before -- resource parameters before the update
+    params_after -- resource parameters after the update
+    lrm_rsc_op_el -- operation history element to be updated
+    crm_meta_attributes -- parameters of a monitor operation
+    """
+    if params_before is None or params_after is None or lrm_rsc_op_el is None:
+        return None
+    recorded_digests = {
+        attr: lrm_rsc_op_el.get(attr)
+        for attr in DIGEST_ATTRS
+        if lrm_rsc_op_el.get(attr) is not None
+    }
+    digests_before = calculate_resource_digests(
+        params_before, crm_meta_attributes
+    )
+    if (
+        not recorded_digests
+        or digests_before is None
+        or any(
+            digests_before.get(DIGEST_ATTR_TO_DIGEST_TYPE_MAP[attr]) != digest
+            for attr, digest in recorded_digests.items()
+        )
+    ):
+        return None
+    return calculate_resource_digests(params_after, crm_meta_attributes)
+
+
+def _get_resource_digests(
+    runner: CommandRunner,
+    resource_id: str,
+    node_name: str,
+    new_instance_attrs: dict[str, str],
+    digest_params: tuple[dict[str, str] | None, dict[str, str] | None],
+    lrm_rsc_op_el: _Element | None,
+    crm_meta_attributes: dict[str, str | None] | None = None,
+) -> dict[str, str | None]:
+    """
+    Get digests of a resource operation, calculate them in-process if
+    possible, otherwise use crm_resource
+
+    runner -- command runner instance
+    resource_id -- id of the resource
+    node_name -- name of the node where the resource is running
+    new_instance_attrs -- updated instance attributes
+    digest_params -- all resource parameters before and after the update
+    lrm_rsc_op_el -- operation history element to be updated
+    crm_meta_attributes -- parameters of a monitor operation
+    """
+    digests = _calculate_digests_in_process(
+        *digest_params, lrm_rsc_op_el, crm_meta_attributes
+    )
+    if digests is not None:
+        return digests
+    return get_resource_digests(
+        runner,
+        resource_id,
+        node_name,
+        new_instance_attrs,
+        crm_meta_attributes=crm_meta_attributes,
+    )
+
+
 def update_scsi_devices_without_restart(
     runner: CommandRunner,
     cluster_state: _Element,
@@ -453,15 +553,22 @@ def update_scsi_devices_without_restart(
     node_name = roles_with_nodes["Started"][0]
 
     new_instance_attrs = {"devices": ",".join(sorted(devices_list))}
+    params_before = _get_digest_params(resource_el)
     arrange_first_instance_attributes(
         resource_el, new_instance_attrs, id_provider
     )
+    digest_params = (params_before, _get_digest_params(resource_el))
 
     lrm_rsc_op_start_list = _get_lrm_rsc_op_elements(
         cib, resource_id, node_name, "start"
     )
-    new_instance_attrs_digests = get_resource_digests(
-        runner, resource_id, node_name, new_instance_attrs
+    new_instance_attrs_digests = _get_resource_digests(
+        runner,
+        resource_id,
+        node_name,
+        new_instance_attrs,
+        digest_params,
+        lrm_rsc_op_start_list[0] if len(lrm_rsc_op_start_list) == 1 else None,
     )
     if len(lrm_rsc_op_start_list) == 1:
         _update_digest_attrs_in_lrm_rsc_op(
@@ -501,11 +608,13 @@ def update_scsi_devices_without_restart(
         if len(lrm_rsc_op_list) == 1:
             _update_digest_attrs_in_lrm_rsc_op(
                 lrm_rsc_op_list[0],
-                get_resource_digests(
+                _get_resource_digests(
                     runner,
                     resource_id,
                     node_name,
                     new_instance_attrs,
+                    digest_params,
+                    lrm_rsc_op_list[0],
                     crm_meta_attributes=monitor_attrs,
                 ),
             )
@@ -1,4 +1,5 @@
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
 import pyparsing
@@ -56,8 +57,13 @@ _token_to_node_expr_type = {
     "version": NODE_ATTR_TYPE_VERSION,
 }
 
-
-pyparsing.ParserElement.enable_packrat()
+# Rule strings tend to repeat, e.g. the same rule is used in many constraints
+# or nvsets. Parsing a rule is much slower than looking it up in the cache.
+_PARSED_RULE_CACHE_SIZE = 1024
+# The packrat cache is cleared before parsing each rule. Pyparsing's default
+# size of 128 entries is not enough for longer rules, which makes parsing them
+# much slower.
+_PACKRAT_CACHE_SIZE = 1024
 
 
 class RuleParseError(Exception):
@@ -79,10 +85,13 @@ class RuleParseError(Exception):
         self.msg = msg
 
 
+@lru_cache(maxsize=_PARSED_RULE_CACHE_SIZE)
 def parse_rule(rule_string: str) -> BoolExpr:
     """
     Parse a rule string and return a corresponding semantic tree
 
+    Parsed trees are cached and shared by all callers, do not modify them.
+
     rule_string -- the whole rule expression
     """
     if not rule_string:
@@ -264,8 +273,12 @@ def __get_date_common_parser_part() -> pyparsing.ParserElement:
     )
 
 
+@lru_cache(maxsize=1)
 def __get_rule_parser() -> pyparsing.ParserElement:
-    # This function defines the rule grammar
+    # This function defines the rule grammar. It is built once on first use.
+    # Packrat is a global pyparsing setting, it is enabled here so that merely
+    # importing this module does not change it.
+    pyparsing.ParserElement.enable_packrat(cache_size_limit=_PACKRAT_CACHE_SIZE)
 
     # How to add new rule expressions:
     #   1 Create new grammar rules in a way similar to existing rsc_expr and
@@ -66,7 +66,9 @@ def remove_elements(
         if env.is_cib_live:
             report_processor.report_list(
                 ensure_resources_stopped(
-                    env.get_cluster_state(), non_stonith_ids, force_flags
+                    env.get_cluster_status_snapshot(),
+                    non_stonith_ids,
+                    force_flags,
                 )
             )
         else:
@@ -36,7 +36,6 @@ from pcs.lib.pacemaker.live import (
     has_cib_xml,
 )
 from pcs.lib.pacemaker.live import verify as verify_cmd
-from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.resource_agent.types import ResourceAgentName
 from pcs.lib.tools import generate_binary_key
 
@@ -78,7 +77,7 @@ def verify(env: LibraryEnvironment, verbose: bool = False) -> None:
     env.report_processor.report_list(
         fencing_topology.verify(
             cib,
-            ClusterState(env.get_cluster_state()).node_section.nodes,
+            env.get_cluster_status_snapshot().cluster_state.node_section.nodes,
         )
     )
     env.report_processor.report_list(verify_bundles(get_resources(cib)))
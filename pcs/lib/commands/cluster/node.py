@@ -8,7 +8,7 @@ from pcs.common.services_dto import ServiceStatusDto
 from pcs.common.str_tools import join_multilines
 from pcs.common.tools import Version, get_version_from_string
 from pcs.common.version_dto import VersionDto
-from pcs.lib import sbd
+from pcs.lib import sbd, tool_probe
 from pcs.lib.cib.node_rename import rename_in_cib
 from pcs.lib.commands.cluster.utils import ensure_live_env, verify_corosync_conf
 from pcs.lib.communication import cluster
@@ -21,13 +21,17 @@ from pcs.lib.communication.nodes import GetOnlineTargets, RemoveNodesFromCib
 from pcs.lib.communication.tools import AllSameDataMixin, run_and_raise
 from pcs.lib.communication.tools import run as run_com
 from pcs.lib.corosync import config_validators
-from pcs.lib.corosync.live import get_corosync_version
+from pcs.lib.corosync.live import (
+    get_corosync_version,
+    get_corosync_version_cmd,
+)
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
 from pcs.lib.node import get_existing_nodes_names
 from pcs.lib.pacemaker.live import (
     get_cib_file_runner_env,
     get_pacemaker_version,
+    get_pacemaker_version_cmd,
     has_cib_xml,
     remove_node,
 )
@@ -478,20 +482,26 @@ def get_host_daemons_info(env: LibraryEnvironment) -> ClusterDaemonsInfoDto:
         "sbd",
     ]
 
+    cluster_configuration_exists = env.has_corosync_conf or has_cib_xml()
+    service_states = env.service_manager.get_states(all_cluster_services)
+    runner = env.cmd_runner()
+    tool_probe.prefetch(
+        runner, [get_corosync_version_cmd(), get_pacemaker_version_cmd()]
+    )
     return ClusterDaemonsInfoDto(
-        cluster_configuration_exists=(env.has_corosync_conf or has_cib_xml()),
+        cluster_configuration_exists=cluster_configuration_exists,
         services=[
             ServiceStatusDto(
                 service=service,
-                installed=env.service_manager.is_installed(service),
-                enabled=env.service_manager.is_enabled(service),
-                running=env.service_manager.is_running(service),
+                installed=service_states[service].installed,
+                enabled=service_states[service].enabled,
+                running=service_states[service].running,
             )
             for service in all_cluster_services
         ],
         versions=ClusterComponentVersionDto(
-            corosync=_version_to_dto(get_corosync_version(env.cmd_runner())),
-            pacemaker=_version_to_dto(get_pacemaker_version(env.cmd_runner())),
+            corosync=_version_to_dto(get_corosync_version(runner)),
+            pacemaker=_version_to_dto(get_pacemaker_version(runner)),
             pcsd=_version_to_dto(get_version_from_string(settings.pcs_version)),
         ),
     )
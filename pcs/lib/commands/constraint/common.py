@@ -21,6 +21,7 @@ from pcs.lib.cib.tools import (
     get_element_by_id,
 )
 from pcs.lib.env import LibraryEnvironment
+from pcs.lib.errors import LibraryError
 
 
 # This is an extracted part of lib commands for creating set constraints for
@@ -77,16 +78,24 @@ def create_with_set(
         ],
     )
 
-    if not duplicate_check:
-        duplicate_check = constraint.have_duplicate_resource_sets
-
-    constraint.check_is_without_duplication(
-        env.report_processor,
-        constraint_section,
-        constraint_element,
-        are_duplicate=duplicate_check,
-        duplication_allowed=duplication_alowed,
-    )
+    if duplicate_check:
+        constraint.check_is_without_duplication(
+            env.report_processor,
+            constraint_section,
+            constraint_element,
+            are_duplicate=duplicate_check,
+            duplication_allowed=duplication_alowed,
+        )
+    elif env.report_processor.report_list(
+        env.get_constraint_duplicates_checker(
+            common.DuplicatesCheckerSetConstraint
+        ).check(
+            constraint_section,
+            constraint_element,
+            {reports.codes.FORCE} if duplication_alowed else set(),
+        )
+    ).has_errors:
+        raise LibraryError()
 
     env.push_cib()
 
@@ -96,9 +96,9 @@ def create_plain_with_rule(
 
     # Check whether the created constraint is a duplicate of an existing one
     env.report_processor.report_list(
-        location.DuplicatesCheckerLocationRulePlain().check(
-            constraint_section, new_constraint, force_flags
-        )
+        env.get_constraint_duplicates_checker(
+            location.DuplicatesCheckerLocationRulePlain
+        ).check(constraint_section, new_constraint, force_flags)
     )
     if env.report_processor.has_errors:
         raise LibraryError()
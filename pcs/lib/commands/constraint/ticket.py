@@ -84,7 +84,9 @@ def create(
 
     # Check whether the created constraint is a duplicate of an existing one
     env.report_processor.report_list(
-        ticket.DuplicatesCheckerTicketPlain().check(
+        env.get_constraint_duplicates_checker(
+            ticket.DuplicatesCheckerTicketPlain
+        ).check(
             constraint_section,
             new_constraint,
             {reports.codes.FORCE} if duplication_alowed else set(),
@@ -174,7 +176,9 @@ def create_with_set(
 
     # Check whether the created constraint is a duplicate of an existing one
     env.report_processor.report_list(
-        ticket.DuplicatesCheckerTicketWithSet().check(
+        env.get_constraint_duplicates_checker(
+            ticket.DuplicatesCheckerTicketWithSet
+        ).check(
             constraint_section,
             new_constraint,
             {reports.codes.FORCE} if duplication_alowed else set(),
@@ -7,7 +7,6 @@ from pcs.lib.cib import fencing_topology as cib_fencing_topology
 from pcs.lib.cib.tools import get_fencing_topology
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
-from pcs.lib.pacemaker.state import ClusterState
 
 
 def add_level(
@@ -40,7 +39,7 @@ def add_level(
         target_type,
         target_value,
         devices,
-        ClusterState(lib_env.get_cluster_state()).node_section.nodes,
+        lib_env.get_cluster_status_snapshot().cluster_state.node_section.nodes,
         level_id,
         force_device,
         force_node,
@@ -126,7 +125,7 @@ def verify(lib_env: LibraryEnvironment) -> None:
     lib_env.report_processor.report_list(
         cib_fencing_topology.verify(
             cib,
-            ClusterState(lib_env.get_cluster_state()).node_section.nodes,
+            lib_env.get_cluster_status_snapshot().cluster_state.node_section.nodes,
         )
     )
     if lib_env.report_processor.has_errors:
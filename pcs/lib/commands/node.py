@@ -10,7 +10,6 @@ from pcs.lib.cib.tools import IdProvider, get_nodes
 from pcs.lib.env import LibraryEnvironment, WaitType
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.live import get_local_node_name
-from pcs.lib.pacemaker.state import ClusterState
 
 
 @contextmanager
@@ -19,7 +18,7 @@ def cib_runner_nodes(lib_env: LibraryEnvironment, wait: WaitType):
     yield (
         lib_env.get_cib(),
         lib_env.cmd_runner(),
-        ClusterState(lib_env.get_cluster_state()).node_section.nodes,
+        lib_env.get_cluster_status_snapshot().cluster_state.node_section.nodes,
     )
     lib_env.push_cib(wait_timeout=wait_timeout)
 
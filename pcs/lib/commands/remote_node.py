@@ -732,7 +732,7 @@ def node_remove_remote(
     if env.is_cib_live:
         report_processor.report_list(
             ensure_resources_stopped(
-                env.get_cluster_state(), resource_ids, force_flags
+                env.get_cluster_status_snapshot(), resource_ids, force_flags
             )
         )
     else:
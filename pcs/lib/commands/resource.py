@@ -1,6 +1,10 @@
+import dataclasses
+import os
 import re
+import time
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import partial
 from typing import Any, cast
@@ -13,6 +17,11 @@ from pcs.common.pacemaker.cibsecret import (
     CibResourceSecretDto,
     CibResourceSecretListDto,
 )
+from pcs.common.pacemaker.resource.disable_impact import (
+    ResourceDisableImpactDto,
+    ResourceDisableImpactListDto,
+    SimulatedOperationDto,
+)
 from pcs.common.pacemaker.resource.list import CibResourcesDto
 from pcs.common.reports import ReportItemList, ReportProcessor
 from pcs.common.reports.item import ReportItem
@@ -42,7 +51,7 @@ from pcs.lib.cib.tools import (
 )
 from pcs.lib.env import LibraryEnvironment, WaitType
 from pcs.lib.errors import LibraryError
-from pcs.lib.external import CommandRunner
+from pcs.lib.external import CommandRunner, ProcessTimeoutException
 from pcs.lib.node import (
     get_existing_nodes_names_addrs,
     get_pacemaker_node_names,
@@ -72,8 +81,8 @@ from pcs.lib.pacemaker.state import (
     is_resource_managed,
 )
 from pcs.lib.pacemaker.status import (
-    ClusterStatusParser,
     ClusterStatusParsingError,
+    ClusterStatusSnapshot,
     cluster_status_parsing_error_to_report,
 )
 from pcs.lib.pacemaker.values import is_true, validate_id
@@ -1336,8 +1345,11 @@ def _disable_run_simulate(
     disabled_resource_ids: set[str],
     inner_resource_ids: set[str],
     strict: bool,
-) -> tuple[str, set[str]]:
-    plaintext_status, transitions, dummy_cib = simulate_cib(cmd_runner, cib)
+    timeout: float | None = None,
+) -> tuple[str, list[simulate_tools.SimulationOperation], set[str]]:
+    plaintext_status, transitions, dummy_cib = simulate_cib(
+        cmd_runner, cib, timeout
+    )
     simulated_operations = simulate_tools.get_operations_from_transitions(
         transitions
     )
@@ -1361,7 +1373,7 @@ def _disable_run_simulate(
     # Stopping a clone stops all its inner resources. That should not block
     # stopping the clone.
     other_affected = other_affected - inner_resource_ids
-    return plaintext_status, other_affected
+    return plaintext_status, simulated_operations, other_affected
 
 
 def disable(
@@ -1499,7 +1511,7 @@ def disable_safe(
     disabled_resource_id_set, inner_resource_id_set = _disable_get_element_ids(
         resource_el_list
     )
-    plaintext_status, other_affected = _disable_run_simulate(
+    plaintext_status, _, other_affected = _disable_run_simulate(
         env.cmd_runner(),
         cib,
         disabled_resource_id_set,
@@ -1577,7 +1589,7 @@ def disable_simulate(
     disabled_resource_id_set, inner_resource_id_set = _disable_get_element_ids(
         resource_el_list
     )
-    plaintext_status, other_affected = _disable_run_simulate(
+    plaintext_status, _, other_affected = _disable_run_simulate(
         env.cmd_runner(),
         cib,
         disabled_resource_id_set,
@@ -1590,6 +1602,148 @@ def disable_simulate(
     )
 
 
+def disable_simulate_bulk(
+    env: LibraryEnvironment,
+    candidate_list: Sequence[StringSequence],
+    strict: bool,
+    max_concurrency: int | None = None,
+    timeout: int | None = None,
+) -> ResourceDisableImpactListDto:
+    """
+    Simulate disallowing each of the specified sets of resources to be started
+    by the cluster, each set is simulated on its own
+
+    env -- provides all for communication with externals
+    candidate_list -- each item holds ids of resources to be disabled
+        together, or in case of tag ids, all resources in tags
+    strict -- if False, allow resources to be migrated
+    max_concurrency -- maximal number of simulations running at the same time,
+        defaults to the number of CPUs
+    timeout -- time limit in seconds for all the simulations, sets which have
+        not been simulated in time are reported as timed out
+    """
+    if not env.is_cib_live:
+        raise LibraryError(
+            ReportItem.error(
+                reports.messages.LiveEnvironmentRequired([file_type_codes.CIB])
+            )
+        )
+    for option_name, option_value in (
+        ("max_concurrency", max_concurrency),
+        ("timeout", timeout),
+    ):
+        if option_value is not None and option_value < 1:
+            env.report_processor.report(
+                ReportItem.error(
+                    reports.messages.InvalidOptionValue(
+                        option_name, str(option_value), "a positive integer"
+                    )
+                )
+            )
+    if env.report_processor.has_errors:
+        raise LibraryError()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    # All the candidates are based on the same CIB. It is serialized once and
+    # each simulation job parses its own copy from the serialized form, so
+    # that only copies of running simulations are kept in memory.
+    base_cib_xml = etree_to_str(env.get_cib())
+    cluster_state = env.get_cluster_state()
+    cmd_runner = env.cmd_runner()
+
+    # crm_simulate does the heavy lifting in its own process, so threads are
+    # enough to run the simulations in parallel. Each crm_simulate process is
+    # killed when the deadline passes, so all the jobs finish by then.
+    with ThreadPoolExecutor(
+        max_workers=(max_concurrency or os.cpu_count() or 1)
+    ) as executor:
+        future_list = [
+            executor.submit(
+                _disable_simulate_bulk_candidate,
+                cmd_runner,
+                base_cib_xml,
+                cluster_state,
+                candidate,
+                strict,
+                deadline,
+            )
+            for candidate in candidate_list
+        ]
+    return ResourceDisableImpactListDto(
+        candidates=[future.result() for future in future_list]
+    )
+
+
+def _disable_simulate_bulk_candidate(
+    cmd_runner: CommandRunner,
+    base_cib_xml: str,
+    cluster_state: _Element,
+    candidate: StringSequence,
+    strict: bool,
+    deadline: float | None,
+) -> ResourceDisableImpactDto:
+    candidate_cib = get_cib(base_cib_xml)
+    resource_el_list, report_list = _find_resources_expand_tags(
+        candidate_cib, candidate
+    )
+    report_list.extend(
+        _resource_list_enable_disable(
+            resource_el_list,
+            resource.common.disable,
+            IdProvider(candidate_cib),
+            cluster_state,
+        )
+    )
+    disabled_id_set, inner_id_set = _disable_get_element_ids(resource_el_list)
+    candidate_dto = ResourceDisableImpactDto(
+        resource_or_tag_ids=list(candidate),
+        disabled_resource_ids=sorted(disabled_id_set),
+        other_affected_resource_ids=[],
+        operations=[],
+        timed_out=False,
+        reports=[report.to_dto() for report in report_list],
+    )
+    if reports.has_errors(report_list):
+        return candidate_dto
+
+    simulation_timeout = None
+    if deadline is not None:
+        simulation_timeout = deadline - time.monotonic()
+        if simulation_timeout <= 0:
+            return dataclasses.replace(candidate_dto, timed_out=True)
+    try:
+        _, operation_list, other_affected = _disable_run_simulate(
+            cmd_runner,
+            candidate_cib,
+            disabled_id_set,
+            inner_id_set,
+            strict,
+            timeout=simulation_timeout,
+        )
+    except ProcessTimeoutException:
+        # crm_simulate has been killed as it has not finished in time
+        return dataclasses.replace(candidate_dto, timed_out=True)
+    except LibraryError as e:
+        return dataclasses.replace(
+            candidate_dto,
+            reports=(
+                candidate_dto.reports + [report.to_dto() for report in e.args]
+            ),
+        )
+    return dataclasses.replace(
+        candidate_dto,
+        other_affected_resource_ids=sorted(other_affected),
+        operations=[
+            SimulatedOperationDto(
+                resource_id=operation.primitive_id,
+                operation=operation.operation_type,
+                node=operation.on_node,
+            )
+            for operation in operation_list
+        ],
+    )
+
+
 def enable(
     env: LibraryEnvironment,
     resource_or_tag_ids: list[str],
@@ -3115,7 +3269,7 @@ def stop(
         )
     env.report_processor.report_list(
         _ensure_resources_managed(
-            env.get_cluster_state(), resource_ids, force_flags
+            env.get_cluster_status_snapshot(), resource_ids, force_flags
         )
     )
 
@@ -3134,19 +3288,18 @@ def stop(
 
 
 def _ensure_resources_managed(
-    state: _Element,
+    state: ClusterStatusSnapshot,
     resource_ids: StringSequence,
     force_flags: reports.types.ForceFlags,
 ) -> reports.ReportItemList:
     report_list: reports.ReportItemList = []
     try:
-        parser = ClusterStatusParser(state)
         try:
-            status_dto = parser.status_xml_to_dto()
+            status_dto, warnings = state.get_resources_status()
         except ClusterStatusParsingError as e:
             report_list.append(cluster_status_parsing_error_to_report(e))
             return report_list
-        report_list.extend(parser.get_warnings())
+        report_list.extend(warnings)
 
         status = ResourcesStatusFacade.from_resources_status_dto(status_dto)
         for r_id in resource_ids:
@@ -3185,7 +3338,7 @@ def _ensure_resources_managed(
                 reports.messages.ResourceIsUnmanaged(resource_id),
             )
             for resource_id in resource_ids
-            if not is_resource_managed(state, resource_id)
+            if not is_resource_managed(state.status_dom, resource_id)
         )
 
     return report_list
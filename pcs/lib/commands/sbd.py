@@ -172,13 +172,14 @@ def check_sbd(
     watchdog -- watchdog path to check
     device_list -- list of paths to check
     """
+    sbd_state = lib_env.service_manager.get_states([settings.sbd_service_name])[
+        settings.sbd_service_name
+    ]
     sbd_status = ServiceStatusDto(
         service=settings.sbd_service_name,
-        installed=lib_env.service_manager.is_installed(
-            settings.sbd_service_name
-        ),
-        enabled=lib_env.service_manager.is_enabled(settings.sbd_service_name),
-        running=lib_env.service_manager.is_running(settings.sbd_service_name),
+        installed=sbd_state.installed,
+        enabled=sbd_state.enabled,
+        running=sbd_state.running,
     )
 
     watchdog_dto: SbdWatchdogStatusDto | None = None
@@ -33,32 +33,38 @@ def get_services_info(
     for services not specified in `services`
     """
     service_set = set(services)
+    service_states = (
+        env.service_manager.get_states(service_set)
+        if installed or enabled or running
+        else {}
+    )
+    available_services = set(
+        env.service_manager.get_available_services() if installed else []
+    )
     return ServicesInfoResultDto(
         [
             ServiceStatusDto(
                 service,
+                # services not in service_set come from the list of
+                # available services, so they are installed
                 (
-                    env.service_manager.is_installed(service)
+                    service not in service_set
+                    or service_states[service].installed
                     if installed
                     else False
                 ),
                 (
-                    env.service_manager.is_enabled(service)
+                    service_states[service].enabled
                     if enabled and service in service_set
                     else False
                 ),
                 (
-                    env.service_manager.is_running(service)
+                    service_states[service].running
                     if running and service in service_set
                     else False
                 ),
             )
-            for service in service_set
-            | set(
-                env.service_manager.get_available_services()
-                if installed
-                else []
-            )
+            for service in service_set | available_services
         ]
     )
 
@@ -41,7 +41,6 @@ from pcs.lib.pacemaker.live import (
     get_ticket_status_text,
 )
 from pcs.lib.pacemaker.status import (
-    ClusterStatusParser,
     ClusterStatusParsingError,
     cluster_status_parsing_error_to_report,
 )
@@ -71,15 +70,12 @@ def resources_status(env: LibraryEnvironment) -> ResourcesStatusDto:
 
     env -- LibraryEnvironment
     """
-    status_xml = env.get_cluster_state()
-
-    parser = ClusterStatusParser(status_xml)
     try:
-        dto = parser.status_xml_to_dto()
+        dto, warnings = env.get_cluster_status_snapshot().get_resources_status()
     except ClusterStatusParsingError as e:
         raise LibraryError(cluster_status_parsing_error_to_report(e)) from e
 
-    env.report_processor.report_list(parser.get_warnings())
+    env.report_processor.report_list(warnings)
 
     return dto
 
@@ -341,18 +337,34 @@ def _get_local_services_status(
         ("pcsd", True),
         (settings.sbd_service_name, False),
     ]
-    service_status_list = []
-    for service, display_always in service_def:
-        with contextlib.suppress(LibraryError):
-            service_status_list.append(
-                _ServiceStatus(
-                    service,
-                    display_always,
-                    service_manager.is_enabled(service),
-                    service_manager.is_running(service),
+    try:
+        service_states = service_manager.get_states(
+            service for service, _ in service_def
+        )
+    except LibraryError:
+        # query the services one by one, so that one failing service does not
+        # hide states of the others
+        service_status_list = []
+        for service, display_always in service_def:
+            with contextlib.suppress(LibraryError):
+                service_status_list.append(
+                    _ServiceStatus(
+                        service,
+                        display_always,
+                        service_manager.is_enabled(service),
+                        service_manager.is_running(service),
+                    )
                 )
-            )
-    return service_status_list
+        return service_status_list
+    return [
+        _ServiceStatus(
+            service,
+            display_always,
+            service_states[service].enabled,
+            service_states[service].running,
+        )
+        for service, display_always in service_def
+    ]
 
 
 def _format_local_services_status(
@@ -2,6 +2,7 @@ from collections.abc import Collection, Mapping
 
 from lxml.etree import _Element
 
+from pcs import settings
 from pcs.common import reports
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
@@ -29,6 +30,7 @@ from pcs.lib.pacemaker.live import (
     is_cibadmin_update_status_supported,
     is_fence_history_supported_management,
     is_getting_resource_digest_supported,
+    prefetch_tool_help,
 )
 from pcs.lib.resource_agent import (
     InvalidResourceAgentName,
@@ -255,6 +257,9 @@ def _update_scsi_devices_get_element_and_devices(
     cib -- cib element
     stonith_id -- id of stonith resource
     """
+    prefetch_tool_help(
+        runner, [settings.crm_resource_exec, settings.cibadmin_exec]
+    )
     if not is_getting_resource_digest_supported(
         runner
     ) or not is_cibadmin_update_status_supported(runner):
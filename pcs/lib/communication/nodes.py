@@ -1,3 +1,5 @@
+import contextlib
+import hashlib
 import json
 from collections.abc import Mapping, Sequence
 
@@ -24,8 +26,14 @@ from pcs.lib.communication.tools import (
     SimpleResponseProcessingNoResponseOnSuccessMixin,
     SkipOfflineMixin,
 )
+from pcs.lib.errors import LibraryError
 from pcs.lib.node_communication import response_to_report_item
 
+# Nodes are first asked whether they already have the distributed files, only
+# files which differ are sent to them afterwards. The check costs a request,
+# so it is only done if the files are large enough to benefit from it.
+_FILE_HASH_CHECK_MIN_LENGTH = 4096
+
 
 class GetOnlineTargets(
     AllSameDataMixin, AllAtOnceStrategyMixin, RunRemotelyBase
@@ -252,11 +260,25 @@ class RunActionBase(
         )
 
     def _process_response(self, response):
+        self._process_action_response(response, self._action_definition)
+
+    def _process_action_response(self, response, action_definition):
         report = self._get_response_report(response)
         if report:
             self._report(report)
             return
-        results = None
+        results = self._get_results(response, action_definition)
+        if results is not None:
+            self._report_results(response.request.target.label, results)
+
+    def _get_results(self, response, action_definition):
+        """
+        Return results of actions from a response or None if the response is
+        not valid
+
+        Response response -- a response to a request with actions
+        dict action_definition -- actions sent in the request
+        """
         target = response.request.target
         try:
             results = json.loads(response.data)
@@ -266,23 +288,25 @@ class RunActionBase(
                     reports.messages.InvalidResponseFormat(target.label)
                 )
             )
-            return
-        results = node_communication_format.response_to_result(
+            return None
+        return node_communication_format.response_to_result(
             results,
             self._response_key,
-            list(self._action_definition.keys()),
+            list(action_definition.keys()),
             target.label,
         )
+
+    def _report_results(self, target_label, results):
         for key, item_response in sorted(results.items()):
             if self._is_success(item_response):
                 # only success process individually
                 report = self._success_report(
-                    target.label,
+                    target_label,
                     self._action_key_to_report(key),
                 )
             else:
                 report = self._failure_report(
-                    target.label,
+                    target_label,
                     self._action_key_to_report(key),
                     node_communication_format.get_format_result(
                         self._code_message_map
@@ -397,11 +421,112 @@ class FileActionBase(RunActionBase):
 
 
 class DistributeFiles(FileActionBase):
+    def __init__(
+        self,
+        report_processor,
+        action_definition,
+        skip_offline_targets=False,
+        allow_fails=False,
+    ):
+        super().__init__(
+            report_processor,
+            action_definition,
+            skip_offline_targets=skip_offline_targets,
+            allow_fails=allow_fails,
+        )
+        self._hash_check_request_data = None
+        if (
+            sum(
+                len(item.get("data", "")) for item in action_definition.values()
+            )
+            >= _FILE_HASH_CHECK_MIN_LENGTH
+        ):
+            self._hash_check_request_data = RequestData(
+                self._request_url,
+                [
+                    (
+                        "data_json",
+                        json.dumps(
+                            {
+                                key: _file_definition_to_hash_check(item)
+                                for key, item in action_definition.items()
+                            }
+                        ),
+                    )
+                ],
+            )
+        # files sent to nodes after checking their hashes
+        self._upload_definitions = {}
+
     def _init_properties(self):
         super()._init_properties()
         self._request_url = "remote/put_file"
         self._code_message_map = {"conflict": "File already exists"}
 
+    def _get_request_data(self):
+        if self._hash_check_request_data is not None:
+            return self._hash_check_request_data
+        return super()._get_request_data()
+
+    def _process_response(self, response):
+        target_label = response.request.target.label
+        if target_label in self._upload_definitions:
+            self._process_action_response(
+                response, self._upload_definitions.pop(target_label)
+            )
+            return []
+        if self._hash_check_request_data is None:
+            return super()._process_response(response)
+        return self._process_hash_check_response(response)
+
+    def _process_hash_check_response(self, response):
+        target = response.request.target
+        if not response.was_connected:
+            self._report(self._get_response_report(response))
+            return []
+        results = None
+        if response.response_code == 200:
+            with contextlib.suppress(ValueError, LibraryError):
+                results = node_communication_format.response_to_result(
+                    json.loads(response.data),
+                    self._response_key,
+                    list(self._action_definition.keys()),
+                    target.label,
+                )
+        if results is None or not all(
+            result.code in ("same_content", "content_needed", "conflict")
+            for result in results.values()
+        ):
+            # the node does not support hash checks, send it all the files
+            upload_definition = self._action_definition
+        else:
+            upload_definition = {}
+            for key, result in sorted(results.items()):
+                if result.code == "same_content":
+                    self._report(
+                        ReportItem.info(
+                            reports.messages.FileDistributionSkippedUnchanged(
+                                target.label, self._action_key_to_report(key)
+                            )
+                        )
+                    )
+                elif result.code == "content_needed":
+                    upload_definition[key] = self._action_definition[key]
+                else:
+                    self._report_results(target.label, {key: result})
+        if not upload_definition:
+            return []
+        self._upload_definitions[target.label] = upload_definition
+        return [
+            Request(
+                target,
+                RequestData(
+                    self._request_url,
+                    [("data_json", json.dumps(upload_definition))],
+                ),
+            )
+        ]
+
     def _failure_report(
         self, target_label, action, reason, severity, forceable
     ):
@@ -732,6 +857,16 @@ class SendPcsdSslCertAndKey(
         )
 
 
+def _file_definition_to_hash_check(file_definition):
+    """
+    Replace data of a file to be put to a node with their hash
+    """
+    hash_check = dict(file_definition)
+    data = hash_check.pop("data")
+    hash_check["data_sha256"] = hashlib.sha256(data.encode("utf-8")).hexdigest()
+    return hash_check
+
+
 def _force(force_code, is_forced):
     if is_forced:
         return dict(
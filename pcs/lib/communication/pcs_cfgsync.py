@@ -54,6 +54,7 @@ class ConfigInfo:
 class GetConfigsResult:
     was_successful: bool
     config_files: dict[FileTypeCode, list[ConfigInfo]]
+    received_bytes: int = 0
 
 
 class GetConfigs(
@@ -73,6 +74,7 @@ class GetConfigs(
         super().__init__(report_processor)
         self._cluster_name = cluster_name
         self._successful_connections = 0
+        self._received_bytes = 0
         self._received_configs: dict[FileTypeCode, list[ConfigInfo]] = (
             defaultdict(list)
         )
@@ -93,6 +95,9 @@ class GetConfigs(
         )
 
     def _process_response(self, response: Response) -> list[Request]:  # noqa: PLR0911
+        if response.was_connected:
+            self._received_bytes += len(response.data.encode("utf-8"))
+
         if response.request.action == self._LEGACY_ENDPOINT:
             self._process_legacy_response(response)
             return []
@@ -251,6 +256,7 @@ class GetConfigs(
         return GetConfigsResult(
             was_successful=self._successful_connections >= 2,
             config_files=self._received_configs,
+            received_bytes=self._received_bytes,
         )
 
 
@@ -1,5 +1,5 @@
 from collections.abc import Generator, Mapping, Sequence
-from typing import Any, TypeVar, overload
+from typing import Any, NamedTuple, TypeVar, overload
 
 from pcs import settings
 from pcs.common import reports
@@ -17,6 +17,14 @@ _KNET_CRYPTO_OPTIONS_PREFIX = "crypto_"
 T = TypeVar("T")
 
 
+class _NodeIndexItem(NamedTuple):
+    nodelist_section: Section
+    node_section: Section
+    node_data: dict[str, str]
+    # None if the node section contains no node options
+    node: CorosyncNode | None
+
+
 class ConfigFacade(FacadeInterface):
     """
     Provides high level access to a corosync config file
@@ -78,6 +86,9 @@ class ConfigFacade(FacadeInterface):
         self._need_stopped_cluster = False
         # set to True if qdevice reload is required to apply changes
         self._need_qdevice_reload = False
+        # node sections and their data, valid for the recorded config version
+        self._node_index: list[_NodeIndexItem] = []
+        self._node_index_key: tuple[Section, int] | None = None
 
     @property
     def need_stopped_cluster(self) -> bool:
@@ -120,42 +131,59 @@ class ConfigFacade(FacadeInterface):
 
     # To get a list of nodenames use pcs.lib.node.get_existing_nodes_names
 
+    def _get_node_index(self) -> list[_NodeIndexItem]:
+        """
+        Get all node sections with their nodelist sections and node data
+
+        The list is built once and reused until the config is changed.
+        """
+        key = (self.config, self.config.version)
+        if self._node_index_key != key:
+            self._node_index = []
+            for nodelist_section in self.config.get_sections("nodelist"):
+                for node_section in nodelist_section.get_sections("node"):
+                    # load all the nodes key-value pairs so that the last
+                    # value for each key wins
+                    node_data = self._get_node_data(node_section)
+                    self._node_index.append(
+                        _NodeIndexItem(
+                            nodelist_section,
+                            node_section,
+                            node_data,
+                            self._create_node(node_data) if node_data else None,
+                        )
+                    )
+            self._node_index_key = key
+        return self._node_index
+
+    @staticmethod
+    def _create_node(node_data: Mapping[str, str]) -> CorosyncNode:
+        return CorosyncNode(
+            node_data.get("name"),
+            [
+                CorosyncNodeAddress(node_data[f"ring{i}_addr"], str(i))
+                for i in range(constants.LINKS_MAX)
+                if node_data.get(f"ring{i}_addr")
+            ],
+            node_data.get("nodeid"),
+        )
+
     def get_nodes(self) -> list[CorosyncNode]:
         """
         Get all defined nodes
         """
-        result = []
-        for nodelist in self.config.get_sections("nodelist"):
-            for node_section in nodelist.get_sections("node"):
-                # first, load all the nodes key-value pairs so that the last
-                # value for each key wins
-                node_data = self._get_node_data(node_section)
-                if not node_data:
-                    continue
-                # add the node data to the resulting list
-                result.append(
-                    CorosyncNode(
-                        node_data.get("name"),
-                        [
-                            CorosyncNodeAddress(
-                                node_data[f"ring{i}_addr"], str(i)
-                            )
-                            for i in range(constants.LINKS_MAX)
-                            if node_data.get(f"ring{i}_addr")
-                        ],
-                        node_data.get("nodeid"),
-                    )
-                )
-        return result
+        return [
+            item.node
+            for item in self._get_node_index()
+            if item.node is not None
+        ]
 
     def _get_used_nodeid_list(self) -> list[str]:
-        used_ids = []
-        for nodelist in self.config.get_sections("nodelist"):
-            for node_section in nodelist.get_sections("node"):
-                used_ids.extend(
-                    [attr[1] for attr in node_section.get_attributes("nodeid")]
-                )
-        return used_ids
+        return [
+            attr[1]
+            for item in self._get_node_index()
+            for attr in item.node_section.get_attributes("nodeid")
+        ]
 
     @staticmethod
     def _get_nodeid_generator(
@@ -181,16 +209,14 @@ class ConfigFacade(FacadeInterface):
         }
 
     def get_used_linknumber_list(self) -> list[int]:
-        for nodelist_section in self.config.get_sections("nodelist"):
-            for node_section in nodelist_section.get_sections("node"):
-                node_data = self._get_node_data(node_section)
-                if not node_data:
-                    continue
-                return [
-                    i
-                    for i in range(constants.LINKS_MAX)
-                    if node_data.get(f"ring{i}_addr")
-                ]
+        for item in self._get_node_index():
+            if not item.node_data:
+                continue
+            return [
+                i
+                for i in range(constants.LINKS_MAX)
+                if item.node_data.get(f"ring{i}_addr")
+            ]
         return []
 
     @staticmethod
@@ -218,12 +244,15 @@ class ConfigFacade(FacadeInterface):
         node_id_generator = self._get_nodeid_generator(
             self._get_used_nodeid_list()
         )
+        # New nodes are added to the end of the nodelist, they do not change
+        # links used by the existing nodes.
+        used_linknumber_list = self.get_used_linknumber_list()
         for node_options in node_list:
             nodelist_section.add_section(
                 self._create_node_section(
                     next(node_id_generator),
                     node_options,
-                    self.get_used_linknumber_list(),
+                    used_linknumber_list,
                 )
             )
         self.__update_two_node()
@@ -234,11 +263,10 @@ class ConfigFacade(FacadeInterface):
 
         node_name_list -- names of nodes to remove
         """
-        for nodelist_section in self.config.get_sections("nodelist"):
-            for node_section in nodelist_section.get_sections("node"):
-                node_data = self._get_node_data(node_section)
-                if node_data.get("name") in node_name_list:
-                    nodelist_section.del_section(node_section)
+        node_name_set = set(node_name_list)
+        for item in self._get_node_index():
+            if item.node_data.get("name") in node_name_set:
+                item.nodelist_section.del_section(item.node_section)
         self.__remove_empty_sections(self.config)
         self.__update_two_node()
 
@@ -253,24 +281,23 @@ class ConfigFacade(FacadeInterface):
         """
         self._need_stopped_cluster = True
         matching_node_addrs: dict[str, list[str]] = {}
-        for nodelist_section in self.config.get_sections("nodelist"):
-            for node_section in nodelist_section.get_sections("node"):
-                node_data = self._get_node_data(node_section)
-                node_ident = node_data.get("name", node_data.get("nodeid", ""))
-
-                if node_data.get("name") == old_name:
-                    node_section.set_attribute("name", new_name)
-                    node_ident = new_name
-
-                # Check for old name in address for all nodes. User should be
-                # notified if such address exists even if it is weird.
-                matching_addrs = [
-                    f"ring{i}_addr"
-                    for i in range(constants.LINKS_MAX)
-                    if node_data.get(f"ring{i}_addr") == old_name
-                ]
-                if matching_addrs:
-                    matching_node_addrs[node_ident] = matching_addrs
+        for item in self._get_node_index():
+            node_data = item.node_data
+            node_ident = node_data.get("name", node_data.get("nodeid", ""))
+
+            if node_data.get("name") == old_name:
+                item.node_section.set_attribute("name", new_name)
+                node_ident = new_name
+
+            # Check for old name in address for all nodes. User should be
+            # notified if such address exists even if it is weird.
+            matching_addrs = [
+                f"ring{i}_addr"
+                for i in range(constants.LINKS_MAX)
+                if node_data.get(f"ring{i}_addr") == old_name
+            ]
+            if matching_addrs:
+                matching_node_addrs[node_ident] = matching_addrs
 
         return (
             [
@@ -343,13 +370,12 @@ class ConfigFacade(FacadeInterface):
             options_updated["linknumber"] = linknumber
 
         # Add addresses
-        for nodelist_section in self.config.get_sections("nodelist"):
-            for node_section in nodelist_section.get_sections("node"):
-                node_name = self._get_node_data(node_section).get("name")
-                if node_name is not None and node_name in node_addr_map:
-                    node_section.add_attribute(
-                        f"ring{linknumber}_addr", node_addr_map[node_name]
-                    )
+        for item in self._get_node_index():
+            node_name = item.node_data.get("name")
+            if node_name is not None and node_name in node_addr_map:
+                item.node_section.add_attribute(
+                    f"ring{linknumber}_addr", node_addr_map[node_name]
+                )
 
         # Add link options.
         if options_updated:
@@ -403,12 +429,12 @@ class ConfigFacade(FacadeInterface):
                 )
                 if interface_number in link_list:
                     totem_section.del_section(interface_section)
+        node_index = self._get_node_index()
         for link_number in link_list:
-            for nodelist_section in self.config.get_sections("nodelist"):
-                for node_section in nodelist_section.get_sections("node"):
-                    node_section.del_attributes_by_name(
-                        f"ring{link_number}_addr"
-                    )
+            for item in node_index:
+                item.node_section.del_attributes_by_name(
+                    f"ring{link_number}_addr"
+                )
         self.__remove_empty_sections(self.config)
 
     def update_link(
@@ -427,13 +453,12 @@ class ConfigFacade(FacadeInterface):
         self._need_stopped_cluster = True
         # change addresses
         if node_addr_map:
-            for nodelist_section in self.config.get_sections("nodelist"):
-                for node_section in nodelist_section.get_sections("node"):
-                    node_name = self._get_node_data(node_section).get("name")
-                    if node_name is not None and node_name in node_addr_map:
-                        node_section.set_attribute(
-                            f"ring{linknumber}_addr", node_addr_map[node_name]
-                        )
+            for item in self._get_node_index():
+                node_name = item.node_data.get("name")
+                if node_name is not None and node_name in node_addr_map:
+                    item.node_section.set_attribute(
+                        f"ring{linknumber}_addr", node_addr_map[node_name]
+                    )
         # make sure we do not change the linknumber
         options_without_linknumber = dict(options)
         if "linknumber" in options_without_linknumber:
@@ -811,9 +836,8 @@ class ConfigFacade(FacadeInterface):
         attrs_to_remove.update(remove_need_stopped_cluster)
         self.__set_section_options(quorum_section_list, attrs_to_remove)
         # remove nodes' votes
-        for nodelist in self.config.get_sections("nodelist"):
-            for node_section in nodelist.get_sections("node"):
-                node_section.del_attributes_by_name("quorum_votes")
+        for item in self._get_node_index():
+            item.node_section.del_attributes_by_name("quorum_votes")
 
         # add new configuration
         quorum = quorum_section_list[-1]
@@ -4,6 +4,7 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
 from pcs.common import file_type_codes, reports
+from pcs.common.types import StringIterable
 from pcs.lib.corosync import constants
 from pcs.lib.interface.config import (
     ExporterInterface,
@@ -23,6 +24,7 @@ class Section:
         self._attr_list: list[AttrTuple] = []
         self._section_list: list[Section] = []
         self._name: str = name
+        self._version = 0
 
     @property
     def parent(self) -> "Section | None":
@@ -36,19 +38,55 @@ class Section:
     def empty(self) -> bool:
         return not self._attr_list and not self._section_list
 
+    @property
+    def version(self) -> int:
+        """
+        Counter of changes done to the section and all its subsections
+        """
+        return self._version
+
+    def _mark_changed(self) -> None:
+        section: Section | None = self
+        while section is not None:
+            # here we are editing obj's attributes of the same class
+            section._version += 1  # noqa: SLF001
+            section = section._parent  # noqa: SLF001
+
     def export(self, indent: str = "    ") -> str:
-        lines = ["{0}: {1}".format(*attr) for attr in self._attr_list]
+        # The indent is only applied to the content of this section,
+        # subsections are always indented by four spaces. All the lines are
+        # put together in one pass, subsections are not exported to strings
+        # separately.
+        prefix = indent if self.parent else ""
+        lines = [prefix + "{0}: {1}".format(*attr) for attr in self._attr_list]
         if self._attr_list and self._section_list:
             lines.append("")
-        section_count = len(self._section_list)
-        for index, section in enumerate(self._section_list, 1):
-            lines.extend(str(section).split("\n"))
-            if not lines[-1].strip():
-                del lines[-1]
-            if index < section_count:
+        # sections to be exported, their prefix and whether they are the last
+        # section of their parent, None stands for the end of a section
+        stack: list[tuple[Section | None, str, bool]] = []
+        _push_sections(stack, self._section_list, prefix)
+        while stack:
+            section, section_prefix, is_last = stack.pop()
+            if section is None:
+                _append_line(lines, section_prefix, "}")
+                if not is_last:
+                    lines.append("")
+                continue
+            _append_line(lines, section_prefix, section.name + " {")
+            content_prefix = section_prefix + "    "
+            attr_list = section.get_attributes()
+            for name, value in attr_list:
+                line = f"{name}: {value}"
+                if "\n" in line:
+                    _append_line(lines, section_prefix, line, "    ")
+                else:
+                    lines.append(content_prefix + line)
+            section_list = section.get_sections()
+            if attr_list and section_list:
                 lines.append("")
+            stack.append((None, section_prefix, is_last))
+            _push_sections(stack, section_list, content_prefix)
         if self.parent:
-            lines = [indent + x if x else x for x in lines]
             lines.insert(0, self.name + " {")
             lines.append("}")
         final = "\n".join(lines)
@@ -77,6 +115,7 @@ class Section:
 
     def add_attribute(self, name: AttrName, value: AttrValue) -> "Section":
         self._attr_list.append((name, value))
+        self._mark_changed()
         return self
 
     def del_attributes_by_name(
@@ -87,6 +126,7 @@ class Section:
             for attr in self._attr_list
             if not (attr[0] == name and (value is None or attr[1] == value))
         ]
+        self._mark_changed()
         return self
 
     def set_attribute(self, name: AttrName, value: AttrValue) -> "Section":
@@ -100,7 +140,8 @@ class Section:
                 new_attr_list.append((name, value))
         self._attr_list = new_attr_list
         if not found:
-            self.add_attribute(name, value)
+            self._attr_list.append((name, value))
+        self._mark_changed()
         return self
 
     def get_sections(self, name: str | None = None) -> list["Section"]:
@@ -121,6 +162,7 @@ class Section:
         # here we are editing obj's _parent attribute of the same class
         section._parent = self  # noqa: SLF001
         self._section_list.append(section)
+        self._mark_changed()
         return self
 
     def del_section(self, section: "Section") -> "Section":
@@ -129,6 +171,7 @@ class Section:
         # thanks to remove raising a ValueError in that case
         # here we are editing obj's _parent attribute of the same class
         section._parent = None  # noqa: SLF001
+        self._mark_changed()
         return self
 
     def __str__(self) -> str:
@@ -160,10 +203,12 @@ class Parser(ParserInterface):
         ]
 
     @staticmethod
-    def _parse_section(lines: list[str], section: Section) -> None:
+    def _parse_section(lines: StringIterable, section: Section) -> None:
         # parser should work the same way as the original parser in corosync
-        while lines:
-            current_line = lines.pop(0).strip()
+        # Nested sections are parsed in the same loop, the section currently
+        # being parsed is tracked instead of recursing into subsections.
+        for line in lines:
+            current_line = line.strip()
             if not current_line or current_line[0] == "#":
                 continue
             if "{" in current_line:
@@ -177,17 +222,16 @@ class Parser(ParserInterface):
                     raise MissingSectionNameBeforeOpeningBraceException()
                 new_section = Section(section_name.strip())
                 section.add_section(new_section)
-                Parser._parse_section(lines, new_section)
+                section = new_section
             elif "}" in current_line:
                 if current_line.strip() != "}":
                     raise ExtraCharactersBeforeOrAfterClosingBraceException()
                 if not section.parent:
                     raise UnexpectedClosingBraceException()
-                return
+                section = section.parent
             elif ":" in current_line:
-                section.add_attribute(
-                    *[x.strip() for x in current_line.split(":", 1)]
-                )
+                name, value = current_line.split(":", 1)
+                section.add_attribute(name.strip(), value.strip())
             else:
                 raise LineIsNotSectionNorKeyValueException()
         if section.parent:
@@ -230,6 +274,27 @@ class Exporter(ExporterInterface):
         return config_structure.export().encode("utf-8")
 
 
+def _push_sections(
+    stack: list[tuple[Section | None, str, bool]],
+    section_list: list[Section],
+    prefix: str,
+) -> None:
+    # pushed in reverse order so that they are popped in the original order
+    for index, section in enumerate(reversed(section_list)):
+        stack.append((section, prefix, index == 0))
+
+
+def _append_line(
+    lines: list[str], prefix: str, line: str, indent: str = ""
+) -> None:
+    # Keeps the output the same as when each subsection was exported to a
+    # string separately. A section indents its attribute lines as a whole,
+    # parent sections split the exported lines and indent each non-empty part.
+    first_part, *other_parts = line.split("\n")
+    lines.append(prefix + indent + first_part)
+    lines.extend(prefix + part if part else part for part in other_parts)
+
+
 def verify_section(
     section: Section, path_prefix: str = ""
 ) -> tuple[list[str], list[str], list[AttrTuple]]:
@@ -9,6 +9,7 @@ from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import format_list, join_multilines
 from pcs.common.tools import Version, get_version_from_string
 from pcs.common.types import StringCollection
+from pcs.lib import tool_probe
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 from pcs.lib.file.instance import FileInstance
@@ -268,12 +269,21 @@ def reload_corosync_conf(runner: CommandRunner) -> reports.ReportItemList:
     return []
 
 
+def get_corosync_version_cmd() -> list[str]:
+    """
+    Return a command printing the installed corosync version
+    """
+    return [settings.corosync_exec, "-v"]
+
+
 def get_corosync_version(runner: CommandRunner) -> Version | None:
     """
     Return the installed corosync version or None if version cannot be
     determined.
     """
-    stdout, stderr, retval = runner.run([settings.corosync_exec, "-v"])
+    stdout, stderr, retval = tool_probe.run_probe(
+        runner, get_corosync_version_cmd()
+    )
     if retval != 0:
         return None
     return get_version_from_string(stdout)
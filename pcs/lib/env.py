@@ -1,6 +1,6 @@
 from collections.abc import Callable, Mapping
 from logging import Logger
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from lxml.etree import _Element
 
@@ -15,6 +15,7 @@ from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.tools import Version
 from pcs.common.types import StringIterable
 from pcs.lib.booth.env import BoothEnv
+from pcs.lib.cib.constraint.common import DuplicatesChecker
 from pcs.lib.communication import qdevice
 from pcs.lib.communication.corosync import (
     CheckCorosyncOffline,
@@ -39,17 +40,19 @@ from pcs.lib.pacemaker.live import (
     ensure_cib_version,
     get_cib,
     get_cib_xml,
-    get_cluster_status_dom,
+    get_cluster_status_xml,
     push_cib_diff_xml,
     replace_cib_configuration,
     wait_for_idle,
 )
+from pcs.lib.pacemaker.status import ClusterStatusSnapshot
 from pcs.lib.pacemaker.values import get_valid_timeout_seconds
 from pcs.lib.services import get_service_manager
 from pcs.lib.tools import create_tmp_cib
 from pcs.lib.xml_tools import etree_to_str
 
 WaitType = None | bool | int | str
+_DuplicatesCheckerT = TypeVar("_DuplicatesCheckerT", bound=DuplicatesChecker)
 
 
 def _wait_type_to_int(wait: WaitType) -> int:
@@ -84,6 +87,7 @@ class LibraryEnvironment:
             Callable[[], Mapping[str, PcsKnownHost]] | None
         ) = None,
         request_timeout: int | None = None,
+        cmd_runner_timeout: float | None = None,
     ):
         self._logger = logger
         self._report_processor = report_processor
@@ -93,6 +97,8 @@ class LibraryEnvironment:
         self._corosync_conf_data = corosync_conf_data
         self._booth_files_data = booth_files_data or {}
         self._request_timeout = request_timeout
+        # kill external processes running longer than this number of seconds
+        self._cmd_runner_timeout = cmd_runner_timeout
         # TODO tokens probably should not be inserted from outside, but we're
         # postponing dealing with them, because it's not that easy to move
         # related code currently - it's in pcsd
@@ -102,6 +108,8 @@ class LibraryEnvironment:
         self._cib_data_tmp_file: Any | None = None  # TODO proper type hint
         self.__loaded_cib_diff_source: str | None = None
         self.__loaded_cib_to_modify: _Element | None = None
+        self.__loaded_cluster_status: ClusterStatusSnapshot | None = None
+        self.__duplicates_checkers: dict[type, DuplicatesChecker] = {}
         self._communicator_factory = NodeCommunicatorFactory(
             CommunicatorLogger(
                 [ReportProcessorToLog(self.logger), self.report_processor]
@@ -187,8 +195,46 @@ class LibraryEnvironment:
             raise AssertionError("CIB has not been loaded")
         return self.__loaded_cib_to_modify
 
+    def get_constraint_duplicates_checker(
+        self, checker_class: type[_DuplicatesCheckerT]
+    ) -> _DuplicatesCheckerT:
+        """
+        Return a checker of duplicate constraints shared by all checks
+
+        The checker keeps an index of constraints in the loaded CIB, so the
+        constraints are indexed only once no matter how many new constraints
+        are checked until the CIB is pushed.
+
+        checker_class -- type of the checker
+        """
+        if checker_class not in self.__duplicates_checkers:
+            self.__duplicates_checkers[checker_class] = checker_class()
+        return cast(
+            _DuplicatesCheckerT, self.__duplicates_checkers[checker_class]
+        )
+
+    def get_cluster_status_snapshot(self) -> ClusterStatusSnapshot:
+        """
+        Return cluster status, load it from crm_mon on the first call
+
+        The status is kept until the cluster is expected to change, i.e. until
+        CIB is pushed or waiting for the cluster to settle down is requested.
+        Call invalidate_cluster_status when the cluster is changed otherwise.
+        """
+        if self.__loaded_cluster_status is None:
+            self.__loaded_cluster_status = ClusterStatusSnapshot(
+                status_xml=get_cluster_status_xml(self.cmd_runner())
+            )
+        return self.__loaded_cluster_status
+
     def get_cluster_state(self) -> _Element:
-        return get_cluster_status_dom(self.cmd_runner())
+        return self.get_cluster_status_snapshot().status_dom
+
+    def invalidate_cluster_status(self) -> None:
+        """
+        Make the next status request load a fresh status from crm_mon
+        """
+        self.__loaded_cluster_status = None
 
     def wait_for_idle(self, timeout: int = 0) -> None:
         """
@@ -197,6 +243,9 @@ class LibraryEnvironment:
         timeout -- timeout in seconds, if less than 0 wait will be skipped, if 0
             wait indefinitely
         """
+        # Waiting is requested after the cluster has been changed, even if the
+        # wait itself is turned off.
+        self.invalidate_cluster_status()
         if timeout < 0:
             # timeout is turned off
             return
@@ -283,9 +332,11 @@ class LibraryEnvironment:
 
     def __do_push_cib(self, push_strategy, wait_timeout: int) -> None:
         push_strategy()
+        self.invalidate_cluster_status()
         self._cib_upgrade_reported = False
         self.__loaded_cib_diff_source = None
         self.__loaded_cib_to_modify = None
+        self.__duplicates_checkers = {}
         if self.is_cib_live:
             self.wait_for_idle(wait_timeout)
 
@@ -482,7 +533,12 @@ class LibraryEnvironment:
         if env:
             runner_env.update(env)
 
-        return CommandRunner(self.logger, self.report_processor, runner_env)
+        return CommandRunner(
+            self.logger,
+            self.report_processor,
+            runner_env,
+            timeout=self._cmd_runner_timeout,
+        )
 
     @property
     def communicator_factory(self) -> NodeCommunicatorFactory:
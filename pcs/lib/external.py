@@ -1,3 +1,4 @@
+import os.path
 import signal
 import subprocess
 from collections.abc import Mapping
@@ -5,7 +6,7 @@ from logging import Logger
 from shlex import quote as shell_quote
 
 from pcs import settings
-from pcs.common import reports
+from pcs.common import reports, timing
 from pcs.common.reports import ReportProcessor
 from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import join_multilines
@@ -14,6 +15,12 @@ from pcs.common.types import StringSequence
 from pcs.lib.errors import LibraryError
 
 
+class ProcessTimeoutException(LibraryError):
+    """
+    An external process has been killed as it has not finished in time
+    """
+
+
 class KillServicesError(Exception):
     def __init__(self, service, message=None, instance=None):
         self.service = service
@@ -27,9 +34,12 @@ class CommandRunner:
         logger: Logger,
         reporter: ReportProcessor,
         env_vars: Mapping[str, str] | None = None,
+        timeout: float | None = None,
     ):
         self._logger = logger
         self._reporter = reporter
+        # timeout of processes which do not specify their own one
+        self._timeout = timeout
         # Reset environment variables by empty dict is desired here.  We need
         # to get rid of defaults - we do not know the context and environment
         # where the library runs.  We also get rid of PATH settings, so all
@@ -47,7 +57,20 @@ class CommandRunner:
         stdin_string: str | None = None,
         env_extend: Mapping[str, str] | None = None,
         binary_output: bool = False,
+        timeout: float | None = None,
     ) -> tuple[str, str, int]:
+        """
+        Run an external process and return its stdout, stderr and exit code
+
+        args -- the process and its arguments
+        stdin_string -- data to be sent to the process via stdin
+        env_extend -- environment variables to be set for the process
+        binary_output -- do not decode stdout and stderr
+        timeout -- kill the process and raise LibraryError if it does not
+            finish in this number of seconds, None to use the runner's timeout
+        """
+        if timeout is None:
+            timeout = self._timeout
         # Allow overriding default settings. If a piece of code really wants to
         # set own PATH or CIB_file, we must allow it. I.e. it wants to run
         # a pacemaker tool on a CIB in a file but cannot afford the risk of
@@ -90,28 +113,45 @@ class CommandRunner:
         )
 
         try:
-            # this is OK as pcs is only single-threaded application
-            process = subprocess.Popen(
-                args,
-                # Some commands react differently if they get anything via stdin
-                stdin=(
-                    subprocess.PIPE
-                    if stdin_string is not None
-                    else subprocess.DEVNULL
-                ),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=(  # noqa: PLW1509
-                    lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-                ),
-                close_fds=True,
-                shell=False,
-                env=env_vars,
-                # decodes newlines and in python3 also converts bytes to str
-                universal_newlines=(not binary_output),
-            )
-            out_std, out_err = process.communicate(stdin_string)
-            retval = process.returncode
+            with timing.span(timing.PROCESS, os.path.basename(args[0])):
+                # preexec_fn is OK here, it only resets a signal handler
+                # which does not need any locks held by other threads
+                process = subprocess.Popen(
+                    args,
+                    # Some commands react differently if they get anything via stdin
+                    stdin=(
+                        subprocess.PIPE
+                        if stdin_string is not None
+                        else subprocess.DEVNULL
+                    ),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    preexec_fn=(  # noqa: PLW1509
+                        lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+                    ),
+                    close_fds=True,
+                    shell=False,
+                    env=env_vars,
+                    # decodes newlines and in python3 also converts bytes to str
+                    universal_newlines=(not binary_output),
+                )
+                try:
+                    out_std, out_err = process.communicate(
+                        stdin_string, timeout=timeout
+                    )
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise ProcessTimeoutException(
+                        ReportItem.error(
+                            reports.messages.RunExternalProcessError(
+                                log_args,
+                                "the process did not finish in time and "
+                                "has been killed",
+                            )
+                        )
+                    ) from None
+                retval = process.returncode
         except OSError as e:
             raise LibraryError(
                 ReportItem.error(
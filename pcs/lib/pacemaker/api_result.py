@@ -6,6 +6,7 @@ from lxml import etree
 from lxml.etree import _Element
 
 from pcs import settings
+from pcs.common import timing
 from pcs.common.tools import xml_fromstring
 from pcs.common.types import StringSequence
 
@@ -22,7 +23,8 @@ def get_api_result_dom(xml: str) -> _Element:
     rng = settings.pacemaker_api_result_schema
     dom = xml_fromstring(xml)
     if os.path.isfile(rng):
-        etree.RelaxNG(file=rng).assertValid(dom)
+        with timing.span(timing.XML_VALIDATE, "api-result"):
+            etree.RelaxNG(file=rng).assertValid(dom)
     return dom
 
 
@@ -0,0 +1,94 @@
+"""
+In-process calculation of resource operation digests. The digests are
+calculated the same way as pacemaker calculates them in
+'crm_resource --digests': an md5 sum of a 'parameters' XML element holding
+the resource parameters as attributes sorted by their names.
+"""
+
+import hashlib
+import re
+from collections.abc import Mapping
+from typing import Final
+
+_CRM_META_PREFIX: Final = "CRM_meta_"
+# parameters removed from all digests besides all CRM_meta_* parameters
+_FILTERED_PARAMS: Final = frozenset(
+    (
+        "id",
+        "crm_feature_set",
+        "op-digest",
+        "on_node",
+        "on_node_uuid",
+        "pcmk_external_ip",
+    )
+)
+# parameters removed from nonprivate digests when no operation history is
+# available, which is the case of 'crm_resource --digests'
+_PRIVATE_PARAMS: Final = frozenset(("passwd", "password", "user"))
+_PARAM_NAME_RE: Final = re.compile(r"^[A-Za-z_][A-Za-z0-9_.:-]*$")
+# Values with characters which pacemaker escapes are not supported, as the
+# escaping differs among pacemaker versions.
+_PLAIN_VALUE_RE: Final = re.compile(r'^[^<>&"\x00-\x1f\x7f]*$')
+
+
+def calculate_resource_digests(
+    resource_options: Mapping[str, str],
+    crm_meta_attributes: Mapping[str, str | None] | None = None,
+) -> dict[str, str | None] | None:
+    """
+    Calculate digests of a resource operation, return None if they cannot be
+    calculated in-process
+
+    The result has the same format as the result of get_resource_digests.
+    The nonreloadable digest is never calculated, as crm_resource does not
+    calculate it either without operation history. Digests of recurring
+    operations cannot be calculated without their timeout, as pacemaker would
+    use a default one.
+
+    resource_options -- all instance attributes of the resource
+    crm_meta_attributes -- parameters of a monitor operation
+    """
+    if crm_meta_attributes is None:
+        crm_meta_attributes = {}
+    try:
+        interval = int(crm_meta_attributes.get("interval") or "0")
+    except ValueError:
+        return None
+    params = {
+        name: value
+        for name, value in resource_options.items()
+        if not name.startswith(_CRM_META_PREFIX)
+        and name not in _FILTERED_PARAMS
+    }
+    if interval != 0:
+        # timeout is kept in digests of recurring operations
+        timeout = crm_meta_attributes.get("timeout")
+        if timeout is None:
+            return None
+        params[f"{_CRM_META_PREFIX}timeout"] = timeout
+    if not all(
+        _PARAM_NAME_RE.match(name) and _PLAIN_VALUE_RE.match(value)
+        for name, value in params.items()
+    ):
+        return None
+    return {
+        "all": _calculate_digest(params),
+        "nonprivate": _calculate_digest(
+            {
+                name: value
+                for name, value in params.items()
+                if name not in _PRIVATE_PARAMS
+            }
+        ),
+        "nonreloadable": None,
+    }
+
+
+def _calculate_digest(params: Mapping[str, str]) -> str:
+    attrs = "".join(
+        f' {name}="{value}"' for name, value in sorted(params.items())
+    )
+    # md5 is not used for security here, this allows it in FIPS mode
+    return hashlib.md5(
+        f"<parameters{attrs}/>".encode(), usedforsecurity=False
+    ).hexdigest()
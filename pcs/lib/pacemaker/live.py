@@ -25,7 +25,7 @@ from pcs.common.types import (
     StringCollection,
     StringSequence,
 )
-from pcs.lib import tools
+from pcs.lib import tool_probe, tools
 from pcs.lib.cib.tools import get_pacemaker_version_by_which_cib_was_validated
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
@@ -82,9 +82,10 @@ def get_cluster_status_xml_raw(runner: CommandRunner) -> tuple[str, str, int]:
     )
 
 
-def _get_cluster_status_xml(runner: CommandRunner) -> str:
+def get_cluster_status_xml(runner: CommandRunner) -> str:
     """
-    Get pacemaker XML status. Using get_cluster_status_dom is preferred instead.
+    Get pacemaker XML status. Using get_cluster_status_dom is preferred unless
+    the status is processed as a stream, see ClusterStatusSnapshot.
     """
     stdout, stderr, retval = get_cluster_status_xml_raw(runner)
     if retval == 0:
@@ -112,7 +113,7 @@ def _get_cluster_status_xml(runner: CommandRunner) -> str:
 
 def get_cluster_status_dom(runner: CommandRunner) -> _Element:
     try:
-        return get_api_result_dom(_get_cluster_status_xml(runner))
+        return get_api_result_dom(get_cluster_status_xml(runner))
     except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
         raise LibraryError(
             ReportItem.error(reports.messages.BadClusterStateFormat())
@@ -424,12 +425,13 @@ def _upgrade_cib(runner: CommandRunner) -> None:
 
 
 def simulate_cib_xml(
-    runner: CommandRunner, cib_xml: str
+    runner: CommandRunner, cib_xml: str, timeout: float | None = None
 ) -> tuple[str, str, str]:
     """
     Run crm_simulate to get effects the cib would have on the live cluster
 
     cib_xml -- CIB XML to simulate
+    timeout -- kill crm_simulate if it runs longer than this number of seconds
     """
     try:
         with (
@@ -445,7 +447,9 @@ def simulate_cib_xml(
                 transitions_file.name,
                 "--xml-pipe",
             ]
-            stdout, stderr, retval = runner.run(cmd, stdin_string=cib_xml)
+            stdout, stderr, retval = runner.run(
+                cmd, stdin_string=cib_xml, timeout=timeout
+            )
             if retval != 0:
                 raise LibraryError(
                     ReportItem.error(
@@ -466,17 +470,18 @@ def simulate_cib_xml(
 
 
 def simulate_cib(
-    runner: CommandRunner, cib: _Element
+    runner: CommandRunner, cib: _Element, timeout: float | None = None
 ) -> tuple[str, _Element, _Element]:
     """
     Run crm_simulate to get effects the cib would have on the live cluster
 
     cib -- cib tree to simulate
+    timeout -- kill crm_simulate if it runs longer than this number of seconds
     """
     cib_xml = etree_to_str(cib)
     try:
         plaintext_result, transitions_xml, new_cib_xml = simulate_cib_xml(
-            runner, cib_xml
+            runner, cib_xml, timeout
         )
         return (
             plaintext_result.strip(),
@@ -936,7 +941,9 @@ def get_rule_in_effect_status(
 def _is_in_pcmk_tool_help(
     runner: CommandRunner, tool: str, text_list: StringCollection
 ) -> bool:
-    stdout, stderr, dummy_retval = runner.run([tool, "--help-all"])
+    stdout, stderr, dummy_retval = tool_probe.run_probe(
+        runner, [tool, "--help-all"]
+    )
     # Help goes to stderr but we check stdout as well if that gets changed. Use
     # generators in all to return early.
     return all(text in stderr for text in text_list) or all(
@@ -944,6 +951,19 @@ def _is_in_pcmk_tool_help(
     )
 
 
+def prefetch_tool_help(
+    runner: CommandRunner, tool_list: StringSequence
+) -> None:
+    """
+    Get help of the tools in parallel, so that following checks of their
+    features do not need to run them one by one
+
+    runner -- runner for running the tools
+    tool_list -- executables of the tools
+    """
+    tool_probe.prefetch(runner, [[tool, "--help-all"] for tool in tool_list])
+
+
 def is_crm_attribute_list_options_supported(runner: CommandRunner) -> bool:
     return _is_in_pcmk_tool_help(
         runner, settings.crm_attribute_exec, ["--list-options"]
@@ -1211,12 +1231,21 @@ def get_resource_secret_value(resource_id: str, attribute_name: str) -> str:
     return secret_value
 
 
+def get_pacemaker_version_cmd() -> list[str]:
+    """
+    Return a command printing the installed pacemaker version
+    """
+    return [settings.pacemakerd_exec, "--version"]
+
+
 def get_pacemaker_version(runner: CommandRunner) -> Version | None:
     """
     Return the installed pacemaker version or None if version cannot be
     determined.
     """
-    stdout, stderr, retval = runner.run([settings.pacemakerd_exec, "--version"])
+    stdout, stderr, retval = tool_probe.run_probe(
+        runner, get_pacemaker_version_cmd()
+    )
     if retval != 0:
         return None
     return get_version_from_string(stdout)
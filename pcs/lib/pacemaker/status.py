@@ -1,7 +1,9 @@
 from collections import Counter
 from collections.abc import Sequence
+from io import BytesIO
 from typing import cast
 
+from lxml import etree
 from lxml.etree import _Element
 
 from pcs.common import reports
@@ -24,6 +26,10 @@ from pcs.common.status_dto import (
     ResourcesStatusDto,
 )
 from pcs.common.str_tools import format_list
+from pcs.common.types import StringCollection
+from pcs.lib.errors import LibraryError
+from pcs.lib.pacemaker.api_result import get_api_result_dom
+from pcs.lib.pacemaker.state import ClusterState
 from pcs.lib.pacemaker.values import is_true
 
 _DEFAULT_SEVERITY = reports.ReportItemSeverity.error()
@@ -31,7 +37,45 @@ _PRIMITIVE_TAG = "resource"
 _GROUP_TAG = "group"
 _CLONE_TAG = "clone"
 _BUNDLE_TAG = "bundle"
+_RESOURCES_TAG = "resources"
 _REPLICA_TAG = "replica"
+_NODE_TAG = "node"
+
+# Attributes required by the rng schema of crm_mon xml which are read with
+# default values when building dtos. The stream parser cannot validate the xml
+# using the schema, so it checks these explicitly to detect malformed status.
+_REQUIRED_ATTRIBUTES = {
+    _PRIMITIVE_TAG: (
+        "id",
+        "resource_agent",
+        "role",
+        "active",
+        "orphaned",
+        "managed",
+        "failed",
+        "failure_ignored",
+        "nodes_running_on",
+    ),
+    _GROUP_TAG: ("id", "number_resources", "managed", "disabled"),
+    _CLONE_TAG: (
+        "id",
+        "multi_state",
+        "unique",
+        "managed",
+        "disabled",
+        "failed",
+        "failure_ignored",
+    ),
+    _BUNDLE_TAG: ("id", "type", "image", "unique", "managed", "failed"),
+    _REPLICA_TAG: ("id",),
+    _NODE_TAG: ("name", "id", "cached"),
+}
+
+
+class ClusterStatusFormatError(Exception):
+    """
+    Cluster status xml is not well-formed or misses required data
+    """
 
 
 class ClusterStatusParsingError(Exception):
@@ -305,7 +349,7 @@ def _bundle_to_dto(
     )
 
 
-class ClusterStatusParser:
+class _ResourcesStatusParserBase:
     TAG_TO_FUNCTION = {
         _PRIMITIVE_TAG: _primitive_to_dto,
         _GROUP_TAG: _group_to_dto,
@@ -313,56 +357,253 @@ class ClusterStatusParser:
         _BUNDLE_TAG: _bundle_to_dto,
     }
 
+    def __init__(self) -> None:
+        self._warnings: reports.ReportItemList = []
+
+    def _resource_to_dto(
+        self, resource: _Element
+    ) -> AnyResourceStatusDto | None:
+        try:
+            return cast(
+                AnyResourceStatusDto,
+                self.TAG_TO_FUNCTION[resource.tag](resource),
+            )
+        except BundleSameIdAsImplicitResourceError as e:
+            # This is the only error that the user can cause directly by
+            # setting the name of the bundle member to be same as one of
+            # the implicitly created resource.
+            # We only skip such bundles while still providing status of the
+            # other resources.
+            self._warnings.append(
+                reports.ReportItem.warning(
+                    reports.messages.ClusterStatusBundleMemberIdAsImplicit(
+                        e.bundle_id, e.bad_ids
+                    )
+                )
+            )
+        except BundleReplicaMissingImplicitResourceError as e:
+            # TODO crm_mon on Fedora 39 returns resource_agent in legacy
+            # format "ocf::*:*" instead of the new "ocf:*:*" and the parser
+            # then cannot find the proper resources in the replicas.
+            # Skip bundles when the legacy format is used.
+            self._warnings.append(
+                cluster_status_parsing_error_to_report(
+                    e, reports.ReportItemSeverity.warning()
+                )
+            )
+        return None
+
+    def status_xml_to_dto(self) -> ResourcesStatusDto:
+        """
+        Return dto containing status of configured resources in the cluster
+        """
+        raise NotImplementedError()
+
+    def get_warnings(self) -> reports.ReportItemList:
+        return self._warnings
+
+
+class ClusterStatusParser(_ResourcesStatusParserBase):
     def __init__(self, status: _Element):
         """
         status -- xml element from crm_mon xml, validated using the appropriate
             rng schema
         """
+        super().__init__()
         self._status = status
-        self._warnings: reports.ReportItemList = []
 
     def status_xml_to_dto(self) -> ResourcesStatusDto:
         """
         Return dto containing status of configured resources in the cluster
         """
         resource_list = cast(list[_Element], self._status.xpath("resources/*"))
-
         resource_dto_list = []
         for resource in resource_list:
-            try:
-                resource_dto = cast(
-                    AnyResourceStatusDto,
-                    self.TAG_TO_FUNCTION[resource.tag](resource),
-                )
+            resource_dto = self._resource_to_dto(resource)
+            if resource_dto is not None:
                 resource_dto_list.append(resource_dto)
-            except BundleSameIdAsImplicitResourceError as e:
-                # This is the only error that the user can cause directly by
-                # setting the name of the bundle member to be same as one of
-                # the implicitly created resource.
-                # We only skip such bundles while still providing status of the
-                # other resources.
-                self._warnings.append(
-                    reports.ReportItem.warning(
-                        reports.messages.ClusterStatusBundleMemberIdAsImplicit(
-                            e.bundle_id, e.bad_ids
-                        )
-                    )
-                )
-            except BundleReplicaMissingImplicitResourceError as e:
-                # TODO crm_mon on Fedora 39 returns resource_agent in legacy
-                # format "ocf::*:*" instead of the new "ocf:*:*" and the parser
-                # then cannot find the proper resources in the replicas.
-                # Skip bundles when the legacy format is used.
-                self._warnings.append(
-                    cluster_status_parsing_error_to_report(
-                        e, reports.ReportItemSeverity.warning()
-                    )
-                )
+        return ResourcesStatusDto(resource_dto_list)
+
+
+class ClusterStatusStreamParser(_ResourcesStatusParserBase):
+    """
+    Parser of crm_mon xml which does not load the whole xml into a tree
+
+    Each top level resource is transformed to a dto as soon as its element is
+    read and the element is discarded afterwards. Other sections of the status
+    (nodes, node history, failures, fence history, ...) are discarded without
+    being processed, unless a caller asks to keep them. Memory consumption
+    therefore does not grow with the size of the discarded sections.
+
+    The xml is not validated using the rng schema, as that requires the whole
+    tree. Attributes of resources required by the schema are checked instead.
+    Missing data and malformed xml are reported as ClusterStatusFormatError.
+    """
 
+    def __init__(self, status_xml: str, keep_sections: StringCollection = ()):
+        """
+        status_xml -- crm_mon xml
+        keep_sections -- tags of top level sections to be kept besides
+            resources, e.g. "summary" or "nodes", get them by get_section
+        """
+        super().__init__()
+        self._status_xml = status_xml
+        self._keep_sections = frozenset(keep_sections)
+        self._sections: dict[str, _Element] = {}
+
+    def status_xml_to_dto(self) -> ResourcesStatusDto:
+        """
+        Return dto containing status of configured resources in the cluster
+        """
+        resource_dto_list = []
+        # depth of the element the current event belongs to, root is 1
+        depth = 0
+        in_resources = False
+        in_kept_section = False
+        try:
+            for event, element in etree.iterparse(
+                BytesIO(self._status_xml.encode("utf-8")),
+                events=("start", "end"),
+                # it raises on a huge xml without the flag huge_tree=True
+                huge_tree=True,
+            ):
+                if event == "start":
+                    depth += 1
+                    if depth == 2:
+                        in_resources = element.tag == _RESOURCES_TAG
+                        in_kept_section = element.tag in self._keep_sections
+                    continue
+                if depth == 3 and not in_kept_section:
+                    if in_resources:
+                        _check_required_attributes(element)
+                        resource_dto = self._resource_to_dto(element)
+                        if resource_dto is not None:
+                            resource_dto_list.append(resource_dto)
+                    _discard_element(element)
+                elif depth == 2:
+                    if in_kept_section:
+                        # Preceding siblings get deleted from the tree later,
+                        # the section is only referenced from here.
+                        self._sections[str(element.tag)] = element
+                    else:
+                        _discard_element(element)
+                    in_resources = False
+                    in_kept_section = False
+                depth -= 1
+        except (etree.XMLSyntaxError, KeyError, ValueError) as e:
+            raise ClusterStatusFormatError() from e
         return ResourcesStatusDto(resource_dto_list)
 
-    def get_warnings(self) -> reports.ReportItemList:
-        return self._warnings
+    def get_section(self, tag: str) -> _Element | None:
+        """
+        Return a top level section kept by status_xml_to_dto
+
+        tag -- tag of the section, it must have been specified in keep_sections
+        """
+        return self._sections.get(tag)
+
+
+def _check_required_attributes(resource_el: _Element) -> None:
+    for element in resource_el.iter():
+        for attribute in _REQUIRED_ATTRIBUTES.get(str(element.tag), ()):
+            if attribute not in element.attrib:
+                raise ClusterStatusFormatError()
+
+
+def _discard_element(element: _Element) -> None:
+    # Free the element's subtree and its already processed preceding siblings.
+    # The element itself is kept as its parent still references it, but it is
+    # empty.
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+class ClusterStatusSnapshot:
+    """
+    Cluster status loaded from crm_mon once, providing its parsed views
+
+    The views are created lazily on the first access and shared by all their
+    users, so that a command does not run crm_mon and parse its output
+    repeatedly. If the status is provided as a string and only the resources
+    status is needed, the xml is processed as a stream and the whole tree is
+    never built.
+    """
+
+    def __init__(
+        self, status: _Element | None = None, status_xml: str | None = None
+    ):
+        """
+        status -- xml element from crm_mon xml, validated using the appropriate
+            rng schema
+        status_xml -- crm_mon xml, used if status is not specified
+        """
+        if status is None and status_xml is None:
+            raise AssertionError("Either status or status_xml must be set")
+        self._status = status
+        self._status_xml = status_xml
+        self._cluster_state: ClusterState | None = None
+        self._resources_status: ResourcesStatusDto | None = None
+        self._resources_status_error: (
+            ClusterStatusParsingError | LibraryError | None
+        ) = None
+        self._resources_status_warnings: reports.ReportItemList = []
+
+    @property
+    def status_dom(self) -> _Element:
+        """
+        Return crm_mon xml validated using the appropriate rng schema
+        """
+        if self._status is None:
+            try:
+                self._status = get_api_result_dom(cast(str, self._status_xml))
+            except (etree.XMLSyntaxError, etree.DocumentInvalid) as e:
+                raise LibraryError(
+                    reports.ReportItem.error(
+                        reports.messages.BadClusterStateFormat()
+                    )
+                ) from e
+        return self._status
+
+    @property
+    def cluster_state(self) -> ClusterState:
+        if self._cluster_state is None:
+            self._cluster_state = ClusterState(self.status_dom)
+        return self._cluster_state
+
+    def get_resources_status(
+        self,
+    ) -> tuple[ResourcesStatusDto, reports.ReportItemList]:
+        """
+        Return status of configured resources and warnings from its parsing
+
+        Raise ClusterStatusParsingError if the status cannot be parsed, raise
+        LibraryError if the status is not a valid crm_mon xml
+        """
+        if self._resources_status_error is not None:
+            raise self._resources_status_error
+        if self._resources_status is None:
+            parser: _ResourcesStatusParserBase
+            if self._status is None:
+                parser = ClusterStatusStreamParser(cast(str, self._status_xml))
+            else:
+                parser = ClusterStatusParser(self._status)
+            try:
+                self._resources_status = parser.status_xml_to_dto()
+            except ClusterStatusParsingError as e:
+                self._resources_status_error = e
+                raise
+            except ClusterStatusFormatError as e:
+                self._resources_status_error = LibraryError(
+                    reports.ReportItem.error(
+                        reports.messages.BadClusterStateFormat()
+                    )
+                )
+                raise self._resources_status_error from e
+            self._resources_status_warnings = parser.get_warnings()
+        return self._resources_status, list(self._resources_status_warnings)
 
 
 def _get_resource_id(resource: _Element) -> str:
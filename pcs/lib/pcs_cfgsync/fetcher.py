@@ -27,6 +27,14 @@ class ConfigFetcher:
     ):
         self._node_communicator = node_communicator
         self._report_processor = report_processor
+        self._received_bytes = 0
+
+    @property
+    def received_bytes(self) -> int:
+        """
+        Total size of responses received by all fetches done by this fetcher
+        """
+        return self._received_bytes
 
     def fetch(
         self,
@@ -52,6 +60,7 @@ class ConfigFetcher:
         cmd = GetConfigs(self._report_processor, cluster_name, False)
         cmd.set_targets(target_list)
         received_configs = run(self._node_communicator, cmd)  # type: ignore
+        self._received_bytes += received_configs.received_bytes
 
         configs_to_update = {}
 
@@ -2,6 +2,7 @@ from lxml import etree
 from lxml.etree import _Element
 
 from pcs import settings
+from pcs.common import timing
 from pcs.common.str_tools import join_multilines
 from pcs.common.tools import xml_fromstring
 from pcs.lib.external import CommandRunner
@@ -182,9 +183,11 @@ def _metadata_xml_to_dom(metadata: str) -> _Element:
     dom = xml_fromstring(metadata)
     ocf_version = _get_ocf_version(dom)
     if ocf_version == const.OCF_1_0:
-        etree.RelaxNG(file=settings.path.ocf_1_0_schema).assertValid(dom)
+        with timing.span(timing.XML_VALIDATE, "ocf-1.0"):
+            etree.RelaxNG(file=settings.path.ocf_1_0_schema).assertValid(dom)
     elif ocf_version == const.OCF_1_1:
-        etree.RelaxNG(file=settings.path.ocf_1_1_schema).assertValid(dom)
+        with timing.span(timing.XML_VALIDATE, "ocf-1.1"):
+            etree.RelaxNG(file=settings.path.ocf_1_1_schema).assertValid(dom)
     return dom
 
 
@@ -1,6 +1,7 @@
 from pcs import settings
 from pcs.common import reports, services
-from pcs.common.types import StringSequence
+from pcs.common.services.types import ServiceState
+from pcs.common.types import StringIterable, StringSequence
 from pcs.lib.errors import LibraryError
 from pcs.lib.external import CommandRunner
 
@@ -62,6 +63,12 @@ class _NoOpDriver(services.interfaces.ServiceManagerInterface):
         del service
         return True
 
+    def get_states(self, services: StringIterable) -> dict[str, ServiceState]:
+        return {
+            service: ServiceState(installed=True, enabled=False, running=False)
+            for service in services
+        }
+
     def get_available_services(self) -> list[str]:
         return []
 
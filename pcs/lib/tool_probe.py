@@ -0,0 +1,166 @@
+"""
+Cache of outputs of commands describing installed tools, such as their help or
+version. The outputs only change when the tools get updated, so they are kept
+in memory and in a file shared by pcs and pcsd, and are valid as long as the
+tool executable stays the same.
+"""
+
+import contextlib
+import json
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Final
+
+from pcs import settings
+from pcs.common.types import StringSequence
+from pcs.lib.external import CommandRunner
+
+_CACHE_VERSION: Final = 1
+
+# identity of an executable: inode, mtime in ns, size
+_Identity = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _ProbeResult:
+    identity: _Identity
+    stdout: str
+    stderr: str
+
+
+_memory_cache: dict[str, _ProbeResult] = {}
+_lock = threading.Lock()
+
+
+def run_probe(
+    runner: CommandRunner, args: StringSequence
+) -> tuple[str, str, int]:
+    """
+    Run a command which describes an installed tool, return a cached output if
+    the tool has not changed since the command was run
+
+    Only successful runs are cached. Commands run by other runners than
+    CommandRunner, e.g. mocked runners, are never cached.
+
+    runner -- runner for running the command
+    args -- the command, its first item is the tool executable
+    """
+    identity = _get_identity(runner, args)
+    if identity is None:
+        return runner.run(args)
+    key = _get_key(args)
+    result = _get_cached(key, identity)
+    if result is not None:
+        return result.stdout, result.stderr, 0
+
+    stdout, stderr, retval = runner.run(args)
+    if retval == 0:
+        _store(key, _ProbeResult(identity, stdout, stderr))
+    return stdout, stderr, retval
+
+
+def prefetch(
+    runner: CommandRunner, args_list: Iterable[StringSequence]
+) -> None:
+    """
+    Run commands which are not cached yet in parallel and cache their outputs
+
+    runner -- runner for running the commands
+    args_list -- commands to run
+    """
+    missing_list = []
+    for args in args_list:
+        identity = _get_identity(runner, args)
+        if identity is not None and not _get_cached(_get_key(args), identity):
+            missing_list.append(args)
+    if len(missing_list) < 2:
+        # nothing to run in parallel, run_probe runs the command when needed
+        return
+    with ThreadPoolExecutor(max_workers=len(missing_list)) as executor:
+        # list makes sure exceptions are raised here
+        list(executor.map(lambda args: run_probe(runner, args), missing_list))
+
+
+def _get_identity(
+    runner: CommandRunner, args: StringSequence
+) -> _Identity | None:
+    # Other runners, e.g. mocked runners in tests, do not run the executable,
+    # so its identity does not describe their output.
+    if type(runner) is not CommandRunner or not args:
+        return None
+    try:
+        stat = os.stat(args[0])
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _get_key(args: StringSequence) -> str:
+    return json.dumps(list(args))
+
+
+def _get_cached(key: str, identity: _Identity) -> _ProbeResult | None:
+    with _lock:
+        result = _memory_cache.get(key)
+        if result is None or result.identity != identity:
+            # another process may have probed the tool meanwhile
+            result = _load_cache_file().get(key)
+            if result is not None:
+                _memory_cache[key] = result
+    if result is not None and result.identity == identity:
+        return result
+    return None
+
+
+def _store(key: str, result: _ProbeResult) -> None:
+    with _lock:
+        _memory_cache[key] = result
+        cached = _load_cache_file()
+        cached[key] = result
+        _save_cache_file(cached)
+
+
+def _load_cache_file() -> dict[str, _ProbeResult]:
+    try:
+        with open(settings.pcs_tool_probe_cache_location) as cache_file:
+            data = json.load(cache_file)
+        if data.get("version") != _CACHE_VERSION:
+            return {}
+        return {
+            key: _ProbeResult(
+                identity=(
+                    entry["identity"][0],
+                    entry["identity"][1],
+                    entry["identity"][2],
+                ),
+                stdout=entry["stdout"],
+                stderr=entry["stderr"],
+            )
+            for key, entry in data["probes"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_cache_file(cached: dict[str, _ProbeResult]) -> None:
+    probes: dict[str, dict[str, Any]] = {
+        key: {
+            "identity": list(result.identity),
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+        for key, result in cached.items()
+    }
+    path = settings.pcs_tool_probe_cache_location
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as cache_file:
+            json.dump({"version": _CACHE_VERSION, "probes": probes}, cache_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        # the file is only a cache, the tools will be probed again next time
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
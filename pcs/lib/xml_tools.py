@@ -4,7 +4,7 @@ from typing import cast
 from lxml import etree
 from lxml.etree import _Element, _ElementTree
 
-from pcs.common import const, pacemaker
+from pcs.common import const, pacemaker, timing
 from pcs.common.types import StringCollection
 
 _XSD_BOOLEAN_TRUE = frozenset(["true", "1"])
@@ -156,7 +156,8 @@ def etree_to_str(tree: _Element) -> str:
     # python 3 removed .encode() from byte strings
     # run(...) calls subprocess.Popen.communicate which calls encode...
     # so there is bytes to str conversion
-    raw = etree.tostring(tree)
+    with timing.span(timing.XML_SERIALIZE):
+        raw = etree.tostring(tree)
     return raw.decode() if isinstance(raw, bytes) else raw
 
 
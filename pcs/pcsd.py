@@ -228,9 +228,9 @@ def _check_nodes(node_list, prefix=""):
     online_code = 0
     status_desc_map = {online_code: "Online", 3: "Unable to authenticate"}
     status_list = []
-
-    def report(node, returncode, _output):
-        del _output
+    for node, (returncode, _) in utils.send_http_request_to_nodes(
+        node_list, "remote/check_auth"
+    ):
         print(
             "{0}{1}: {2}".format(
                 prefix, node, status_desc_map.get(returncode, "Offline")
@@ -238,11 +238,6 @@ def _check_nodes(node_list, prefix=""):
         )
         status_list.append(returncode)
 
-    utils.read_known_hosts_file()  # cache known hosts
-    utils.run_parallel(
-        utils.create_task_list(report, utils.checkAuthorization, node_list)
-    )
-
     return any(status != online_code for status in status_list)
 
 
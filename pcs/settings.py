@@ -0,0 +1,252 @@
+import os
+
+# generic system paths
+chkconfig_exec = "/sbin/chkconfig"
+find_exec = "/usr/bin/find"
+killall_exec = "/usr/bin/killall"
+rm_exec = "/bin/rm"
+ruby_exec = "/usr/bin/ruby"
+service_exec = "/usr/sbin/service"
+rc_service_exec = "/sbin/rc-service"
+rc_update_exec = "/sbin/rc-update"
+systemctl_exec = "/bin/systemctl"
+systemd_unit_path = "/etc/systemd/system:/usr/lib/systemd/system".split(":")
+certutil_exec = "/usr/bin/certutil"
+
+
+# pcs
+pcs_version = "0.12.0"
+pcs_bundled_packages_dir = os.path.join("", "packages")
+pcs_data_dir = "/root/package/data/"
+
+
+# pcsd
+pcsd_exec_location = "/usr/lib/pcsd"
+pcsd_public_dir = ""
+pcsd_webui_dir = ""
+pcs_capabilities = os.path.join(pcsd_exec_location, "capabilities.xml")
+# Set pcsd_gem_path to None if there are no bundled ruby gems and the path does
+# not exists.
+pcsd_gem_path = "" or None
+pcsd_unix_socket = "/var/run/pcsd.socket"
+pcsd_ruby_socket = "/var/run/pcsd-ruby.socket"
+pcsd_fork_server_socket = "/var/run/pcsd-fork-server.socket"
+pcsd_log_location = os.path.join(
+    os.environ.get("LOGS_DIRECTORY", "/var/log/pcsd"),
+    "pcsd.log",
+)
+
+pcsd_default_port = 2224
+pcsd_config = "/etc/sysconfig/pcsd"
+
+pcsd_var_location = os.environ.get(
+    "STATE_DIRECTORY", "/var/lib/pcsd"
+)
+pcsd_cert_location = os.path.join(pcsd_var_location, "pcsd.crt")
+pcsd_dr_config_location = os.path.join(pcsd_var_location, "disaster-recovery")
+pcsd_key_location = os.path.join(pcsd_var_location, "pcsd.key")
+pcsd_known_hosts_location = os.path.join(pcsd_var_location, "known-hosts")
+pcsd_settings_conf_location = os.path.join(
+    pcsd_var_location, "pcs_settings.conf"
+)
+pcsd_users_conf_location = os.path.join(pcsd_var_location, "pcs_users.conf")
+# cache of CIB checkpoints metadata, see pcs.lib.cib.checkpoint
+cib_checkpoint_index_location = os.path.join(
+    pcsd_var_location, "cib_checkpoint_index.json"
+)
+# cache of help and version outputs of tools, see pcs.lib.tool_probe
+pcs_tool_probe_cache_location = os.path.join(
+    pcsd_var_location, "tool_probe_cache.json"
+)
+# web UI sessions kept across pcsd restarts, see pcs.daemon.app.webui.session
+pcsd_sessions_location = os.path.join(pcsd_var_location, "pcsd_sessions")
+
+default_ssl_ciphers = "DEFAULT:!RC4"
+# Ssl options are based on default options in python (maybe with some extra
+# options). Format here is the same as the PCSD_SSL_OPTIONS environment
+# variable format (string with coma as a delimiter).
+default_ssl_options = ",".join(
+    [
+        "OP_NO_COMPRESSION",
+        "OP_CIPHER_SERVER_PREFERENCE",
+        "OP_SINGLE_DH_USE",
+        "OP_SINGLE_ECDH_USE",
+        "OP_NO_SSLv2",
+        "OP_NO_SSLv3",
+        "OP_NO_TLSv1",
+        "OP_NO_TLSv1_1",
+        "OP_NO_RENEGOTIATION",
+    ]
+)
+default_request_timeout = 60
+gui_session_lifetime_seconds = 60 * 60
+# keep web UI sessions when pcsd restarts
+gui_session_persistent = False
+# replaced pcsd_token_max_bytes = 256. The bytes were always base64 encoded
+# - resulting in ~345 chars, we need to make this value at least 345 chars
+# to stay backwards compatible
+pcsd_token_max_chars = 512
+
+# pcsd task scheduler settings
+async_api_scheduler_interval_ms = 100
+pcsd_worker_count = 10
+pcsd_temporary_workers = 10
+# threads running read-only commands in pcsd
+pcsd_inline_worker_count = 4
+# seconds after which external processes run by those threads are killed
+pcsd_inline_command_timeout = 60
+# seconds to reuse results of read-only commands while the CIB stays the
+# same, 0 disables reusing them
+pcsd_shared_result_ttl_seconds = 0
+pcsd_worker_reset_limit = 100
+pcsd_deadlock_threshold_timeout = 5
+task_unresponsive_timeout_seconds = 60 * 60
+task_abandoned_timeout_seconds = 1 * 60
+task_deletion_timeout_seconds = 1 * 60
+
+# pcsd fork server settings, the server runs pcs commands for ruby pcsd
+pcsd_fork_server_child_count = 10
+pcsd_fork_server_queue_size = 100
+pcsd_fork_server_command_timeout_seconds = 60 * 60
+
+# pcsd cfgsync settings
+pcs_cfgsync_ctl_location = os.path.join(pcsd_var_location, "cfgsync_ctl")
+pcs_cfgsync_file_backup_count_default = 50
+pcs_cfgsync_file_backup_count_minimum = 0
+pcs_cfgsync_thread_interval_default = 600
+pcs_cfgsync_thread_interval_minimum = 60
+pcs_cfgsync_thread_interval_previous_not_connected_default = 60
+pcs_cfgsync_thread_interval_previous_not_connected_minimum = 20
+# Periodic syncs back off exponentially up to this multiple of the configured
+# interval while nothing changes in the cluster.
+pcs_cfgsync_backoff_max_factor = 8
+# Ratio of the interval randomly added or subtracted to spread node requests.
+pcs_cfgsync_jitter_ratio = 0.1
+# Upper limit of a random delay of a sync triggered by a config push.
+pcs_cfgsync_push_trigger_delay_max = 5
+
+
+# corosync
+# Used only in settings.py and utils.py. Make it private once utils.py is removed.
+corosync_execs = "/usr/sbin"
+corosync_conf_dir = "/etc/corosync"
+corosync_exec = os.path.join(corosync_execs, "corosync")
+corosync_cfgtool_exec = os.path.join(corosync_execs, "corosync-cfgtool")
+corosync_quorumtool_exec = os.path.join(corosync_execs, "corosync-quorumtool")
+corosync_conf_file = os.path.join(corosync_conf_dir, "corosync.conf")
+corosync_uidgid_dir = os.path.join(corosync_conf_dir, "uidgid.d")
+corosync_authkey_file = os.path.join(corosync_conf_dir, "authkey")
+# Must be set to 256 for corosync to work in FIPS environment.
+corosync_authkey_bytes = 256
+corosync_log_file = "/var/log/cluster/corosync.log"
+
+
+# corosync qnetd and qdevice
+corosync_qnet_execs = "/usr/bin"
+corosync_qnetd_certutil_exec = os.path.join(
+    corosync_qnet_execs, "corosync-qnetd-certutil"
+)
+corosync_qnetd_tool_exec = os.path.join(
+    corosync_qnet_execs, "corosync-qnetd-tool"
+)
+corosync_qdevice_execs = "/usr/sbin"
+corosync_qdevice_conf_dir = "/etc/corosync/qdevice"
+corosync_qdevice_net_server_certs_dir = os.path.join(
+    corosync_qdevice_conf_dir, "qnetd/nssdb"
+)
+corosync_qdevice_net_server_ca_file_name = "qnetd-cacert.crt"
+corosync_qdevice_net_client_certs_dir = os.path.join(
+    corosync_qdevice_conf_dir, "qdevice/net/nssdb"
+)
+corosync_qdevice_net_client_ca_file_name = "qnetd-cacert.crt"
+corosync_qdevice_tool_exec = os.path.join(
+    corosync_qdevice_execs, "corosync-qdevice-tool"
+)
+corosync_qdevice_net_certutil_exec = os.path.join(
+    corosync_qdevice_execs, "corosync-qdevice-net-certutil"
+)
+
+
+# pacemaker
+# Used only in settings.py and utils.py. Make it private once utils.py is removed.
+pacemaker_execs = "/usr/sbin"
+pacemaker_authkey_file = "/etc/pacemaker/authkey"
+# Using the same value as for corosync. Higher values MAY work in FIPS.
+pacemaker_authkey_bytes = 256
+pacemaker_local_state_dir = os.path.join(
+    "/", "/var", "lib/pacemaker"
+)
+pacemaker_secrets_dir = os.path.join(pacemaker_local_state_dir, "lrm/secrets")
+pacemaker_daemon_dir = "/usr/libexec/pacemaker"
+pacemaker_schedulerd_exec = os.path.join(
+    pacemaker_daemon_dir, "pacemaker-schedulerd"
+)
+pacemakerd_exec = os.path.join(pacemaker_execs, "pacemakerd")
+iso8601_exec = os.path.join(pacemaker_execs, "iso8601")
+pacemaker_controld_exec = os.path.join(pacemaker_daemon_dir, "pacemaker-controld")
+pacemaker_based_exec = os.path.join(pacemaker_daemon_dir, "pacemaker-based")
+pacemaker_fenced_exec = os.path.join(pacemaker_daemon_dir, "pacemaker-fenced")
+crm_attribute_exec = os.path.join(pacemaker_execs, "crm_attribute")
+crm_resource_exec = os.path.join(pacemaker_execs, "crm_resource")
+crm_mon_exec = os.path.join(pacemaker_execs, "crm_mon")
+crm_report_exec = os.path.join(pacemaker_execs, "crm_report")
+crm_rule_exec = os.path.join(pacemaker_execs, "crm_rule")
+crm_diff_exec = os.path.join(pacemaker_execs, "crm_diff")
+crm_simulate_exec = os.path.join(pacemaker_execs, "crm_simulate")
+crm_ticket_exec = os.path.join(pacemaker_execs, "crm_ticket")
+crm_verify_exec = os.path.join(pacemaker_execs, "crm_verify")
+crm_node_exec = os.path.join(pacemaker_execs, "crm_node")
+cibadmin_exec = os.path.join(pacemaker_execs, "cibadmin")
+stonith_admin_exec = os.path.join(pacemaker_execs, "stonith_admin")
+pacemaker_api_result_schema = "/usr/share/pacemaker/api/api-result.rng"
+cib_dir = "/var/lib/pacemaker/cib"
+pacemaker_uname = "hacluster"
+pacemaker_gname = "haclient"
+pacemaker_wait_timeout_status = 124
+
+
+# resource / stonith agents
+fence_agent_execs = "/usr/sbin"
+
+
+# sbd
+sbd_exec = "/usr/sbin/sbd"
+sbd_config = "/etc/sysconfig/sbd"
+sbd_service_name = "sbd"
+# this limit is also mentioned in docs, change there as well
+sbd_max_device_num = 3
+# message types are also mentioned in docs, change there as well
+sbd_message_types = ["test", "reset", "off", "crashdump", "exit", "clear"]
+sbd_watchdog_default = "/dev/watchdog"
+
+
+# booth
+# Booth does not support keys longer than 64 bytes.
+booth_authkey_bytes = 64
+booth_authkey_file_mode = 0o600
+booth_exec = "/usr/sbin/booth"
+booth_config_dir = "/etc/booth"
+booth_enable_authfile_set_enabled = False
+booth_enable_authfile_unset_enabled = False or booth_enable_authfile_set_enabled
+
+
+# path manager
+_ocf_1_0_schema_filename = "ocf-1.0.rng"
+_ocf_1_1_schema_filename = "ocf-1.1.rng"
+
+
+class _PathManager:
+    @property
+    def ocf_1_0_schema(self):
+        return os.path.join(pcs_data_dir, _ocf_1_0_schema_filename)
+
+    @property
+    def ocf_1_1_schema(self):
+        return os.path.join(pcs_data_dir, _ocf_1_1_schema_filename)
+
+    @property
+    def pcs_data_dir(self):
+        return pcs_data_dir
+
+
+path = _PathManager()
@@ -0,0 +1,256 @@
+"""
+Status of the cluster provided by the SNMP agent. It is put together from
+corosync.conf, corosync quorum status and one pacemaker status, all of them
+obtained and processed in the agent's process.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import cast
+
+from lxml.etree import _Element
+
+from pcs.common.const import PCMK_ROLE_STOPPED
+from pcs.common.resource_status import ResourcesStatusFacade
+from pcs.common.status_dto import (
+    AnyResourceStatusDto,
+    CloneStatusDto,
+    GroupStatusDto,
+    PrimitiveStatusDto,
+)
+from pcs.common.types import StringCollection
+from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncConfigFacade
+from pcs.lib.corosync.live import (
+    QuorumStatusFacade,
+    QuorumStatusParsingException,
+    QuorumStatusReadException,
+    get_quorum_status_text,
+)
+from pcs.lib.errors import LibraryError
+from pcs.lib.external import CommandRunner
+from pcs.lib.file.instance import FileInstance
+from pcs.lib.node import get_existing_nodes_names
+from pcs.lib.pacemaker.live import get_cluster_status_dom
+from pcs.lib.pacemaker.state import ClusterState
+from pcs.lib.pacemaker.status import ClusterStatusParser
+
+
+@dataclass(frozen=True)
+class ClusterStatus:
+    cluster_name: str
+    quorate: bool
+    known_nodes: list[str]
+    corosync_online: list[str]
+    corosync_offline: list[str]
+    pacemaker_online: list[str]
+    pacemaker_standby: list[str]
+    pacemaker_offline: list[str]
+    resources_all: list[str]
+    resources_running: list[str]
+    resources_stopped: list[str]
+    resources_failed: list[str]
+
+
+def get_cluster_status(runner: CommandRunner) -> ClusterStatus:
+    """
+    Get status of the cluster as seen from the local node
+
+    Errors of reading or parsing corosync.conf and pacemaker status are
+    raised, except for pacemaker not running on the local node.
+
+    runner -- a command runner instance
+    """
+    corosync_conf = cast(
+        CorosyncConfigFacade,
+        FileInstance.for_corosync_conf().read_to_facade(),
+    )
+    try:
+        corosync_online = [
+            node.name
+            for node in QuorumStatusFacade.from_string(
+                get_quorum_status_text(runner)
+            ).node_list
+        ]
+    except (QuorumStatusReadException, QuorumStatusParsingException):
+        # corosync is not running on the local node
+        corosync_online = []
+    try:
+        status_dom = get_cluster_status_dom(runner)
+    except LibraryError:
+        # pacemaker is not running on the local node
+        status_dom = None
+    return build_cluster_status(corosync_conf, corosync_online, status_dom)
+
+
+def build_cluster_status(
+    corosync_conf: CorosyncConfigFacade,
+    corosync_online: StringCollection,
+    status_dom: _Element | None,
+) -> ClusterStatus:
+    """
+    Put together status of the cluster
+
+    corosync_conf -- corosync.conf of the local node
+    corosync_online -- names of nodes which are corosync members
+    status_dom -- pacemaker status, None if pacemaker is not running
+    """
+    corosync_nodes = get_existing_nodes_names(corosync_conf)[0]
+    corosync_online_list = sorted(
+        name for name in corosync_nodes if name in corosync_online
+    )
+    corosync_offline_list = sorted(
+        name for name in corosync_nodes if name not in corosync_online
+    )
+
+    quorate = False
+    pacemaker_online: list[str] = []
+    pacemaker_standby: list[str] = []
+    pacemaker_offline: list[str] = []
+    resources_all: list[str] = []
+    resources_running: list[str] = []
+    resources_stopped: list[str] = []
+    resources_failed: list[str] = []
+    if status_dom is not None:
+        quorate = bool(
+            status_dom.xpath("summary/current_dc[@with_quorum='true']")
+        )
+        for node in ClusterState(status_dom).node_section.nodes:
+            if node.attrs.type != "member":
+                # remote and guest nodes
+                continue
+            if not node.attrs.online:
+                pacemaker_offline.append(node.attrs.name)
+            elif node.attrs.standby:
+                # Nodes in standby which still run resources are reported as
+                # offline. This is kept for compatibility with values
+                # previously provided by pcsd.
+                if node.attrs.resources_running:
+                    pacemaker_offline.append(node.attrs.name)
+                else:
+                    pacemaker_standby.append(node.attrs.name)
+            else:
+                pacemaker_online.append(node.attrs.name)
+
+        resources_status = ClusterStatusParser(status_dom).status_xml_to_dto()
+        resources_facade = ResourcesStatusFacade.from_resources_status_dto(
+            resources_status
+        )
+        for primitive_id, disabled in _get_primitives(
+            resources_status.resources
+        ):
+            resources_all.append(primitive_id)
+            instances = cast(
+                list[PrimitiveStatusDto],
+                resources_facade.get_resource_all_instances(primitive_id),
+            )
+            if disabled:
+                resources_stopped.append(primitive_id)
+            elif any(instance.active for instance in instances):
+                resources_running.append(primitive_id)
+            else:
+                resources_failed.append(primitive_id)
+
+    return ClusterStatus(
+        cluster_name=corosync_conf.get_cluster_name(),
+        quorate=quorate,
+        known_nodes=list(
+            dict.fromkeys(
+                corosync_online_list
+                + corosync_offline_list
+                + pacemaker_online
+                + pacemaker_offline
+                + pacemaker_standby
+            )
+        ),
+        corosync_online=corosync_online_list,
+        corosync_offline=corosync_offline_list,
+        pacemaker_online=pacemaker_online,
+        pacemaker_standby=pacemaker_standby,
+        pacemaker_offline=pacemaker_offline,
+        resources_all=resources_all,
+        resources_running=resources_running,
+        resources_stopped=resources_stopped,
+        resources_failed=resources_failed,
+    )
+
+
+def _get_primitives(
+    resources: Iterable[AnyResourceStatusDto],
+    parent_disabled: bool = False,
+) -> list[tuple[str, bool]]:
+    """
+    Return ids of configured primitives and whether they are disabled
+
+    Bundles and orphaned resources are skipped, each primitive is listed once
+    regardless of the number of its instances.
+    """
+    result: dict[str, bool] = {}
+    for resource in resources:
+        if isinstance(resource, PrimitiveStatusDto):
+            if not resource.orphaned:
+                result.setdefault(
+                    resource.resource_id,
+                    not resource.resource_agent.startswith("stonith:")
+                    and (
+                        parent_disabled
+                        or resource.target_role == PCMK_ROLE_STOPPED
+                    ),
+                )
+        elif isinstance(resource, GroupStatusDto):
+            for primitive_id, disabled in _get_primitives(
+                resource.members, parent_disabled or resource.disabled
+            ):
+                result.setdefault(primitive_id, disabled)
+        elif isinstance(resource, CloneStatusDto):
+            for primitive_id, disabled in _get_primitives(
+                resource.instances, parent_disabled or resource.disabled
+            ):
+                result.setdefault(primitive_id, disabled)
+    return list(result.items())
+
+
+class ClusterStatusCache:
+    """
+    Keeps the last status of the cluster so that it is not gathered again
+    when it has just been gathered
+
+    Gathering the status may take longer than the update interval of the
+    agent. Updates which have been missed in the meantime are then served
+    with the just gathered status instead of gathering it again right away.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], ClusterStatus],
+        min_age: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        loader -- function gathering the status
+        min_age -- how long in seconds the status is reused after it has been
+            gathered
+        clock -- function returning current time in seconds
+        """
+        self._loader = loader
+        self._min_age = min_age
+        self._clock = clock
+        self._status: ClusterStatus | None = None
+        self._loaded_at = 0.0
+
+    def get(self) -> ClusterStatus:
+        """
+        Return status of the cluster, gather it if the cached one is too old
+        """
+        if (
+            self._status is None
+            or self._clock() - self._loaded_at >= self._min_age
+        ):
+            # drop the old status first, so that it is not served if
+            # gathering a new one fails
+            self._status = None
+            self._status = self._loader()
+            # measured after the status has been gathered so that updates
+            # missed while gathering it do not trigger gathering it again
+            self._loaded_at = self._clock()
+        return self._status
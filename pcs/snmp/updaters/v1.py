@@ -2,7 +2,8 @@ import logging
 
 from pcs.snmp.agentx.types import IntegerType, Oid, StringType
 from pcs.snmp.agentx.updater import AgentxUpdaterBase
-from pcs.utils import run_pcsdcli
+from pcs.snmp.cluster_status import ClusterStatusCache, get_cluster_status
+from pcs.utils import cmd_runner
 
 logger = logging.getLogger("pcs.snmp.updaters.v1")
 logger.addHandler(logging.NullHandler())
@@ -40,165 +41,88 @@ _cluster_v1_oid_tree = Oid(
 class ClusterPcsV1Updater(AgentxUpdaterBase):
     _oid_tree = Oid(0, "pcs_v1", member_list=[_cluster_v1_oid_tree])
 
+    _status_cache = None
+
     def update(self):
-        output, ret_val = run_pcsdcli("node_status")
-        if ret_val != 0 or output["status"] != "ok":
-            logger.error(
-                "Unable to obtain cluster status.\nPCSD return code: %s\n"
-                "PCSD output: %s\n",
-                ret_val,
-                output,
+        if self._status_cache is None:
+            self._status_cache = ClusterStatusCache(
+                lambda: get_cluster_status(cmd_runner()),
+                # status gathered in the second half of the previous interval
+                # is reused, so that intervals missed while gathering the
+                # status are coalesced into one update
+                self._freq / 2,
             )
+        try:
+            status = self._status_cache.get()
+        except Exception:
+            logger.exception("Unable to obtain cluster status")
             return
-        data = output["data"]
         self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName",
-            data.get("cluster_name", ""),
+            "pcmkPcsV1Cluster.pcmkPcsV1ClusterName", status.cluster_name
         )
         self.set_value(
             "pcmkPcsV1Cluster.pcmkPcsV1ClusterQuorate",
-            _bool_to_int(data.get("node", {}).get("quorum")),
+            _bool_to_int(status.quorate),
         )
 
         # nodes
-        known_nodes = data.get("known_nodes", [])
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNum", len(known_nodes)
+        self._set_list(
+            "pcmkPcsV1ClusterNodesNum",
+            "pcmkPcsV1ClusterNodesNames",
+            status.known_nodes,
         )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterNodesNames", known_nodes
+        self._set_list(
+            "pcmkPcsV1ClusterCorosyncNodesOnlineNum",
+            "pcmkPcsV1ClusterCorosyncNodesOnlineNames",
+            status.corosync_online,
         )
-
-        corosync_nodes_online = data.get("corosync_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNum",
-            len(corosync_nodes_online),
+        self._set_list(
+            "pcmkPcsV1ClusterCorosyncNodesOfflineNum",
+            "pcmkPcsV1ClusterCorosyncNodesOfflineNames",
+            status.corosync_offline,
         )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOnlineNames",
-            corosync_nodes_online,
+        self._set_list(
+            "pcmkPcsV1ClusterPcmkNodesOnlineNum",
+            "pcmkPcsV1ClusterPcmkNodesOnlineNames",
+            status.pacemaker_online,
         )
-
-        corosync_nodes_offline = data.get("corosync_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNum",
-            len(corosync_nodes_offline),
+        self._set_list(
+            "pcmkPcsV1ClusterPcmkNodesStandbyNum",
+            "pcmkPcsV1ClusterPcmkNodesStandbyNames",
+            status.pacemaker_standby,
         )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterCorosyncNodesOfflineNames",
-            corosync_nodes_offline,
-        )
-
-        pcmk_nodes_online = data.get("pacemaker_online")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNum",
-            len(pcmk_nodes_online),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOnlineNames",
-            pcmk_nodes_online,
-        )
-
-        pcmk_nodes_standby = data.get("pacemaker_standby")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNum",
-            len(pcmk_nodes_standby),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesStandbyNames",
-            pcmk_nodes_standby,
-        )
-
-        pcmk_nodes_offline = data.get("pacemaker_offline")
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNum",
-            len(pcmk_nodes_offline),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterPcmkNodesOfflineNames",
-            pcmk_nodes_offline,
+        self._set_list(
+            "pcmkPcsV1ClusterPcmkNodesOfflineNum",
+            "pcmkPcsV1ClusterPcmkNodesOfflineNames",
+            status.pacemaker_offline,
         )
 
         # resources
-        primitive_list = []
-        for resource in data.get("resource_list", []):
-            primitive_list.extend(_get_primitives(resource))
-
-        primitive_id_list = _get_resource_id_list(primitive_list)
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesNum",
-            len(primitive_id_list),
+        self._set_list(
+            "pcmkPcsV1ClusterAllResourcesNum",
+            "pcmkPcsV1ClusterAllResourcesIds",
+            status.resources_all,
         )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterAllResourcesIds",
-            primitive_id_list,
+        self._set_list(
+            "pcmkPcsV1ClusterRunningResourcesNum",
+            "pcmkPcsV1ClusterRunningResourcesIds",
+            status.resources_running,
         )
-        running_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["running"])
+        self._set_list(
+            "pcmkPcsV1ClusterStoppedResourcesNum",
+            "pcmkPcsV1ClusterStoppedResourcesIds",
+            status.resources_stopped,
         )
-
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesNum",
-            len(running_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterRunningResourcesIds",
-            running_primitive_id_list,
+        self._set_list(
+            "pcmkPcsV1ClusterFailedResourcesNum",
+            "pcmkPcsV1ClusterFailedResourcesIds",
+            status.resources_failed,
         )
 
-        disabled_primitive_id_list = _get_resource_id_list(
-            primitive_list, _res_in_status(["disabled"])
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesNum",
-            len(disabled_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterStoppedResourcesIds",
-            disabled_primitive_id_list,
-        )
-
-        failed_primitive_id_list = _get_resource_id_list(
-            primitive_list,
-            lambda res: not _res_in_status(["running", "disabled"])(res),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesNum",
-            len(failed_primitive_id_list),
-        )
-        self.set_value(
-            "pcmkPcsV1Cluster.pcmkPcsV1ClusterFailedResourcesIds",
-            failed_primitive_id_list,
-        )
+    def _set_list(self, num_oid, names_oid, value_list):
+        self.set_value(f"pcmkPcsV1Cluster.{num_oid}", len(value_list))
+        self.set_value(f"pcmkPcsV1Cluster.{names_oid}", value_list)
 
 
 def _bool_to_int(value):
     return 1 if value else 0
-
-
-def _get_primitives(resource):
-    res_type = resource["class_type"]
-    if res_type == "primitive":
-        return [resource]
-    if res_type == "group":
-        primitive_list = []
-        for primitive in resource["members"]:
-            primitive_list.extend(_get_primitives(primitive))
-        return primitive_list
-    # check master-slave type
-    if res_type in ["clone", "master"]:
-        return _get_primitives(resource["member"])
-    return []
-
-
-def _get_resource_id_list(resource_list, predicate=None):
-    if predicate is None:
-
-        def predicate(_):
-            return True
-
-    return [resource["id"] for resource in resource_list if predicate(resource)]
-
-
-def _res_in_status(status_list):
-    return lambda res: res["status"] in status_list
@@ -240,6 +240,12 @@ Options:
                        A few commands only use the specified file in read-only
                        mode since their effect is not a CIB modification.
     --debug            Print all network traffic and external commands run.
+    --timing           Print time spent running external processes, sending
+                       requests to nodes, processing XML and reports when the
+                       command finishes.
+    --timing-profile=<file>
+                       Save python profiler statistics of the command to the
+                       specified file.
     --version          Print pcs version information. List pcs capabilities if
                        --full is specified.
     --request-timeout  Timeout for each outgoing request to another node in
@@ -957,6 +963,24 @@ Commands:
         to 60 minutes.
         If --force is specified, checks for safe disable will be skipped.
 
+    disable-impact <resource id | tag id>[,<resource id | tag id>...]...
+            [max-concurrency=<number>] [timeout=<time>] [--no-strict]
+            [--output-format=text|json]
+        Simulate disabling each of the specified sets of resources, one set per
+        argument with ids separated by commas, and print which other resources
+        would be affected. No changes to the cluster configuration are made.
+        The sets are simulated independently of each other, up to
+        max-concurrency of them at the same time. It defaults to the number of
+        CPUs. Sets which have not been simulated within the timeout are
+        reported as timed out. Returns 0 if all the sets have been simulated,
+        1 if any of them timed out or could not be simulated.
+        If --no-strict is specified, only resources which would get stopped or
+        demoted are reported as affected. Moving resources between nodes is
+        allowed.
+        There are 2 formats of output available: 'text' and 'json'. The 'json'
+        format also contains resource operations the cluster would perform.
+        Use --output-format option to select one.
+
     restart <resource id> [node] [--wait=n]
         Restart the resource specified. If a node is specified and if the
         resource is a clone or bundle it will be restarted only on the node
@@ -3002,8 +3026,11 @@ Commands:
         If --local is specified only the files on the current node will
         be restored.
 
-    checkpoint
-        List all available configuration checkpoints.
+    checkpoint [--full] [--since <date and time>]
+        List all available configuration checkpoints. If --full is specified,
+        also show epoch and size of the checkpoints. If --since is specified,
+        list only checkpoints created since the specified date and time in
+        format 'YYYY-MM-DD [HH:MM[:SS]]'.
 
     checkpoint view <checkpoint_number>
         Show specified configuration checkpoint.
@@ -3011,6 +3038,17 @@ Commands:
     checkpoint diff <checkpoint_number> <checkpoint_number>
         Show differences between the two specified checkpoints. Use checkpoint
         number 'live' to compare a checkpoint to the current live configuration.
+        Resources, constraints and cluster properties are compared one by one,
+        other configuration sections are compared as XML.
+
+    checkpoint diff <checkpoint_number>..<checkpoint_number>
+        Show differences between each two consecutive checkpoints from the
+        specified range of checkpoints, ordered by their creation time.
+
+    checkpoint diff --since <date and time>
+        Show differences between each two consecutive checkpoints created since
+        the specified date and time in format 'YYYY-MM-DD [HH:MM[:SS]]'. The
+        first of those checkpoints is compared to the checkpoint preceding it.
 
     checkpoint restore <checkpoint_number>
         Restore cluster configuration to specified checkpoint.
@@ -9,9 +9,9 @@ import subprocess
 import sys
 import tarfile
 import tempfile
-import threading
 import time
 import xml.dom.minidom
+from collections.abc import Generator, Iterable
 from functools import lru_cache
 from io import BytesIO
 from textwrap import dedent
@@ -24,7 +24,7 @@ import pcs.cli.booth.env
 import pcs.lib.corosync.config_parser as corosync_conf_parser
 from pcs import settings, usage
 from pcs.cli.cluster_property.output import PropertyConfigurationFacade
-from pcs.cli.common import middleware
+from pcs.cli.common import local_pcsd, middleware
 from pcs.cli.common.env_cli import Env
 from pcs.cli.common.errors import CmdLineInputError
 from pcs.cli.common.lib_wrapper import Library
@@ -37,7 +37,16 @@ from pcs.common import const, file_type_codes
 from pcs.common import file as pcs_file
 from pcs.common import pacemaker as common_pacemaker
 from pcs.common import pcs_pycurl as pycurl
-from pcs.common.host import PcsKnownHost
+from pcs.common.host import Destination, PcsKnownHost
+from pcs.common.node_communicator import (
+    CommunicatorLoggerInterface,
+    MultiaddressCommunicator,
+    NodeTargetFactory,
+    Request,
+    RequestData,
+    RequestTarget,
+    Response,
+)
 from pcs.common.pacemaker.resource.operations import (
     OCF_CHECK_LEVEL_INSTANCE_ATTRIBUTE_NAME,
 )
@@ -47,7 +56,7 @@ from pcs.common.services.errors import ManageServiceError
 from pcs.common.services.interfaces import ServiceManagerInterface
 from pcs.common.str_tools import format_list
 from pcs.common.tools import Version, timeout_to_seconds
-from pcs.common.types import StringSequence
+from pcs.common.types import StringIterable, StringSequence
 from pcs.lib.corosync.config_facade import ConfigFacade as corosync_conf_facade
 from pcs.lib.env import LibraryEnvironment
 from pcs.lib.errors import LibraryError
@@ -147,26 +156,6 @@ def cluster_upgrade_to_version(required_version: Version) -> Any:
     return dom
 
 
-# Check status of node
-def checkStatus(node):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(
-        node, "remote/status", urlencode({"version": "2"}), False, False
-    )
-
-
-# Check and see if we're authorized (faster than a status check)
-def checkAuthorization(node):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(node, "remote/check_auth", None, False, False)
-
-
 def get_uid_gid_file_name(uid, gid):
     """
     Commandline options: no options
@@ -347,154 +336,6 @@ def read_known_hosts_file_not_cached() -> dict[str, PcsKnownHost]:
     return {}
 
 
-def repeat_if_timeout(send_http_request_function, repeat_count=15):
-    """
-    Commandline options: no options
-    NOTE: callback send_http_request_function may use --request-timeout
-    """
-
-    def repeater(node, *args, **kwargs):
-        repeats_left = repeat_count
-        while True:
-            retval, output = send_http_request_function(node, *args, **kwargs)
-            if (
-                retval != 2
-                or "Operation timed out" not in output
-                or repeats_left < 1
-            ):
-                # did not timed out OR repeat limit exceeded
-                return retval, output
-            repeats_left = repeats_left - 1
-            if "--debug" in pcs_options:
-                print_to_stderr(f"{node}: {output}, trying again...")
-
-    return repeater
-
-
-def setCorosyncConfig(node, config):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    data = urlencode({"corosync_conf": config})
-    (status, data) = sendHTTPRequest(node, "remote/set_corosync_conf", data)
-    if status != 0:
-        err("Unable to set corosync config: {0}".format(data))
-
-
-def getPacemakerNodeStatus(node):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(
-        node, "remote/pacemaker_node_status", None, False, False
-    )
-
-
-def startCluster(node, quiet=False, timeout=None):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(
-        node,
-        "remote/cluster_start",
-        printResult=False,
-        printSuccess=not quiet,
-        timeout=timeout,
-    )
-
-
-def stopPacemaker(node, quiet=False, force=True):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return stopCluster(
-        node, pacemaker=True, corosync=False, quiet=quiet, force=force
-    )
-
-
-def stopCorosync(node, quiet=False, force=True):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return stopCluster(
-        node, pacemaker=False, corosync=True, quiet=quiet, force=force
-    )
-
-
-def stopCluster(node, quiet=False, pacemaker=True, corosync=True, force=True):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    data = {}
-    timeout = None
-    if pacemaker and not corosync:
-        data["component"] = "pacemaker"
-        timeout = 2 * 60
-    elif corosync and not pacemaker:
-        data["component"] = "corosync"
-    if force:
-        data["force"] = 1
-    data = urlencode(data)
-    return sendHTTPRequest(
-        node,
-        "remote/cluster_stop",
-        data,
-        printResult=False,
-        printSuccess=not quiet,
-        timeout=timeout,
-    )
-
-
-def enableCluster(node):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(node, "remote/cluster_enable", None, False, True)
-
-
-def disableCluster(node):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(node, "remote/cluster_disable", None, False, True)
-
-
-def destroyCluster(node, quiet=False):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    return sendHTTPRequest(
-        node, "remote/cluster_destroy", None, not quiet, not quiet
-    )
-
-
-def restoreConfig(node, tarball_data):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    data = urlencode({"tarball": tarball_data})
-    return sendHTTPRequest(node, "remote/config_restore", data, False, True)
-
-
-def pauseConfigSyncing(node, delay_seconds=300):
-    """
-    Commandline options:
-      * --request-timeout - timeout for HTTP requests
-    """
-    data = urlencode({"sync_thread_pause": delay_seconds})
-    return sendHTTPRequest(node, "remote/set_sync_options", data, False, False)
-
-
 # Send an HTTP request to a node return a tuple with status, data
 # If status is 0 then data contains server response
 # Otherwise if non-zero then data contains error message
@@ -504,7 +345,7 @@ def pauseConfigSyncing(node, delay_seconds=300):
 # 2 = No response,
 # 3 = Auth Error
 # 4 = Permission denied
-def sendHTTPRequest(  # noqa: PLR0912, PLR0915
+def sendHTTPRequest(
     host, request, data=None, printResult=True, printSuccess=True, timeout=None
 ):
     """
@@ -512,155 +353,69 @@ def sendHTTPRequest(  # noqa: PLR0912, PLR0915
       * --request-timeout - timeout for HTTP requests
       * --debug
     """
-    port = None
-    addr = host
-    token = None
-    known_host = read_known_hosts_file().get(host, None)
-    # TODO: do not allow communication with unknown host
-    if known_host:
-        port = known_host.dest.port
-        addr = known_host.dest.addr
-        token = known_host.token
-    if port is None:
-        port = settings.pcsd_default_port
-    url = "https://{host}:{port}/{request}".format(
-        host="[{0}]".format(addr) if ":" in addr else addr,
-        request=request,
-        port=port,
+    [(_, response)] = list(
+        _send_http_requests([(host, request, data or "")], timeout)
     )
-    if "--debug" in pcs_options:
-        print_to_stderr(f"Sending HTTP Request to: {url}\nData: {data}")
-
-    def __debug_callback(data_type, debug_data):
-        prefixes = {
-            pycurl.DEBUG_TEXT: b"* ",
-            pycurl.DEBUG_HEADER_IN: b"< ",
-            pycurl.DEBUG_HEADER_OUT: b"> ",
-            pycurl.DEBUG_DATA_IN: b"<< ",
-            pycurl.DEBUG_DATA_OUT: b">> ",
-        }
-        if data_type in prefixes:
-            debug_output.write(prefixes[data_type])
-            debug_output.write(debug_data)
-            if not debug_data.endswith(b"\n"):
-                debug_output.write(b"\n")
-
-    output = BytesIO()
-    debug_output = BytesIO()
-    cookies = __get_cookie_list(token)
-    if not timeout:
-        timeout = settings.default_request_timeout
-    timeout = pcs_options.get("--request-timeout", timeout)
-
-    handler = pycurl.Curl()
-    handler.setopt(pycurl.PROTOCOLS, pycurl.PROTO_HTTPS)
-    handler.setopt(pycurl.URL, url.encode("utf-8"))
-    handler.setopt(pycurl.WRITEFUNCTION, output.write)
-    handler.setopt(pycurl.VERBOSE, 1)
-    handler.setopt(pycurl.NOSIGNAL, 1)  # required for multi-threading
-    handler.setopt(pycurl.DEBUGFUNCTION, __debug_callback)
-    handler.setopt(pycurl.TIMEOUT_MS, int(timeout * 1000))
-    handler.setopt(pycurl.SSL_VERIFYHOST, 0)
-    handler.setopt(pycurl.SSL_VERIFYPEER, 0)
-    handler.setopt(pycurl.HTTPHEADER, ["Expect: "])
-    if cookies:
-        handler.setopt(pycurl.COOKIE, ";".join(cookies).encode("utf-8"))
-    if data:
-        handler.setopt(pycurl.COPYPOSTFIELDS, data.encode("utf-8"))
-    try:
-        handler.perform()
-        response_data = output.getvalue().decode("utf-8")
-        response_code = handler.getinfo(pycurl.RESPONSE_CODE)
-        if printResult or printSuccess:
-            print_to_stderr(host + ": " + response_data.strip())
-        if "--debug" in pcs_options:
-            print_to_stderr(
-                "Response Code: {response_code}\n"
-                "--Debug Response Start--\n"
-                "{response_data}\n"
-                "--Debug Response End--\n"
-                "Communication debug info for calling: {url}\n"
-                "--Debug Communication Output Start--\n"
-                "{debug_comm_output}\n"
-                "--Debug Communication Output End--".format(
-                    response_code=response_code,
-                    response_data=response_data,
-                    url=url,
-                    debug_comm_output=debug_output.getvalue().decode(
-                        "utf-8", "ignore"
-                    ),
-                )
-            )
-
-        if response_code == 401:
-            output = (
-                3,
-                (
-                    "Unable to authenticate to {node} - (HTTP error: {code}), "
-                    "try running 'pcs host auth {node}'"
-                ).format(node=host, code=response_code),
-            )
-        elif response_code == 403:
-            output = (
-                4,
-                "{node}: Permission denied - (HTTP error: {code})".format(
-                    node=host, code=response_code
-                ),
-            )
-        elif response_code >= 400:
-            output = (
-                1,
-                "Error connecting to {node} - (HTTP error: {code})".format(
-                    node=host, code=response_code
-                ),
-            )
-        else:
-            output = (0, response_data)
-
-        if printResult and output[0] != 0:
+    if not response.was_connected:
+        output = _connection_error_to_result(host, response.error_msg)
+        if printResult:
             print_to_stderr(output[1])
-
         return output
-    except pycurl.error as e:
-        if is_proxy_set(os.environ):
-            reports_output.warn(
-                "Proxy is set in environment variables, try disabling it"
-            )
-        dummy_errno, reason = e.args
-        if "--debug" in pcs_options:
-            print_to_stderr(f"Response Reason: {reason}")
-        msg = (
-            "Unable to connect to {host}, check if pcsd is running there or try "
-            "setting higher timeout with --request-timeout option ({reason})"
-        ).format(host=host, reason=reason)
-        if printResult:
-            print_to_stderr(msg)
-        return (2, msg)
+    if printResult or printSuccess:
+        print_to_stderr(host + ": " + response.data.strip())
+    output = _http_response_to_result(
+        host, response.response_code, response.data
+    )
+    if printResult and output[0] != 0:
+        print_to_stderr(output[1])
+    return output
 
 
-def __get_cookie_list(token):
+def _http_response_to_result(host, response_code, response_data):
     """
     Commandline options: no options
     """
-    cookies = []
-    if token:
-        cookies.append("token=" + token)
-    if os.geteuid() == 0:
-        for name in ("CIB_user", "CIB_user_groups"):
-            if name in os.environ and os.environ[name].strip():
-                value = os.environ[name].strip()
-                # Let's be safe about characters in env variables and do base64.
-                # We cannot do it for CIB_user however to be backward compatible
-                # so we at least remove disallowed characters.
-                if name == "CIB_user":
-                    value = re.sub(r"[^!-~]", "", value).replace(";", "")
-                else:
-                    # python3 requires the value to be bytes not str
-                    value = base64.b64encode(value.encode("utf8")).decode(
-                        "utf-8"
-                    )
-                cookies.append("{0}={1}".format(name, value))
-    return cookies
+    if response_code == 401:
+        return (
+            3,
+            (
+                "Unable to authenticate to {node} - (HTTP error: {code}), "
+                "try running 'pcs host auth {node}'"
+            ).format(node=host, code=response_code),
+        )
+    if response_code == 403:
+        return (
+            4,
+            "{node}: Permission denied - (HTTP error: {code})".format(
+                node=host, code=response_code
+            ),
+        )
+    if response_code >= 400:
+        return (
+            1,
+            "Error connecting to {node} - (HTTP error: {code})".format(
+                node=host, code=response_code
+            ),
+        )
+    return (0, response_data)
+
+
+def _connection_error_to_result(host, reason):
+    """
+    Commandline options: no options
+    """
+    if is_proxy_set(os.environ):
+        reports_output.warn(
+            "Proxy is set in environment variables, try disabling it"
+        )
+    return (
+        2,
+        (
+            "Unable to connect to {host}, check if pcsd is running there or "
+            "try setting higher timeout with --request-timeout option "
+            "({reason})"
+        ).format(host=host, reason=reason),
+    )
 
 
 def get_corosync_conf_facade(conf_text=None):
@@ -946,6 +701,17 @@ def run_pcsdcli(command, data=None):
     return output_json, retval
 
 
+def get_local_pcsd_token() -> str | None:
+    """
+    Commandline options: no options
+
+    Return a token of the local pcsd from known-hosts, the local pcsd
+    authenticates the user as hacluster by it
+    """
+    known_host = read_known_hosts_file().get("localhost")
+    return known_host.token if known_host else None
+
+
 def call_local_pcsd(argv, options, std_in=None):  # noqa: PLR0911
     """
     Commandline options:
@@ -961,9 +727,20 @@ def call_local_pcsd(argv, options, std_in=None):  # noqa: PLR0911
     if std_in:
         data["stdin"] = std_in
     data_send = urlencode(data)
-    code, output = sendHTTPRequest(
-        "localhost", "run_pcs", data_send, False, False
-    )
+    try:
+        code, output = _http_response_to_result(
+            "localhost",
+            *local_pcsd.send_request(
+                "run_pcs",
+                data_send,
+                timeout=pcs_options.get("--request-timeout"),
+                token=get_local_pcsd_token(),
+            ),
+        )
+    except local_pcsd.LocalPcsdUnavailable:
+        code, output = sendHTTPRequest(
+            "localhost", "run_pcs", data_send, False, False
+        )
 
     if code == 3:  # not authenticated
         return [
@@ -1001,75 +778,260 @@ def call_local_pcsd(argv, options, std_in=None):  # noqa: PLR0911
         return [["Unable to communicate with pcsd"], 1, "", ""]
 
 
-def map_for_error_list(callab, iterab):
+class _NodeCommunicatorLogger(CommunicatorLoggerInterface):
     """
-    Commandline options: no options
-    NOTE: callback 'callab' may use some options
+    Print communication debug info the same way sendHTTPRequest does
     """
-    error_list = []
-    for item in iterab:
-        retval, error = callab(item)
-        if retval != 0:
-            error_list.append(error)
-    return error_list
 
+    def log_request_start(self, request: Request) -> None:
+        if "--debug" in pcs_options:
+            print_to_stderr(
+                f"Sending HTTP Request to: {request.url}\nData: {request.data}"
+            )
+
+    def log_response(self, response: Response) -> None:
+        if "--debug" not in pcs_options:
+            return
+        if not response.was_connected:
+            print_to_stderr(f"Response Reason: {response.error_msg}")
+            return
+        print_to_stderr(
+            "Response Code: {response_code}\n"
+            "--Debug Response Start--\n"
+            "{response_data}\n"
+            "--Debug Response End--\n"
+            "Communication debug info for calling: {url}\n"
+            "--Debug Communication Output Start--\n"
+            "{debug_comm_output}\n"
+            "--Debug Communication Output End--".format(
+                response_code=response.response_code,
+                response_data=response.data,
+                url=response.request.url,
+                debug_comm_output=response.debug,
+            )
+        )
 
-def run_parallel(worker_list, wait_seconds=1):
+    def log_retry(self, response: Response, previous_dest: Destination) -> None:
+        if "--debug" in pcs_options:
+            print_to_stderr(
+                f"Unable to connect to '{response.request.host_label}' via "
+                f"address '{previous_dest.addr}' and port "
+                f"'{previous_dest.port}', trying address "
+                f"'{response.request.dest.addr}' and port "
+                f"'{response.request.dest.port}'"
+            )
+
+    def log_no_more_addresses(self, response: Response) -> None:
+        # the connection error is reported as a result of the request
+        pass
+
+
+@lru_cache
+def _get_node_communicator() -> MultiaddressCommunicator:
     """
     Commandline options: no options
+
+    All requests to nodes share one communicator, so that connections opened
+    by previous requests are reused.
     """
-    thread_list = set()
-    for worker in worker_list:
-        thread = threading.Thread(target=worker)
-        thread.daemon = True
-        thread.start()
-        thread_list.add(thread)
+    user = None
+    groups = None
+    if os.geteuid() == 0:
+        env_user, env_groups = (
+            os.environ.get(name, "") for name in ("CIB_user", "CIB_user_groups")
+        )
+        user = env_user.strip() or None
+        groups = env_groups.split() or None
+    return MultiaddressCommunicator(_NodeCommunicatorLogger(), user, groups)
 
-    while thread_list:
-        thread = thread_list.pop()
-        thread.join(wait_seconds)
-        if thread.is_alive():
-            thread_list.add(thread)
 
+def _send_http_requests(
+    request_list: Iterable[tuple[str, str, str]],
+    timeout: int | None = None,
+    repeat_if_timeout: int = 0,
+) -> Generator[tuple[tuple[str, str, str], Response], None, None]:
+    """
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
 
-def create_task(report, action, node, *args, **kwargs):
+    Send all the requests at once, yield each request and its final response,
+    see send_http_requests for parameters
     """
-    Commandline options: no options
+    communicator = _get_node_communicator()
+    communicator.set_request_timeout(
+        pcs_options.get(
+            "--request-timeout", timeout or settings.default_request_timeout
+        )
+    )
+    target_factory = NodeTargetFactory(read_known_hosts_file())
+    repeats_left: dict[Request, tuple[tuple[str, str, str], int]] = {}
+
+    def add_request(
+        node_request: tuple[str, str, str],
+        target: RequestTarget,
+        repeat_count: int,
+    ) -> None:
+        dummy_node, path, data = node_request
+        request = Request(target, RequestData(path, data=data))
+        repeats_left[request] = (node_request, repeat_count)
+        communicator.add_requests([request])
+
+    for node_request in request_list:
+        add_request(
+            node_request,
+            target_factory.get_target_from_hostname(node_request[0]),
+            repeat_if_timeout,
+        )
+    finished = False
+    try:
+        for response in communicator.start_loop():
+            node_request, repeat_count = repeats_left.pop(response.request)
+            if (
+                not response.was_connected
+                and response.errno == pycurl.E_OPERATION_TIMEDOUT
+                and repeat_count > 0
+            ):
+                if "--debug" in pcs_options:
+                    print_to_stderr(
+                        f"{node_request[0]}: {response.error_msg}, trying "
+                        "again..."
+                    )
+                add_request(
+                    node_request, response.request.target, repeat_count - 1
+                )
+                continue
+            yield node_request, response
+        finished = True
+    finally:
+        if not finished:
+            # The communicator cannot be used anymore, as it was left in
+            # the middle of processing requests. Let the next requests
+            # create a new one.
+            _get_node_communicator.cache_clear()
+
+
+def send_http_requests(
+    request_list: Iterable[tuple[str, str, str]],
+    timeout: int | None = None,
+    repeat_if_timeout: int = 0,
+) -> Generator[tuple[tuple[str, str, str], tuple[int, str]], None, None]:
     """
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
 
-    def worker():
-        returncode, output = action(node, *args, **kwargs)
-        report(node, returncode, output)
+    Send all the requests at once, yield each request and its result as
+    returned by sendHTTPRequest as soon as its response arrives. No other
+    requests may be sent before the generator is exhausted.
 
-    return worker
+    request_list -- node name, url path and urlencoded data of each request
+    timeout -- timeout for the requests overriding the default one
+    repeat_if_timeout -- how many times to repeat a timed out request
+    """
+    for node_request, response in _send_http_requests(
+        request_list, timeout, repeat_if_timeout
+    ):
+        node = node_request[0]
+        if response.was_connected:
+            yield (
+                node_request,
+                _http_response_to_result(
+                    node, response.response_code, response.data
+                ),
+            )
+        else:
+            yield (
+                node_request,
+                _connection_error_to_result(node, response.error_msg),
+            )
 
 
-def create_task_list(report, action, node_list, *args, **kwargs):
+def send_http_request_to_nodes(
+    node_list: StringIterable,
+    request: str,
+    data: str = "",
+    timeout: int | None = None,
+    repeat_if_timeout: int = 0,
+) -> Generator[tuple[str, tuple[int, str]], None, None]:
     """
-    Commandline options: no options
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
+
+    Send a request to all the nodes at once, yield a node name and a result
+    as returned by sendHTTPRequest for each node as soon as its response
+    arrives, see send_http_requests for parameters
+
+    request -- url path of the request
+    data -- urlencoded data to send
     """
-    return [
-        create_task(report, action, node, *args, **kwargs) for node in node_list
-    ]
+    for (node, _, _), result in send_http_requests(
+        [(node, request, data) for node in dict.fromkeys(node_list)],
+        timeout,
+        repeat_if_timeout,
+    ):
+        yield node, result
 
 
-def parallel_for_nodes(action, node_list, *args, **kwargs):
+def run_for_nodes(
+    node_list: StringIterable,
+    request: str,
+    data: str = "",
+    timeout: int | None = None,
+    repeat_if_timeout: int = 0,
+) -> dict[str, str]:
     """
-    Commandline options: no options
-    NOTE: callback 'action' may use some cmd options
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+      * --debug
+
+    Send a request to all the nodes at once, print a result for each node and
+    return error messages of nodes where the request failed, see
+    send_http_request_to_nodes for parameters
     """
     node_errors = {}
-
-    def report(node, returncode, output):
+    for node, (returncode, output) in send_http_request_to_nodes(
+        node_list, request, data, timeout, repeat_if_timeout
+    ):
         message = "{0}: {1}".format(node, output.strip())
         print_to_stderr(message)
         if returncode != 0:
             node_errors[node] = message
-
-    run_parallel(create_task_list(report, action, node_list, *args, **kwargs))
     return node_errors
 
 
+def stop_cluster_on_nodes(
+    node_list: StringIterable,
+    pacemaker: bool = True,
+    corosync: bool = True,
+    force: bool = True,
+) -> dict[str, str]:
+    """
+    Commandline options:
+      * --request-timeout - timeout for HTTP requests
+    """
+    data: dict[str, Any] = {}
+    timeout = None
+    repeat_count = 0
+    if pacemaker and not corosync:
+        data["component"] = "pacemaker"
+        timeout = 2 * 60
+        # stopping pacemaker takes long time when resources are being moved
+        repeat_count = 15
+    elif corosync and not pacemaker:
+        data["component"] = "corosync"
+    if force:
+        data["force"] = 1
+    return run_for_nodes(
+        node_list,
+        "remote/cluster_stop",
+        urlencode(data),
+        timeout=timeout,
+        repeat_if_timeout=repeat_count,
+    )
+
+
 def get_group_children(group_id):
     """
     Commandline options: no options
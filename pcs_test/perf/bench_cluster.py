@@ -0,0 +1,88 @@
+import json
+
+from pcs.common import file_type_codes
+from pcs.lib.commands import cluster
+from pcs.lib.communication.pcs_cfgsync import GetConfigs
+from pcs.lib.communication.tools import run
+
+from pcs_test.perf.benchmark import Benchmark, get_env
+from pcs_test.perf.fake_pcsd import FakePcsdCluster
+
+
+class _PcsdBenchmark(Benchmark):
+    def __init__(self, name: str, nodes: int):
+        self.name = name
+        self._node_names = [f"node{i}" for i in range(1, nodes + 1)]
+        self._pcsd: FakePcsdCluster | None = None
+
+    @property
+    def pcsd(self) -> FakePcsdCluster:
+        if self._pcsd is None:
+            raise AssertionError("Fake pcsd is not running")
+        return self._pcsd
+
+    def set_up(self) -> None:
+        self._pcsd = FakePcsdCluster(self._node_names)
+        self._pcsd.__enter__()
+
+    def tear_down(self) -> None:
+        if self._pcsd is not None:
+            self._pcsd.__exit__()
+            self._pcsd = None
+
+
+class ClusterSetup(_PcsdBenchmark):
+    def __init__(self, nodes: int):
+        super().__init__(f"cluster.setup.{nodes}", nodes)
+
+    def run(self) -> None:
+        cluster.setup(
+            get_env(known_hosts_getter=lambda: self.pcsd.known_hosts),
+            "perf-cluster",
+            [
+                # each node needs a unique address
+                dict(name=name, addrs=[f"127.0.0.{i}"])
+                for i, name in enumerate(self._node_names, 1)
+            ],
+        )
+
+
+class CfgsyncGetConfigs(_PcsdBenchmark):
+    def __init__(self, nodes: int):
+        super().__init__(f"cfgsync.get_configs.{nodes}", nodes)
+
+    def set_up(self) -> None:
+        super().set_up()
+        known_hosts = {
+            name: host.to_known_host_dict()[1]
+            for name, host in self.pcsd.known_hosts.items()
+        }
+        self.pcsd.set_configs(
+            {
+                file_type_codes.PCS_KNOWN_HOSTS: json.dumps(
+                    {
+                        "format_version": 1,
+                        "data_version": 1,
+                        "known_hosts": known_hosts,
+                    }
+                ),
+            }
+        )
+
+    def run(self) -> None:
+        env = get_env(known_hosts_getter=lambda: self.pcsd.known_hosts)
+        cmd = GetConfigs(env.report_processor, "perf-cluster")
+        cmd.set_targets(
+            env.get_node_target_factory().get_target_list(self._node_names)
+        )
+        result = run(env.get_node_communicator(), cmd)
+        if not result.was_successful:
+            raise AssertionError("Unable to get configs from fake nodes")
+
+
+BENCHMARKS = [
+    ClusterSetup(3),
+    ClusterSetup(16),
+    CfgsyncGetConfigs(3),
+    CfgsyncGetConfigs(16),
+]
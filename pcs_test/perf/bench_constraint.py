@@ -0,0 +1,25 @@
+from pcs.lib.commands.constraint import common as constraint
+
+from pcs_test.perf.benchmark import PacemakerBenchmark, get_env
+from pcs_test.perf.generators import ClusterSpec
+
+
+class ConstraintConfig(PacemakerBenchmark):
+    def __init__(self, constraints: int):
+        super().__init__(
+            f"constraint.config.{constraints}",
+            ClusterSpec(
+                primitives=constraints // 5,
+                location_constraints=constraints // 5,
+                location_rule_constraints=constraints // 5,
+                colocation_constraints=constraints // 5,
+                order_constraints=constraints // 10,
+                set_constraints=constraints // 10,
+            ),
+        )
+
+    def run(self) -> None:
+        constraint.get_config(get_env())
+
+
+BENCHMARKS = [ConstraintConfig(100), ConstraintConfig(2500)]
@@ -0,0 +1,101 @@
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.config_parser import Exporter, Parser, Section
+
+from pcs_test.perf.benchmark import Benchmark
+from pcs_test.perf.generators import ClusterSpec, generate_corosync_conf
+
+_LINKS = 8
+# corosync.conf is parsed and exported several times in one pcs command
+_REPEAT = 20
+
+
+class _CorosyncConfBenchmark(Benchmark):
+    def __init__(self, operation: str, spec: ClusterSpec):
+        self.name = f"corosync.{operation}.{spec.nodes}"
+        self._spec = spec
+        self.conf_data = b""
+
+    def set_up(self) -> None:
+        if not self.conf_data:
+            self.conf_data = generate_corosync_conf(self._spec, _LINKS).encode(
+                "utf-8"
+            )
+
+
+class Parse(_CorosyncConfBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("parse", spec)
+
+    def run(self) -> None:
+        for _ in range(_REPEAT):
+            Parser.parse(self.conf_data)
+
+
+class Export(_CorosyncConfBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("export", spec)
+        self._config: Section | None = None
+
+    def set_up(self) -> None:
+        super().set_up()
+        self._config = Parser.parse(self.conf_data)
+
+    def run(self) -> None:
+        assert self._config is not None
+        for _ in range(_REPEAT):
+            Exporter.export(self._config)
+
+
+class Nodes(_CorosyncConfBenchmark):
+    """
+    Node operations of the facade as done by node add, node remove and link
+    commands
+    """
+
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("nodes", spec)
+        self._facade: ConfigFacade | None = None
+
+    def set_up(self) -> None:
+        super().set_up()
+        self._facade = ConfigFacade(Parser.parse(self.conf_data))
+
+    def run(self) -> None:
+        facade = self._facade
+        assert facade is not None
+        for _ in range(_REPEAT):
+            facade.get_nodes()
+        facade.add_nodes(
+            [
+                dict(
+                    name=f"new-node{i}",
+                    addrs=[f"10.{link}.255.{i}" for link in range(_LINKS)],
+                )
+                for i in range(16)
+            ]
+        )
+        facade.remove_nodes(self._spec.node_names[:16])
+        facade.rename_node(self._spec.node_names[16], "renamed-node")
+        facade.update_link(
+            "1",
+            {
+                name: f"10.1.254.{i}"
+                for i, name in enumerate(self._spec.node_names[17:])
+            },
+            {},
+        )
+        facade.remove_links(["7"])
+        facade.add_link(
+            {
+                name: f"10.7.254.{i}"
+                for i, name in enumerate(self._spec.node_names[17:])
+            },
+            {},
+        )
+
+
+_SPEC = ClusterSpec(nodes=256)
+
+BENCHMARKS = [
+    benchmark_class(_SPEC) for benchmark_class in (Parse, Export, Nodes)
+]
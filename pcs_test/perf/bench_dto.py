@@ -0,0 +1,106 @@
+import dataclasses
+import json
+from functools import cache
+from typing import Any
+
+import dacite
+
+from pcs.common.interface import dto
+from pcs.common.status_dto import ResourcesStatusDto
+from pcs.lib.commands import status
+
+from pcs_test.perf.benchmark import Benchmark, get_env
+from pcs_test.perf.fake_pacemaker import FakePacemaker
+from pcs_test.perf.generators import (
+    ClusterSpec,
+    generate_cib,
+    generate_crm_mon,
+)
+
+
+@cache
+def _get_resources_status(spec: ClusterSpec) -> ResourcesStatusDto:
+    with FakePacemaker(generate_cib(spec), generate_crm_mon(spec, True)):
+        return status.resources_status(get_env())
+
+
+class _ResourcesStatusDtoBenchmark(Benchmark):
+    """
+    Conversion of a large resources status DTO, the status is obtained once
+    and shared by all the benchmarks
+    """
+
+    def __init__(self, operation: str, spec: ClusterSpec):
+        self.name = f"dto.{operation}.{spec.primitives}"
+        self._spec = spec
+        self.payload: dict[str, Any] = {}
+
+    @property
+    def dto(self) -> ResourcesStatusDto:
+        return _get_resources_status(self._spec)
+
+    def set_up(self) -> None:
+        if not self.payload:
+            self.payload = json.loads(dto.to_json(self.dto))
+
+
+class ToDict(_ResourcesStatusDtoBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("to_dict", spec)
+
+    def run(self) -> None:
+        dto.to_dict(self.dto)
+
+
+class ToDictAsdict(_ResourcesStatusDtoBenchmark):
+    # reference for the to_dict benchmark
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("to_dict.asdict", spec)
+
+    def run(self) -> None:
+        dataclasses.asdict(self.dto)
+
+
+class ToJson(_ResourcesStatusDtoBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("to_json", spec)
+
+    def run(self) -> None:
+        dto.to_json(self.dto)
+
+
+class FromDict(_ResourcesStatusDtoBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("from_dict", spec)
+
+    def run(self) -> None:
+        dto.from_dict(ResourcesStatusDto, self.payload, strict=True)
+
+
+class FromDictDacite(_ResourcesStatusDtoBenchmark):
+    # reference for the from_dict benchmark
+    def __init__(self, spec: ClusterSpec):
+        super().__init__("from_dict.dacite", spec)
+
+    def run(self) -> None:
+        dacite.from_dict(
+            ResourcesStatusDto,
+            self.payload,
+            dacite.Config(type_hooks=dto.DTO_TYPE_HOOKS_MAP, strict=True),
+        )
+
+
+_SPEC = ClusterSpec(
+    nodes=16, primitives=5000, groups=500, clones=100, bundles=50
+)
+
+BENCHMARKS = [
+    benchmark_class(_SPEC)
+    for benchmark_class in (
+        ToDict,
+        ToDictAsdict,
+        ToJson,
+        FromDict,
+        FromDictDacite,
+    )
+]
@@ -0,0 +1,42 @@
+from pcs.lib.commands import cib, resource
+
+from pcs_test.perf.benchmark import PacemakerBenchmark, get_env
+from pcs_test.perf.generators import RESOURCE_AGENT, ClusterSpec
+
+
+class ResourceCreate(PacemakerBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__(f"resource.create.{spec.primitives}", spec)
+
+    def run(self) -> None:
+        resource.create(get_env(), "R-new", RESOURCE_AGENT, [], {}, {})
+
+
+class ResourceDelete(PacemakerBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        # only stopped resources can be deleted without forcing it
+        super().__init__(
+            f"resource.delete.{spec.primitives}", spec, running=False
+        )
+
+    def run(self) -> None:
+        cib.remove_elements(get_env(), ["R1"])
+
+
+_SPEC_SMALL = ClusterSpec(primitives=100, groups=10, clones=10, bundles=5)
+_SPEC_LARGE = ClusterSpec(
+    primitives=2000,
+    groups=100,
+    clones=100,
+    bundles=20,
+    location_constraints=500,
+    colocation_constraints=500,
+    order_constraints=500,
+)
+
+BENCHMARKS = [
+    ResourceCreate(_SPEC_SMALL),
+    ResourceCreate(_SPEC_LARGE),
+    ResourceDelete(_SPEC_SMALL),
+    ResourceDelete(_SPEC_LARGE),
+]
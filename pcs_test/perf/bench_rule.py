@@ -0,0 +1,45 @@
+from pcs.lib.cib.rule import parse_rule
+
+from pcs_test.perf.benchmark import Benchmark
+
+
+def _rule_string(index: int) -> str:
+    return (
+        f"(#uname eq node{index} or defined pingd{index}) and "
+        f"date in_range 2014-06-26 to duration years={index % 10 + 1} and "
+        f"resource ocf:pacemaker:Dummy{index} and op monitor interval={index}s"
+    )
+
+
+class _RuleBenchmark(Benchmark):
+    def __init__(self, operation: str, rule_count: int, distinct_count: int):
+        self.name = f"rule.{operation}.{rule_count}"
+        self.rule_string_list = [
+            _rule_string(i % distinct_count) for i in range(rule_count)
+        ]
+
+    def set_up(self) -> None:
+        # measure parsing, not looking up rules parsed in previous runs
+        parse_rule.cache_clear()
+
+
+class Parse(_RuleBenchmark):
+    def __init__(self, rule_count: int):
+        super().__init__("parse", rule_count, rule_count)
+
+    def run(self) -> None:
+        for rule_string in self.rule_string_list:
+            parse_rule(rule_string)
+
+
+class ParseRepeated(_RuleBenchmark):
+    # scripts and bulk imports use the same rules many times
+    def __init__(self, rule_count: int):
+        super().__init__("parse_repeated", rule_count, rule_count // 100)
+
+    def run(self) -> None:
+        for rule_string in self.rule_string_list:
+            parse_rule(rule_string)
+
+
+BENCHMARKS = [Parse(200), ParseRepeated(10000)]
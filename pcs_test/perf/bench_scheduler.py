@@ -0,0 +1,146 @@
+import asyncio
+from queue import Queue
+from unittest import mock
+
+from pcs.common.async_tasks.dto import CommandDto, CommandOptionsDto
+from pcs.common.async_tasks.types import TaskFinishType
+from pcs.daemon.async_tasks.scheduler import Scheduler, SchedulerConfig
+from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.async_tasks.worker.types import (
+    Message,
+    TaskExecuted,
+    TaskFinished,
+)
+from pcs.lib.auth.types import AuthUser
+
+from pcs_test.perf.benchmark import Benchmark
+
+_AUTH_USER = AuthUser("hacluster", ["haclient"])
+_COMMAND = Command(
+    CommandDto("status.full_cluster_status_plaintext", {}, CommandOptionsDto())
+)
+
+
+class _SchedulerBenchmark(Benchmark):
+    """
+    Scheduler without worker processes, tasks are never executed unless the
+    benchmark sends messages on behalf of workers
+    """
+
+    def __init__(self, operation: str, task_count: int):
+        self.name = f"scheduler.{operation}.{task_count}"
+        self._task_count = task_count
+        self._patchers: list[mock._patch] = []
+        self.scheduler: Scheduler | None = None
+        self.worker_message_q: Queue[Message] = Queue()
+
+    def set_up(self) -> None:
+        # the manager and the pool would start processes
+        self._patchers = [
+            mock.patch("multiprocessing.Manager"),
+            mock.patch("multiprocessing.Pool"),
+        ]
+        mock_manager, _ = [patcher.start() for patcher in self._patchers]
+        self.worker_message_q = Queue()
+        # worker message queue and logging queue
+        mock_manager.return_value.Queue.side_effect = [
+            self.worker_message_q,
+            Queue(),
+        ]
+        self.scheduler = Scheduler(SchedulerConfig())
+
+    def tear_down(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.terminate_nowait()
+            self.scheduler = None
+        for patcher in self._patchers:
+            patcher.stop()
+        self._patchers = []
+
+    def create_tasks(self) -> list[str]:
+        assert self.scheduler is not None
+        return [
+            self.scheduler.new_task(_COMMAND, _AUTH_USER)
+            for _ in range(self._task_count)
+        ]
+
+
+class NewTask(_SchedulerBenchmark):
+    def __init__(self, task_count: int):
+        super().__init__("new_task", task_count)
+
+    def run(self) -> None:
+        self.create_tasks()
+
+
+class Tick(_SchedulerBenchmark):
+    """
+    Scheduler passes with many queued tasks of which only a few get a message
+    in each pass
+    """
+
+    _TICKS = 100
+    _MESSAGES_PER_TICK = 10
+
+    def __init__(self, task_count: int):
+        super().__init__("tick", task_count)
+        self._task_ident_list: list[str] = []
+
+    def set_up(self) -> None:
+        super().set_up()
+        self._task_ident_list = self.create_tasks()
+        asyncio.run(self._perform_ticks(1))
+
+    async def _perform_ticks(self, count: int) -> None:
+        assert self.scheduler is not None
+        for _ in range(count):
+            await self.scheduler.perform_actions()
+
+    async def _perform_ticks_with_messages(self) -> None:
+        assert self.scheduler is not None
+        task_ident_iter = iter(self._task_ident_list)
+        for _ in range(self._TICKS):
+            for _ in range(self._MESSAGES_PER_TICK):
+                self.worker_message_q.put_nowait(
+                    Message(next(task_ident_iter), TaskExecuted(worker_pid=1))
+                )
+            await self.scheduler.perform_actions()
+
+    def run(self) -> None:
+        asyncio.run(self._perform_ticks_with_messages())
+
+
+class RunIdenticalTasks(_SchedulerBenchmark):
+    """
+    Many identical requests of a read-only command waiting for the command at
+    the same time, as sent by web UI tabs and monitoring of a cluster
+    """
+
+    _COMMAND = Command(
+        CommandDto("status.resources_status", {}, CommandOptionsDto())
+    )
+
+    def __init__(self, task_count: int):
+        super().__init__("run_identical", task_count)
+
+    async def _run_tasks(self) -> None:
+        scheduler = self.scheduler
+        assert scheduler is not None
+        runs = [
+            asyncio.create_task(scheduler.run_task(self._COMMAND, _AUTH_USER))
+            for _ in range(self._task_count)
+        ]
+        # let all the requests create or join tasks
+        await asyncio.sleep(0)
+        for task_ident in list(scheduler._task_register):
+            self.worker_message_q.put_nowait(
+                Message(task_ident, TaskFinished(TaskFinishType.SUCCESS, None))
+            )
+        await scheduler.perform_actions()
+        await asyncio.gather(*runs)
+
+    def run(self) -> None:
+        asyncio.run(self._run_tasks())
+
+
+BENCHMARKS = [NewTask(10000), Tick(10000), RunIdenticalTasks(10000)]
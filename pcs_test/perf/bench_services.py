@@ -0,0 +1,188 @@
+"""
+Benchmarks of commands querying states of local services
+
+Besides measuring time, the benchmarks count spawned systemctl processes and
+fail if the count differs from the expected one. Each command is measured with
+states of services queried at once and one by one, the latter is how the
+commands queried the services before get_states was added to service managers.
+"""
+
+import os
+import os.path
+import shutil
+import stat
+import sys
+import tempfile
+from collections.abc import Callable
+from unittest import mock
+
+from pcs import settings
+from pcs.common.services.drivers import SystemdDriver
+from pcs.common.services.types import ServiceState
+from pcs.common.types import StringIterable
+from pcs.lib.commands import services, status
+from pcs.lib.commands.cluster import node
+from pcs.lib.env import LibraryEnvironment
+from pcs.lib.external import CommandRunner
+
+from pcs_test.perf.benchmark import Benchmark, get_env
+from pcs_test.perf.fake_pacemaker_tools import write_file
+
+# services pcsd asks about when providing info about a host
+_HOST_SERVICES = [
+    "booth",
+    "corosync",
+    "corosync-qdevice",
+    "corosync-qnetd",
+    "pacemaker",
+    "pacemaker_remote",
+    "pcsd",
+    "sbd",
+]
+
+# systemctl, corosync and pacemakerd, the latter two print their versions
+_SCRIPT_TEMPLATE = """#!{python}
+import os.path
+import sys
+
+argv = sys.argv[1:]
+if os.path.basename(sys.argv[0]) != "systemctl":
+    print("version 3.1.8")
+elif argv[0] == "list-unit-files":
+    for service in {services!r}:
+        print(service + ".service enabled")
+elif argv[0] == "show":
+    print(
+        "\\n\\n".join(
+            "LoadState=loaded\\nActiveState=active\\nUnitFileState=enabled"
+            for _ in argv[2:]
+        )
+    )
+"""
+
+
+def _get_states_per_service(
+    self: SystemdDriver, service_names: StringIterable
+) -> dict[str, ServiceState]:
+    return {
+        service: ServiceState(
+            installed=self.is_installed(service),
+            enabled=self.is_enabled(service),
+            running=self.is_running(service),
+        )
+        for service in service_names
+    }
+
+
+class _ServicesBenchmark(Benchmark):
+    def __init__(
+        self,
+        command: str,
+        batched: bool,
+        spawn_count: int,
+        run_command: Callable[[LibraryEnvironment], object],
+    ):
+        variant = "batched" if batched else "per_service"
+        self.name = f"services.{command}.{variant}"
+        self._batched = batched
+        self._spawn_count = spawn_count
+        self._run_command = run_command
+        self._tmp_dir: str | None = None
+        self._patchers: list[mock._patch] = []
+        self._mock_run: mock.Mock | None = None
+
+    def set_up(self) -> None:
+        self._tmp_dir = tempfile.mkdtemp(prefix="pcs_perf_")
+        exec_settings = {
+            setting_name: self._write_script(tool)
+            for tool, setting_name in (
+                ("systemctl", "systemctl_exec"),
+                ("corosync", "corosync_exec"),
+                ("pacemakerd", "pacemakerd_exec"),
+            )
+        }
+        self._patchers = [
+            mock.patch.multiple(
+                settings, systemd_unit_path=[self._tmp_dir], **exec_settings
+            )
+        ]
+        if not self._batched:
+            self._patchers.append(
+                mock.patch.object(
+                    SystemdDriver, "get_states", _get_states_per_service
+                )
+            )
+        for patcher in self._patchers:
+            patcher.start()
+        # count the processes while still running them
+        run_patcher = mock.patch.object(
+            CommandRunner, "run", autospec=True, side_effect=CommandRunner.run
+        )
+        self._mock_run = run_patcher.start()
+        self._patchers.append(run_patcher)
+
+    def tear_down(self) -> None:
+        for patcher in self._patchers:
+            patcher.stop()
+        self._patchers = []
+        self._mock_run = None
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir)
+            self._tmp_dir = None
+
+    def run(self) -> None:
+        assert self._mock_run is not None
+        self._run_command(get_env())
+        spawn_count = sum(
+            1
+            for call in self._mock_run.call_args_list
+            if call.args[1][0] == settings.systemctl_exec
+        )
+        if spawn_count != self._spawn_count:
+            raise AssertionError(
+                f"{self.name}: systemctl spawned {spawn_count} times, "
+                f"expected {self._spawn_count}"
+            )
+
+    def _write_script(self, tool: str) -> str:
+        assert self._tmp_dir is not None
+        path = os.path.join(self._tmp_dir, tool)
+        write_file(
+            path,
+            _SCRIPT_TEMPLATE.format(
+                python=sys.executable, services=_HOST_SERVICES
+            ),
+        )
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        return path
+
+
+def _cluster_status(env: LibraryEnvironment) -> None:
+    # the rest of full_cluster_status_plaintext does not query services
+    status._get_local_services_status(env.service_manager)
+
+
+def _services_info(env: LibraryEnvironment) -> None:
+    services.get_services_info(
+        env, _HOST_SERVICES, installed=True, enabled=True, running=True
+    )
+
+
+def _host_daemons_info(env: LibraryEnvironment) -> None:
+    node.get_host_daemons_info(env)
+
+
+BENCHMARKS = [
+    # one systemctl show or list-unit-files and is-enabled and is-active for
+    # each of 5 services
+    _ServicesBenchmark("status", True, 1, _cluster_status),
+    _ServicesBenchmark("status", False, 11, _cluster_status),
+    # systemctl show and list-unit-files for services not specified, or
+    # list-unit-files and is-enabled and is-active for each of 8 services
+    _ServicesBenchmark("info", True, 2, _services_info),
+    _ServicesBenchmark("info", False, 17, _services_info),
+    # one systemctl show or list-unit-files and is-enabled and is-active for
+    # each of 7 services
+    _ServicesBenchmark("daemons", True, 1, _host_daemons_info),
+    _ServicesBenchmark("daemons", False, 15, _host_daemons_info),
+]
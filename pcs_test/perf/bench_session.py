@@ -0,0 +1,77 @@
+import os.path
+import tempfile
+
+from pcs.daemon.app.webui.session import Storage
+
+from pcs_test.perf.benchmark import Benchmark
+
+_LIFETIME = 60 * 60
+
+
+class _SessionBenchmark(Benchmark):
+    def __init__(self, operation: str, session_count: int):
+        self.name = f"session.{operation}.{session_count}"
+        self._session_count = session_count
+        self.storage = Storage(_LIFETIME)
+        self.sid_list: list[str] = []
+
+    def set_up(self) -> None:
+        self.storage = Storage(_LIFETIME)
+        self.sid_list = [
+            self.storage.login(f"user{i}").sid
+            for i in range(self._session_count)
+        ]
+
+
+class Login(_SessionBenchmark):
+    def __init__(self, session_count: int):
+        super().__init__("login", session_count)
+
+    def set_up(self) -> None:
+        self.storage = Storage(_LIFETIME)
+
+    def run(self) -> None:
+        for i in range(self._session_count):
+            self.storage.login(f"user{i}")
+
+
+class Get(_SessionBenchmark):
+    """
+    Requests of web UI users with many active sessions
+    """
+
+    def __init__(self, session_count: int):
+        super().__init__("get", session_count)
+
+    def run(self) -> None:
+        for sid in self.sid_list:
+            self.storage.get(sid)
+
+
+class Load(_SessionBenchmark):
+    """
+    Loading sessions saved by pcsd before it has been restarted
+    """
+
+    def __init__(self, session_count: int):
+        super().__init__("load", session_count)
+        self._tmp_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._session_file = ""
+
+    def set_up(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._session_file = os.path.join(self._tmp_dir.name, "sessions")
+        storage = Storage(_LIFETIME, self._session_file)
+        for i in range(self._session_count):
+            storage.login(f"user{i}")
+
+    def run(self) -> None:
+        Storage(_LIFETIME, self._session_file)
+
+    def tear_down(self) -> None:
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+
+
+BENCHMARKS = [Login(10000), Get(10000), Load(10000)]
@@ -0,0 +1,24 @@
+from pcs.lib.commands import status
+
+from pcs_test.perf.benchmark import PacemakerBenchmark, get_env
+from pcs_test.perf.generators import ClusterSpec
+
+
+class ResourcesStatus(PacemakerBenchmark):
+    def __init__(self, spec: ClusterSpec):
+        super().__init__(f"status.resources.{spec.primitives}", spec)
+
+    def run(self) -> None:
+        status.resources_status(get_env())
+
+
+BENCHMARKS = [
+    ResourcesStatus(
+        ClusterSpec(nodes=3, primitives=100, groups=10, clones=10, bundles=5)
+    ),
+    ResourcesStatus(
+        ClusterSpec(
+            nodes=16, primitives=5000, groups=500, clones=100, bundles=50
+        )
+    ),
+]
@@ -0,0 +1,115 @@
+"""
+Minimal benchmarking framework
+
+A benchmark is a subclass of Benchmark. Only its run method is timed, set_up
+and tear_down run around each repetition and may be arbitrarily slow. Modules
+named bench_*.py in this directory list their benchmarks in a module-level
+variable BENCHMARKS.
+"""
+
+import logging
+import os.path
+import pkgutil
+import statistics
+import time
+from dataclasses import dataclass
+from importlib import import_module
+
+from pcs.common.reports.processor import ReportProcessorToLog
+from pcs.lib.env import LibraryEnvironment
+
+from pcs_test.perf.fake_pacemaker import FakePacemaker
+from pcs_test.perf.generators import (
+    ClusterSpec,
+    generate_cib,
+    generate_crm_mon,
+)
+
+PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Benchmark:
+    name: str = ""
+
+    def set_up(self) -> None:
+        pass
+
+    def run(self) -> None:
+        raise NotImplementedError()
+
+    def tear_down(self) -> None:
+        pass
+
+
+class PacemakerBenchmark(Benchmark):
+    """
+    Benchmark of a command working with a live CIB and cluster status
+    """
+
+    def __init__(self, name: str, spec: ClusterSpec, running: bool = True):
+        self.name = name
+        self._spec = spec
+        self._running = running
+        self._cib_xml: str | None = None
+        self._crm_mon_xml = ""
+        self._pacemaker: FakePacemaker | None = None
+
+    def set_up(self) -> None:
+        if self._cib_xml is None:
+            self._cib_xml = generate_cib(self._spec)
+            self._crm_mon_xml = generate_crm_mon(self._spec, self._running)
+        self._pacemaker = FakePacemaker(self._cib_xml, self._crm_mon_xml)
+        self._pacemaker.__enter__()
+
+    def tear_down(self) -> None:
+        if self._pacemaker is not None:
+            self._pacemaker.__exit__()
+            self._pacemaker = None
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    times: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def minimum(self) -> float:
+        return min(self.times)
+
+
+def measure(benchmark: Benchmark, repeat: int) -> BenchmarkResult:
+    times = []
+    for _ in range(repeat):
+        benchmark.set_up()
+        try:
+            start = time.perf_counter()
+            benchmark.run()
+            times.append(time.perf_counter() - start)
+        finally:
+            benchmark.tear_down()
+    return BenchmarkResult(benchmark.name, times)
+
+
+def discover_benchmarks() -> list[Benchmark]:
+    benchmark_list: list[Benchmark] = []
+    for module_info in sorted(
+        pkgutil.iter_modules([PERF_DIR]), key=lambda info: info.name
+    ):
+        if module_info.name.startswith("bench_"):
+            module = import_module(f"pcs_test.perf.{module_info.name}")
+            benchmark_list.extend(module.BENCHMARKS)
+    return benchmark_list
+
+
+def get_env(**kwargs) -> LibraryEnvironment:
+    """
+    Return a library environment working with a live cluster, which is
+    supposed to be provided by FakePacemaker and FakePcsdCluster. Warnings and
+    errors are printed to stderr.
+    """
+    logger = logging.getLogger("pcs_perf")
+    return LibraryEnvironment(logger, ReportProcessorToLog(logger), **kwargs)
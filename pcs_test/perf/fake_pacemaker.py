@@ -0,0 +1,109 @@
+"""
+Stand-ins for pacemaker command line tools
+
+The tools are real executables, so benchmarks pay the price of spawning
+processes just like pcs does on a live cluster. Their state (CIB, crm_mon
+output) is kept in files in a temporary directory. Each tool can be slowed down
+by a configured latency to emulate a busy cluster.
+"""
+
+import os
+import os.path
+import shutil
+import stat
+import sys
+import tempfile
+from unittest import mock
+
+from pcs import settings
+
+from pcs_test.perf.fake_pacemaker_tools import (
+    CIB_FILE,
+    CRM_MON_FILE,
+    PACKAGE_DIR,
+    read_file,
+    write_file,
+)
+
+_TOOL_SETTINGS = {
+    "cibadmin": "cibadmin_exec",
+    "crm_diff": "crm_diff_exec",
+    "crm_mon": "crm_mon_exec",
+    "crm_resource": "crm_resource_exec",
+}
+
+_SCRIPT_TEMPLATE = """#!{python}
+import sys
+sys.path.insert(0, {package_dir!r})
+from pcs_test.perf.fake_pacemaker_tools import main
+sys.exit(main({tool!r}, {state_dir!r}, {latency!r}, sys.argv[1:]))
+"""
+
+
+class FakePacemaker:
+    """
+    Create fake pacemaker tools and point pcs settings to them
+
+    Use as a context manager:
+        with FakePacemaker(cib_xml, crm_mon_xml, latency=0.01) as pacemaker:
+            ...
+            pacemaker.cib_xml  # current CIB as modified by pcs
+    """
+
+    def __init__(
+        self, cib_xml: str, crm_mon_xml: str = "", latency: float = 0.0
+    ):
+        self._cib_xml = cib_xml
+        self._crm_mon_xml = crm_mon_xml
+        self._latency = latency
+        self._state_dir: str | None = None
+        self._patcher: mock._patch | None = None
+
+    def __enter__(self) -> "FakePacemaker":
+        self._state_dir = tempfile.mkdtemp(prefix="pcs_perf_")
+        self.set_cib(self._cib_xml)
+        self.set_crm_mon(self._crm_mon_xml)
+        exec_settings = {}
+        for tool, setting_name in _TOOL_SETTINGS.items():
+            exec_settings[setting_name] = self._write_script(tool)
+        self._patcher = mock.patch.multiple(settings, **exec_settings)
+        self._patcher.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self._patcher is not None:
+            self._patcher.stop()
+            self._patcher = None
+        if self._state_dir is not None:
+            shutil.rmtree(self._state_dir)
+            self._state_dir = None
+
+    @property
+    def cib_xml(self) -> str:
+        return read_file(self._path(CIB_FILE))
+
+    def set_cib(self, cib_xml: str) -> None:
+        write_file(self._path(CIB_FILE), cib_xml)
+
+    def set_crm_mon(self, crm_mon_xml: str) -> None:
+        write_file(self._path(CRM_MON_FILE), crm_mon_xml)
+
+    def _path(self, file_name: str) -> str:
+        if self._state_dir is None:
+            raise AssertionError("FakePacemaker is not running")
+        return os.path.join(self._state_dir, file_name)
+
+    def _write_script(self, tool: str) -> str:
+        path = self._path(tool)
+        write_file(
+            path,
+            _SCRIPT_TEMPLATE.format(
+                python=sys.executable,
+                package_dir=PACKAGE_DIR,
+                tool=tool,
+                state_dir=self._state_dir,
+                latency=self._latency,
+            ),
+        )
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        return path
@@ -0,0 +1,128 @@
+"""
+Implementation of fake pacemaker tools, see FakePacemaker
+
+The tools run in their own processes, so this module only depends on the
+standard library to keep the start-up time of the tools low.
+"""
+
+import os.path
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+PACKAGE_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+CRM_RESOURCE_DATA_DIR = os.path.join(
+    PACKAGE_DIR, "pcs_test", "tools", "bin_mock", "pcmk", "crm_resource.d"
+)
+
+CIB_FILE = "cib.xml"
+CRM_MON_FILE = "crm_mon.xml"
+
+
+def read_file(path: str) -> str:
+    with open(path) as a_file:
+        return a_file.read()
+
+
+def write_file(path: str, data: str) -> None:
+    with open(path, "w") as a_file:
+        a_file.write(data)
+
+
+def _get_arg_value(argv: list[str], name: str) -> str | None:
+    for i, arg in enumerate(argv[:-1]):
+        if arg == name:
+            return argv[i + 1]
+    return None
+
+
+def _cibadmin(state_dir: str, argv: list[str]) -> int:  # noqa: PLR0911
+    cib_path = os.path.join(state_dir, CIB_FILE)
+    if "--query" in argv:
+        scope = _get_arg_value(argv, "--scope")
+        if scope is None:
+            sys.stdout.write(read_file(cib_path))
+            return 0
+        element = ET.parse(cib_path).getroot().find(f".//{scope}")
+        if element is None:
+            return 105
+        sys.stdout.write(ET.tostring(element, encoding="unicode"))
+        return 0
+    if "--upgrade" in argv:
+        return 0
+    if "--patch" in argv:
+        # fake crm_diff produces the whole new CIB instead of a patch
+        write_file(cib_path, sys.stdin.read())
+        return 0
+    if "--replace" in argv:
+        new_xml = sys.stdin.read()
+        if _get_arg_value(argv, "--scope") == "configuration":
+            cib = ET.parse(cib_path).getroot()
+            old_configuration = cib.find("configuration")
+            if old_configuration is not None:
+                cib.remove(old_configuration)
+            cib.insert(0, ET.fromstring(new_xml))
+            new_xml = ET.tostring(cib, encoding="unicode")
+        write_file(cib_path, new_xml)
+        return 0
+    sys.stderr.write(f"fake cibadmin: unsupported arguments {argv}\n")
+    return 64
+
+
+def _crm_diff(argv: list[str]) -> int:
+    original = _get_arg_value(argv, "--original")
+    new = _get_arg_value(argv, "--new")
+    if original is None or new is None:
+        return 64
+    new_xml = read_file(new)
+    if read_file(original) == new_xml:
+        return 0
+    sys.stdout.write(new_xml)
+    return 1
+
+
+_VALIDATE_RESULT = """<pacemaker-result api-version="2.30" request="crm_resource">
+  <resource-agent-action action="validate">
+    <overrides/>
+    <agent-status code="0" message="ok" execution_code="0"
+        execution_message="complete" reason="ok"/>
+    <command code="0"/>
+  </resource-agent-action>
+  <status code="0" message="OK"/>
+</pacemaker-result>
+"""
+
+
+def _crm_resource(argv: list[str]) -> int:
+    if argv and argv[0] == "--validate":
+        sys.stdout.write(_VALIDATE_RESULT)
+        return 0
+    if len(argv) == 2 and argv[0] == "--show-metadata":
+        file_name = "{}_metadata.xml".format(argv[1].replace(":", "__"))
+    elif argv == ["--list-options", "primitive", "--output-as", "xml"]:
+        file_name = "primitive-meta_metadata.xml"
+    else:
+        file_name = ""
+    path = os.path.join(CRM_RESOURCE_DATA_DIR, file_name)
+    if not file_name or not os.path.isfile(path):
+        sys.stderr.write(f"fake crm_resource: unsupported arguments {argv}\n")
+        return 1
+    sys.stdout.write(read_file(path))
+    return 0
+
+
+def main(tool: str, state_dir: str, latency: float, argv: list[str]) -> int:
+    if latency:
+        time.sleep(latency)
+    if tool == "cibadmin":
+        return _cibadmin(state_dir, argv)
+    if tool == "crm_diff":
+        return _crm_diff(argv)
+    if tool == "crm_mon":
+        sys.stdout.write(read_file(os.path.join(state_dir, CRM_MON_FILE)))
+        return 0
+    if tool == "crm_resource":
+        return _crm_resource(argv)
+    raise AssertionError(f"Unknown fake tool '{tool}'")
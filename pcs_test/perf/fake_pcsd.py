@@ -0,0 +1,220 @@
+"""
+Local multi-node stand-in for pcsd
+
+Every node of a fake cluster is an HTTPS server listening on its own port of
+the loopback interface. All the servers run in one background thread. The
+servers answer the subset of pcsd API used by the benchmarked commands and
+count the requests they received.
+"""
+
+import asyncio
+import json
+import os.path
+import shutil
+import socket
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Mapping
+
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+from tornado.web import Application, RequestHandler
+
+from pcs.common import file_type_codes, ssl
+from pcs.common.communication.const import COM_STATUS_SUCCESS
+from pcs.common.host import Destination, PcsKnownHost
+
+LOCALHOST = "127.0.0.1"
+
+
+class _NodeHandler(RequestHandler):
+    _ENDPOINTS = {
+        "remote/check_auth": "_check_auth",
+        "remote/check_host": "_check_host",
+        "remote/cluster_destroy": "_empty",
+        "remote/known_hosts_change": "_empty",
+        "remote/put_file": "_put_file",
+        "remote/remove_file": "_remove_file",
+        "api/v1/cfgsync-get-configs/v1": "_get_configs",
+    }
+
+    def initialize(self, node: "_FakeNode") -> None:
+        self._node = node
+
+    async def post(self, path: str) -> None:
+        await self._handle(path)
+
+    async def get(self, path: str) -> None:
+        await self._handle(path)
+
+    async def _handle(self, path: str) -> None:
+        self._node.request_counter[path] += 1
+        if self._node.latency:
+            await asyncio.sleep(self._node.latency)
+        if path not in self._ENDPOINTS:
+            self.set_status(404)
+            return
+        self.write(getattr(self, self._ENDPOINTS[path])())
+
+    def _get_files_result(self, code: str) -> str:
+        files = json.loads(self.get_argument("data_json"))
+        return json.dumps(
+            {
+                "files": {
+                    file_id: {"code": code, "message": ""} for file_id in files
+                }
+            }
+        )
+
+    def _check_auth(self) -> str:
+        return json.dumps({"success": True})
+
+    def _check_host(self) -> str:
+        return json.dumps(
+            {
+                "services": {
+                    service: {
+                        "installed": True,
+                        "enabled": False,
+                        "running": False,
+                        "version": "1.0",
+                    }
+                    for service in (
+                        "corosync",
+                        "pacemaker",
+                        "pacemaker_remote",
+                        "pcsd",
+                    )
+                },
+                "cluster_configuration_exists": False,
+            }
+        )
+
+    def _empty(self) -> str:
+        return ""
+
+    def _put_file(self) -> str:
+        return self._get_files_result("written")
+
+    def _remove_file(self) -> str:
+        return self._get_files_result("deleted")
+
+    def _get_configs(self) -> str:
+        cluster_name = json.loads(self.request.body)["cluster_name"]
+        return json.dumps(
+            {
+                "status": COM_STATUS_SUCCESS,
+                "status_msg": None,
+                "report_list": [],
+                "data": {
+                    "cluster_name": cluster_name,
+                    "configs": self._node.configs,
+                },
+            }
+        )
+
+
+class _FakeNode:
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+        self.request_counter: Counter[str] = Counter()
+        self.configs: dict[str, str] = {}
+        self.sockets = bind_sockets(0, LOCALHOST, family=socket.AF_INET)
+        self.port: int = self.sockets[0].getsockname()[1]
+
+
+class FakePcsdCluster:
+    """
+    Run fake pcsd nodes in a background thread
+
+    Use as a context manager:
+        with FakePcsdCluster(["node1", "node2"]) as cluster:
+            env = LibraryEnvironment(
+                ..., known_hosts_getter=lambda: cluster.known_hosts
+            )
+    """
+
+    def __init__(self, node_names: list[str], latency: float = 0.0):
+        self._nodes = [_FakeNode(name, latency) for name in node_names]
+        self._cert_dir: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._servers: list[HTTPServer] = []
+
+    @property
+    def known_hosts(self) -> dict[str, PcsKnownHost]:
+        return {
+            node.name: PcsKnownHost(
+                node.name,
+                token=f"token-{node.name}",
+                dest_list=[Destination(LOCALHOST, node.port)],
+            )
+            for node in self._nodes
+        }
+
+    @property
+    def request_count(self) -> int:
+        return sum(node.request_counter.total() for node in self._nodes)
+
+    def set_configs(self, configs: Mapping[file_type_codes.FileTypeCode, str]):
+        """
+        Set configuration files provided by all nodes via cfgsync
+        """
+        for node in self._nodes:
+            node.configs = dict(configs)
+
+    def __enter__(self) -> "FakePcsdCluster":
+        self._cert_dir = tempfile.mkdtemp(prefix="pcs_perf_pcsd_")
+        cert_path = os.path.join(self._cert_dir, "pcsd.crt")
+        key_path = os.path.join(self._cert_dir, "pcsd.key")
+        key = ssl.generate_key(length=2048)
+        with open(cert_path, "wb") as cert_file:
+            cert_file.write(ssl.dump_cert(ssl.generate_cert(key, LOCALHOST)))
+        with open(key_path, "wb") as key_file:
+            key_file.write(ssl.dump_key(key))
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(
+            self._start_servers(cert_path, key_path), self._loop
+        ).result()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._stop_servers(), self._loop
+            ).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        if self._cert_dir is not None:
+            shutil.rmtree(self._cert_dir)
+            self._cert_dir = None
+
+    def _run_loop(self) -> None:
+        if self._loop is not None:
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_forever()
+
+    async def _start_servers(self, cert_path: str, key_path: str) -> None:
+        for node in self._nodes:
+            server = HTTPServer(
+                Application([(r"/(.*)", _NodeHandler, dict(node=node))]),
+                ssl_options=dict(certfile=cert_path, keyfile=key_path),
+            )
+            server.add_sockets(node.sockets)
+            self._servers.append(server)
+
+    async def _stop_servers(self) -> None:
+        for server in self._servers:
+            server.stop()
+            await server.close_all_connections()
+        self._servers = []
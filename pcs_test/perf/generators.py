@@ -0,0 +1,333 @@
+"""
+Generators of synthetic CIBs, crm_mon outputs and corosync.conf files of
+arbitrary size
+
+Resources are named in a predictable way so that benchmarks can address them:
+    R{i} -- standalone primitives
+    G{i} -- groups, their members are G{i}-R{j}
+    C{i} -- clones of primitives C{i}-R
+    B{i} -- bundles, containing primitive B{i}-R
+    node{i} -- cluster nodes, numbered from 1
+"""
+
+from dataclasses import dataclass
+from xml.sax.saxutils import quoteattr
+
+RESOURCE_AGENT = "ocf:pcsmock:minimal"
+_AGENT_CLASS, _AGENT_PROVIDER, _AGENT_TYPE = RESOURCE_AGENT.split(":")
+CIB_SCHEMA = "pacemaker-3.9"
+
+
+@dataclass(frozen=True)
+class ClusterSpec:
+    nodes: int = 3
+    primitives: int = 0
+    groups: int = 0
+    group_size: int = 3
+    clones: int = 0
+    bundles: int = 0
+    location_constraints: int = 0
+    location_rule_constraints: int = 0
+    colocation_constraints: int = 0
+    order_constraints: int = 0
+    set_constraints: int = 0
+
+    @property
+    def node_names(self) -> list[str]:
+        return [f"node{i}" for i in range(1, self.nodes + 1)]
+
+    @property
+    def primitive_ids(self) -> list[str]:
+        return [f"R{i}" for i in range(1, self.primitives + 1)]
+
+    def node_name(self, index: int) -> str:
+        return f"node{index % self.nodes + 1}"
+
+
+def _primitive_xml(resource_id: str) -> str:
+    return f"""
+        <primitive id="{resource_id}" class="{_AGENT_CLASS}"
+            provider="{_AGENT_PROVIDER}" type="{_AGENT_TYPE}"
+        >
+            <operations>
+                <op id="{resource_id}-monitor-interval-10s" name="monitor"
+                    interval="10s" timeout="20s"
+                />
+            </operations>
+        </primitive>
+    """
+
+
+def _resources_cib_xml(spec: ClusterSpec) -> list[str]:
+    parts = [_primitive_xml(resource_id) for resource_id in spec.primitive_ids]
+    for i in range(1, spec.groups + 1):
+        parts.append(f'<group id="G{i}">')
+        parts.extend(
+            _primitive_xml(f"G{i}-R{j}") for j in range(1, spec.group_size + 1)
+        )
+        parts.append("</group>")
+    parts.extend(
+        f'<clone id="C{i}">{_primitive_xml(f"C{i}-R")}</clone>'
+        for i in range(1, spec.clones + 1)
+    )
+    parts.extend(
+        f"""
+            <bundle id="B{i}">
+                <podman image="localhost/pcmktest:http" replicas="1"/>
+                <network control-port="3121"/>
+                {_primitive_xml(f"B{i}-R")}
+            </bundle>
+            """
+        for i in range(1, spec.bundles + 1)
+    )
+    return parts
+
+
+def _constraints_cib_xml(spec: ClusterSpec) -> list[str]:
+    # Constraints reference standalone primitives, so there must be some.
+    primitive_ids = spec.primitive_ids or ["R1"]
+
+    def rsc(index: int) -> str:
+        return primitive_ids[index % len(primitive_ids)]
+
+    parts: list[str] = []
+    parts.extend(
+        f"""<rsc_location id="location-{i}" rsc="{rsc(i)}"
+                node="{spec.node_name(i)}" score="{i % 100 + 1}"
+            />"""
+        for i in range(spec.location_constraints)
+    )
+    parts.extend(
+        f"""
+            <rsc_location id="location-rule-{i}" rsc="{rsc(i)}">
+                <rule id="location-rule-{i}-rule" boolean-op="and"
+                    score="INFINITY"
+                >
+                    <expression id="location-rule-{i}-rule-expr"
+                        attribute="#uname" operation="eq"
+                        value={quoteattr(spec.node_name(i))}
+                    />
+                    <date_expression id="location-rule-{i}-rule-expr-1"
+                        operation="gt" start="2020-01-0{i % 9 + 1}"
+                    />
+                </rule>
+            </rsc_location>
+            """
+        for i in range(spec.location_rule_constraints)
+    )
+    parts.extend(
+        f"""<rsc_colocation id="colocation-{i}" rsc="{rsc(i)}"
+                with-rsc="{rsc(i + 1)}" score="INFINITY"
+            />"""
+        for i in range(spec.colocation_constraints)
+    )
+    parts.extend(
+        f"""<rsc_order id="order-{i}" first="{rsc(i)}"
+                first-action="start" then="{rsc(i + 1)}" then-action="start"
+            />"""
+        for i in range(spec.order_constraints)
+    )
+    parts.extend(
+        f"""
+            <rsc_order id="order-set-{i}">
+                <resource_set id="order-set-{i}-set">
+                    <resource_ref id="{rsc(i)}"/>
+                    <resource_ref id="{rsc(i + 1)}"/>
+                    <resource_ref id="{rsc(i + 2)}"/>
+                </resource_set>
+            </rsc_order>
+            """
+        for i in range(spec.set_constraints)
+    )
+    return parts
+
+
+def generate_cib(spec: ClusterSpec) -> str:
+    """
+    Return a CIB containing nodes, resources and constraints defined by spec
+    """
+    nodes = "\n".join(
+        f'<node id="{i}" uname="{name}"/>'
+        for i, name in enumerate(spec.node_names, 1)
+    )
+    resources = "\n".join(_resources_cib_xml(spec))
+    constraints = "\n".join(_constraints_cib_xml(spec))
+    return f"""
+        <cib epoch="1" num_updates="0" admin_epoch="0"
+            validate-with="{CIB_SCHEMA}" crm_feature_set="3.19.0"
+            have-quorum="1" dc-uuid="1"
+        >
+          <configuration>
+            <crm_config/>
+            <nodes>{nodes}</nodes>
+            <resources>{resources}</resources>
+            <constraints>{constraints}</constraints>
+          </configuration>
+          <status/>
+        </cib>
+    """.strip()
+
+
+def _primitive_status_xml(
+    resource_id: str,
+    node_name: str | None,
+    resource_agent: str = RESOURCE_AGENT,
+) -> str:
+    if node_name is None:
+        return f"""
+            <resource id="{resource_id}" resource_agent="{resource_agent}"
+                role="Stopped" active="false" orphaned="false"
+                blocked="false" maintenance="false" managed="true"
+                failed="false" failure_ignored="false" nodes_running_on="0"
+            />
+        """
+    return f"""
+        <resource id="{resource_id}" resource_agent="{resource_agent}"
+            role="Started" active="true" orphaned="false" blocked="false"
+            maintenance="false" managed="true" failed="false"
+            failure_ignored="false" nodes_running_on="1"
+        >
+            <node name="{node_name}" id="{node_name}" cached="true"/>
+        </resource>
+    """
+
+
+def _resources_status_xml(spec: ClusterSpec, running: bool) -> list[str]:
+    def on_node(index: int) -> str | None:
+        return spec.node_name(index) if running else None
+
+    parts = [
+        _primitive_status_xml(resource_id, on_node(i))
+        for i, resource_id in enumerate(spec.primitive_ids)
+    ]
+    for i in range(1, spec.groups + 1):
+        parts.append(
+            f"""<group id="G{i}" number_resources="{spec.group_size}"
+                maintenance="false" managed="true" disabled="false"
+            >"""
+        )
+        parts.extend(
+            _primitive_status_xml(f"G{i}-R{j}", on_node(i))
+            for j in range(1, spec.group_size + 1)
+        )
+        parts.append("</group>")
+    for i in range(1, spec.clones + 1):
+        parts.append(
+            f"""<clone id="C{i}" multi_state="false" unique="false"
+                maintenance="false" managed="true" disabled="false"
+                failed="false" failure_ignored="false"
+            >"""
+        )
+        parts.extend(
+            _primitive_status_xml(f"C{i}-R", on_node(node_index))
+            for node_index in range(spec.nodes)
+        )
+        parts.append("</clone>")
+    for i in range(1, spec.bundles + 1):
+        node_name = on_node(i)
+        replica = "\n".join(
+            [
+                _primitive_status_xml(f"B{i}-R", node_name and f"B{i}-0"),
+                _primitive_status_xml(
+                    f"B{i}-podman-0", node_name, "ocf:heartbeat:podman"
+                ),
+                _primitive_status_xml(
+                    f"B{i}-0", node_name, "ocf:pacemaker:remote"
+                ),
+            ]
+        )
+        parts.append(
+            f"""
+            <bundle id="B{i}" type="podman" image="localhost/pcmktest:http"
+                unique="false" maintenance="false" managed="true"
+                failed="false"
+            >
+                <replica id="0">{replica}</replica>
+            </bundle>
+            """
+        )
+    return parts
+
+
+def generate_crm_mon(spec: ClusterSpec, running: bool = True) -> str:
+    """
+    Return crm_mon xml output describing all resources defined by spec on
+    online nodes
+
+    running -- if False, all resources are stopped
+    """
+    nodes = "\n".join(
+        f"""<node name="{name}" id="{i}" online="true" standby="false"
+            standby_onfail="false" maintenance="false" pending="false"
+            unclean="false" shutdown="false" expected_up="true"
+            is_dc="{"true" if i == 1 else "false"}" resources_running="0"
+            type="member"
+        />"""
+        for i, name in enumerate(spec.node_names, 1)
+    )
+    resources = "\n".join(_resources_status_xml(spec, running))
+    return f"""
+        <pacemaker-result api-version="2.30"
+            request="crm_mon --one-shot --inactive --output-as xml"
+        >
+          <summary>
+            <stack type="corosync"/>
+            <current_dc present="true" name="node1" id="1" with_quorum="true"/>
+            <nodes_configured number="{spec.nodes}"/>
+            <resources_configured number="0" disabled="0" blocked="0"/>
+            <cluster_options stonith-enabled="false" symmetric-cluster="true"
+                no-quorum-policy="stop" maintenance-mode="false"
+                stop-all-resources="false" stonith-timeout-ms="60000"
+                priority-fencing-delay-ms="0"
+            />
+          </summary>
+          <nodes>{nodes}</nodes>
+          <resources>{resources}</resources>
+          <status code="0" message="OK"/>
+        </pacemaker-result>
+    """.strip()
+
+
+def generate_corosync_conf(spec: ClusterSpec, links: int = 1) -> str:
+    """
+    Generate a knet corosync.conf with an interface section for each link
+    """
+    interfaces = "\n\n".join(
+        f"""    interface {{
+        linknumber: {link}
+        knet_link_priority: {link}
+    }}"""
+        for link in range(links)
+    )
+    nodes = "\n\n".join(
+        "    node {\n"
+        + "".join(
+            f"        ring{link}_addr: 10.{link}.{i // 256}.{i % 256}\n"
+            for link in range(links)
+        )
+        + f"        name: {name}\n        nodeid: {i}\n    }}"
+        for i, name in enumerate(spec.node_names, 1)
+    )
+    return f"""totem {{
+    version: 2
+    cluster_name: perf-cluster
+    transport: knet
+
+{interfaces}
+}}
+
+nodelist {{
+{nodes}
+}}
+
+quorum {{
+    provider: corosync_votequorum
+}}
+
+logging {{
+    to_logfile: yes
+    logfile: /var/log/cluster/corosync.log
+    to_syslog: yes
+    timestamp: on
+}}
+"""
@@ -0,0 +1,138 @@
+# ruff: noqa: PLC0415 `import` should be at the top-level of a file
+import argparse
+import json
+import os
+import sys
+
+PACKAGE_DIR = os.path.realpath(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+BASELINES_FILE = os.path.join(PACKAGE_DIR, "pcs_test", "perf", "baselines.json")
+
+
+def _parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        prog="pcs_test/perf/suite.py",
+        description="Script for running pcs performance benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+Each benchmark is run several times and its median time is compared to the
+stored baseline. The script fails if any benchmark is slower than its baseline
+multiplied by the threshold. Baselines depend on the machine they were
+measured on, update them when moving to a different machine.
+
+Examples:
+
+    pcs_test/perf/suite.py                       - run all benchmarks
+    pcs_test/perf/suite.py resource.create       - run matching benchmarks
+    pcs_test/perf/suite.py --update-baselines    - store new baselines
+""",
+        allow_abbrev=False,
+    )
+    arg_parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help="Run only benchmarks whose names contain any of the strings",
+    )
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="How many times to run each benchmark (default: %(default)s)",
+    )
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help=(
+            "Maximal allowed ratio of a measured time to its baseline "
+            "(default: %(default)s)"
+        ),
+    )
+    arg_parser.add_argument(
+        "--baselines",
+        default=BASELINES_FILE,
+        help="Path to a file with baselines (default: %(default)s)",
+    )
+    arg_parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="Store measured times as new baselines instead of comparing them",
+    )
+    arg_parser.add_argument(
+        "--list",
+        action="store_true",
+        dest="list_benchmarks",
+        help="List discovered benchmarks without running them",
+    )
+    return arg_parser.parse_args()
+
+
+def _load_baselines(path: str) -> dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baselines_file:
+        return json.load(baselines_file)
+
+
+def _save_baselines(path: str, baselines: dict[str, float]) -> None:
+    with open(path, "w") as baselines_file:
+        json.dump(baselines, baselines_file, indent=4, sort_keys=True)
+        baselines_file.write("\n")
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.repeat < 1:
+        sys.exit("--repeat must be a positive integer")
+
+    sys.path.insert(0, PACKAGE_DIR)
+    from pcs import settings
+
+    settings.pcs_data_dir = os.path.join(PACKAGE_DIR, "data")
+
+    from pcs_test.perf.benchmark import discover_benchmarks, measure
+
+    benchmark_list = [
+        benchmark
+        for benchmark in discover_benchmarks()
+        if not args.benchmarks
+        or any(pattern in benchmark.name for pattern in args.benchmarks)
+    ]
+    if args.list_benchmarks:
+        for benchmark in benchmark_list:
+            print(benchmark.name)
+        return
+
+    baselines = _load_baselines(args.baselines)
+    regression_list = []
+    for benchmark in benchmark_list:
+        result = measure(benchmark, args.repeat)
+        baseline = baselines.get(result.name)
+        if args.update_baselines:
+            baselines[result.name] = round(result.median, 4)
+            status = "stored"
+        elif baseline is None:
+            status = "no baseline"
+        elif result.median > baseline * args.threshold:
+            status = f"REGRESSION ({result.median / baseline:.2f}x baseline)"
+            regression_list.append(result.name)
+        else:
+            status = f"ok ({result.median / baseline:.2f}x baseline)"
+        print(
+            f"{result.name:<32} median {result.median:8.4f}s "
+            f"min {result.minimum:8.4f}s  {status}"
+        )
+        sys.stdout.flush()
+
+    if args.update_baselines:
+        _save_baselines(args.baselines, baselines)
+        print(f"Baselines stored in {args.baselines}")
+    if regression_list:
+        sys.exit(
+            "Performance regressions detected in: " + ", ".join(regression_list)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import json
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.cli.common import local_pcsd
+from pcs.common import reports
+from pcs.common.async_tasks.dto import (
+    CommandDto,
+    CommandOptionsDto,
+    TaskResultDto,
+)
+from pcs.common.async_tasks.types import (
+    TaskFinishType,
+    TaskKillReason,
+    TaskState,
+)
+from pcs.common.interface.dto import to_dict
+
+from pcs_test.tools.misc import get_tmp_dir
+
+
+def fixture_task_result(finish_type, result=None, report_list=()):
+    return TaskResultDto(
+        task_ident="id",
+        command=CommandDto("quorum.status_text", {}, CommandOptionsDto()),
+        reports=[report.to_dto() for report in report_list],
+        state=TaskState.FINISHED,
+        task_finish_type=finish_type,
+        kill_reason=(
+            TaskKillReason.USER if finish_type == TaskFinishType.KILL else None
+        ),
+        result=result,
+    )
+
+
+class GetLibraryCommand(TestCase):
+    def test_status(self):
+        for argv in (["status"], ["status", "status"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(
+                    CommandDto(
+                        "status.full_cluster_status_plaintext",
+                        {"hide_inactive_resources": True, "verbose": False},
+                        CommandOptionsDto(request_timeout=10),
+                    ),
+                    local_pcsd.get_library_command(
+                        argv,
+                        {"--hide-inactive": True, "--request-timeout": 10},
+                    ),
+                )
+
+    def test_quorum_status(self):
+        for argv in (["quorum", "status"], ["status", "quorum"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(
+                    CommandDto("quorum.status_text", {}, CommandOptionsDto()),
+                    local_pcsd.get_library_command(argv, {}),
+                )
+
+    def test_unsupported_option(self):
+        self.assertIsNone(
+            local_pcsd.get_library_command(
+                ["quorum", "status"], {"--full": True}
+            )
+        )
+        self.assertIsNone(
+            local_pcsd.get_library_command(["status"], {"-f": "cib.xml"})
+        )
+
+    def test_unsupported_command(self):
+        self.assertIsNone(
+            local_pcsd.get_library_command(["cluster", "start"], {})
+        )
+        self.assertIsNone(
+            local_pcsd.get_library_command(["status", "pcsd"], {})
+        )
+
+
+class PrintLibraryCommandResult(TestCase):
+    def setUp(self):
+        self.mock_print = self._patch("builtins.print")
+        self.mock_print_report = self._patch(
+            "pcs.cli.common.local_pcsd.print_report"
+        )
+        self.mock_error = self._patch("pcs.cli.common.local_pcsd.error")
+        self.warning = reports.ReportItem.warning(
+            reports.messages.CorosyncNotRunningCheckNodeStopped("node1")
+        )
+        self.debug = reports.ReportItem.debug(
+            reports.messages.CorosyncNotRunningCheckNodeStopped("node2")
+        )
+        self.error = reports.ReportItem.error(
+            reports.messages.CorosyncNotRunningCheckNodeStopped("node3")
+        )
+
+    def _patch(self, target):
+        patcher = mock.patch(target)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_success(self):
+        self.assertEqual(
+            0,
+            local_pcsd.print_library_command_result(
+                fixture_task_result(
+                    TaskFinishType.SUCCESS,
+                    "output",
+                    [self.warning, self.debug],
+                )
+            ),
+        )
+        self.mock_print.assert_called_once_with("output")
+        self.mock_print_report.assert_called_once_with(self.warning.to_dto())
+        self.mock_error.assert_not_called()
+
+    def test_debug(self):
+        local_pcsd.print_library_command_result(
+            fixture_task_result(
+                TaskFinishType.SUCCESS, "output", [self.warning, self.debug]
+            ),
+            debug=True,
+        )
+        self.assertEqual(
+            [mock.call(self.warning.to_dto()), mock.call(self.debug.to_dto())],
+            self.mock_print_report.mock_calls,
+        )
+
+    def test_fail(self):
+        self.assertEqual(
+            1,
+            local_pcsd.print_library_command_result(
+                fixture_task_result(TaskFinishType.FAIL, None, [self.error])
+            ),
+        )
+        self.mock_print.assert_not_called()
+        self.mock_print_report.assert_called_once_with(self.error.to_dto())
+        self.mock_error.assert_not_called()
+
+    def test_killed(self):
+        self.assertEqual(
+            1,
+            local_pcsd.print_library_command_result(
+                fixture_task_result(TaskFinishType.KILL)
+            ),
+        )
+        self.mock_print.assert_not_called()
+        self.mock_error.assert_called_once_with(
+            "Command was terminated by pcsd"
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(
+            (self.path, self.headers["Content-Type"], body.decode())
+        )
+        self.server.cookies.append(self.headers["Cookie"])
+        status, response = self.server.responses.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class SendRequest(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_cli_local_pcsd")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.socket_path = os.path.join(self.tmp_dir.name, "pcsd.socket")
+        patcher = mock.patch.object(
+            settings, "pcsd_unix_socket", self.socket_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start_server(self, responses):
+        server = socketserver.UnixStreamServer(self.socket_path, _Handler)
+        server.requests = []
+        server.cookies = []
+        server.responses = list(responses)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_success(self):
+        server = self.start_server([(200, "response")])
+        self.assertEqual(
+            (200, "response"), local_pcsd.send_request("run_pcs", "a=b")
+        )
+        self.assertEqual(
+            [("/run_pcs", "application/x-www-form-urlencoded", "a=b")],
+            server.requests,
+        )
+        self.assertEqual([None], server.cookies)
+
+    def test_token(self):
+        server = self.start_server([(200, "response")])
+        self.assertEqual(
+            (200, "response"),
+            local_pcsd.send_request("run_pcs", "a=b", token="a-token"),
+        )
+        self.assertEqual(["token=a-token"], server.cookies)
+
+    def test_not_authorized(self):
+        self.start_server([(401, "")])
+        with self.assertRaises(local_pcsd.LocalPcsdUnavailable):
+            local_pcsd.send_request("run_pcs", "a=b")
+
+    def test_no_socket(self):
+        with self.assertRaises(local_pcsd.LocalPcsdUnavailable):
+            local_pcsd.send_request("run_pcs", "a=b")
+
+    def test_run_library_command(self):
+        task_result = fixture_task_result(TaskFinishType.SUCCESS, "output")
+        server = self.start_server([(200, json.dumps(to_dict(task_result)))])
+        self.assertEqual(
+            task_result,
+            local_pcsd.run_library_command(task_result.command),
+        )
+        path, content_type, body = server.requests[0]
+        self.assertEqual("/api/v2/task/run", path)
+        self.assertEqual("application/json", content_type)
+        self.assertEqual("quorum.status_text", json.loads(body)["command_name"])
+
+    def test_run_library_command_error(self):
+        self.start_server([(404, "")])
+        with self.assertRaises(local_pcsd.LocalPcsdUnavailable):
+            local_pcsd.run_library_command(
+                CommandDto("quorum.status_text", {}, CommandOptionsDto())
+            )
@@ -621,10 +621,11 @@ class IsOptionExpectingValue(TestCase):
 class InputModifiersTest(TestCase):
     def setUp(self):
         self.supported = ["a", "b", "c"]
-        # --debug is implicitly supported in all commands, tested separately
-        # in test_debug_implicit
-        self.bool_opts = sorted(MODIFIER_OPTIONS_BOOL - {"--debug"})
-        self.val_opts = sorted(MODIFIER_OPTIONS_VAL)
+        # --debug and timing options are implicitly supported in all
+        # commands, tested separately in test_debug_implicit and
+        # test_timing_implicit
+        self.bool_opts = sorted(MODIFIER_OPTIONS_BOOL - {"--debug", "--timing"})
+        self.val_opts = sorted(MODIFIER_OPTIONS_VAL - {"--timing-profile"})
 
     def _get_specified(self, *keys):
         return {key: i for i, key in enumerate(keys)}
@@ -676,6 +677,11 @@ class InputModifiersTest(TestCase):
     def test_debug_implicit(self):
         InputModifiers({"--debug": ""}).ensure_only_supported()
 
+    def test_timing_implicit(self):
+        InputModifiers(
+            {"--timing": "", "--timing-profile": "file"}
+        ).ensure_only_supported()
+
     def test_bool_options(self):
         for opt in self.bool_opts:
             with self.subTest(opt=opt):
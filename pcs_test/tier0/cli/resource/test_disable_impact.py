@@ -0,0 +1,203 @@
+import json
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs.cli.common.errors import CmdLineInputError
+from pcs.cli.resource import command
+from pcs.common import reports
+from pcs.common.pacemaker.resource.disable_impact import (
+    ResourceDisableImpactDto,
+    ResourceDisableImpactListDto,
+    SimulatedOperationDto,
+)
+
+from pcs_test.tools.misc import dict_to_modifiers
+
+
+def _fixture_dto(resource_or_tag_ids, **kwargs):
+    return ResourceDisableImpactDto(
+        resource_or_tag_ids=resource_or_tag_ids,
+        disabled_resource_ids=kwargs.get(
+            "disabled_resource_ids", resource_or_tag_ids
+        ),
+        other_affected_resource_ids=kwargs.get(
+            "other_affected_resource_ids", []
+        ),
+        operations=kwargs.get("operations", []),
+        timed_out=kwargs.get("timed_out", False),
+        reports=kwargs.get("reports", []),
+    )
+
+
+FIXTURE_RESULT = ResourceDisableImpactListDto(
+    candidates=[
+        _fixture_dto(["A"]),
+        _fixture_dto(
+            ["B", "C"],
+            other_affected_resource_ids=["D", "E"],
+            operations=[
+                SimulatedOperationDto(
+                    resource_id="D", operation="stop", node="node1"
+                ),
+            ],
+            reports=[
+                reports.ReportItem.warning(
+                    reports.messages.ResourceIsUnmanaged("B")
+                ).to_dto()
+            ],
+        ),
+        _fixture_dto(["F"], timed_out=True),
+        _fixture_dto(
+            ["X"],
+            disabled_resource_ids=[],
+            reports=[
+                reports.ReportItem.error(
+                    reports.messages.CibSimulateError("some stderr")
+                ).to_dto()
+            ],
+        ),
+    ]
+)
+
+
+@mock.patch("pcs.cli.resource.command.print")
+class DisableImpact(TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["resource"])
+        self.lib.resource = mock.Mock(spec_set=["disable_simulate_bulk"])
+        self.lib.resource.disable_simulate_bulk.return_value = FIXTURE_RESULT
+
+    def _call_cmd(self, argv, modifiers=None):
+        command.disable_impact(
+            self.lib, argv, dict_to_modifiers(modifiers or {})
+        )
+
+    def assert_input_error(self, argv, message, modifiers=None):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self._call_cmd(argv, modifiers)
+        self.assertEqual(cm.exception.message, message)
+        self.lib.resource.disable_simulate_bulk.assert_not_called()
+
+    def test_no_args(self, mock_print):
+        self.assert_input_error([], None)
+        self.assert_input_error(["timeout=10"], None)
+        mock_print.assert_not_called()
+
+    def test_duplicate_args(self, mock_print):
+        self.assert_input_error(["A", "A"], "duplicate argument: 'A'")
+        mock_print.assert_not_called()
+
+    def test_unknown_option(self, mock_print):
+        self.assert_input_error(["A", "nodes=2"], "Unknown option 'nodes'")
+        mock_print.assert_not_called()
+
+    def test_bad_options(self, mock_print):
+        self.assert_input_error(
+            ["A", "max-concurrency=0"],
+            "'0' is not a valid max-concurrency value, use a positive integer",
+        )
+        self.assert_input_error(
+            ["A", "timeout=0"],
+            "'0' is not a valid timeout value, use a positive integer or a "
+            "time interval",
+        )
+        self.assert_input_error(
+            ["A", "timeout=often"],
+            "'often' is not a valid timeout value, use a positive integer or "
+            "a time interval",
+        )
+        mock_print.assert_not_called()
+
+    def test_unsupported_output_format(self, mock_print):
+        self.assert_input_error(
+            ["A"],
+            (
+                "Unknown value 'cmd' for '--output-format' option. Supported "
+                "values are: 'json', 'text'"
+            ),
+            {"output-format": "cmd"},
+        )
+        mock_print.assert_not_called()
+
+    def assert_exit_error(self, argv, modifiers=None):
+        with self.assertRaises(SystemExit) as cm:
+            self._call_cmd(argv, modifiers)
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_text(self, mock_print):
+        self.assert_exit_error(
+            ["A", "max-concurrency=4", "B,C", "timeout=2min", "F", "X"],
+            {"no-strict": True},
+        )
+        self.lib.resource.disable_simulate_bulk.assert_called_once_with(
+            [["A"], ["B", "C"], ["F"], ["X"]],
+            False,
+            max_concurrency=4,
+            timeout=120,
+        )
+        mock_print.assert_called_once_with(
+            dedent(
+                """\
+                A: no other resources affected
+                B,C: affects 'D', 'E'
+                  Warning: 'B' is unmanaged
+                F: simulation timed out
+                X: unable to simulate
+                  Error: Unable to simulate changes in CIB: some stderr"""
+            )
+        )
+
+    def test_json(self, mock_print):
+        self.assert_exit_error(["A"], {"output-format": "json"})
+        self.lib.resource.disable_simulate_bulk.assert_called_once_with(
+            [["A"]], True, max_concurrency=None, timeout=None
+        )
+        mock_print.assert_called_once()
+        self.assertEqual(
+            json.loads(mock_print.call_args[0][0])["candidates"][1][
+                "operations"
+            ],
+            [{"resource_id": "D", "operation": "stop", "node": "node1"}],
+        )
+
+    def test_all_simulated(self, mock_print):
+        self.lib.resource.disable_simulate_bulk.return_value = (
+            ResourceDisableImpactListDto(
+                candidates=FIXTURE_RESULT.candidates[:2]
+            )
+        )
+        self._call_cmd(["A", "B,C"])
+        mock_print.assert_called_once_with(
+            dedent(
+                """\
+                A: no other resources affected
+                B,C: affects 'D', 'E'
+                  Warning: 'B' is unmanaged"""
+            )
+        )
+
+    def test_timed_out(self, mock_print):
+        self.lib.resource.disable_simulate_bulk.return_value = (
+            ResourceDisableImpactListDto(
+                candidates=FIXTURE_RESULT.candidates[:3]
+            )
+        )
+        self.assert_exit_error(["A", "B,C", "F"], {"output-format": "json"})
+        mock_print.assert_called_once()
+
+    def test_error(self, mock_print):
+        self.lib.resource.disable_simulate_bulk.return_value = (
+            ResourceDisableImpactListDto(
+                candidates=[FIXTURE_RESULT.candidates[0]]
+                + FIXTURE_RESULT.candidates[3:]
+            )
+        )
+        self.assert_exit_error(["A", "X"])
+        mock_print.assert_called_once_with(
+            dedent(
+                """\
+                A: no other resources affected
+                X: unable to simulate
+                  Error: Unable to simulate changes in CIB: some stderr"""
+            )
+        )
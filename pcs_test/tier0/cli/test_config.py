@@ -0,0 +1,246 @@
+import os
+from datetime import datetime
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs import config
+from pcs.cli.common.errors import CmdLineInputError
+
+from pcs_test.tools.fixture_cib import modify_cib
+from pcs_test.tools.misc import (
+    dict_to_modifiers,
+    get_tmp_dir,
+    read_test_resource,
+)
+
+FIXTURE_RESOURCES = """
+    <resources>
+        <primitive id="A" class="ocf" provider="pacemaker" type="Dummy"/>
+    </resources>
+"""
+FIXTURE_RESOURCES_CHANGED = """
+    <resources>
+        <primitive id="A" class="ocf" provider="pacemaker" type="Stateful"/>
+    </resources>
+"""
+FIXTURE_TOPOLOGY = """
+    <fencing-topology>
+        <fencing-level id="fl1" index="1" devices="S1" target="node1"/>
+    </fencing-topology>
+"""
+FIXTURE_TOPOLOGY_CHANGED = """
+    <fencing-topology>
+        <fencing-level id="fl1" index="1" devices="S2" target="node1"/>
+    </fencing-topology>
+"""
+
+
+def fixture_time(hour):
+    return datetime(2024, 5, 6, hour).timestamp()
+
+
+@mock.patch("pcs.config.print_to_stderr")
+@mock.patch("pcs.config.print")
+class ConfigCheckpointDiff(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_cli_config_checkpoint")
+        self.addCleanup(self.tmp_dir.cleanup)
+        for name, value in (
+            ("cib_dir", self.tmp_dir.name),
+            (
+                "cib_checkpoint_index_location",
+                os.path.join(self.tmp_dir.name, "index.json"),
+            ),
+        ):
+            patcher = mock.patch.object(config.settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.lib = mock.Mock(spec_set=[])
+
+    def write_checkpoint(self, number, hour, **modifiers):
+        path = os.path.join(self.tmp_dir.name, f"cib-{number}.raw")
+        with open(path, "w") as checkpoint_file:
+            checkpoint_file.write(
+                modify_cib(read_test_resource("cib-empty.xml"), **modifiers)
+            )
+        os.utime(path, (fixture_time(hour), fixture_time(hour)))
+
+    def fixture_checkpoints(self):
+        # created in a different order than numbered
+        self.write_checkpoint(1, 10, resources=FIXTURE_RESOURCES)
+        self.write_checkpoint(3, 11, resources=FIXTURE_RESOURCES_CHANGED)
+        self.write_checkpoint(2, 12, resources=FIXTURE_RESOURCES_CHANGED)
+
+    def call_cmd(self, argv, modifiers=None):
+        config.config_checkpoint_diff(
+            self.lib, argv, dict_to_modifiers(modifiers or {})
+        )
+
+    @staticmethod
+    def get_output(mock_print):
+        return "\n".join(
+            " ".join(str(arg) for arg in call.args)
+            for call in mock_print.call_args_list
+        )
+
+    def assert_checkpoints_diff(self, mock_print):
+        self.assertEqual(
+            dedent(
+                """\
+                Differences between checkpoint 1 (-) and checkpoint 3 (+):
+                Resource 'A' changed:
+                  - Resource: A (class=ocf provider=pacemaker type=Dummy)
+                  ?                                                ^ ^^^
+                  + Resource: A (class=ocf provider=pacemaker type=Stateful)
+                  ?                                                ^^^^^^ ^
+
+                Differences between checkpoint 3 (-) and checkpoint 2 (+):
+                No differences"""
+            ),
+            self.get_output(mock_print),
+        )
+
+    def test_range(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        with mock.patch(
+            "pcs.config._load_configuration_snapshot",
+            wraps=config._load_configuration_snapshot,
+        ) as mock_load:
+            self.call_cmd(["1..2"])
+        # checkpoint 2 is identical to checkpoint 3, it is not loaded
+        self.assertEqual(
+            ["1", "3"],
+            [call.args[0].number for call in mock_load.call_args_list],
+        )
+        self.assert_checkpoints_diff(mock_print)
+        mock_stderr.assert_not_called()
+
+    def test_range_reversed(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        self.call_cmd(["2..1"])
+        self.assert_checkpoints_diff(mock_print)
+        mock_stderr.assert_not_called()
+
+    def test_range_part(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        self.call_cmd(["3..2"])
+        self.assertEqual(
+            dedent(
+                """\
+                Differences between checkpoint 3 (-) and checkpoint 2 (+):
+                No differences"""
+            ),
+            self.get_output(mock_print),
+        )
+        mock_stderr.assert_not_called()
+
+    def test_range_same_checkpoint(self, mock_print, mock_stderr):
+        del mock_stderr
+        self.fixture_checkpoints()
+        with (
+            mock.patch("pcs.utils.err", side_effect=SystemExit(1)) as mock_err,
+            self.assertRaises(SystemExit),
+        ):
+            self.call_cmd(["2..2"])
+        mock_err.assert_called_once_with(
+            "cannot diff a checkpoint against itself"
+        )
+        mock_print.assert_not_called()
+
+    def test_range_unknown_checkpoint(self, mock_print, mock_stderr):
+        del mock_stderr
+        self.fixture_checkpoints()
+        with (
+            mock.patch("pcs.utils.err", side_effect=SystemExit(1)) as mock_err,
+            self.assertRaises(SystemExit),
+        ):
+            self.call_cmd(["1..4"])
+        mock_err.assert_called_once_with("unable to read checkpoint '4'")
+        mock_print.assert_not_called()
+
+    def test_since(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        # the first checkpoint is compared to the one preceding it
+        self.call_cmd([], {"since": "2024-05-06 10:30"})
+        self.assert_checkpoints_diff(mock_print)
+        mock_stderr.assert_not_called()
+
+    def test_since_first_checkpoint(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        self.call_cmd([], {"since": "2024-05-06"})
+        self.assert_checkpoints_diff(mock_print)
+        mock_stderr.assert_not_called()
+
+    def test_since_one_checkpoint(self, mock_print, mock_stderr):
+        self.write_checkpoint(1, 10, resources=FIXTURE_RESOURCES)
+        self.call_cmd([], {"since": "2024-05-06"})
+        mock_print.assert_not_called()
+        mock_stderr.assert_called_once_with("No checkpoints to compare")
+
+    def test_since_no_new_checkpoints(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        self.call_cmd([], {"since": "2024-05-06 13:00"})
+        mock_print.assert_not_called()
+        mock_stderr.assert_called_once_with("No checkpoints to compare")
+
+    def test_since_invalid(self, mock_print, mock_stderr):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self.call_cmd([], {"since": "yesterday"})
+        self.assertEqual(
+            "'yesterday' is not a valid date and time, use format "
+            "'YYYY-MM-DD [HH:MM[:SS]]'",
+            cm.exception.message,
+        )
+        mock_print.assert_not_called()
+        mock_stderr.assert_not_called()
+
+    def test_since_and_range(self, mock_print, mock_stderr):
+        with self.assertRaises(CmdLineInputError) as cm:
+            self.call_cmd(["1..2"], {"since": "2024-05-06"})
+        self.assertIsNone(cm.exception.message)
+        mock_print.assert_not_called()
+        mock_stderr.assert_not_called()
+
+    def test_two_checkpoints(self, mock_print, mock_stderr):
+        self.fixture_checkpoints()
+        self.call_cmd(["2", "1"])
+        self.assertEqual(
+            dedent(
+                """\
+                Differences between checkpoint 2 (-) and checkpoint 1 (+):
+                Resource 'A' changed:
+                  - Resource: A (class=ocf provider=pacemaker type=Stateful)
+                  ?                                                ^^^^^^ ^
+                  + Resource: A (class=ocf provider=pacemaker type=Dummy)
+                  ?                                                ^ ^^^"""
+            ),
+            self.get_output(mock_print),
+        )
+        mock_stderr.assert_not_called()
+
+    def test_other_sections(self, mock_print, mock_stderr):
+        self.write_checkpoint(1, 10, optional_in_conf=FIXTURE_TOPOLOGY)
+        self.write_checkpoint(2, 11, optional_in_conf=FIXTURE_TOPOLOGY_CHANGED)
+        self.write_checkpoint(3, 12)
+        self.call_cmd(["1..3"])
+        self.assertEqual(
+            dedent(
+                """\
+                Differences between checkpoint 1 (-) and checkpoint 2 (+):
+                Configuration section 'fencing-topology' changed:
+                    <fencing-topology>
+                  -   <fencing-level devices="S1" id="fl1" index="1" target="node1"/>
+                  ?                            ^
+                  +   <fencing-level devices="S2" id="fl1" index="1" target="node1"/>
+                  ?                            ^
+                    </fencing-topology>
+
+                Differences between checkpoint 2 (-) and checkpoint 3 (+):
+                Configuration section 'fencing-topology' removed:
+                  - <fencing-topology>
+                  -   <fencing-level devices="S2" id="fl1" index="1" target="node1"/>
+                  - </fencing-topology>"""
+            ),
+            self.get_output(mock_print),
+        )
+        mock_stderr.assert_not_called()
@@ -1,19 +1,24 @@
 import importlib
+import json
 import pkgutil
 from collections.abc import Sequence
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, field, is_dataclass
 from typing import Any
 from unittest import TestCase
 
+import dacite
 from dacite.exceptions import WrongTypeError
 
 import pcs
 from pcs.common.interface.dto import (
+    DTO_TYPE_HOOKS_MAP,
     DataTransferObject,
     PayloadConversionError,
     from_dict,
     to_dict,
+    to_json,
 )
+from pcs.common.reports.types import MessageCode
 from pcs.common.types import CorosyncNodeAddressType
 
 
@@ -238,3 +243,118 @@ class UnexpectedTypes(TestCase):
         self.assertEqual(
             dict(field_a="a", field_b={1: "1", 2: "2"}), to_dict(dto)
         )
+
+
+@dataclass
+class LeafDto(DataTransferObject):
+    name: str
+    weight: float
+
+
+@dataclass
+class OtherLeafDto(DataTransferObject):
+    name: str
+    count: int
+
+
+@dataclass
+class TreeDto(DataTransferObject):
+    name: str
+    leaves: Sequence[LeafDto | OtherLeafDto]
+    children: list["TreeDto"] = field(default_factory=list)
+    address_type: CorosyncNodeAddressType | None = None
+    code: MessageCode | None = None
+    counts: dict[str, int] = field(default_factory=dict)
+    pair: tuple[str, str] | None = None
+
+
+_TREE_PAYLOAD = {
+    "name": "root",
+    "leaves": [{"name": "a", "weight": 1}, {"name": "b", "count": 2}],
+    "children": [
+        {
+            "name": "child",
+            "leaves": [],
+            "address_type": "FQDN",
+            "code": "CODE",
+            "counts": {"x": 1},
+            "pair": ["a", "b"],
+        }
+    ],
+}
+
+
+class CompiledConversion(TestCase):
+    # Results and errors must be exactly the same as if the payload was
+    # converted by dacite only
+    def assert_same_as_dacite(self, cls, payload, strict=False):
+        config = dacite.Config(type_hooks=DTO_TYPE_HOOKS_MAP, strict=strict)
+        try:
+            expected = dacite.from_dict(cls, payload, config)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                from_dict(cls, payload, strict=strict)
+            self.assertEqual(str(e), str(cm.exception))
+            return
+        self.assertEqual(expected, from_dict(cls, payload, strict=strict))
+
+    def test_success(self):
+        self.assertEqual(
+            TreeDto(
+                "root",
+                [LeafDto("a", 1), OtherLeafDto("b", 2)],
+                [
+                    TreeDto(
+                        "child",
+                        [],
+                        [],
+                        CorosyncNodeAddressType.FQDN,
+                        MessageCode("CODE"),
+                        {"x": 1},
+                        ("a", "b"),
+                    )
+                ],
+            ),
+            from_dict(TreeDto, _TREE_PAYLOAD, strict=True),
+        )
+        self.assert_same_as_dacite(TreeDto, _TREE_PAYLOAD, strict=True)
+
+    def test_errors(self):
+        child = _TREE_PAYLOAD["children"][0]
+        payloads = [
+            {**_TREE_PAYLOAD, "unexpected": 1},
+            {"leaves": []},
+            {**_TREE_PAYLOAD, "name": 1},
+            {**_TREE_PAYLOAD, "leaves": [{"name": "c"}]},
+            {**_TREE_PAYLOAD, "leaves": "a"},
+            {**_TREE_PAYLOAD, "children": [{**child, "counts": {1: 1}}]},
+            {**_TREE_PAYLOAD, "children": [{**child, "pair": ["a"]}]},
+            {**_TREE_PAYLOAD, "children": [{**child, "address_type": "a"}]},
+            {**_TREE_PAYLOAD, "children": [{**child, "extra": "a"}]},
+        ]
+        for strict in (False, True):
+            for payload in payloads:
+                with self.subTest(strict=strict, payload=payload):
+                    self.assert_same_as_dacite(TreeDto, payload, strict=strict)
+
+    def test_not_compiled_data(self):
+        payloads = [
+            {**_TREE_PAYLOAD, "leaves": ({"name": "a", "weight": 1.5},)},
+            {**_TREE_PAYLOAD, "children": [TreeDto("a", [])]},
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                self.assert_same_as_dacite(TreeDto, payload)
+
+
+class ToJson(TestCase):
+    def test_same_as_to_dict(self):
+        dto = from_dict(TreeDto, _TREE_PAYLOAD)
+        self.assertEqual(json.dumps(to_dict(dto)), to_json(dto))
+        self.assertEqual(
+            json.dumps(to_dict(dto), indent=2), to_json(dto, indent=2)
+        )
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            to_json(DtoWithAny("a", object()))
@@ -3251,6 +3251,14 @@ class FileDistributionSuccess(NameBuildTest):
         )
 
 
+class FileDistributionSkippedUnchanged(NameBuildTest):
+    def test_build_messages(self):
+        self.assert_message_from_report(
+            "node1: file 'some authfile' unchanged, distribution skipped",
+            reports.FileDistributionSkippedUnchanged("node1", "some authfile"),
+        )
+
+
 class FileDistributionError(NameBuildTest):
     def test_build_messages(self):
         self.assert_message_from_report(
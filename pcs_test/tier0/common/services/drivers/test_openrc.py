@@ -4,7 +4,7 @@ from unittest import TestCase, mock
 from pcs.common.services import errors
 from pcs.common.services.drivers import OpenRcDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import ExecutorResult, ServiceState
 
 
 class Base(TestCase):
@@ -271,3 +271,32 @@ class GetAvailableServicesTest(Base):
         self.mock_executor.run.assert_called_once_with(
             [self.rc_service_bin, "--list"]
         )
+
+
+class GetStatesTest(Base):
+    def test_success(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(0, "test\nservice1\nabc\n", ""),
+            ExecutorResult(0, " test | default\n service1 | default\n", ""),
+            ExecutorResult(0, "is running", ""),
+            ExecutorResult(3, "is stopped", ""),
+            ExecutorResult(1, "", "does not exist"),
+        ]
+        self.assertEqual(
+            self.driver.get_states(["test", "abc", "xyz"]),
+            {
+                "test": ServiceState(True, True, True),
+                "abc": ServiceState(True, False, False),
+                "xyz": ServiceState(False, False, False),
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call([self.rc_service_bin, "--list"]),
+                mock.call([self.rc_update_bin, "show", "default"]),
+                mock.call([self.rc_service_bin, "test", "status"]),
+                mock.call([self.rc_service_bin, "abc", "status"]),
+                mock.call([self.rc_service_bin, "xyz", "status"]),
+            ],
+        )
@@ -3,7 +3,7 @@ from unittest import TestCase, mock
 from pcs.common.services import errors
 from pcs.common.services.drivers import SystemdDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import ExecutorResult, ServiceState
 
 
 def service_name(service, instance=None):
@@ -246,3 +246,85 @@ class GetAvailableServicesTest(Base):
         self.mock_executor.run.assert_called_once_with(
             [self.binary, "list-unit-files", "--full"]
         )
+
+
+class GetStatesTest(Base):
+    show_cmd = "--property=LoadState,ActiveState,UnitFileState"
+
+    def test_no_services(self):
+        self.assertEqual(self.driver.get_states([]), {})
+        self.mock_executor.run.assert_not_called()
+
+    def test_success(self):
+        services = ["running", "stopped", "static", "masked", "missing"]
+        output = (
+            "LoadState=loaded\nActiveState=active\nUnitFileState=enabled\n\n"
+            "LoadState=loaded\nActiveState=inactive\nUnitFileState=disabled\n"
+            "\n"
+            "ActiveState=reloading\nLoadState=loaded\nUnitFileState=static\n"
+            "\n"
+            "LoadState=masked\nActiveState=inactive\nUnitFileState=masked\n\n"
+            "LoadState=not-found\nActiveState=inactive\nUnitFileState=\n"
+        )
+        self.mock_executor.run.return_value = ExecutorResult(0, output, "")
+        self.assertEqual(
+            self.driver.get_states(services),
+            {
+                "running": ServiceState(True, True, True),
+                "stopped": ServiceState(True, False, False),
+                "static": ServiceState(True, True, True),
+                "masked": ServiceState(True, False, False),
+                "missing": ServiceState(False, False, False),
+            },
+        )
+        # all the services are checked by running one process
+        self.mock_executor.run.assert_called_once_with(
+            [
+                self.binary,
+                "show",
+                self.show_cmd,
+                *[service_name(service) for service in services],
+            ]
+        )
+
+    def test_unexpected_output(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(
+                0, "LoadState=loaded\nActiveState=active\nUnitFileState=\n", ""
+            ),
+            ExecutorResult(0, f"{self.service}.service disabled\n", ""),
+            ExecutorResult(0, "enabled", ""),
+            ExecutorResult(3, "inactive", ""),
+            ExecutorResult(1, "not-found", ""),
+            ExecutorResult(3, "inactive", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_states([self.service, "other"]),
+            {
+                self.service: ServiceState(True, True, False),
+                "other": ServiceState(False, False, False),
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call(
+                    [
+                        self.binary,
+                        "show",
+                        self.show_cmd,
+                        service_name(self.service),
+                        service_name("other"),
+                    ]
+                ),
+                mock.call([self.binary, "list-unit-files", "--full"]),
+                mock.call(
+                    [self.binary, "is-enabled", service_name(self.service)]
+                ),
+                mock.call(
+                    [self.binary, "is-active", service_name(self.service)]
+                ),
+                mock.call([self.binary, "is-enabled", service_name("other")]),
+                mock.call([self.binary, "is-active", service_name("other")]),
+            ],
+        )
@@ -3,7 +3,7 @@ from unittest import TestCase, mock
 from pcs.common.services import errors
 from pcs.common.services.drivers import SysVInitRhelDriver
 from pcs.common.services.interfaces import ExecutorInterface
-from pcs.common.services.types import ExecutorResult
+from pcs.common.services.types import ExecutorResult, ServiceState
 
 
 class Base(TestCase):
@@ -224,3 +224,36 @@ class GetAvailableServicesTest(Base):
         self.mock_executor.run.return_value = ExecutorResult(1, "", "error")
         self.assertEqual(self.driver.get_available_services(), [])
         self.mock_executor.run.assert_called_once_with([self.chkconfig_bin])
+
+
+class GetStatesTest(Base):
+    def test_success(self):
+        self.mock_executor.run.side_effect = [
+            ExecutorResult(
+                0,
+                "abc            	0:off	1:on	2:on	3:on	4:on	5:on	6:off\n"
+                "xyz            	0:off	1:off	2:off	3:off	4:off	5:off	6:off\n",
+                "",
+            ),
+            ExecutorResult(0, "", ""),
+            ExecutorResult(0, "is running", ""),
+            ExecutorResult(1, "", ""),
+            ExecutorResult(3, "is stopped", ""),
+        ]
+        self.assertEqual(
+            self.driver.get_states(["abc", "xyz"]),
+            {
+                "abc": ServiceState(True, True, True),
+                "xyz": ServiceState(True, False, False),
+            },
+        )
+        self.assertEqual(
+            self.mock_executor.run.mock_calls,
+            [
+                mock.call([self.chkconfig_bin]),
+                mock.call([self.chkconfig_bin, "abc"]),
+                mock.call([self.service_bin, "abc", "status"]),
+                mock.call([self.chkconfig_bin, "xyz"]),
+                mock.call([self.service_bin, "xyz", "status"]),
+            ],
+        )
@@ -1,3 +1,4 @@
+import gzip
 import io
 from unittest import TestCase, mock
 
@@ -268,6 +269,7 @@ class CreateRequestHandleTest(TestCase):
         pycurl.SSL_VERIFYHOST: 0,
         pycurl.SSL_VERIFYPEER: 0,
         pycurl.NOSIGNAL: 1,
+        pycurl.ACCEPT_ENCODING: "",
     }
 
     def test_all_info(self, mock_curl):
@@ -338,6 +340,27 @@ class CreateRequestHandleTest(TestCase):
         self.assertEqual("", handle.output_buffer.getvalue().decode("utf-8"))
         self.assertEqual("", handle.debug_buffer.getvalue().decode("utf-8"))
 
+    def test_compression_headers(self, mock_curl):
+        mock_curl.return_value = MockCurl(
+            None, b"", [(pycurl.DEBUG_DATA_IN, b"\x1f\x8b")]
+        )
+        request = lib.Request(
+            lib.RequestTarget("label"), lib.RequestData("action")
+        )
+        handle = lib._create_request_handle(request, {}, 10)
+        self.assertFalse(handle.accepts_compressed_request)
+        self.assertFalse(handle.response_compressed)
+        handle.opts[pycurl.HEADERFUNCTION](b"HTTP/1.1 200 OK\r\n")
+        handle.opts[pycurl.HEADERFUNCTION](b"Accept-Encoding: gzip\r\n")
+        handle.opts[pycurl.HEADERFUNCTION](b"content-encoding: gzip\r\n")
+        self.assertTrue(handle.accepts_compressed_request)
+        self.assertTrue(handle.response_compressed)
+        handle.perform()
+        self.assertEqual(
+            "<< [2 bytes of compressed data]\n",
+            handle.debug_buffer.getvalue().decode("utf-8"),
+        )
+
 
 def fixture_request(host_id=1, action="action"):
     return lib.Request(
@@ -396,6 +419,11 @@ class CommunicatorSimpleTest(CommunicatorBaseTest):
         response = self.get_response(com, mock_create_handle, MockCurl())
         self.assert_common_checks(com, response)
 
+    def test_share_handle(self, mock_create_handle, _):
+        com = self.get_communicator()
+        response = self.get_response(com, mock_create_handle, MockCurl())
+        self.assertIs(com._share_handle, response.handle.opts[pycurl.SHARE])
+
     def test_failure(self, mock_create_handle, _):
         com = self.get_communicator()
         expected_reason = "expected reason"
@@ -477,6 +505,67 @@ class CommunicatorMultiTest(CommunicatorBaseTest):
         com._multi_handle.assert_no_handle_left()
 
 
+@mock.patch(
+    "pcs.common.node_communicator.pycurl.CurlMulti",
+    side_effect=lambda: MockCurlMulti([1]),
+)
+@mock.patch("pcs.common.node_communicator._create_request_handle")
+class CommunicatorCompressionTest(CommunicatorBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.dests_accepting_compression = set()
+
+    def send(self, mock_create_handle, data, accepts_compressed_request):
+        handle = MockCurl()
+        handle.accepts_compressed_request = accepts_compressed_request
+        request = lib.Request(
+            lib.RequestTarget("host"), lib.RequestData("action", data)
+        )
+        handle.request_obj = request
+        mock_create_handle.return_value = handle
+        com = lib.Communicator(
+            self.mock_com_log,
+            None,
+            None,
+            dests_accepting_compression=self.dests_accepting_compression,
+        )
+        com.add_requests([request])
+        list(com.start_loop())
+        return handle
+
+    def test_compress_when_accepted(self, mock_create_handle, _):
+        data = [("data", "a" * 2000)]
+        handle = self.send(mock_create_handle, data, True)
+        self.assertFalse(handle.request_compressed)
+        self.assertEqual(
+            {Destination("host", PORT)}, self.dests_accepting_compression
+        )
+
+        handle = self.send(mock_create_handle, data, True)
+        self.assertTrue(handle.request_compressed)
+        self.assertEqual(
+            ("Expect: ", "Content-Encoding: gzip"),
+            handle.opts[pycurl.HTTPHEADER],
+        )
+        self.assertEqual(
+            "data=" + "a" * 2000,
+            gzip.decompress(handle.opts[pycurl.POSTFIELDS]).decode("utf-8"),
+        )
+
+        handle = self.send(mock_create_handle, data, False)
+        self.assertTrue(handle.request_compressed)
+        self.assertEqual(set(), self.dests_accepting_compression)
+
+        handle = self.send(mock_create_handle, data, False)
+        self.assertFalse(handle.request_compressed)
+
+    def test_small_data_not_compressed(self, mock_create_handle, _):
+        self.dests_accepting_compression.add(Destination("host", PORT))
+        handle = self.send(mock_create_handle, [("data", "a")], True)
+        self.assertFalse(handle.request_compressed)
+        self.assertNotIn(pycurl.POSTFIELDS, handle.opts)
+
+
 def fixture_logger_request_retry_calls(response, hostname):
     return [
         mock.call.log_request_start(response.request),
@@ -0,0 +1,80 @@
+from unittest import TestCase, mock
+
+from pcs.common import timing
+
+
+class TimingTest(TestCase):
+    def setUp(self):
+        self.addCleanup(timing.disable)
+
+    def test_disabled(self):
+        self.assertFalse(timing.is_enabled())
+        with timing.span(timing.PROCESS, "crm_mon"):
+            pass
+        timing.record(timing.HTTP_TOTAL, "remote/status", 1.0)
+
+    def test_span(self):
+        collector = timing.enable()
+        self.assertTrue(timing.is_enabled())
+        with (
+            mock.patch(
+                "pcs.common.timing.time.perf_counter", side_effect=[1.0, 3.5]
+            ),
+            timing.span(timing.PROCESS, "crm_mon"),
+        ):
+            pass
+        self.assertEqual(
+            {timing.PROCESS: {"crm_mon": timing.TimingStat(1, 2.5, 2.5)}},
+            collector.get_stats(),
+        )
+
+    def test_span_exception(self):
+        collector = timing.enable()
+        with self.assertRaises(ValueError), timing.span(timing.XML_PARSE):
+            raise ValueError()
+        self.assertEqual(1, collector.get_stats()[timing.XML_PARSE][""].count)
+
+    def test_record(self):
+        collector = timing.enable()
+        timing.record(timing.HTTP_TOTAL, "remote/status", 1.0)
+        timing.record(timing.HTTP_TOTAL, "remote/status", 3.0)
+        timing.record(timing.HTTP_TOTAL, "remote/check_auth", 0.5)
+        self.assertEqual(
+            {
+                timing.HTTP_TOTAL: {
+                    "remote/status": timing.TimingStat(2, 4.0, 3.0),
+                    "remote/check_auth": timing.TimingStat(1, 0.5, 0.5),
+                }
+            },
+            collector.get_stats(),
+        )
+
+
+class FormatBreakdownTest(TestCase):
+    def test_sorted_and_limited(self):
+        collector = timing.TimingCollector()
+        collector.add(timing.XML_PARSE, "", 0.5)
+        for i in range(4):
+            collector.add(timing.PROCESS, f"tool{i}", float(i + 1))
+        with mock.patch.object(
+            timing.TimingCollector,
+            "elapsed",
+            new_callable=mock.PropertyMock,
+            return_value=12.0,
+        ):
+            lines = timing.format_breakdown(collector, max_names=2)
+        self.assertEqual(
+            [
+                "Timing breakdown, total 12.000s:",
+                "  process                             4x    10.000s "
+                "(max 4.000s)",
+                "    tool3                             1x     4.000s "
+                "(max 4.000s)",
+                "    tool2                             1x     3.000s "
+                "(max 3.000s)",
+                "    ... 2 more",
+                "  xml parse                           1x     0.500s "
+                "(max 0.500s)",
+            ],
+            lines,
+        )
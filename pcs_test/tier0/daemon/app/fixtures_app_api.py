@@ -62,6 +62,7 @@ class ApiTestBase(AsyncHTTPTestCase):
         """
         banned_headers = {"Server"}
         required_headers = {
+            "Accept-Encoding": "gzip",
             "Cache-Control": "no-store, no-cache",
             "Content-Security-Policy": "frame-ancestors 'self'; default-src 'self'",
             "Pragma": "no-cache",
@@ -51,6 +51,7 @@ from pcs.common.version_dto import VersionDto
 from pcs.daemon.app import api_v0
 from pcs.daemon.async_tasks.scheduler import Scheduler, TaskNotFoundError
 from pcs.daemon.async_tasks.types import Command
+from pcs.daemon.pcs_cfgsync import CfgSyncScheduler
 
 from pcs_test.tier0.daemon.app.fixtures_app_api import (
     ApiTestBase,
@@ -70,6 +71,7 @@ class ApiV0Test(ApiTestBase):
         self.scheduler = mock.AsyncMock(Scheduler)
         self.api_auth_provider_factory = MockAuthProviderFactory()
         self.sync_config_lock = Lock()
+        self.cfgsync_scheduler = mock.Mock(CfgSyncScheduler)
         super().setUp()
 
     def get_app(self) -> Application:
@@ -181,21 +183,17 @@ class BaseApiV0Handler(ApiV0Test):
                 effective_username=None, effective_groups=None
             ),
         )
-        self.scheduler.new_task.return_value = self.task_ident
         self.addCleanup(self.assert_scheduler_calls)
 
     def assert_scheduler_calls(self):
         if self.command_executed:
-            self.scheduler.new_task.assert_called_once_with(
+            self.scheduler.run_task.assert_called_once_with(
                 Command(self.command_dto, is_legacy_command=True),
                 self.api_auth_provider_factory.user,
             )
-            self.scheduler.wait_for_task.assert_called_once_with(
-                self.task_ident, self.api_auth_provider_factory.user
-            )
 
     def test_success(self):
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[
@@ -222,9 +220,7 @@ class BaseApiV0Handler(ApiV0Test):
         self.api_auth_provider_factory.provider.auth_user.assert_called_once_with()
 
     def test_task_not_found(self):
-        self.scheduler.wait_for_task.side_effect = TaskNotFoundError(
-            self.task_ident
-        )
+        self.scheduler.run_task.side_effect = TaskNotFoundError(self.task_ident)
 
         response = self.fetch(self.url)
         self.assert_body(response.body, "Internal server error")
@@ -240,7 +236,7 @@ class BaseApiV0Handler(ApiV0Test):
         self.api_auth_provider_factory.provider.auth_user.assert_called_once_with()
 
     def test_permission_denied(self):
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[
@@ -259,7 +255,7 @@ class BaseApiV0Handler(ApiV0Test):
         self.assertEqual(response.code, 403)
 
     def test_task_timeout(self):
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[],
@@ -274,7 +270,7 @@ class BaseApiV0Handler(ApiV0Test):
         self.assertEqual(response.code, 500)
 
     def test_task_killed(self):
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[],
@@ -289,7 +285,7 @@ class BaseApiV0Handler(ApiV0Test):
         self.assertEqual(response.code, 400)
 
     def test_task_exception(self):
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[],
@@ -312,7 +308,7 @@ class BaseApiV0Handler(ApiV0Test):
                 effective_groups=["haclient", "wheel", "square"],
             ),
         )
-        self.scheduler.wait_for_task.return_value = TaskResultDto(
+        self.scheduler.run_task.return_value = TaskResultDto(
             task_ident=self.task_ident,
             command=self.command_dto,
             reports=[
@@ -368,6 +364,7 @@ class ApiV0HandlerTest(ApiV0Test):
                 self.api_auth_provider_factory,
                 self.scheduler,
                 self.sync_config_lock,
+                self.cfgsync_scheduler,
             )
         )
 
@@ -1438,6 +1435,7 @@ class SetSyncOptions(ApiV0HandlerTest):
         self.mock_run_library_command.assert_called_once_with(
             "pcs_cfgsync.update_sync_options", {"options": {}}
         )
+        self.cfgsync_scheduler.request_sync.assert_called_once_with()
 
     def test_success_with_args(self):
         self.mock_run_library_command.return_value = self.result_success()
@@ -1458,6 +1456,7 @@ class SetSyncOptions(ApiV0HandlerTest):
         self.mock_run_library_command.assert_called_once_with(
             "pcs_cfgsync.update_sync_options", {"options": {}}
         )
+        self.cfgsync_scheduler.request_sync.assert_not_called()
 
 
 class SetConfigs(ApiV0HandlerTest):
@@ -1529,6 +1528,7 @@ class SetConfigs(ApiV0HandlerTest):
             self.command,
             {"cluster_name": "test", "configs": {}, "force_flags": []},
         )
+        self.cfgsync_scheduler.request_sync.assert_not_called()
 
     def test_success_multiple_files(self):
         self.mock_run_library_command.return_value = self.result_success(
@@ -1598,6 +1598,7 @@ class SetConfigs(ApiV0HandlerTest):
                 "force_flags": [],
             },
         )
+        self.cfgsync_scheduler.request_sync.assert_called_once_with()
 
     def test_success_with_force(self):
         self.mock_run_library_command.return_value = self.result_success()
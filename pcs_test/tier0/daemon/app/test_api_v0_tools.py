@@ -140,8 +140,6 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             side_effect=lambda msg, code=400: Finish()
         )
 
-        self.scheduler.new_task.return_value = self.task_ident
-
     async def test_success(self):
         report_items = [
             reports.ReportItem.info(
@@ -157,7 +155,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result="command result",
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         result = await run_library_command_in_scheduler(
             self.scheduler,
@@ -171,13 +169,10 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
         self.assertEqual(result.result, "command result")
         self.assertEqual(result.reports, report_items)
 
-        self.scheduler.new_task.assert_called_once_with(
+        self.scheduler.run_task.assert_called_once_with(
             Command(self.command_dto, is_legacy_command=True),
             self.auth_user,
         )
-        self.scheduler.wait_for_task.assert_called_once_with(
-            self.task_ident, self.auth_user
-        )
         self.error_handler.assert_not_called()
 
     async def test_failure(self):
@@ -195,7 +190,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         result = await run_library_command_in_scheduler(
             self.scheduler,
@@ -211,9 +206,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
         self.error_handler.assert_not_called()
 
     async def test_task_not_found(self):
-        self.scheduler.wait_for_task.side_effect = TaskNotFoundError(
-            self.task_ident
-        )
+        self.scheduler.run_task.side_effect = TaskNotFoundError(self.task_ident)
 
         with self.assertRaises(Finish):
             await run_library_command_in_scheduler(
@@ -239,7 +232,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         with self.assertRaises(Finish):
             await run_library_command_in_scheduler(
@@ -268,7 +261,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         result = await run_library_command_in_scheduler(
             self.scheduler,
@@ -291,7 +284,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=TaskKillReason.COMPLETION_TIMEOUT,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         with self.assertRaises(Finish):
             await run_library_command_in_scheduler(
@@ -315,7 +308,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         with self.assertRaises(Finish):
             await run_library_command_in_scheduler(
@@ -337,7 +330,7 @@ class RunLibraryCommandInSchedulerTest(IsolatedAsyncioTestCase):
             kill_reason=None,
             result=None,
         )
-        self.scheduler.wait_for_task.return_value = task_result
+        self.scheduler.run_task.return_value = task_result
 
         with self.assertRaises(Finish):
             await run_library_command_in_scheduler(
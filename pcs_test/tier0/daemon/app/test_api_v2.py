@@ -335,8 +335,7 @@ class RunTaskHandlerTest(ApiV2Test):
         self.auth_provider_factory.provider.auth_user.assert_called_once_with()
 
     def test_success(self):
-        self.scheduler.new_task.return_value = "task-123"
-        self.scheduler.wait_for_task.return_value = self.make_task_result_dto(
+        self.scheduler.run_task.return_value = self.make_task_result_dto(
             task_ident="task-123", result="command result"
         )
 
@@ -347,12 +346,9 @@ class RunTaskHandlerTest(ApiV2Test):
         data = self.assert_success_response(response)
         self.assertEqual(data["task_ident"], "task-123")
         self.assertEqual(data["result"], "command result")
-        self.scheduler.new_task.assert_called_once_with(
+        self.scheduler.run_task.assert_called_once_with(
             Command(self.make_command_dto()), self.auth_provider_factory.user
         )
-        self.scheduler.wait_for_task.assert_called_once_with(
-            "task-123", self.auth_provider_factory.user
-        )
 
     def test_no_json_in_body(self):
         response = self.fetch(self.url, body="", headers={})
@@ -362,24 +358,19 @@ class RunTaskHandlerTest(ApiV2Test):
             400,
             "Request body is missing, has wrong format or wrong/missing headers.",
         )
-        self.scheduler.new_task.assert_not_called()
-        self.scheduler.wait_for_task.assert_not_called()
+        self.scheduler.run_task.assert_not_called()
 
     def test_task_not_found_error(self):
-        self.scheduler.new_task.return_value = "task-123"
-        self.scheduler.wait_for_task.side_effect = TaskNotFoundError("task-123")
+        self.scheduler.run_task.side_effect = TaskNotFoundError("task-123")
 
         response = self.fetch(
             self.url, body=json.dumps(self.make_command_dict())
         )
 
         self.assert_error_response(response, 500)
-        self.scheduler.new_task.assert_called_once_with(
+        self.scheduler.run_task.assert_called_once_with(
             Command(self.make_command_dto()), self.auth_provider_factory.user
         )
-        self.scheduler.wait_for_task.assert_called_once_with(
-            "task-123", self.auth_provider_factory.user
-        )
 
 
 class TaskInfoHandlerTest(ApiV2Test):
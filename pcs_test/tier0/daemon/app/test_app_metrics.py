@@ -0,0 +1,61 @@
+import json
+from unittest import mock
+
+from pcs.daemon.app import metrics
+from pcs.daemon.app.auth_provider import (
+    ApiAuthProviderFactoryInterface,
+    ApiAuthProviderInterface,
+    NotAuthorizedException,
+)
+from pcs.daemon.app.common import BaseHandler, Http404Handler
+from pcs.daemon.metrics import MetricsRegistry
+
+from pcs_test.tier0.daemon.app.fixtures_app import AppTest
+
+
+class _OkHandler(BaseHandler):
+    def get(self):
+        self.write("ok")
+
+
+class MetricsAppTest(AppTest):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.auth_provider = mock.AsyncMock(spec=ApiAuthProviderInterface)
+        self.auth_provider_factory = mock.Mock(
+            spec=ApiAuthProviderFactoryInterface
+        )
+        self.auth_provider_factory.create.return_value = self.auth_provider
+        super().setUp()
+
+    def get_app(self):
+        return metrics.MetricsApplication(
+            [("/ok", _OkHandler, None)]
+            + list(
+                metrics.get_routes(self.auth_provider_factory, self.registry)
+            ),
+            default_handler_class=Http404Handler,
+            metrics=self.registry,
+        )
+
+    def test_requests_observed(self):
+        self.fetch("/ok")
+        self.fetch("/ok")
+        self.fetch("/nonexistent")
+        requests = self.registry.to_dict()["requests"]
+        self.assertEqual(["GET /ok", "GET unmatched"], list(requests))
+        self.assertEqual(2, requests["GET /ok"]["count"])
+
+    def test_metrics_provided(self):
+        self.registry.observe_command("resource.create", 0.5)
+        response = self.fetch("/metrics")
+        self.assertEqual(200, response.code)
+        self.assertEqual(
+            1,
+            json.loads(response.body)["commands"]["resource.create"]["count"],
+        )
+
+    def test_not_authorized(self):
+        self.auth_provider.auth_user.side_effect = NotAuthorizedException()
+        response = self.fetch("/metrics")
+        self.assertEqual(401, response.code)
@@ -1,7 +1,12 @@
+import asyncio
 import dataclasses
+import datetime
+import os
+import threading
 from queue import Empty
 from unittest import mock
 
+from pcs import settings
 from pcs.common.async_tasks.dto import (
     CommandDto,
     CommandOptionsDto,
@@ -16,10 +21,24 @@ from pcs.common.reports import ReportItem
 from pcs.common.reports.messages import CibUpgradeSuccessful
 from pcs.daemon.async_tasks import scheduler
 from pcs.daemon.async_tasks.task import Task, TaskConfig
+from pcs.daemon.async_tasks.task_register import TaskRegister
+from pcs.daemon.async_tasks.types import Command
 from pcs.daemon.async_tasks.worker.executor import task_executor
-from pcs.daemon.async_tasks.worker.types import Message, TaskExecuted
+from pcs.daemon.async_tasks.worker.types import (
+    Message,
+    TaskExecuted,
+    TaskFinished,
+)
+from pcs.daemon.metrics import MetricsRegistry
+
+from pcs_test.tools.misc import get_tmp_dir
 
-from .helpers import ANOTHER_AUTH_USER, AUTH_USER, SchedulerBaseAsyncTestCase
+from .helpers import (
+    ANOTHER_AUTH_USER,
+    AUTH_USER,
+    MockOsKillMixin,
+    SchedulerBaseAsyncTestCase,
+)
 
 WORKER1_PID = 2222
 WORKER2_PID = 3333
@@ -165,6 +184,349 @@ class ReceiveMessagesTest(SchedulerBaseAsyncTestCase):
             self.worker_com.get_nowait()
 
 
+class ReceiveMessagesMetricsTest(SchedulerBaseAsyncTestCase, MockOsKillMixin):
+    def setUp(self):
+        super().setUp()
+        self._init_mock_os_kill()
+        self.metrics = MetricsRegistry()
+        self.scheduler._metrics = self.metrics
+
+    async def _receive(self, count):
+        received = 0
+        while received < count:
+            received += await self.scheduler._receive_messages()
+
+    async def test_finished_command_observed(self):
+        self._create_tasks(2)
+        self.worker_com.put(Message("id0", TaskExecuted(WORKER1_PID)))
+        self.worker_com.put(Message("id1", TaskExecuted(WORKER2_PID)))
+        self.worker_com.put(
+            Message("id0", TaskFinished(TaskFinishType.SUCCESS, None))
+        )
+        await self._receive(3)
+        commands = self.metrics.to_dict()["commands"]
+        self.assertEqual(["command 0"], list(commands.keys()))
+        self.assertEqual(1, commands["command 0"]["count"])
+
+    async def test_not_executed_command_not_observed(self):
+        self._create_tasks(1)
+        self.worker_com.put(
+            Message("id0", ReportItem.error(CibUpgradeSuccessful()).to_dto())
+        )
+        await self._receive(1)
+        self.assertEqual({}, self.metrics.to_dict()["commands"])
+
+
+class InlineTaskTest(SchedulerBaseAsyncTestCase):
+    READ_ONLY_COMMAND = "cluster.get_permissions"
+
+    def setUp(self):
+        super().setUp()
+        self.run_command_mock = mock.patch(
+            "pcs.daemon.async_tasks.scheduler.run_command",
+            side_effect=self._run_command,
+        ).start()
+        self.release_command = threading.Event()
+        self.release_command.set()
+        self.finish_command = True
+
+    def _run_command(
+        self, logger, communicator, worker_command, command_timeout=None
+    ):
+        del logger, command_timeout
+        self.release_command.wait()
+        communicator.put(
+            Message(
+                worker_command.task_ident,
+                ReportItem.info(CibUpgradeSuccessful()).to_dto(),
+            )
+        )
+        if self.finish_command:
+            communicator.put(
+                Message(
+                    worker_command.task_ident,
+                    TaskFinished(TaskFinishType.SUCCESS, "result"),
+                )
+            )
+
+    def _new_task(self, command_name):
+        return self.scheduler.new_task(
+            Command(CommandDto(command_name, {}, CommandOptionsDto())),
+            AUTH_USER,
+        )
+
+    async def _wait_for_threads(self):
+        self.scheduler._inline_pool.shutdown(wait=True)
+        # let the loop run callbacks scheduled by the threads
+        await asyncio.sleep(0)
+
+    async def test_read_only_command(self):
+        task_ident = self._new_task(self.READ_ONLY_COMMAND)
+        task_result = await self.scheduler.wait_for_task(task_ident, AUTH_USER)
+        self.assertEqual(TaskFinishType.SUCCESS, task_result.task_finish_type)
+        self.assertEqual("result", task_result.result)
+        self.assertEqual(1, len(task_result.reports))
+        self.run_command_mock.assert_called_once()
+        self.assertEqual(
+            settings.pcsd_inline_command_timeout,
+            self.run_command_mock.call_args.kwargs["command_timeout"],
+        )
+        self.mp_pool_mock.apply_async.assert_not_called()
+
+    async def test_other_command(self):
+        task_ident = self._new_task("resource.create")
+        await self._wait_for_threads()
+        self.run_command_mock.assert_not_called()
+        self.assertEqual(
+            TaskState.CREATED, self.scheduler._task_register[task_ident].state
+        )
+
+    async def test_disabled(self):
+        self.scheduler._config = dataclasses.replace(
+            self.scheduler._config, inline_worker_count=0
+        )
+        self.scheduler._inline_pool = None
+        task_ident = self._new_task(self.READ_ONLY_COMMAND)
+        self.run_command_mock.assert_not_called()
+        self.assertEqual(
+            TaskState.CREATED, self.scheduler._task_register[task_ident].state
+        )
+
+    def test_no_running_loop(self):
+        task_ident = self._new_task(self.READ_ONLY_COMMAND)
+        self.run_command_mock.assert_not_called()
+        self.assertEqual(
+            TaskState.CREATED, self.scheduler._task_register[task_ident].state
+        )
+
+    async def test_killed_while_running(self):
+        self.release_command.clear()
+        task_ident = self._new_task(self.READ_ONLY_COMMAND)
+        self.assertEqual(
+            TaskState.EXECUTED, self.scheduler._task_register[task_ident].state
+        )
+        self.scheduler.kill_task(task_ident, AUTH_USER)
+        await self.scheduler._process_tasks()
+        self.release_command.set()
+        await self._wait_for_threads()
+        task_result = self.scheduler.get_task(task_ident, AUTH_USER)
+        self.assertEqual(TaskState.FINISHED, task_result.state)
+        self.assertEqual(TaskFinishType.KILL, task_result.task_finish_type)
+        self.assertEqual([], task_result.reports)
+        self.assertIsNone(task_result.result)
+
+    async def test_not_finished(self):
+        self.finish_command = False
+        task_ident = self._new_task(self.READ_ONLY_COMMAND)
+        await self._wait_for_threads()
+        task_result = self.scheduler.get_task(task_ident, AUTH_USER)
+        self.assertEqual(
+            TaskFinishType.UNHANDLED_EXCEPTION, task_result.task_finish_type
+        )
+        self.assertEqual(1, len(task_result.reports))
+
+
+class RunTaskTest(SchedulerBaseAsyncTestCase):
+    SHAREABLE_COMMAND = "status.resources_status"
+
+    def setUp(self):
+        super().setUp()
+        self.cib_version_mock = mock.patch.object(
+            self.scheduler, "_get_cib_version", return_value=(0, 1, 2)
+        ).start()
+
+    def _enable_shared_results(self):
+        self.scheduler._config = dataclasses.replace(
+            self.scheduler._config, shared_result_ttl=10
+        )
+
+    @staticmethod
+    def _command(command_name, params=None):
+        return Command(
+            CommandDto(command_name, params or {}, CommandOptionsDto())
+        )
+
+    async def _start(self, command, auth_user=AUTH_USER):
+        run = asyncio.create_task(self.scheduler.run_task(command, auth_user))
+        # let the coroutine create or join a task
+        await asyncio.sleep(0)
+        return run
+
+    def _finish_tasks(self, result="result"):
+        for task in list(self.scheduler._task_register.values()):
+            if task.state != TaskState.FINISHED:
+                self.scheduler._deliver_message(
+                    task,
+                    Message(
+                        task.task_ident,
+                        TaskFinished(TaskFinishType.SUCCESS, result),
+                    ),
+                )
+
+    async def test_identical_requests_share_task(self):
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self.assertEqual(1, len(self.scheduler._task_register))
+        self._finish_tasks()
+        result1, result2 = await asyncio.gather(run1, run2)
+        self.assertEqual(result1, result2)
+        self.assertEqual("result", result1.result)
+        self.assertEqual({}, self.scheduler._shared_tasks)
+
+    async def test_finished_task_not_shared(self):
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("first")
+        await run1
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("second")
+        self.assertEqual("second", (await run2).result)
+        self.cib_version_mock.assert_not_called()
+
+    async def test_different_requests_not_shared(self):
+        runs = [
+            await self._start(self._command(self.SHAREABLE_COMMAND)),
+            await self._start(
+                self._command(self.SHAREABLE_COMMAND, {"param": "value"})
+            ),
+            await self._start(
+                self._command(self.SHAREABLE_COMMAND), ANOTHER_AUTH_USER
+            ),
+            await self._start(
+                Command(
+                    CommandDto(self.SHAREABLE_COMMAND, {}, CommandOptionsDto()),
+                    is_legacy_command=True,
+                )
+            ),
+        ]
+        self.assertEqual(4, len(self.scheduler._task_register))
+        self._finish_tasks()
+        await asyncio.gather(*runs)
+
+    async def test_not_shareable_command(self):
+        runs = [
+            await self._start(self._command("resource.create")),
+            await self._start(self._command("resource.create")),
+        ]
+        self.assertEqual(2, len(self.scheduler._task_register))
+        self._finish_tasks()
+        await asyncio.gather(*runs)
+        self.assertEqual({}, self.scheduler._shared_tasks)
+
+    async def test_killed_task_not_shared(self):
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        (task_ident,) = self.scheduler._task_register.keys()
+        self.scheduler.kill_task(task_ident, AUTH_USER)
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self.assertEqual(2, len(self.scheduler._task_register))
+        self._finish_tasks()
+        await asyncio.gather(run1, run2)
+        self.assertEqual({}, self.scheduler._shared_tasks)
+
+    async def test_result_reused(self):
+        self._enable_shared_results()
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("first")
+        result1 = await run1
+        await self.scheduler._process_tasks()
+        self.assertEqual(0, len(self.scheduler._task_register))
+        result2 = await self.scheduler.run_task(
+            self._command(self.SHAREABLE_COMMAND), AUTH_USER
+        )
+        self.assertEqual(result1, result2)
+        self.assertEqual(0, len(self.scheduler._task_register))
+        self.assertEqual(2, self.cib_version_mock.call_count)
+
+    async def _assert_result_not_reused(self):
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("first")
+        await run1
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("second")
+        self.assertEqual("second", (await run2).result)
+
+    async def test_result_not_reused_cib_changed(self):
+        self._enable_shared_results()
+        self.cib_version_mock.side_effect = [(0, 1, 2), (0, 1, 3)]
+        await self._assert_result_not_reused()
+
+    async def test_result_not_reused_cib_not_loaded(self):
+        self._enable_shared_results()
+        self.cib_version_mock.return_value = None
+        await self._assert_result_not_reused()
+
+    async def test_result_not_reused_disabled(self):
+        await self._assert_result_not_reused()
+        self.cib_version_mock.assert_not_called()
+
+    async def test_result_not_reused_expired(self):
+        self._enable_shared_results()
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("first")
+        await run1
+        for key, shared_result in self.scheduler._shared_results.items():
+            self.scheduler._shared_results[key] = dataclasses.replace(
+                shared_result, expires_at=datetime.datetime.now()
+            )
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("second")
+        self.assertEqual("second", (await run2).result)
+
+    async def test_result_not_reused_not_cib_based(self):
+        self._enable_shared_results()
+        self.scheduler._inline_pool = None
+        run1 = await self._start(self._command("quorum.status_text"))
+        self._finish_tasks("first")
+        await run1
+        run2 = await self._start(self._command("quorum.status_text"))
+        self._finish_tasks("second")
+        self.assertEqual("second", (await run2).result)
+        self.cib_version_mock.assert_not_called()
+
+    async def test_failed_result_not_reused(self):
+        self._enable_shared_results()
+        run1 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        (task,) = self.scheduler._task_register.values()
+        self.scheduler._deliver_message(
+            task,
+            Message(task.task_ident, TaskFinished(TaskFinishType.FAIL, None)),
+        )
+        await run1
+        run2 = await self._start(self._command(self.SHAREABLE_COMMAND))
+        self._finish_tasks("second")
+        self.assertEqual("second", (await run2).result)
+
+
+class GetCibVersionTest(SchedulerBaseAsyncTestCase):
+    def setUp(self):
+        super().setUp()
+        tmp_dir = get_tmp_dir("tier0_daemon_scheduler")
+        self.addCleanup(tmp_dir.cleanup)
+        self.cibadmin = os.path.join(tmp_dir.name, "cibadmin")
+        mock.patch.object(settings, "cibadmin_exec", self.cibadmin).start()
+
+    def _fixture_cibadmin(self, stdout, retval=0):
+        with open(self.cibadmin, "w") as cibadmin_file:
+            cibadmin_file.write(f"#!/bin/sh\necho '{stdout}'\nexit {retval}\n")
+        os.chmod(self.cibadmin, 0o700)
+
+    async def test_success(self):
+        self._fixture_cibadmin(
+            '<cib admin_epoch="1" epoch="22" num_updates="333"/>'
+        )
+        self.assertEqual((1, 22, 333), await self.scheduler._get_cib_version())
+
+    async def test_cibadmin_failed(self):
+        self._fixture_cibadmin("", retval=102)
+        self.assertIsNone(await self.scheduler._get_cib_version())
+
+    async def test_cibadmin_missing(self):
+        self.assertIsNone(await self.scheduler._get_cib_version())
+
+    async def test_invalid_version(self):
+        self._fixture_cibadmin('<cib admin_epoch="1" epoch="22"/>')
+        self.assertIsNone(await self.scheduler._get_cib_version())
+
+
 class ProcessTasksTest(SchedulerBaseAsyncTestCase):
     async def test_empty_created_task_index(self):
         await self.scheduler._process_tasks()
@@ -230,24 +592,32 @@ def get_generator(return_values):
 
 class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
     @staticmethod
-    def _create_task(index, state=TaskState.CREATED):
+    def _create_task(index, state=TaskState.CREATED, inline=False):
         task = Task(
             f"id{index}",
             CommandDto(f"cmd{index}", {}, CommandOptionsDto()),
             AUTH_USER,
             TaskConfig(),
         )
-        if state != TaskState.CREATED:
+        if state == TaskState.EXECUTED and not inline:
+            task.receive_message(
+                Message(task.task_ident, TaskExecuted(WORKER1_PID))
+            )
+        elif state != TaskState.CREATED:
             task.state = state
         return task
 
+    def _set_task_register(self, *tasks):
+        register = TaskRegister()
+        for task in tasks:
+            register.add(task)
+        self.scheduler._task_register = register
+
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: False)
     def test_threshold_not_achieved(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2")
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._set_task_register(task1, task2)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", get_generator([True, False]))
@@ -255,9 +625,7 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.EXECUTED)
         task3 = self._create_task("3")
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._set_task_register(task1, task2, task3)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -265,27 +633,21 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.EXECUTED)
         task3 = self._create_task("3", TaskState.FINISHED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._set_task_register(task1, task2, task3)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
     def test_new_tasks_waiting(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.CREATED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._set_task_register(task1, task2)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
     def test_queued_tasks_waiting(self):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.QUEUED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2)
-        }
+        self._set_task_register(task1, task2)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -293,9 +655,7 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
         task1 = self._create_task("1", TaskState.EXECUTED)
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3)
-        }
+        self._set_task_register(task1, task2, task3)
         self.assertTrue(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -307,9 +667,7 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
         task4 = self._create_task("4", TaskState.EXECUTED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3, task4)
-        }
+        self._set_task_register(task1, task2, task3, task4)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
 
     @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
@@ -322,7 +680,20 @@ class DeadlockDetectionTest(SchedulerBaseAsyncTestCase):
         task2 = self._create_task("2", TaskState.QUEUED)
         task3 = self._create_task("3", TaskState.CREATED)
         task4 = self._create_task("4", TaskState.EXECUTED)
-        self.scheduler._task_register = {
-            task.task_ident: task for task in (task1, task2, task3, task4)
-        }
+        self._set_task_register(task1, task2, task3, task4)
+        self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+    @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
+    def test_inline_tasks_not_counted(self):
+        task1 = self._create_task("1", TaskState.EXECUTED, inline=True)
+        task2 = self._create_task("2", TaskState.QUEUED)
+        self._set_task_register(task1, task2)
         self.assertFalse(self.scheduler._is_possibly_dead_locked())
+
+    @mock.patch.object(Task, "is_defunct", lambda self, timeout: True)
+    def test_inline_tasks_with_workers_busy(self):
+        task1 = self._create_task("1", TaskState.EXECUTED)
+        task2 = self._create_task("2", TaskState.EXECUTED, inline=True)
+        task3 = self._create_task("3", TaskState.QUEUED)
+        self._set_task_register(task1, task2, task3)
+        self.assertTrue(self.scheduler._is_possibly_dead_locked())
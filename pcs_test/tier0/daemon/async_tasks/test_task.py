@@ -151,6 +151,9 @@ class TestKill(MockOsKillMixin, TaskBaseTestCase):
         self.assertEqual(types.TaskState.FINISHED, task_dto.state)
         self.assertEqual(types.TaskFinishType.KILL, task_dto.task_finish_type)
 
+    def test_kill_executed_no_worker(self):
+        self._assert_killed(types.TaskState.EXECUTED)
+
     def test_kill_finished(self):
         self._assert_not_killed(types.TaskState.FINISHED)
 
@@ -281,3 +284,57 @@ class TestAbandoned(TaskBaseTestCase):
         mock_is_timed_out.assert_called_once_with(
             task_abandoned_timeout_seconds
         )
+
+
+class TestGetNextCheckTime(MockDateTimeNowMixin, TaskBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.task._config = tasks.TaskConfig(
+            abandoned_timeout=10, unresponsive_timeout=20, deletion_timeout=30
+        )
+        self.mock_datetime_now = self._init_mock_datetime_now()
+
+    def test_created(self):
+        self.assertIsNone(self.task.get_next_check_time())
+
+    def test_queued(self):
+        self.task.state = types.TaskState.QUEUED
+        self.assertIsNone(self.task.get_next_check_time())
+
+    def test_executed(self):
+        self.task.state = types.TaskState.EXECUTED
+        self.task._last_message_at = DATETIME_NOW
+        self.assertEqual(
+            DATETIME_NOW + timedelta(seconds=20),
+            self.task.get_next_check_time(),
+        )
+
+    def test_finished(self):
+        self.task.state = types.TaskState.FINISHED
+        self.assertEqual(
+            DATETIME_NOW + timedelta(seconds=10),
+            self.task.get_next_check_time(),
+        )
+
+    def test_deletion_requested(self):
+        self.task.request_deletion()
+        self.assertEqual(
+            DATETIME_NOW + timedelta(seconds=30),
+            self.task.get_next_check_time(),
+        )
+        self.task.state = types.TaskState.FINISHED
+        self.assertEqual(
+            DATETIME_NOW + timedelta(seconds=10),
+            self.task.get_next_check_time(),
+        )
+
+
+class TestStateObserver(TaskBaseTestCase):
+    def test_notified(self):
+        observer = mock.Mock()
+        self.task.set_state_observer(observer)
+        self.task.state = types.TaskState.QUEUED
+        observer.assert_called_once_with(self.task, types.TaskState.CREATED)
+        self.task.set_state_observer(None)
+        self.task.state = types.TaskState.EXECUTED
+        observer.assert_called_once()
@@ -0,0 +1,99 @@
+from datetime import timedelta
+from unittest import TestCase
+
+from pcs.common.async_tasks.dto import CommandDto, CommandOptionsDto
+from pcs.common.async_tasks.types import TaskState
+from pcs.daemon.async_tasks.task import Task, TaskConfig
+from pcs.daemon.async_tasks.task_register import TaskRegister
+from pcs.daemon.async_tasks.types import Command
+
+from .helpers import AUTH_USER, DATETIME_NOW
+
+
+def fixture_task(task_ident):
+    return Task(
+        task_ident,
+        Command(CommandDto("command", {}, CommandOptionsDto())),
+        AUTH_USER,
+        TaskConfig(),
+    )
+
+
+class TaskRegisterTest(TestCase):
+    def setUp(self):
+        self.register = TaskRegister()
+        self.task1 = fixture_task("id1")
+        self.task2 = fixture_task("id2")
+        self.register.add(self.task1)
+        self.register.add(self.task2)
+
+    def assert_to_process(self, task_list, now=DATETIME_NOW):
+        self.assertEqual(task_list, self.register.pop_tasks_to_process(now))
+
+    def test_mapping(self):
+        self.assertEqual(2, len(self.register))
+        self.assertIn("id1", self.register)
+        self.assertNotIn("id3", self.register)
+        self.assertIs(self.task2, self.register["id2"])
+        self.assertEqual(["id1", "id2"], list(self.register))
+
+    def test_state_index(self):
+        self.assertEqual(2, self.register.count_by_state(TaskState.CREATED))
+        self.task1.state = TaskState.QUEUED
+        self.assertEqual(1, self.register.count_by_state(TaskState.CREATED))
+        self.assertEqual(
+            [self.task1], list(self.register.get_by_state(TaskState.QUEUED))
+        )
+        self.register.remove("id1")
+        self.assertEqual(0, self.register.count_by_state(TaskState.QUEUED))
+        # removed tasks do not update the register anymore
+        self.task1.state = TaskState.EXECUTED
+        self.assertEqual(0, self.register.count_by_state(TaskState.EXECUTED))
+
+    def test_touched(self):
+        self.assert_to_process([self.task1, self.task2])
+        self.assert_to_process([])
+        self.register.touch(self.task2)
+        self.task1.state = TaskState.QUEUED
+        self.assert_to_process([self.task2, self.task1])
+        self.assert_to_process([])
+
+    def test_scheduled(self):
+        self.assert_to_process([self.task1, self.task2])
+        self.register.schedule_check(
+            self.task1, DATETIME_NOW + timedelta(seconds=10)
+        )
+        self.register.schedule_check(
+            self.task2, DATETIME_NOW + timedelta(seconds=5)
+        )
+        # a later check does not postpone the scheduled one
+        self.register.schedule_check(
+            self.task2, DATETIME_NOW + timedelta(seconds=20)
+        )
+        self.assert_to_process([])
+        self.assert_to_process(
+            [self.task2], DATETIME_NOW + timedelta(seconds=5)
+        )
+        self.assert_to_process(
+            [self.task1], DATETIME_NOW + timedelta(seconds=30)
+        )
+        self.assert_to_process([], DATETIME_NOW + timedelta(seconds=30))
+
+    def test_scheduled_sooner(self):
+        self.assert_to_process([self.task1, self.task2])
+        self.register.schedule_check(
+            self.task1, DATETIME_NOW + timedelta(seconds=10)
+        )
+        self.register.schedule_check(
+            self.task1, DATETIME_NOW + timedelta(seconds=5)
+        )
+        self.assert_to_process(
+            [self.task1], DATETIME_NOW + timedelta(seconds=5)
+        )
+        self.assert_to_process([], DATETIME_NOW + timedelta(seconds=10))
+
+    def test_removed_not_processed(self):
+        self.register.schedule_check(self.task1, DATETIME_NOW)
+        self.register.remove("id1")
+        self.register.remove("id2")
+        self.assert_to_process([])
@@ -46,6 +46,7 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.NOTIFY_SOCKET: None,
             env.PCSD_DEBUG: False,
             env.PCSD_SESSION_LIFETIME: settings.gui_session_lifetime_seconds,
+            env.PCSD_SESSION_PERSISTENT: settings.gui_session_persistent,
             env.WEBUI_DIR: settings.pcsd_webui_dir,
             env.WEBUI_FALLBACK: webui_fallback(settings.pcsd_public_dir),
             env.PCSD_DEV: False,
@@ -53,11 +54,14 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.PCSD_WORKER_RESET_LIMIT: settings.pcsd_worker_reset_limit,
             env.PCSD_MAX_WORKER_COUNT: settings.pcsd_worker_count
             + settings.pcsd_temporary_workers,
+            env.PCSD_INLINE_WORKER_COUNT: settings.pcsd_inline_worker_count,
+            env.PCSD_SHARED_RESULT_TTL: settings.pcsd_shared_result_ttl_seconds,
             env.PCSD_DEADLOCK_THRESHOLD_TIMEOUT: settings.pcsd_deadlock_threshold_timeout,
             env.PCSD_CHECK_INTERVAL_MS: settings.async_api_scheduler_interval_ms,
             env.PCSD_TASK_ABANDONED_TIMEOUT: settings.task_abandoned_timeout_seconds,
             env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: settings.task_unresponsive_timeout_seconds,
             env.PCSD_TASK_DELETION_TIMEOUT: settings.task_deletion_timeout_seconds,
+            env.PCSD_FORK_SERVER_CHILD_COUNT: settings.pcsd_fork_server_child_count,
             "has_errors": False,
         }
         if specific_env_values is None:
@@ -84,15 +88,19 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             env.NOTIFY_SOCKET: "xyz",
             env.PCSD_DEBUG: "true",
             env.PCSD_SESSION_LIFETIME: str(session_lifetime),
+            env.PCSD_SESSION_PERSISTENT: "true",
             env.PCSD_DEV: "true",
             env.PCSD_WORKER_COUNT: "1",
             env.PCSD_WORKER_RESET_LIMIT: "2",
             env.PCSD_MAX_WORKER_COUNT: "3",
+            env.PCSD_INLINE_WORKER_COUNT: "0",
+            env.PCSD_SHARED_RESULT_TTL: "9",
             env.PCSD_DEADLOCK_THRESHOLD_TIMEOUT: "4",
             env.PCSD_CHECK_INTERVAL_MS: "5",
             env.PCSD_TASK_ABANDONED_TIMEOUT: "6",
             env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: "7",
             env.PCSD_TASK_DELETION_TIMEOUT: "8",
+            env.PCSD_FORK_SERVER_CHILD_COUNT: "0",
         }
         self.assert_environ_produces_modified_pcsd_env(
             environ=environ,
@@ -104,17 +112,21 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 env.NOTIFY_SOCKET: environ[env.NOTIFY_SOCKET],
                 env.PCSD_DEBUG: True,
                 env.PCSD_SESSION_LIFETIME: session_lifetime,
+                env.PCSD_SESSION_PERSISTENT: True,
                 env.WEBUI_DIR: env.LOCAL_WEBUI_DIR,
                 env.WEBUI_FALLBACK: webui_fallback(env.LOCAL_PUBLIC_DIR),
                 env.PCSD_DEV: True,
                 env.PCSD_WORKER_COUNT: 1,
                 env.PCSD_WORKER_RESET_LIMIT: 2,
                 env.PCSD_MAX_WORKER_COUNT: 3,
+                env.PCSD_INLINE_WORKER_COUNT: 0,
+                env.PCSD_SHARED_RESULT_TTL: 9,
                 env.PCSD_DEADLOCK_THRESHOLD_TIMEOUT: 4,
                 env.PCSD_CHECK_INTERVAL_MS: 5,
                 env.PCSD_TASK_ABANDONED_TIMEOUT: 6,
                 env.PCSD_TASK_UNRESPONSIVE_TIMEOUT: 7,
                 env.PCSD_TASK_DELETION_TIMEOUT: 8,
+                env.PCSD_FORK_SERVER_CHILD_COUNT: 0,
             },
         )
 
@@ -129,6 +141,13 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
             ],
         )
 
+    @mock.patch.object(env.settings, "gui_session_persistent", True)
+    def test_session_persistent_disabled(self):
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_SESSION_PERSISTENT: "false"},
+            specific_env_values={env.PCSD_SESSION_PERSISTENT: False},
+        )
+
     def test_report_invalid_ssl_ciphers(self):
         environ = {env.PCSD_SSL_CIPHERS: "invalid ;@{}+ ciphers"}
         self.assert_environ_produces_modified_pcsd_env(
@@ -285,3 +304,15 @@ class Prepare(TestCase, create_setup_patch_mixin(env)):
                 f"Value '-1' for '{env.PCSD_TASK_DELETION_TIMEOUT}' is not a non-negative integer"
             ],
         )
+
+    def test_invalid_fork_server_child_count(self):
+        self.assert_environ_produces_modified_pcsd_env(
+            environ={env.PCSD_FORK_SERVER_CHILD_COUNT: "-1"},
+            specific_env_values={
+                env.PCSD_FORK_SERVER_CHILD_COUNT: settings.pcsd_fork_server_child_count,
+                "has_errors": True,
+            },
+            errors=[
+                f"Value '-1' for '{env.PCSD_FORK_SERVER_CHILD_COUNT}' is not a non-negative integer"
+            ],
+        )
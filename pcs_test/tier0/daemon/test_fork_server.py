@@ -0,0 +1,160 @@
+import json
+import os
+import socket
+import sys
+import time
+from unittest import TestCase
+
+from pcs.daemon import fork_server
+
+from pcs_test.tools.misc import get_tmp_dir
+
+_STATE = []
+
+
+def _echo():
+    _STATE.append(sys.argv)
+    print(
+        json.dumps(
+            {
+                "argv": sys.argv,
+                "stdin": sys.stdin.read(),
+                "cib_env": {
+                    name: value
+                    for name, value in os.environ.items()
+                    if name.startswith("CIB_")
+                },
+                "state": len(_STATE),
+                # the last one is the descriptor of the listed directory
+                "fds": sorted(int(fd) for fd in os.listdir("/proc/self/fd")),
+            }
+        )
+    )
+    sys.stderr.write("warning\n")
+    if len(sys.argv) > 1:
+        sys.exit(int(sys.argv[1]))
+
+
+def _fail():
+    raise RuntimeError("failure")
+
+
+def _sleep():
+    time.sleep(float(sys.argv[1]))
+
+
+def _load_entry_points():
+    return {"echo": _echo, "fail": _fail, "sleep": _sleep}
+
+
+class ForkServer(TestCase):
+    def setUp(self):
+        tmp_dir = get_tmp_dir("tier0_daemon_fork_server")
+        self.addCleanup(tmp_dir.cleanup)
+        self.socket_path = os.path.join(tmp_dir.name, "fork-server.socket")
+
+    def start_server(self, max_children=2, max_queued=2):
+        pid = fork_server.start(
+            self.socket_path,
+            max_children,
+            max_queued,
+            command_timeout=60,
+            load_entry_points=_load_entry_points,
+        )
+
+        def stop():
+            fork_server.stop(pid)
+            os.waitpid(pid, 0)
+
+        self.addCleanup(stop)
+
+    def send(self, request):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.socket_path)
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            return self.receive(connection)
+
+    @staticmethod
+    def receive(connection):
+        response = b""
+        while data := connection.recv(4096):
+            response += data
+        return json.loads(response)
+
+    def test_socket_permissions(self):
+        self.start_server()
+        self.assertEqual(0o600, os.stat(self.socket_path).st_mode & 0o777)
+
+    def test_run_command(self):
+        self.start_server()
+        for _ in range(2):
+            response = self.send(
+                {
+                    "executable": "echo",
+                    "argv": ["3", "a b"],
+                    "stdin": "input\n",
+                    "env": {"CIB_user": "hacluster"},
+                }
+            )
+            self.assertEqual("warning\n", response["stderr"])
+            self.assertEqual(3, response["retval"])
+            self.assertEqual(
+                {
+                    "argv": ["echo", "3", "a b"],
+                    "stdin": "input\n",
+                    "cib_env": {"CIB_user": "hacluster"},
+                    # each command starts with the state of the server
+                    "state": 1,
+                    "fds": [0, 1, 2, 3],
+                },
+                json.loads(response["stdout"]),
+            )
+
+    def test_exception(self):
+        self.start_server()
+        response = self.send({"executable": "fail"})
+        self.assertEqual("", response["stdout"])
+        self.assertIn("RuntimeError: failure", response["stderr"])
+        self.assertEqual(1, response["retval"])
+
+    def test_timeout(self):
+        self.start_server()
+        response = self.send(
+            {"executable": "sleep", "argv": ["30"], "timeout": 1}
+        )
+        self.assertEqual(
+            "Error: Command has been terminated after 1 seconds\n",
+            response["stderr"],
+        )
+        self.assertNotEqual(0, response["retval"])
+
+    def test_invalid_request(self):
+        self.start_server()
+        self.assertEqual(
+            {"error": "Invalid request: unknown executable 'pcs'"},
+            self.send({"executable": "pcs"}),
+        )
+        self.assertEqual(
+            {"error": "Invalid request: invalid arguments"},
+            self.send({"executable": "echo", "argv": "3"}),
+        )
+
+    def test_too_many_commands(self):
+        self.start_server(max_children=1, max_queued=1)
+        connections = []
+        for _ in range(3):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.addCleanup(connection.close)
+            connection.connect(self.socket_path)
+            connection.sendall(
+                json.dumps({"executable": "sleep", "argv": ["1"]}).encode()
+                + b"\n"
+            )
+            connections.append(connection)
+            time.sleep(0.3)
+        self.assertEqual(
+            {"error": "Too many commands are waiting"},
+            self.receive(connections[2]),
+        )
+        for connection in connections[:2]:
+            self.assertEqual(0, self.receive(connection)["retval"])
@@ -61,8 +61,9 @@ class ManageTest(TestCase, create_setup_patch_mixin(http_server)):
         self.assertEqual(0, len(self.server_list))
         self.assertFalse(self.https_server_manage.server_is_running)
 
-    def HTTPServer(self, app, ssl_options=None):
+    def HTTPServer(self, app, ssl_options=None, decompress_request=False):
         self.assertEqual(self.app, app)
+        self.assertTrue(decompress_request)
         if ssl_options is not None:
             self.assertEqual(
                 self.pcsd_ssl.create_context.return_value, ssl_options
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from pcs.daemon.metrics import Histogram, MetricsRegistry
+
+
+class HistogramTest(TestCase):
+    def test_empty(self):
+        self.assertEqual(
+            dict(count=0, sum=0.0, buckets={"0.1": 0, "1.0": 0, "+Inf": 0}),
+            Histogram([0.1, 1.0]).to_dict(),
+        )
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram([0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+            histogram.observe(value)
+        self.assertEqual(
+            dict(count=5, sum=5.65, buckets={"0.1": 2, "1.0": 3, "+Inf": 5}),
+            histogram.to_dict(),
+        )
+
+
+class MetricsRegistryTest(TestCase):
+    def test_requests_and_commands(self):
+        registry = MetricsRegistry()
+        registry.observe_request("GET /remote/status", 0.2)
+        registry.observe_request("GET /remote/status", 0.3)
+        registry.observe_command("resource.create", 1.5)
+        result = registry.to_dict()
+        self.assertEqual(["GET /remote/status"], list(result["requests"]))
+        self.assertEqual(2, result["requests"]["GET /remote/status"]["count"])
+        self.assertEqual(["resource.create"], list(result["commands"]))
+        self.assertEqual(1.5, result["commands"]["resource.create"]["sum"])
+
+    def test_endpoints_limit(self):
+        registry = MetricsRegistry(max_endpoints=2)
+        for endpoint in ("a", "b", "c", "d", "a"):
+            registry.observe_request(endpoint, 0.1)
+        requests = registry.to_dict()["requests"]
+        self.assertEqual(["a", "b", "other"], list(requests))
+        self.assertEqual(2, requests["a"]["count"])
+        self.assertEqual(2, requests["other"]["count"])
+
+    def test_sources(self):
+        registry = MetricsRegistry()
+        registry.register_source("cfgsync", lambda: dict(sync_count=3))
+        self.assertEqual(
+            dict(requests={}, commands={}, cfgsync=dict(sync_count=3)),
+            registry.to_dict(),
+        )
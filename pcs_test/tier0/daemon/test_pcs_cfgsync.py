@@ -10,7 +10,11 @@ from pcs.common.host import Destination, PcsKnownHost
 from pcs.common.interface.dto import to_dict
 from pcs.common.pcs_cfgsync_dto import SyncConfigsDto
 from pcs.common.reports.processor import ReportProcessorToLog
-from pcs.daemon.pcs_cfgsync import CfgSyncPullManager
+from pcs.daemon.pcs_cfgsync import (
+    CfgSyncMetrics,
+    CfgSyncPullManager,
+    CfgSyncScheduler,
+)
 from pcs.lib.corosync.config_facade import ConfigFacade as CorosyncFacade
 from pcs.lib.corosync.config_parser import Exporter as CorosyncExporter
 from pcs.lib.host.config.exporter import Exporter as KnownHostsExporter
@@ -98,10 +102,10 @@ class RunCfgSync(TestCase):
         env = self.env_assist.get_env()
         self.logger = env.logger
         report_processor = ReportProcessorToLog(self.logger)
-        puller = CfgSyncPullManager(
+        self.puller = CfgSyncPullManager(
             report_processor, env.get_node_communicator(), self.logger
         )
-        return puller.run_cfgsync()
+        return self.puller.run_cfgsync()
 
     def assert_logger_calls(self, expected_calls):
         self.assertIsNotNone(
@@ -178,6 +182,24 @@ class RunCfgSync(TestCase):
         )
         self.assertEqual(result, settings.pcs_cfgsync_thread_interval_default)
 
+    def test_no_corosync_metrics_not_updated(self):
+        self.config.raw_file.exists(
+            file_type_codes.PCS_CFGSYNC_CTL,
+            settings.pcs_cfgsync_ctl_location,
+            exists=False,
+            name="pcs_cfgsync_ctl.exists",
+        )
+        self.config.raw_file.exists(
+            file_type_codes.COROSYNC_CONF,
+            settings.corosync_conf_file,
+            exists=False,
+            name="corosync_conf.exists",
+        )
+
+        self.run_cfgsync()
+
+        self.assertEqual(self.puller.metrics, CfgSyncMetrics())
+
     def test_no_corosync_no_cfgsync_ctl(self):
         self.config.raw_file.exists(
             file_type_codes.PCS_CFGSYNC_CTL,
@@ -481,6 +503,12 @@ class RunCfgSync(TestCase):
             ]
         )
         self.assertEqual(result, settings.pcs_cfgsync_thread_interval_default)
+        metrics = self.puller.metrics
+        self.assertEqual(metrics.sync_count, 1)
+        self.assertFalse(metrics.last_sync_changed)
+        self.assertTrue(metrics.last_sync_connected)
+        self.assertIsNotNone(metrics.last_sync_time)
+        self.assertEqual(metrics.config_versions, {})
 
     def test_fetch_known_hosts_newer_than_local(self):
         self.fixture_before_fetch_config_files_all_successful()
@@ -738,3 +766,97 @@ class RunCfgSync(TestCase):
             ]
         )
         self.assertEqual(result, settings.pcs_cfgsync_thread_interval_default)
+        metrics = self.puller.metrics
+        self.assertEqual(metrics.sync_count, 1)
+        self.assertTrue(metrics.last_sync_changed)
+        self.assertTrue(metrics.last_sync_connected)
+        self.assertGreater(metrics.received_bytes, 0)
+        self.assertEqual(
+            metrics.config_versions,
+            {
+                file_type_codes.PCS_KNOWN_HOSTS: 99,
+                file_type_codes.PCS_SETTINGS_CONF: 99,
+            },
+        )
+
+
+class CfgSyncMetricsToDict(TestCase):
+    def test_success(self):
+        metrics = CfgSyncMetrics(
+            last_sync_time=1000.5,
+            last_sync_changed=True,
+            last_sync_connected=True,
+            sync_count=2,
+            received_bytes=300,
+            config_versions={
+                file_type_codes.PCS_SETTINGS_CONF: 5,
+                file_type_codes.PCS_KNOWN_HOSTS: 7,
+            },
+        )
+        self.assertEqual(
+            json.loads(json.dumps(metrics.to_dict())),
+            dict(
+                last_sync_time=1000.5,
+                last_sync_changed=True,
+                last_sync_connected=True,
+                sync_count=2,
+                received_bytes=300,
+                config_versions={
+                    file_type_codes.PCS_KNOWN_HOSTS: 7,
+                    file_type_codes.PCS_SETTINGS_CONF: 5,
+                },
+            ),
+        )
+
+
+@mock.patch("pcs.daemon.pcs_cfgsync.random.uniform", lambda a, b: 0)
+class CfgSyncSchedulerGetNextInterval(TestCase):
+    def setUp(self):
+        self.metrics = CfgSyncMetrics()
+        pull_manager = mock.Mock(spec_set=CfgSyncPullManager)
+        pull_manager.metrics = self.metrics
+        self.scheduler = CfgSyncScheduler(
+            pull_manager, mock.Mock(), mock.Mock()
+        )
+
+    def assert_intervals(self, expected_intervals):
+        self.assertEqual(
+            [
+                self.scheduler.get_next_interval(100, synced=True)
+                for _ in expected_intervals
+            ],
+            expected_intervals,
+        )
+
+    def test_backoff_when_nothing_changes(self):
+        self.metrics.last_sync_connected = True
+        self.assert_intervals([100, 200, 400, 800, 800])
+
+    def test_no_backoff_when_not_connected(self):
+        self.assert_intervals([100, 100, 100])
+
+    def test_backoff_reset_on_change(self):
+        self.metrics.last_sync_connected = True
+        self.assert_intervals([100, 200, 400])
+        self.metrics.last_sync_changed = True
+        self.assert_intervals([100, 100])
+
+    def test_backoff_reset_on_not_synced(self):
+        self.metrics.last_sync_connected = True
+        self.assert_intervals([100, 200, 400])
+        self.assertEqual(self.scheduler.get_next_interval(60, synced=False), 60)
+        self.assert_intervals([100, 200])
+
+    def test_jitter(self):
+        with mock.patch(
+            "pcs.daemon.pcs_cfgsync.random.uniform", lambda a, b: b
+        ):
+            self.assertAlmostEqual(
+                self.scheduler.get_next_interval(100, synced=True), 110
+            )
+
+    def test_backoff_reset_on_request(self):
+        self.metrics.last_sync_connected = True
+        self.assert_intervals([100, 200, 400])
+        self.scheduler.request_sync()
+        self.assert_intervals([100, 200])
@@ -1,3 +1,5 @@
+import json
+import os
 from contextlib import contextmanager
 from unittest import TestCase
 
@@ -8,6 +10,7 @@ except ImportError:
 
 from pcs_test.tools.misc import (
     create_setup_patch_mixin,
+    get_tmp_dir,
     skip_unless_webui_installed,
 )
 
@@ -87,3 +90,104 @@ class StorageTest(TestCase, PatchSessionMixin):
         session1 = self.storage.login(USER)
         self.assertIsNotNone(session1)
         self.assertEqual(session1.username, USER)
+
+    def test_used_session_does_not_expire(self):
+        session1 = self.storage.login(USER)
+        # reading sid refreshes the session
+        sid = session1.sid
+        for time in (8, 16, 24):
+            self.now.return_value = time
+            self.assertIs(self.storage.get(sid), session1)
+        self.now.return_value = 35
+        self.assertIsNone(self.storage.get(sid))
+
+    def test_destroyed_session_not_dropped_again(self):
+        session1 = self.storage.login(USER)
+        self.storage.destroy(session1.sid)
+        self.now.return_value = 11
+        self.storage.drop_expired()
+        self.assertIsNone(self.storage.get(session1.sid))
+
+
+@skip_unless_webui_installed()
+class PersistentStorageTest(TestCase, PatchSessionMixin):
+    def setUp(self):
+        self.now = self.setup_patch("session.now", return_value=0)
+        tmp_dir = get_tmp_dir("tier0_daemon_session")
+        self.addCleanup(tmp_dir.cleanup)
+        self.session_file = os.path.join(tmp_dir.name, "sessions")
+
+    def storage(self):
+        return webui.session.Storage(
+            lifetime_seconds=100, session_file=self.session_file
+        )
+
+    def read_records(self):
+        with open(self.session_file) as session_file:
+            return [json.loads(line) for line in session_file]
+
+    def test_sessions_kept(self):
+        storage1 = self.storage()
+        session1 = storage1.login(USER)
+        session2 = storage1.login("another user")
+        storage2 = self.storage()
+        self.assertEqual(USER, storage2.get(session1.sid).username)
+        self.assertEqual("another user", storage2.get(session2.sid).username)
+        self.assertEqual(0o600, os.stat(self.session_file).st_mode & 0o777)
+
+    def test_destroyed_session_not_kept(self):
+        storage1 = self.storage()
+        session1 = storage1.login(USER)
+        storage1.destroy(session1.sid)
+        self.assertIsNone(self.storage().get(session1.sid))
+
+    def test_expired_session_not_kept(self):
+        storage1 = self.storage()
+        session1 = storage1.login(USER)
+        self.now.return_value = 101
+        self.assertIsNone(self.storage().get(session1.sid))
+        self.assertEqual([], self.read_records())
+
+    def test_access_saved(self):
+        storage1 = self.storage()
+        session1 = storage1.login(USER)
+        # access is not saved on every request
+        self.now.return_value = 30
+        storage1.get(session1.sid)
+        self.now.return_value = 90
+        storage1.get(session1.sid)
+        self.assertEqual(
+            [0, 90], [record["last_access"] for record in self.read_records()]
+        )
+        self.now.return_value = 180
+        self.assertIsNotNone(self.storage().get(session1.sid))
+
+    def test_file_compacted(self):
+        storage1 = self.storage()
+        session_list = [storage1.login(USER) for _ in range(5)]
+        for session in session_list[:4]:
+            storage1.destroy(session.sid)
+        self.assertEqual(9, len(self.read_records()))
+        self.storage()
+        self.assertEqual(
+            [session_list[4].sid],
+            [record["sid"] for record in self.read_records()],
+        )
+
+    def test_invalid_records_ignored(self):
+        with open(self.session_file, "w") as session_file:
+            session_file.write(
+                json.dumps({"sid": "sid1", "username": USER, "last_access": 0})
+                + "\n"
+                + "{}\n"
+                + '{"sid": "sid2", "username": '
+            )
+        storage = self.storage()
+        self.assertEqual(USER, storage.get("sid1").username)
+        self.assertIsNone(storage.get("sid2"))
+
+    def test_unable_to_save(self):
+        os.mkdir(self.session_file)
+        storage = self.storage()
+        session1 = storage.login(USER)
+        self.assertIs(session1, storage.get(session1.sid))
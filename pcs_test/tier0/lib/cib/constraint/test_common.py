@@ -5,6 +5,7 @@ from lxml import etree
 from pcs.common import const, reports
 from pcs.lib.cib.constraint.common import (
     DuplicatesChecker,
+    DuplicatesCheckerSetConstraint,
     create_constraint_with_set,
     find_constraints_of_same_type,
     is_constraint,
@@ -187,6 +188,88 @@ class DuplicatesCheckerTest(DuplicatesCheckerTestBase):
         self.assert_success(cib, checker, duplicates)
 
 
+class DuplicatesCheckerSignatureTest(DuplicatesCheckerTestBase):
+    class MockChecker(DuplicatesChecker):
+        def _get_signature_list(self, constraint_el):
+            return [int(constraint_el.attrib["id"][-1]) % 2]
+
+    def test_success(self):
+        cib = fixture_cib()
+        duplicates = {
+            f"{type_id}{number}": (
+                [] if number == 2 else [f"{type_id}{4 - number}"]
+            )
+            for type_id in ("LP", "LS", "CP", "CS", "OP", "OS", "TP", "TS")
+            for number in (1, 2, 3)
+        }
+        checker = self.MockChecker()
+        self.assert_success(cib, checker, duplicates)
+
+
+class DuplicatesCheckerSetConstraintTest(TestCase):
+    @staticmethod
+    def _check(checker, cib, constraint_id):
+        return [
+            report.message.to_dto().payload["constraint_ids"]
+            for report in checker.check(
+                cib, cib.xpath(".//*[@id=$id]", id=constraint_id)[0]
+            )
+        ]
+
+    @staticmethod
+    def _append(cib, constraint_id, resource_ids):
+        constraint_el = etree.SubElement(
+            cib, "rsc_order", {"id": constraint_id}
+        )
+        set_el = etree.SubElement(constraint_el, "resource_set")
+        for resource_id in resource_ids:
+            etree.SubElement(set_el, "resource_ref", {"id": resource_id})
+        return constraint_el
+
+    def test_no_duplicates(self):
+        cib = fixture_cib()
+        checker = DuplicatesCheckerSetConstraint()
+        for constraint_id in ("LS1", "CS2", "OS3", "TS1"):
+            with self.subTest(constraint_id=constraint_id):
+                self.assertEqual(self._check(checker, cib, constraint_id), [])
+
+    def test_appended_constraints(self):
+        cib = fixture_cib()
+        checker = DuplicatesCheckerSetConstraint()
+        self._append(cib, "OS4", ["R1", "R2"])
+        self.assertEqual(self._check(checker, cib, "OS4"), [["OS1"]])
+        self._append(cib, "OS5", ["R1", "R2"])
+        self.assertEqual(self._check(checker, cib, "OS5"), [["OS1", "OS4"]])
+        self._append(cib, "OS6", ["R2", "R1"])
+        self.assertEqual(self._check(checker, cib, "OS6"), [])
+
+    def test_removed_constraints(self):
+        cib = fixture_cib()
+        checker = DuplicatesCheckerSetConstraint()
+        self._append(cib, "OS4", ["R1", "R2"])
+        self.assertEqual(self._check(checker, cib, "OS4"), [["OS1"]])
+        cib.remove(cib.xpath(".//*[@id='OS1']")[0])
+        self.assertEqual(self._check(checker, cib, "OS4"), [])
+        cib.remove(cib.xpath(".//*[@id='OS4']")[0])
+        self._append(cib, "OS5", ["R2", "R3"])
+        self.assertEqual(self._check(checker, cib, "OS5"), [["OS2"]])
+
+    def test_inserted_constraints(self):
+        cib = fixture_cib()
+        checker = DuplicatesCheckerSetConstraint()
+        self.assertEqual(self._check(checker, cib, "OS1"), [])
+        cib.insert(0, self._append(cib, "OS4", ["R1", "R2"]))
+        self.assertEqual(self._check(checker, cib, "OS1"), [["OS4"]])
+
+    def test_another_section(self):
+        checker = DuplicatesCheckerSetConstraint()
+        cib = fixture_cib()
+        self.assertEqual(self._check(checker, cib, "OS1"), [])
+        cib = fixture_cib()
+        self._append(cib, "OS4", ["R1", "R2"])
+        self.assertEqual(self._check(checker, cib, "OS1"), [["OS4"]])
+
+
 class ValidateConstrainableElement(TestCase):
     _cib = str_to_etree(
         """
@@ -958,3 +958,11 @@ class Parser(TestCase):
                         exception_data, (e.lineno, e.colno, e.pos, e.msg)
                     )
                 self.assertEqual(rule_string, e.rule_string)
+
+
+class ParseRuleCache(TestCase):
+    def test_parsed_rules_cached(self):
+        self.assertIs(
+            rule.parse_rule("date gt 2014-06-26"),
+            rule.parse_rule("date gt 2014-06-26"),
+        )
@@ -0,0 +1,276 @@
+import json
+import os
+from unittest import TestCase, mock
+
+from lxml import etree
+
+from pcs.lib.cib import checkpoint
+
+from pcs_test.tools.fixture_cib import modify_cib
+from pcs_test.tools.misc import get_tmp_dir, read_test_resource
+
+FIXTURE_RESOURCES = """
+    <resources>
+        <primitive id="A" class="ocf" provider="pacemaker" type="Dummy"/>
+        <group id="G">
+            <primitive id="B" class="ocf" provider="pacemaker" type="Dummy"/>
+        </group>
+    </resources>
+"""
+FIXTURE_RESOURCES_CHANGED = """
+    <resources>
+        <group id="G">
+            <primitive id="B" class="ocf" provider="pacemaker" type="Stateful"/>
+        </group>
+        <primitive id="C" class="ocf" provider="pacemaker" type="Dummy"/>
+    </resources>
+"""
+FIXTURE_CONSTRAINTS = """
+    <constraints>
+        <rsc_location id="L1" rsc="A" node="node1" score="INFINITY"/>
+        <rsc_order id="O1" first="A" then="G"/>
+    </constraints>
+"""
+FIXTURE_CONSTRAINTS_CHANGED = """
+    <constraints>
+        <rsc_location id="L1" rsc="A" node="node2" score="INFINITY"/>
+    </constraints>
+"""
+
+
+def fixture_crm_config(**properties):
+    return """
+        <crm_config>
+            <cluster_property_set id="cib-bootstrap-options">
+                {}
+            </cluster_property_set>
+        </crm_config>
+    """.format(
+        "\n".join(
+            f'<nvpair id="opt-{name}" name="{name}" value="{value}"/>'
+            for name, value in properties.items()
+        )
+    )
+
+
+def fixture_snapshot(**modifiers):
+    return checkpoint.get_configuration_snapshot(
+        etree.fromstring(
+            modify_cib(read_test_resource("cib-empty.xml"), **modifiers)
+        )
+    )
+
+
+class GetCheckpointIndex(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_cib_checkpoint")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cib_dir = os.path.join(self.tmp_dir.name, "cib")
+        os.mkdir(self.cib_dir)
+        self.index_path = os.path.join(self.tmp_dir.name, "index.json")
+
+    def write_checkpoint(self, number, epoch, timestamp):
+        path = checkpoint.get_checkpoint_path(self.cib_dir, number)
+        with open(path, "w") as checkpoint_file:
+            checkpoint_file.write(
+                f'<cib admin_epoch="0" epoch="{epoch}" num_updates="3">'
+                "<configuration/></cib>"
+            )
+        os.utime(path, (timestamp, timestamp))
+        return path
+
+    def test_no_checkpoints(self):
+        self.assertEqual(
+            [], checkpoint.get_checkpoint_index(self.cib_dir, self.index_path)
+        )
+
+    def test_missing_dir(self):
+        with self.assertRaises(OSError):
+            checkpoint.get_checkpoint_index(
+                os.path.join(self.tmp_dir.name, "missing")
+            )
+
+    def test_sorted_by_time(self):
+        self.write_checkpoint(1, 10, 3000)
+        self.write_checkpoint(2, 11, 1000)
+        self.write_checkpoint(3, 12, 2000)
+        with open(os.path.join(self.cib_dir, "cib-4.raw.sig"), "w") as sig:
+            sig.write("signature")
+        with open(os.path.join(self.cib_dir, "cib-5.raw"), "w") as broken:
+            broken.write("not an xml")
+
+        index = checkpoint.get_checkpoint_index(self.cib_dir)
+
+        self.assertEqual([2, 3, 1], [info.number for info in index])
+        self.assertEqual(
+            [(0, 11, 3), (0, 12, 3), (0, 10, 3)],
+            [info.epoch for info in index],
+        )
+        self.assertEqual(
+            [1000.0, 2000.0, 3000.0], [info.timestamp for info in index]
+        )
+        self.assertEqual(
+            checkpoint.get_checkpoint_path(self.cib_dir, 2), index[0].path
+        )
+        self.assertEqual(64, len(index[0].content_hash))
+        self.assertNotEqual(index[0].content_hash, index[1].content_hash)
+
+    def test_saved_index_reused(self):
+        self.write_checkpoint(1, 10, 1000)
+        self.write_checkpoint(2, 11, 2000)
+        first_index = checkpoint.get_checkpoint_index(
+            self.cib_dir, self.index_path
+        )
+        self.assertTrue(os.path.exists(self.index_path))
+
+        # a changed checkpoint is read again, the others are taken from the
+        # saved index
+        self.write_checkpoint(2, 21, 3000)
+        with mock.patch(
+            "pcs.lib.cib.checkpoint._read_index_entry",
+            wraps=checkpoint._read_index_entry,
+        ) as mock_read:
+            second_index = checkpoint.get_checkpoint_index(
+                self.cib_dir, self.index_path
+            )
+        mock_read.assert_called_once()
+
+        self.assertEqual(first_index[0], second_index[0])
+        self.assertEqual((0, 21, 3), second_index[1].epoch)
+        with open(self.index_path) as index_file:
+            self.assertEqual(
+                [0, 21, 3],
+                json.load(index_file)["checkpoints"]["cib-2.raw"]["epoch"],
+            )
+
+    def test_broken_index_ignored(self):
+        self.write_checkpoint(1, 10, 1000)
+        with open(self.index_path, "w") as index_file:
+            index_file.write("[1, 2")
+        self.assertEqual(
+            [1],
+            [
+                info.number
+                for info in checkpoint.get_checkpoint_index(
+                    self.cib_dir, self.index_path
+                )
+            ],
+        )
+
+
+class DiffSnapshots(TestCase):
+    def test_no_differences(self):
+        diff = checkpoint.diff_snapshots(
+            fixture_snapshot(
+                resources=FIXTURE_RESOURCES,
+                constraints=FIXTURE_CONSTRAINTS,
+                crm_config=fixture_crm_config(a="1"),
+            ),
+            fixture_snapshot(
+                resources=FIXTURE_RESOURCES,
+                constraints=FIXTURE_CONSTRAINTS,
+                crm_config=fixture_crm_config(a="1"),
+            ),
+        )
+        self.assertTrue(diff.is_empty)
+
+    def test_differences(self):
+        diff = checkpoint.diff_snapshots(
+            fixture_snapshot(
+                resources=FIXTURE_RESOURCES,
+                constraints=FIXTURE_CONSTRAINTS,
+                crm_config=fixture_crm_config(a="1", b="2"),
+            ),
+            fixture_snapshot(
+                resources=FIXTURE_RESOURCES_CHANGED,
+                constraints=FIXTURE_CONSTRAINTS_CHANGED,
+                crm_config=fixture_crm_config(b="3", c="4"),
+                fencing_topology="""
+                    <fencing-topology>
+                        <fencing-level
+                            id="fl1" index="1" devices="S1" target="node1"
+                        />
+                    </fencing-topology>
+                """,
+            ),
+        )
+        self.assertFalse(diff.is_empty)
+        self.assertEqual(
+            [
+                ("A", checkpoint.CHANGE_REMOVED),
+                ("B", checkpoint.CHANGE_CHANGED),
+                ("C", checkpoint.CHANGE_ADDED),
+            ],
+            diff.resources,
+        )
+        self.assertEqual(
+            [
+                ("L1", checkpoint.CHANGE_CHANGED),
+                ("O1", checkpoint.CHANGE_REMOVED),
+            ],
+            diff.constraints,
+        )
+        self.assertEqual(
+            [("a", "1", None), ("b", "2", "3"), ("c", None, "4")],
+            diff.properties,
+        )
+        self.assertEqual(
+            [("fencing-topology", checkpoint.CHANGE_ADDED)],
+            diff.other_sections,
+        )
+
+    def test_whitespace_in_other_sections(self):
+        diff = checkpoint.diff_snapshots(
+            fixture_snapshot(
+                fencing_topology="""
+                    <fencing-topology>
+                        <fencing-level
+                            id="fl1" index="1" devices="S1" target="node1"
+                        />
+                    </fencing-topology>
+                """,
+            ),
+            fixture_snapshot(
+                fencing_topology=(
+                    "<fencing-topology><fencing-level devices='S1' id='fl1' "
+                    "index='1' target='node1'/></fencing-topology>"
+                ),
+            ),
+        )
+        self.assertTrue(diff.is_empty)
+
+
+class SectionToLines(TestCase):
+    def test_success(self):
+        snapshot = fixture_snapshot(
+            tags="""
+                <tags>
+                    <tag id="T1">
+                        <obj_ref id="A"/>
+                    </tag>
+                </tags>
+            """
+        )
+        self.assertEqual(
+            [
+                "<tags>",
+                '  <tag id="T1">',
+                '    <obj_ref id="A"/>',
+                "  </tag>",
+                "</tags>",
+            ],
+            checkpoint.section_to_lines(snapshot.other_sections["tags"]),
+        )
+
+
+class GetConstraintsMap(TestCase):
+    def test_split(self):
+        constraints = fixture_snapshot(
+            constraints=FIXTURE_CONSTRAINTS
+        ).constraints
+        constraints_map = checkpoint.get_constraints_map(constraints)
+        self.assertEqual(["L1", "O1"], sorted(constraints_map))
+        self.assertEqual(constraints.location, constraints_map["L1"].location)
+        self.assertEqual([], constraints_map["L1"].order)
+        self.assertEqual(constraints.order, constraints_map["O1"].order)
+        self.assertEqual([], constraints_map["O1"].location)
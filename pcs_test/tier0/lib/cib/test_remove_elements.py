@@ -6,6 +6,7 @@ from lxml.etree import _Element
 from pcs.common import reports
 from pcs.lib.cib import const
 from pcs.lib.cib import remove_elements as lib
+from pcs.lib.pacemaker.status import ClusterStatusSnapshot
 
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import (
@@ -1222,7 +1223,9 @@ class EnsureResourcesStopped(TestCase):
             """,
         )
 
-        report_list = lib.ensure_resources_stopped(state, ["A", "B", "C"], [])
+        report_list = lib.ensure_resources_stopped(
+            ClusterStatusSnapshot(state), ["A", "B", "C"], []
+        )
         self.assertEqual(report_list, [])
 
     def test_some_not_stopped(self):
@@ -1241,7 +1244,9 @@ class EnsureResourcesStopped(TestCase):
             """,
         )
 
-        report_list = lib.ensure_resources_stopped(state, ["A", "B", "C"], [])
+        report_list = lib.ensure_resources_stopped(
+            ClusterStatusSnapshot(state), ["A", "B", "C"], []
+        )
         self.assertEqual(
             report_list,
             [
@@ -1263,7 +1268,7 @@ class EnsureResourcesStopped(TestCase):
         )
 
         report_list = lib.ensure_resources_stopped(
-            state, ["A"], [reports.codes.FORCE]
+            ClusterStatusSnapshot(state), ["A"], [reports.codes.FORCE]
         )
         self.assertEqual(
             report_list,
@@ -1287,7 +1292,9 @@ class EnsureResourcesStopped(TestCase):
             """,
         )
 
-        report_list = lib.ensure_resources_stopped(state, ["C"], [])
+        report_list = lib.ensure_resources_stopped(
+            ClusterStatusSnapshot(state), ["C"], []
+        )
         self.assertEqual(
             report_list,
             [
@@ -1311,7 +1318,9 @@ class EnsureResourcesStopped(TestCase):
             """,
         )
 
-        report_list = lib.ensure_resources_stopped(state, ["A"], [])
+        report_list = lib.ensure_resources_stopped(
+            ClusterStatusSnapshot(state), ["A"], []
+        )
         self.assertEqual(
             report_list,
             [
@@ -1342,7 +1351,9 @@ class EnsureResourcesStopped(TestCase):
         """,
         )
 
-        report_list = lib.ensure_resources_stopped(state, ["C"], [])
+        report_list = lib.ensure_resources_stopped(
+            ClusterStatusSnapshot(state), ["C"], []
+        )
         self.assertEqual(report_list, [])
 
 
@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import json
 from unittest import TestCase, mock
 
@@ -150,6 +152,102 @@ class CorosyncAuthkeyVariants(TestCase):
         )
 
 
+@mock.patch("pcs.lib.communication.nodes._FILE_HASH_CHECK_MIN_LENGTH", 1)
+class CorosyncAuthkeyHashCheck(TestCase):
+    def setUp(self):
+        self.env_assist, self.config = get_env_tools(self)
+        self.existing_nodes = ["node1", "node2", "node3"]
+        self.config.env.set_known_nodes(self.existing_nodes)
+        self.config.corosync_conf.load_content(
+            corosync_conf_fixture(
+                [
+                    node_fixture(node, node_id)
+                    for node_id, node in enumerate(self.existing_nodes, 1)
+                ],
+                get_two_node(len(self.existing_nodes)),
+            )
+        )
+
+    def test_send_changed_files_only(self):
+        file_data = base64.b64encode(TEST_AUTHKEY_DEFAULT_SIZE).decode("utf-8")
+        file_definition = dict(type="corosync_authkey", rewrite_existing=True)
+
+        def put_file_call(label, output, response_code=200, **file_data):
+            return dict(
+                label=label,
+                action="remote/put_file",
+                param_list=[
+                    (
+                        "data_json",
+                        json.dumps(
+                            {"corosync authkey": file_definition | file_data}
+                        ),
+                    )
+                ],
+                output=output,
+                response_code=response_code,
+            )
+
+        def output(code):
+            return json.dumps(
+                {"files": {"corosync authkey": {"code": code, "message": ""}}}
+            )
+
+        data_sha256 = hashlib.sha256(file_data.encode("utf-8")).hexdigest()
+        self.config.http.host.check_auth(node_labels=self.existing_nodes)
+        self.config.http.place_multinode_call(
+            "http.files.put_files",
+            communication_list=[
+                [
+                    put_file_call(
+                        "node1",
+                        output("same_content"),
+                        data_sha256=data_sha256,
+                    ),
+                    put_file_call(
+                        "node2",
+                        output("content_needed"),
+                        data_sha256=data_sha256,
+                    ),
+                    # pcsd not supporting hash checks
+                    put_file_call(
+                        "node3",
+                        "Invalid input data format",
+                        response_code=400,
+                        data_sha256=data_sha256,
+                    ),
+                ],
+                [put_file_call("node2", output("rewritten"), data=file_data)],
+                [put_file_call("node3", output("rewritten"), data=file_data)],
+            ],
+        )
+        self.config.http.corosync.reload_corosync_conf(
+            node_labels=self.existing_nodes[:1],
+        )
+        cluster.corosync_authkey_change(
+            self.env_assist.get_env(),
+            corosync_authkey=TEST_AUTHKEY_DEFAULT_SIZE,
+            force_flags=[],
+        )
+        self.env_assist.assert_reports(
+            _get_file_distribution_started_report(self.existing_nodes)
+            + [
+                fixture.info(
+                    reports.codes.FILE_DISTRIBUTION_SKIPPED_UNCHANGED,
+                    node="node1",
+                    file_description="corosync authkey",
+                )
+            ]
+            + _get_file_distribution_success_reports(["node2", "node3"])
+            + [
+                fixture.info(
+                    reports.codes.COROSYNC_CONFIG_RELOADED,
+                    node=self.existing_nodes[0],
+                ),
+            ]
+        )
+
+
 @mock.patch(
     "pcs.lib.commands.cluster.misc.generate_binary_key",
     lambda random_bytes_count: TEST_AUTHKEY_DEFAULT_SIZE,
@@ -8,6 +8,7 @@ from pcs.common.cluster_dto import (
     ClusterComponentVersionDto,
     ClusterDaemonsInfoDto,
 )
+from pcs.common.services.types import ServiceState
 from pcs.common.services_dto import ServiceStatusDto
 from pcs.common.version_dto import VersionDto
 from pcs.lib.commands import cluster
@@ -88,25 +89,14 @@ class GetHostDaemonsInfo(TestCase):
             "sbd",
         ]
 
-        for service in all_services:
-            installed, enabled, running = service_states.get(
-                service, (False, False, False)
-            )
-            self.config.services.is_installed(
-                service,
-                return_value=installed,
-                name=f"services.is_installed.{service}",
-            )
-            self.config.services.is_enabled(
-                service,
-                return_value=enabled,
-                name=f"services.is_enabled.{service}",
-            )
-            self.config.services.is_running(
-                service,
-                return_value=running,
-                name=f"services.is_running.{service}",
-            )
+        self.config.services.get_states(
+            {
+                service: ServiceState(
+                    *service_states.get(service, (False, False, False))
+                )
+                for service in all_services
+            }
+        )
 
     def _configure_services_from_fixture(self):
         self._configure_all_services(
@@ -1,11 +1,17 @@
 import json
+import threading
 from unittest import TestCase, mock
 
 from pcs import settings
 from pcs.common import reports
+from pcs.common.pacemaker.resource.disable_impact import (
+    ResourceDisableImpactDto,
+    SimulatedOperationDto,
+)
 from pcs.common.reports import ReportItemSeverity as severities
 from pcs.lib.commands import resource
 from pcs.lib.errors import LibraryError
+from pcs.lib.external import ProcessTimeoutException
 
 from pcs_test.tier0.lib.commands.tag.tag_common import fixture_tags_xml
 from pcs_test.tools import fixture
@@ -2536,6 +2542,286 @@ class DisableSimulate(DisableSafeFixturesMixin, TestCase):
         )
 
 
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_rng/api/api-result.rng")
+)
+class DisableSimulateBulk(DisableSafeFixturesMixin, TestCase):
+    def fixture_load(self):
+        self.config.runner.cib.load(
+            resources=fixture_two_primitives_cib_enabled
+        )
+        self.config.runner.pcmk.load_state(
+            resources=fixture_two_primitives_status_managed
+        )
+
+    def fixture_simulation(self, name, transitions, resources, **kwargs):
+        self.tmp_file_mock_obj.extend_calls(
+            [
+                TmpFileCall(
+                    self.new_cib_file_name,
+                    new_content=self.new_cib_content,
+                ),
+                TmpFileCall(
+                    self.transitions_file_name,
+                    new_content=transitions,
+                ),
+            ]
+        )
+        self.config.runner.pcmk.simulate_cib(
+            self.new_cib_file_name,
+            self.transitions_file_name,
+            name=name,
+            resources=resources,
+            **kwargs,
+        )
+
+    @staticmethod
+    def fixture_dto(resource_or_tag_ids, disabled_resource_ids, **kwargs):
+        return ResourceDisableImpactDto(
+            resource_or_tag_ids=resource_or_tag_ids,
+            disabled_resource_ids=disabled_resource_ids,
+            other_affected_resource_ids=kwargs.get(
+                "other_affected_resource_ids", []
+            ),
+            operations=kwargs.get("operations", []),
+            timed_out=kwargs.get("timed_out", False),
+            reports=kwargs.get("reports", []),
+        )
+
+    def test_not_live(self):
+        self.config.env.set_cib_data("<cib />")
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.disable_simulate_bulk(
+                self.env_assist.get_env(), [["A"]], True
+            ),
+            [
+                fixture.error(
+                    reports.codes.LIVE_ENVIRONMENT_REQUIRED,
+                    forbidden_options=["CIB"],
+                ),
+            ],
+            expected_in_processor=False,
+        )
+
+    def test_invalid_options(self):
+        self.env_assist.assert_raise_library_error(
+            lambda: resource.disable_simulate_bulk(
+                self.env_assist.get_env(),
+                [["A"]],
+                True,
+                max_concurrency=0,
+                timeout=-1,
+            )
+        )
+        self.env_assist.assert_reports(
+            [
+                fixture.error(
+                    reports.codes.INVALID_OPTION_VALUE,
+                    option_name=option_name,
+                    option_value=option_value,
+                    allowed_values="a positive integer",
+                    cannot_be_empty=False,
+                    forbidden_characters=None,
+                )
+                for option_name, option_value in (
+                    ("max_concurrency", "0"),
+                    ("timeout", "-1"),
+                )
+            ]
+        )
+
+    def test_success(self):
+        self.fixture_load()
+        self.fixture_simulation(
+            "simulate.A",
+            self.fixture_transitions_both_stopped,
+            fixture_two_primitives_cib_disabled,
+        )
+        self.fixture_simulation(
+            "simulate.AB",
+            self.fixture_transitions_both_stopped,
+            fixture_two_primitives_cib_disabled_both,
+        )
+        self.fixture_simulation(
+            "simulate.A.error",
+            self.transitions_content,
+            fixture_two_primitives_cib_disabled,
+            stderr="some stderr",
+            returncode=1,
+        )
+
+        result = resource.disable_simulate_bulk(
+            self.env_assist.get_env(),
+            [["A"], ["A", "B"], ["X"], ["A"]],
+            True,
+            max_concurrency=1,
+        )
+        operations = [
+            SimulatedOperationDto(
+                resource_id="A", operation="stop", node="node1"
+            ),
+            SimulatedOperationDto(
+                resource_id="B", operation="stop", node="node2"
+            ),
+        ]
+        self.assertEqual(
+            result.candidates[:2],
+            [
+                self.fixture_dto(
+                    ["A"],
+                    ["A"],
+                    other_affected_resource_ids=["B"],
+                    operations=operations,
+                ),
+                self.fixture_dto(["A", "B"], ["A", "B"], operations=operations),
+            ],
+        )
+        self.assertEqual(
+            result.candidates[2],
+            self.fixture_dto(["X"], [], reports=result.candidates[2].reports),
+        )
+        self.assertEqual(
+            [reports.codes.ID_NOT_FOUND],
+            [report.message.code for report in result.candidates[2].reports],
+        )
+        self.assertEqual(
+            result.candidates[3],
+            self.fixture_dto(
+                ["A"],
+                ["A"],
+                reports=[
+                    reports.ReportItem.error(
+                        reports.messages.CibSimulateError("some stderr")
+                    ).to_dto()
+                ],
+            ),
+        )
+
+    def test_simulations_run_in_parallel(self):
+        self.fixture_load()
+        barrier = threading.Barrier(2, timeout=TIMEOUT)
+
+        def simulate(*args, **kwargs):
+            del args, kwargs
+            barrier.wait()
+            return "", [], set()
+
+        with mock.patch(
+            "pcs.lib.commands.resource._disable_run_simulate",
+            side_effect=simulate,
+        ):
+            result = resource.disable_simulate_bulk(
+                self.env_assist.get_env(),
+                [["A"], ["B"]],
+                True,
+                max_concurrency=2,
+            )
+        self.assertEqual(
+            result.candidates,
+            [self.fixture_dto(["A"], ["A"]), self.fixture_dto(["B"], ["B"])],
+        )
+
+    def test_timeout(self):
+        self.fixture_load()
+        simulate_mock = mock.Mock(
+            side_effect=ProcessTimeoutException(
+                reports.ReportItem.error(
+                    reports.messages.RunExternalProcessError(
+                        "crm_simulate", "killed"
+                    )
+                )
+            )
+        )
+        with (
+            mock.patch(
+                "pcs.lib.commands.resource._disable_run_simulate",
+                simulate_mock,
+            ),
+            mock.patch(
+                "pcs.lib.commands.resource.time.monotonic",
+                # deadline computed, the first simulation started, killed and
+                # the second one not started at all
+                side_effect=[0.0, 1.0, 6.0],
+            ),
+        ):
+            result = resource.disable_simulate_bulk(
+                self.env_assist.get_env(),
+                [["A"], ["B"]],
+                True,
+                max_concurrency=1,
+                timeout=5,
+            )
+        self.assertEqual(
+            result.candidates,
+            [
+                self.fixture_dto(["A"], ["A"], timed_out=True),
+                self.fixture_dto(["B"], ["B"], timed_out=True),
+            ],
+        )
+        simulate_mock.assert_called_once()
+        self.assertEqual(simulate_mock.call_args.kwargs, {"timeout": 4.0})
+
+    def test_simulation_error_before_timeout(self):
+        self.fixture_load()
+        report = reports.ReportItem.error(
+            reports.messages.CibSimulateError("some stderr")
+        )
+        with (
+            mock.patch(
+                "pcs.lib.commands.resource._disable_run_simulate",
+                side_effect=LibraryError(report),
+            ),
+            mock.patch(
+                "pcs.lib.commands.resource.time.monotonic",
+                side_effect=[0.0, 1.0],
+            ),
+        ):
+            result = resource.disable_simulate_bulk(
+                self.env_assist.get_env(),
+                [["A"]],
+                True,
+                timeout=5,
+            )
+        self.assertEqual(
+            result.candidates,
+            [self.fixture_dto(["A"], ["A"], reports=[report.to_dto()])],
+        )
+
+    def test_simulation_error_after_deadline(self):
+        self.fixture_load()
+        report = reports.ReportItem.error(
+            reports.messages.CibSimulateError("some stderr")
+        )
+        simulate_mock = mock.Mock(side_effect=LibraryError(report))
+        with (
+            mock.patch(
+                "pcs.lib.commands.resource._disable_run_simulate",
+                simulate_mock,
+            ),
+            mock.patch(
+                "pcs.lib.commands.resource.time.monotonic",
+                # the first simulation failed on its own, not because of the
+                # timeout, the second one not started at all
+                side_effect=[0.0, 1.0, 6.0],
+            ),
+        ):
+            result = resource.disable_simulate_bulk(
+                self.env_assist.get_env(),
+                [["A"], ["B"]],
+                True,
+                max_concurrency=1,
+                timeout=5,
+            )
+        self.assertEqual(
+            result.candidates,
+            [
+                self.fixture_dto(["A"], ["A"], reports=[report.to_dto()]),
+                self.fixture_dto(["B"], ["B"], timed_out=True),
+            ],
+        )
+        simulate_mock.assert_called_once()
+
+
 class DisableSafeMixin(DisableSafeFixturesMixin):
     def test_not_live(self):
         self.config.env.set_cib_data("<cib />")
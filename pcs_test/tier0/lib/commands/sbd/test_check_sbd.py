@@ -8,6 +8,7 @@ from pcs.common.sbd_dto import (
     SbdDeviceStatusDto,
     SbdWatchdogStatusDto,
 )
+from pcs.common.services.types import ServiceState
 from pcs.common.services_dto import ServiceStatusDto
 from pcs.lib.commands.sbd import check_sbd
 
@@ -34,9 +35,7 @@ class TestCheckSbdServiceOnly(TestCase):
         self.env_assist, self.config = get_env_tools(self)
 
     def test_all_true(self):
-        self.config.services.is_installed("sbd", return_value=True)
-        self.config.services.is_enabled("sbd", return_value=True)
-        self.config.services.is_running("sbd", return_value=True)
+        self.config.services.get_states({"sbd": ServiceState(True, True, True)})
         result = check_sbd(self.env_assist.get_env())
         self.assertEqual(
             result,
@@ -51,9 +50,9 @@ class TestCheckSbdServiceOnly(TestCase):
         )
 
     def test_not_installed(self):
-        self.config.services.is_installed("sbd", return_value=False)
-        self.config.services.is_enabled("sbd", return_value=False)
-        self.config.services.is_running("sbd", return_value=False)
+        self.config.services.get_states(
+            {"sbd": ServiceState(False, False, False)}
+        )
         result = check_sbd(self.env_assist.get_env())
         self.assertEqual(
             result,
@@ -68,9 +67,9 @@ class TestCheckSbdServiceOnly(TestCase):
         )
 
     def test_installed_not_enabled_not_running(self):
-        self.config.services.is_installed("sbd", return_value=True)
-        self.config.services.is_enabled("sbd", return_value=False)
-        self.config.services.is_running("sbd", return_value=False)
+        self.config.services.get_states(
+            {"sbd": ServiceState(True, False, False)}
+        )
         result = check_sbd(self.env_assist.get_env())
         self.assertEqual(
             result,
@@ -88,9 +87,7 @@ class TestCheckSbdServiceOnly(TestCase):
 class TestCheckSbdWatchdog(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
-        self.config.services.is_installed("sbd", return_value=True)
-        self.config.services.is_enabled("sbd", return_value=True)
-        self.config.services.is_running("sbd", return_value=True)
+        self.config.services.get_states({"sbd": ServiceState(True, True, True)})
 
     def test_watchdog_exists(self):
         self.config.runner.sbd.list_watchdogs(WATCHDOG_LIST_OUTPUT)
@@ -142,9 +139,7 @@ class TestCheckSbdWatchdog(TestCase):
 class TestCheckSbdDeviceList(TestCase):
     def setUp(self):
         self.env_assist, self.config = get_env_tools(self)
-        self.config.services.is_installed("sbd", return_value=True)
-        self.config.services.is_enabled("sbd", return_value=True)
-        self.config.services.is_running("sbd", return_value=True)
+        self.config.services.get_states({"sbd": ServiceState(True, True, True)})
 
     @mock.patch("pcs.lib.sbd.os.stat")
     def test_multiple_devices(self, mock_stat):
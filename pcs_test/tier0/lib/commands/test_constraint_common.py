@@ -39,6 +39,9 @@ def fixture_env(cib):
     env.get_cib = mock.Mock()
     env.get_cib.return_value = cib
     env.push_cib = mock.Mock()
+    env.get_constraint_duplicates_checker = lambda checker_class: (
+        checker_class()
+    )
     env.report_processor = MockLibraryReportProcessor()
     return env
 
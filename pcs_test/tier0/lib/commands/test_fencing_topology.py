@@ -31,43 +31,38 @@ patch_command = create_patcher("pcs.lib.commands.fencing_topology")
 
 @patch_command("cib_fencing_topology.add_level")
 @patch_env("push_cib")
-@patch_command("ClusterState")
-@patch_env("get_cluster_state")
+@patch_env("get_cluster_status_snapshot")
 @patch_env("get_cib")
 class AddLevel(TestCase):
     def prepare_mocks(
         self,
         mock_get_cib,
-        mock_status_dom,
         mock_status,
     ):
         mock_get_cib.return_value = "mocked cib"
-        mock_status_dom.return_value = "mock get_cluster_status_dom"
         mock_status.return_value = mock.MagicMock(
-            node_section=mock.MagicMock(nodes="nodes")
+            cluster_state=mock.MagicMock(
+                node_section=mock.MagicMock(nodes="nodes")
+            )
         )
 
     def assert_mocks(
         self,
-        mock_status_dom,
         mock_status,
         mock_push_cib,
     ):
-        mock_status_dom.assert_called_once_with()
-        mock_status.assert_called_once_with("mock get_cluster_status_dom")
+        mock_status.assert_called_once_with()
         mock_push_cib.assert_called_once_with()
 
     def test_success(
         self,
         mock_get_cib,
-        mock_status_dom,
         mock_status,
         mock_push_cib,
         mock_add_level,
     ):
         self.prepare_mocks(
             mock_get_cib,
-            mock_status_dom,
             mock_status,
         )
         lib_env = create_lib_env()
@@ -96,7 +91,6 @@ class AddLevel(TestCase):
         )
         mock_get_cib.assert_called_once_with()
         self.assert_mocks(
-            mock_status_dom,
             mock_status,
             mock_push_cib,
         )
@@ -104,14 +98,12 @@ class AddLevel(TestCase):
     def test_target_attribute_updates_cib(
         self,
         mock_get_cib,
-        mock_status_dom,
         mock_status,
         mock_push_cib,
         mock_add_level,
     ):
         self.prepare_mocks(
             mock_get_cib,
-            mock_status_dom,
             mock_status,
         )
         lib_env = create_lib_env()
@@ -141,7 +133,6 @@ class AddLevel(TestCase):
         )
         mock_get_cib.assert_called_once_with()
         self.assert_mocks(
-            mock_status_dom,
             mock_status,
             mock_push_cib,
         )
@@ -149,14 +140,12 @@ class AddLevel(TestCase):
     def test_target_regexp_updates_cib(
         self,
         mock_get_cib,
-        mock_status_dom,
         mock_status,
         mock_push_cib,
         mock_add_level,
     ):
         self.prepare_mocks(
             mock_get_cib,
-            mock_status_dom,
             mock_status,
         )
         lib_env = create_lib_env()
@@ -186,7 +175,6 @@ class AddLevel(TestCase):
         )
         mock_get_cib.assert_called_once_with()
         self.assert_mocks(
-            mock_status_dom,
             mock_status,
             mock_push_cib,
         )
@@ -382,28 +370,26 @@ class RemoveLevelsByParams(TestCase):
 
 @patch_command("cib_fencing_topology.verify")
 @patch_env("push_cib")
-@patch_command("ClusterState")
-@patch_env("get_cluster_state")
+@patch_env("get_cluster_status_snapshot")
 @patch_env("get_cib", lambda self: "mocked cib")
 class Verify(TestCase):
     def test_success(
         self,
-        mock_status_dom,
         mock_status,
         mock_push_cib,
         mock_verify,
     ):
-        mock_status_dom.return_value = "mock get_cluster_status_dom"
         mock_status.return_value = mock.MagicMock(
-            node_section=mock.MagicMock(nodes="nodes")
+            cluster_state=mock.MagicMock(
+                node_section=mock.MagicMock(nodes="nodes")
+            )
         )
         lib_env = create_lib_env()
 
         lib.verify(lib_env)
 
         mock_verify.assert_called_once_with("mocked cib", "nodes")
-        mock_status_dom.assert_called_once_with()
-        mock_status.assert_called_once_with("mock get_cluster_status_dom")
+        mock_status.assert_called_once_with()
         mock_push_cib.assert_not_called()
 
 
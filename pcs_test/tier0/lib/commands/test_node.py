@@ -265,19 +265,18 @@ class CibRunnerNodes(TestCase):
     @patch_env("get_cib", lambda self: "mocked cib")
     @patch_env("cmd_runner", lambda self: "mocked cmd_runner")
     @patch_env("ensure_wait_satisfiable")
-    @patch_command("ClusterState")
-    @patch_env("get_cluster_state")
+    @patch_env("get_cluster_status_snapshot")
     def test_wire_together_all_expected_dependencies(
         self,
-        get_cluster_state,
-        cluster_state,
+        get_cluster_status_snapshot,
         ensure_wait_satisfiable,
         push_cib,
     ):
-        cluster_state.return_value = mock.MagicMock(
-            node_section=mock.MagicMock(nodes="nodes")
+        get_cluster_status_snapshot.return_value = mock.MagicMock(
+            cluster_state=mock.MagicMock(
+                node_section=mock.MagicMock(nodes="nodes")
+            )
         )
-        get_cluster_state.return_value = "mock get_cluster_state"
         wait = 10
         ensure_wait_satisfiable.return_value = wait
 
@@ -286,8 +285,7 @@ class CibRunnerNodes(TestCase):
             self.assertEqual(runner, "mocked cmd_runner")
             self.assertEqual(nodes, "nodes")
             ensure_wait_satisfiable.assert_called_once_with(wait)
-            get_cluster_state.assert_called_once_with()
-            cluster_state.assert_called_once_with("mock get_cluster_state")
+            get_cluster_status_snapshot.assert_called_once_with()
 
         push_cib.assert_called_once_with(wait_timeout=wait)
 
@@ -10,6 +10,7 @@ from pcs.common.const import (
     PcmkRoleType,
 )
 from pcs.common.reports import codes as report_codes
+from pcs.common.services.types import ServiceState
 from pcs.common.status_dto import (
     BundleReplicaStatusDto,
     BundleStatusDto,
@@ -183,55 +184,20 @@ class FullClusterStatusPlaintextBase(TestCase):
         sbd_enabled=False,
         sbd_active=False,
     ):
-        self.config.services.is_enabled(
-            "corosync",
-            name="services.is_enabled.corosync",
-            return_value=corosync_enabled,
-        )
-        self.config.services.is_running(
-            "corosync",
-            name="services.is_running.corosync",
-            return_value=corosync_active,
-        )
-        self.config.services.is_enabled(
-            "pacemaker",
-            name="services.is_enabled.pacemaker",
-            return_value=pacemaker_enabled,
-        )
-        self.config.services.is_running(
-            "pacemaker",
-            name="services.is_running.pacemaker",
-            return_value=pacemaker_active,
-        )
-        self.config.services.is_enabled(
-            "pacemaker_remote",
-            name="services.is_enabled.pacemaker_remote",
-            return_value=pacemaker_remote_enabled,
-        )
-        self.config.services.is_running(
-            "pacemaker_remote",
-            name="services.is_running.pacemaker_remote",
-            return_value=pacemaker_remote_active,
-        )
-        self.config.services.is_enabled(
-            "pcsd",
-            name="services.is_enabled.pcsd",
-            return_value=pcsd_enabled,
-        )
-        self.config.services.is_running(
-            "pcsd",
-            name="services.is_running.pcsd",
-            return_value=pcsd_active,
-        )
-        self.config.services.is_enabled(
-            "sbd",
-            name="services.is_enabled.sbd_2",
-            return_value=sbd_enabled,
-        )
-        self.config.services.is_running(
-            "sbd",
-            name="services.is_running.sbd_2",
-            return_value=sbd_active,
+        self.config.services.get_states(
+            {
+                "corosync": ServiceState(
+                    True, corosync_enabled, corosync_active
+                ),
+                "pacemaker": ServiceState(
+                    True, pacemaker_enabled, pacemaker_active
+                ),
+                "pacemaker_remote": ServiceState(
+                    True, pacemaker_remote_enabled, pacemaker_remote_active
+                ),
+                "pcsd": ServiceState(True, pcsd_enabled, pcsd_active),
+                "sbd": ServiceState(True, sbd_enabled, sbd_active),
+            }
         )
 
 
@@ -909,6 +875,55 @@ class FullClusterStatusPlaintext(FullClusterStatusPlaintextBase):
             ),
         )
 
+    def test_daemon_status_get_states_failure(self):
+        self._fixture_config_live_minimal()
+        self.config.services.get_states(
+            {
+                service: ServiceState(True, True, True)
+                for service in (
+                    "corosync",
+                    "pacemaker",
+                    "pacemaker_remote",
+                    "pcsd",
+                    "sbd",
+                )
+            },
+            exception=LibraryError(),
+        )
+        for service, enabled, running in (
+            ("corosync", True, True),
+            ("pacemaker", True, False),
+            ("pacemaker_remote", None, None),
+            ("pcsd", True, True),
+            ("sbd", False, False),
+        ):
+            self.config.services.is_enabled(
+                service,
+                return_value=enabled,
+                exception=LibraryError() if enabled is None else None,
+                name=f"services.is_enabled.{service}",
+            )
+            if enabled is not None:
+                self.config.services.is_running(
+                    service,
+                    return_value=running,
+                    name=f"services.is_running.{service}",
+                )
+        self.config.fs.isfile(settings.crm_rule_exec, return_value=True)
+        self.assertEqual(
+            status.full_cluster_status_plaintext(self.env_assist.get_env()),
+            dedent(
+                """\
+                Cluster name: test99
+                crm_mon cluster status
+
+                Daemon Status:
+                  corosync: active/enabled
+                  pacemaker: inactive/enabled
+                  pcsd: active/enabled"""
+            ),
+        )
+
     def test_daemon_status_all_off(self):
         self._fixture_config_live_minimal()
         self._fixture_config_local_daemons(
@@ -1454,6 +1469,28 @@ class ResourcesStatus(TestCase):
             False,
         )
 
+    def test_clone_missing_attributes(self):
+        self.config.runner.pcmk.load_state(
+            resources="""
+                <resources>
+                    <clone id="C">
+                        <resource id="R7" resource_agent="ocf:pacemaker:Dummy"
+                            role="Stopped" active="false" orphaned="false"
+                            blocked="false" maintenance="false" managed="true"
+                            failed="false" failure_ignored="false"
+                            nodes_running_on="0"
+                        />
+                    </clone>
+                </resources>
+            """,
+        )
+
+        self.env_assist.assert_raise_library_error(
+            lambda: status.resources_status(self.env_assist.get_env()),
+            [fixture.error(report_codes.BAD_CLUSTER_STATE_FORMAT)],
+            False,
+        )
+
     def test_bad_xml(self):
         self.config.runner.pcmk.load_state(
             resources="""
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest import TestCase, mock
 
@@ -46,6 +47,22 @@ DEFAULT_PCMK_HOST_MAP = "node1:1;node2:2;node3:3"
 DEFAULT_NODE_KEY_MAP = {"node1": "1", "node2": "2", "node3": "3"}
 
 
+def fixture_native_digest(devices, timeout=None):
+    params = {
+        "devices": ",".join(sorted(devices)),
+        "pcmk_host_check": "static-list",
+        "pcmk_host_list": "node1 node2 node3",
+        "pcmk_host_map": DEFAULT_PCMK_HOST_MAP,
+        "pcmk_reboot_action": "off",
+    }
+    if timeout:
+        params["CRM_meta_timeout"] = timeout
+    attrs = "".join(
+        f' {name}="{value}"' for name, value in sorted(params.items())
+    )
+    return hashlib.md5(f"<parameters{attrs}/>".encode()).hexdigest()
+
+
 def _fixture_ops(resource_id, ops):
     return "\n".join(
         [
@@ -467,6 +484,8 @@ class UpdateScsiDevicesMixin:
         lrm_start_ops_updated=DEFAULT_LRM_START_OPS_UPDATED,
         digests_attrs_list=None,
         digests_attrs_list_updated=None,
+        start_digests=True,
+        monitor_digests=True,
     ):
         self.config_cib(
             devices_before=devices_before,
@@ -475,6 +494,8 @@ class UpdateScsiDevicesMixin:
             lrm_monitor_ops=lrm_monitor_ops,
             lrm_start_ops=lrm_start_ops,
             digests_attrs_list=digests_attrs_list,
+            start_digests=start_digests,
+            monitor_digests=monitor_digests,
         )
         if unfence:
             self.config.corosync_conf.load_content(
@@ -1412,6 +1433,51 @@ class UpdateScsiDevicesDigestsBase(UpdateScsiDevicesMixin):
             ),
         )
 
+    def test_digests_calculated_in_process(self):
+        digest_before = fixture_native_digest(DEVICES_1)
+        digest_after = fixture_native_digest(DEVICES_2)
+        monitor_digest_before = fixture_native_digest(DEVICES_1, "10000")
+        monitor_digest_after = fixture_native_digest(DEVICES_2, "10000")
+        self.assert_command_success(
+            unfence=[DEV_2],
+            resource_ops=(("monitor", "30s", "10s", None),),
+            lrm_start_ops=(("0", digest_before, digest_before, None),),
+            lrm_monitor_ops=(("30000", monitor_digest_before, None, None),),
+            lrm_start_ops_updated=(("0", digest_after, digest_after, None),),
+            lrm_monitor_ops_updated=(
+                ("30000", monitor_digest_after, None, None),
+            ),
+            digests_attrs_list=[
+                [
+                    (
+                        "digests-all",
+                        self.digest_attr_value_single(digest_before),
+                    ),
+                ]
+            ],
+            digests_attrs_list_updated=[
+                [
+                    (
+                        "digests-all",
+                        self.digest_attr_value_single(digest_after),
+                    ),
+                ]
+            ],
+            start_digests=False,
+            monitor_digests=False,
+        )
+
+    def test_digests_calculated_in_process_monitor_without_timeout(self):
+        # the default timeout of the monitor is not known to pcs
+        digest_before = fixture_native_digest(DEVICES_1)
+        digest_after = fixture_native_digest(DEVICES_2)
+        self.assert_command_success(
+            unfence=[DEV_2],
+            lrm_start_ops=(("0", digest_before, None, None),),
+            lrm_start_ops_updated=(("0", digest_after, None, None),),
+            start_digests=False,
+        )
+
     def _digests_attrs_before(self, last_comma=True):
         return [
             (
@@ -215,6 +215,35 @@ class GetNodesTest(TestCase):
         self.assertEqual(nodes[1].addrs[0].type, CorosyncNodeAddressType.FQDN)
         self.assertEqual(nodes[1].addrs[1].type, CorosyncNodeAddressType.IPV6)
 
+    def test_config_changed(self):
+        facade = _get_facade(
+            dedent(
+                """\
+                nodelist {
+                    node {
+                        ring0_addr: n1a
+                        name: n1
+                        nodeid: 1
+                    }
+                }
+                """
+            )
+        )
+        self.assert_equal_nodelist(
+            [{"name": "n1", "id": "1", "addrs": [("0", "n1a")]}],
+            facade.get_nodes(),
+        )
+        node_section = facade.config.get_sections("nodelist")[0].get_sections(
+            "node"
+        )[0]
+        node_section.set_attribute("name", "n2")
+        node_section.add_attribute("ring1_addr", "n2b")
+        self.assert_equal_nodelist(
+            [{"name": "n2", "id": "1", "addrs": [("0", "n1a"), ("1", "n2b")]}],
+            facade.get_nodes(),
+        )
+        self.assertEqual([0, 1], facade.get_used_linknumber_list())
+
 
 class AddNodesTest(TestCase):
     def test_adding_two_nodes(self):
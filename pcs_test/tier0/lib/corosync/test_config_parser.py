@@ -650,6 +650,40 @@ class SectionTest(TestCase):
         self.assertEqual(child1.get_root().name, "root")
         self.assertEqual(child1a.get_root().name, "root")
 
+    def test_version(self):
+        root = config_parser.Section("root")
+        child1 = config_parser.Section("child1")
+        child1a = config_parser.Section("child1a")
+        child2 = config_parser.Section("child2")
+        self.assertEqual(0, root.version)
+
+        root.add_section(child1)
+        child1.add_section(child1a)
+        self.assertEqual(2, root.version)
+        self.assertEqual(1, child1.version)
+        self.assertEqual(0, child1a.version)
+
+        child1a.add_attribute("name1", "value1")
+        child1a.set_attribute("name1", "value2")
+        child1a.del_attributes_by_name("name1")
+        self.assertEqual(5, root.version)
+        self.assertEqual(4, child1.version)
+        self.assertEqual(3, child1a.version)
+
+        child1a.get_attributes()
+        child1.get_sections()
+        root.export()
+        self.assertEqual(5, root.version)
+
+        # moving a section changes both its old and new parent
+        child2.add_section(child1a)
+        self.assertEqual(6, root.version)
+        self.assertEqual(5, child1.version)
+        self.assertEqual(1, child2.version)
+
+        root.del_section(child1)
+        self.assertEqual(7, root.version)
+
     def test_str(self):
         root = config_parser.Section("root")
         self.assertEqual(str(root), "")
@@ -1116,6 +1150,18 @@ class ParserTest(TestCase):
             string.encode("utf-8"),
         )
 
+    def test_sections_deeply_nested(self):
+        depth = 2000
+        string = "".join(
+            "    " * level + "section {\n" for level in range(depth)
+        ) + "".join("    " * level + "}\n" for level in reversed(range(depth)))
+        root = config_parser.Parser.parse(string.encode("utf-8"))
+        section = root
+        for _ in range(depth):
+            section = section.get_sections("section")[0]
+        self.assertTrue(section.empty)
+        self.assertEqual(string, root.export())
+
     def test_junk_line(self):
         string = outdent(
             """\
@@ -0,0 +1,84 @@
+import hashlib
+from unittest import TestCase
+
+from pcs.lib.pacemaker.digest import calculate_resource_digests
+
+
+def _md5(text):
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+class CalculateResourceDigests(TestCase):
+    def test_sorted_params(self):
+        self.assertEqual(
+            {
+                "all": _md5('<parameters a="1" b="x y" c=""/>'),
+                "nonprivate": _md5('<parameters a="1" b="x y" c=""/>'),
+                "nonreloadable": None,
+            },
+            calculate_resource_digests({"c": "", "b": "x y", "a": "1"}),
+        )
+
+    def test_no_params(self):
+        self.assertEqual(
+            _md5("<parameters/>"), calculate_resource_digests({})["all"]
+        )
+
+    def test_filtered_params(self):
+        self.assertEqual(
+            _md5('<parameters a="1"/>'),
+            calculate_resource_digests(
+                {
+                    "a": "1",
+                    "CRM_meta_timeout": "10000",
+                    "crm_feature_set": "3.16.2",
+                    "pcmk_external_ip": "1.2.3.4",
+                }
+            )["all"],
+        )
+
+    def test_private_params(self):
+        digests = calculate_resource_digests(
+            {"a": "1", "password": "secret", "user": "root"}
+        )
+        self.assertEqual(
+            _md5('<parameters a="1" password="secret" user="root"/>'),
+            digests["all"],
+        )
+        self.assertEqual(_md5('<parameters a="1"/>'), digests["nonprivate"])
+
+    def test_non_recurring_operation(self):
+        self.assertEqual(
+            _md5('<parameters a="1"/>'),
+            calculate_resource_digests(
+                {"a": "1"}, {"interval": "0", "timeout": "20000"}
+            )["all"],
+        )
+
+    def test_recurring_operation(self):
+        self.assertEqual(
+            _md5('<parameters CRM_meta_timeout="20000" a="1"/>'),
+            calculate_resource_digests(
+                {"a": "1"}, {"interval": "60000", "timeout": "20000"}
+            )["all"],
+        )
+
+    def test_recurring_operation_without_timeout(self):
+        self.assertIsNone(
+            calculate_resource_digests(
+                {"a": "1"}, {"interval": "60000", "timeout": None}
+            )
+        )
+
+    def test_invalid_interval(self):
+        self.assertIsNone(
+            calculate_resource_digests({"a": "1"}, {"interval": "60s"})
+        )
+
+    def test_unsupported_value(self):
+        for value in ('a"b', "a&b", "a<b", "a\nb"):
+            with self.subTest(value=value):
+                self.assertIsNone(calculate_resource_digests({"a": value}))
+
+    def test_unsupported_name(self):
+        self.assertIsNone(calculate_resource_digests({"a b": "1"}))
@@ -60,7 +60,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         self.config.runner.pcmk.load_state(stdout=self.fixture_xml())
         env = self.env_assist.get_env()
         assert_xml_equal(
-            self.fixture_xml(), lib._get_cluster_status_xml(env.cmd_runner())
+            self.fixture_xml(), lib.get_cluster_status_xml(env.cmd_runner())
         )
 
     def test_error(self):
@@ -72,7 +72,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(
                 report_codes.CRM_MON_ERROR,
                 reason="an error\nThis is an error message\nAnd one more",
@@ -87,7 +87,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(
                 report_codes.CRM_MON_ERROR,
                 reason="stderr text\nstdout text",
@@ -98,7 +98,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         self.config.runner.pcmk.load_state(stdout="<xml/>", returncode=1)
         env = self.env_assist.get_env()
         assert_raise_library_error(
-            lambda: lib._get_cluster_status_xml(env.cmd_runner()),
+            lambda: lib.get_cluster_status_xml(env.cmd_runner()),
             fixture.error(report_codes.BAD_CLUSTER_STATE_FORMAT),
         )
 
@@ -109,7 +109,7 @@ class GetClusterStatusXml(GetClusterStatusMixin, TestCase):
         )
         env = self.env_assist.get_env()
         with self.assertRaises(lib.PacemakerNotConnectedException) as cm:
-            lib._get_cluster_status_xml(env.cmd_runner())
+            lib.get_cluster_status_xml(env.cmd_runner())
         assert_report_item_list_equal(
             cm.exception.args,
             [
@@ -863,6 +863,7 @@ class SimulateCibXml(TestCase):
                 "--xml-pipe",
             ],
             stdin_string=orig_cib_data,
+            timeout=None,
         )
 
     def test_error_creating_cib(self):
@@ -989,7 +990,7 @@ class SimulateCib(TestCase):
         self.assertEqual(result[0], "some output")
         assert_xml_equal(self.transitions, etree_to_str(result[1]))
         assert_xml_equal(self.new_cib, etree_to_str(result[2]))
-        mock_simulate.assert_called_once_with(self.runner, self.cib_xml)
+        mock_simulate.assert_called_once_with(self.runner, self.cib_xml, None)
 
     def test_invalid_cib(self, mock_simulate):
         mock_simulate.return_value = (
@@ -28,6 +28,7 @@ from pcs.lib.pacemaker import status
 
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import (
+    assert_raise_library_error,
     assert_report_item_equal,
     assert_report_item_list_equal,
 )
@@ -1723,3 +1724,238 @@ class TestResourcesStatusToDto(TestCase):
                 )
             ],
         )
+
+
+class ClusterStatusSnapshot(TestCase):
+    def test_resources_status_parsed_once(self):
+        status_xml = etree.fromstring(
+            fixture_crm_mon_xml([fixture_primitive_xml()])
+        )
+        snapshot = status.ClusterStatusSnapshot(status_xml)
+
+        result, warnings = snapshot.get_resources_status()
+        self.assertEqual(result, ResourcesStatusDto([fixture_primitive_dto()]))
+        assert_report_item_list_equal(warnings, [])
+        self.assertIs(snapshot.get_resources_status()[0], result)
+        self.assertIs(snapshot.status_dom, status_xml)
+
+    def test_resources_status_warnings(self):
+        status_xml = etree.fromstring(
+            fixture_crm_mon_xml(
+                [fixture_bundle_xml("bundle", ['<replica id="0"/>'])]
+            )
+        )
+        snapshot = status.ClusterStatusSnapshot(status_xml)
+
+        for _ in range(2):
+            result, warnings = snapshot.get_resources_status()
+            self.assertEqual(result, ResourcesStatusDto([]))
+            assert_report_item_list_equal(
+                warnings,
+                [
+                    fixture.warn(
+                        reports.codes.BAD_CLUSTER_STATE_DATA,
+                        reason=(
+                            "Replica '0' of bundle 'bundle' is missing "
+                            "implicit container resource"
+                        ),
+                    )
+                ],
+            )
+
+    def test_resources_status_error(self):
+        status_xml = etree.fromstring(
+            fixture_crm_mon_xml([fixture_primitive_xml(resource_id="")])
+        )
+        snapshot = status.ClusterStatusSnapshot(status_xml)
+
+        for _ in range(2):
+            with self.assertRaises(status.EmptyResourceIdError):
+                snapshot.get_resources_status()
+
+    def test_from_xml_resources_status_streamed(self):
+        snapshot = status.ClusterStatusSnapshot(
+            status_xml=fixture_crm_mon_xml([fixture_primitive_xml()])
+        )
+
+        result, warnings = snapshot.get_resources_status()
+        self.assertEqual(result, ResourcesStatusDto([fixture_primitive_dto()]))
+        assert_report_item_list_equal(warnings, [])
+        self.assertIs(snapshot.get_resources_status()[0], result)
+        self.assertEqual(
+            [
+                el.get("id")
+                for el in snapshot.status_dom.iterfind(".//resource")
+            ],
+            ["resource"],
+        )
+
+    def test_from_xml_dom(self):
+        snapshot = status.ClusterStatusSnapshot(
+            status_xml=fixture_crm_mon_xml([fixture_primitive_xml()])
+        )
+        self.assertIs(snapshot.status_dom, snapshot.status_dom)
+        result, _ = snapshot.get_resources_status()
+        self.assertEqual(result, ResourcesStatusDto([fixture_primitive_dto()]))
+
+    def test_from_xml_bad_format(self):
+        snapshot = status.ClusterStatusSnapshot(
+            status_xml=fixture_crm_mon_xml(['<clone id="C"/>'])
+        )
+        for _ in range(2):
+            assert_raise_library_error(
+                snapshot.get_resources_status,
+                fixture.error(reports.codes.BAD_CLUSTER_STATE_FORMAT),
+            )
+
+    def test_from_xml_not_xml(self):
+        snapshot = status.ClusterStatusSnapshot(status_xml="not an xml")
+        assert_raise_library_error(
+            lambda: snapshot.status_dom,
+            fixture.error(reports.codes.BAD_CLUSTER_STATE_FORMAT),
+        )
+
+
+class ClusterStatusStreamParser(TestCase):
+    def assert_same_as_tree_parser(self, status_xml):
+        tree_parser = status.ClusterStatusParser(etree.fromstring(status_xml))
+        stream_parser = status.ClusterStatusStreamParser(status_xml)
+        self.assertEqual(
+            stream_parser.status_xml_to_dto(), tree_parser.status_xml_to_dto()
+        )
+        self.assertEqual(
+            [report.to_dto() for report in stream_parser.get_warnings()],
+            [report.to_dto() for report in tree_parser.get_warnings()],
+        )
+
+    def test_empty_resources(self):
+        self.assert_same_as_tree_parser(fixture_crm_mon_xml([]))
+
+    def test_all_resource_types(self):
+        self.assert_same_as_tree_parser(
+            fixture_crm_mon_xml(
+                [
+                    fixture_primitive_xml(),
+                    fixture_group_xml(members=[fixture_primitive_xml()]),
+                    fixture_clone_xml(instances=[fixture_primitive_xml()]),
+                    fixture_bundle_xml(
+                        replicas=[
+                            fixture_replica_xml(
+                                ip=True,
+                                member=fixture_primitive_xml(
+                                    node_names=["resource-bundle-0"]
+                                ),
+                            )
+                        ]
+                    ),
+                ]
+            )
+        )
+
+    def test_skipped_bundle_warning(self):
+        self.assert_same_as_tree_parser(
+            fixture_crm_mon_xml(
+                [
+                    fixture_bundle_xml("bundle", ['<replica id="0"/>']),
+                    fixture_primitive_xml(),
+                ]
+            )
+        )
+
+    def test_other_sections_ignored(self):
+        status_xml = f"""
+            <pacemaker-result api-version="2.30" request="crm_mon">
+                <nodes>
+                    <node name="node1" id="1" online="true"/>
+                </nodes>
+                <resources>
+                    {fixture_primitive_xml(resource_id="A")}
+                </resources>
+                <node_history>
+                    <node name="node1">
+                        <resource_history id="A" orphan="false">
+                            <operation_history call="1" task="start"/>
+                        </resource_history>
+                    </node>
+                </node_history>
+                <fence_history/>
+                <status code="0" message="OK"/>
+            </pacemaker-result>
+        """
+        parser = status.ClusterStatusStreamParser(status_xml)
+        self.assertEqual(
+            parser.status_xml_to_dto(),
+            ResourcesStatusDto([fixture_primitive_dto(resource_id="A")]),
+        )
+
+    def test_parsing_error(self):
+        parser = status.ClusterStatusStreamParser(
+            fixture_crm_mon_xml([fixture_primitive_xml(resource_id="")])
+        )
+        with self.assertRaises(status.EmptyResourceIdError):
+            parser.status_xml_to_dto()
+
+    def test_missing_data(self):
+        parser = status.ClusterStatusStreamParser(
+            fixture_crm_mon_xml(["<resource/>"])
+        )
+        with self.assertRaises(status.ClusterStatusFormatError):
+            parser.status_xml_to_dto()
+
+    def test_not_xml(self):
+        parser = status.ClusterStatusStreamParser("not an xml")
+        with self.assertRaises(status.ClusterStatusFormatError):
+            parser.status_xml_to_dto()
+
+    def test_missing_required_attributes(self):
+        resource_list = [
+            '<clone id="C"/>',
+            fixture_group_xml(
+                members=[
+                    '<resource id="R" resource_agent="ocf:heartbeat:Dummy" '
+                    'role="Started"/>'
+                ]
+            ),
+            fixture_bundle_xml(replicas=["<replica/>"]),
+        ]
+        for resource in resource_list:
+            with self.subTest(resource=resource):
+                parser = status.ClusterStatusStreamParser(
+                    fixture_crm_mon_xml([resource])
+                )
+                with self.assertRaises(status.ClusterStatusFormatError):
+                    parser.status_xml_to_dto()
+
+    def test_keep_sections(self):
+        status_xml = f"""
+            <pacemaker-result api-version="2.30" request="crm_mon">
+                <summary>
+                    <nodes_configured number="1"/>
+                </summary>
+                <nodes>
+                    <node name="node1" id="1" online="true"/>
+                    <node name="node2" id="2" online="true"/>
+                </nodes>
+                <resources>
+                    {fixture_primitive_xml(resource_id="A")}
+                </resources>
+                <node_history>
+                    <node name="node1"/>
+                </node_history>
+                <status code="0" message="OK"/>
+            </pacemaker-result>
+        """
+        parser = status.ClusterStatusStreamParser(
+            status_xml, keep_sections=["nodes"]
+        )
+        self.assertEqual(
+            parser.status_xml_to_dto(),
+            ResourcesStatusDto([fixture_primitive_dto(resource_id="A")]),
+        )
+        nodes = parser.get_section("nodes")
+        self.assertEqual(
+            [node.get("name") for node in nodes.iterfind("node")],
+            ["node1", "node2"],
+        )
+        self.assertIsNone(parser.get_section("summary"))
+        self.assertIsNone(parser.get_section("node_history"))
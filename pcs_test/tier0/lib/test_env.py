@@ -5,6 +5,8 @@ from unittest import TestCase, mock
 from pcs.common import file_type_codes
 from pcs.common.reports import ReportItemSeverity as severity
 from pcs.common.reports import codes as report_codes
+from pcs.lib.cib.constraint.location import DuplicatesCheckerLocationRulePlain
+from pcs.lib.cib.constraint.ticket import DuplicatesCheckerTicketPlain
 from pcs.lib.env import LibraryEnvironment
 
 from pcs_test.tools.assertions import assert_raise_library_error
@@ -107,6 +109,7 @@ class CmdRunner(TestCase):
             {
                 "LC_ALL": "C",
             },
+            timeout=None,
         )
 
     def test_user(self, mock_runner):
@@ -125,6 +128,24 @@ class CmdRunner(TestCase):
                 "CIB_user": user,
                 "LC_ALL": "C",
             },
+            timeout=None,
+        )
+
+    def test_timeout(self, mock_runner):
+        expected_runner = mock.MagicMock()
+        mock_runner.return_value = expected_runner
+        env = LibraryEnvironment(
+            self.mock_logger, self.mock_reporter, cmd_runner_timeout=30
+        )
+        runner = env.cmd_runner()
+        self.assertEqual(expected_runner, runner)
+        mock_runner.assert_called_once_with(
+            self.mock_logger,
+            self.mock_reporter,
+            {
+                "LC_ALL": "C",
+            },
+            timeout=30,
         )
 
     @patch_env("create_tmp_cib")
@@ -147,6 +168,7 @@ class CmdRunner(TestCase):
                 "LC_ALL": "C",
                 "CIB_file": tmp_file_name,
             },
+            timeout=None,
         )
         mock_tmpfile.assert_called_once_with(self.mock_reporter, "<cib />")
 
@@ -191,3 +213,97 @@ class EnsureValidWait(TestCase):
         get_valid_timeout.return_value = timeout
         env.ensure_wait_satisfiable(timeout)
         get_valid_timeout.assert_called_once_with(timeout)
+
+
+@patch_env_object("cmd_runner", lambda self: "runner")
+@patch_env("get_cluster_status_xml")
+class ClusterStatus(TestCase):
+    def setUp(self):
+        self.env = LibraryEnvironment(
+            mock.MagicMock(logging.Logger), MockLibraryReportProcessor()
+        )
+
+    @staticmethod
+    def fixture_status(node_name):
+        return f"""
+            <pacemaker-result api-version="2.30" request="crm_mon">
+                <nodes><node name="{node_name}" /></nodes>
+                <resources />
+                <status code="0" message="OK"/>
+            </pacemaker-result>
+        """
+
+    def assert_node(self, node_name):
+        self.assertEqual(
+            self.env.get_cluster_state().find("nodes/node").get("name"),
+            node_name,
+        )
+
+    def test_loaded_once(self, mock_status_xml):
+        mock_status_xml.return_value = self.fixture_status("node1")
+        snapshot = self.env.get_cluster_status_snapshot()
+        self.assertIs(self.env.get_cluster_status_snapshot(), snapshot)
+        self.assertIs(self.env.get_cluster_state(), snapshot.status_dom)
+        self.assert_node("node1")
+        mock_status_xml.assert_called_once_with("runner")
+
+    def test_invalidate(self, mock_status_xml):
+        mock_status_xml.side_effect = [
+            self.fixture_status("node1"),
+            self.fixture_status("node2"),
+        ]
+        self.assert_node("node1")
+        self.env.invalidate_cluster_status()
+        self.assert_node("node2")
+        self.assertEqual(mock_status_xml.call_count, 2)
+
+    @patch_env("wait_for_idle")
+    def test_invalidate_on_wait(self, mock_wait, mock_status_xml):
+        mock_status_xml.side_effect = [
+            self.fixture_status("node1"),
+            self.fixture_status("node2"),
+        ]
+        self.assert_node("node1")
+        self.env.wait_for_idle(-1)
+        self.assert_node("node2")
+        mock_wait.assert_not_called()
+
+
+@patch_env_object("cmd_runner", lambda self: "runner")
+class ConstraintDuplicatesChecker(TestCase):
+    def setUp(self):
+        self.env = LibraryEnvironment(
+            mock.MagicMock(logging.Logger), MockLibraryReportProcessor()
+        )
+
+    def test_shared(self):
+        checker = self.env.get_constraint_duplicates_checker(
+            DuplicatesCheckerTicketPlain
+        )
+        self.assertIsInstance(checker, DuplicatesCheckerTicketPlain)
+        self.assertIs(
+            self.env.get_constraint_duplicates_checker(
+                DuplicatesCheckerTicketPlain
+            ),
+            checker,
+        )
+        self.assertIsInstance(
+            self.env.get_constraint_duplicates_checker(
+                DuplicatesCheckerLocationRulePlain
+            ),
+            DuplicatesCheckerLocationRulePlain,
+        )
+
+    @patch_env("replace_cib_configuration")
+    def test_dropped_on_push(self, mock_replace):
+        checker = self.env.get_constraint_duplicates_checker(
+            DuplicatesCheckerTicketPlain
+        )
+        self.env.push_cib("custom cib")
+        self.assertIsNot(
+            self.env.get_constraint_duplicates_checker(
+                DuplicatesCheckerTicketPlain
+            ),
+            checker,
+        )
+        mock_replace.assert_called_once_with("runner", "custom cib")
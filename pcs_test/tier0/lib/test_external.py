@@ -1,5 +1,5 @@
 import logging
-from subprocess import DEVNULL
+from subprocess import DEVNULL, TimeoutExpired
 from unittest import TestCase, mock
 
 import pcs.lib.external as lib
@@ -50,7 +50,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -134,7 +134,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -222,7 +222,7 @@ class CommandRunnerTest(TestCase):
         self.assertEqual(real_stdout, expected_stdout)
         self.assertEqual(real_stderr, expected_stderr)
         self.assertEqual(real_retval, expected_retval)
-        mock_process.communicate.assert_called_once_with(stdin)
+        mock_process.communicate.assert_called_once_with(stdin, timeout=None)
         self.assert_popen_called_with(
             mock_popen, command, {"env": {}, "stdin": -1}
         )
@@ -361,7 +361,7 @@ class CommandRunnerTest(TestCase):
             ),
         )
 
-        mock_process.communicate.assert_called_once_with(None)
+        mock_process.communicate.assert_called_once_with(None, timeout=None)
         self.assert_popen_called_with(
             mock_popen,
             command,
@@ -390,6 +390,61 @@ class CommandRunnerTest(TestCase):
             ],
         )
 
+    def test_timeout(self, mock_popen):
+        command = ["a_command"]
+        command_str = "a_command"
+        mock_process = mock.MagicMock(
+            spec_set=["communicate", "kill", "returncode"]
+        )
+        mock_process.communicate.side_effect = [
+            TimeoutExpired(command, 5),
+            ("", ""),
+        ]
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(self.mock_logger, self.mock_reporter)
+        with self.assertRaises(lib.ProcessTimeoutException) as cm:
+            runner.run(command, timeout=5)
+        assert_report_item_list_equal(
+            cm.exception.args,
+            [
+                (
+                    severity.ERROR,
+                    report_codes.RUN_EXTERNAL_PROCESS_ERROR,
+                    {
+                        "command": command_str,
+                        "reason": (
+                            "the process did not finish in time and has been "
+                            "killed"
+                        ),
+                    },
+                ),
+            ],
+        )
+
+        mock_process.kill.assert_called_once_with()
+        self.assertEqual(
+            mock_process.communicate.call_args_list,
+            [mock.call(None, timeout=5), mock.call()],
+        )
+
+    def test_runner_timeout(self, mock_popen):
+        mock_process = mock.MagicMock(spec_set=["communicate", "returncode"])
+        mock_process.communicate.return_value = ("", "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        runner = lib.CommandRunner(
+            self.mock_logger, self.mock_reporter, timeout=30
+        )
+        runner.run(["a_command"])
+        runner.run(["a_command"], timeout=5)
+
+        self.assertEqual(
+            mock_process.communicate.call_args_list,
+            [mock.call(None, timeout=30), mock.call(None, timeout=5)],
+        )
+
 
 class KillServicesTest(TestCase):
     def setUp(self):
@@ -0,0 +1,121 @@
+import os
+import stat
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.lib import tool_probe
+from pcs.lib.external import CommandRunner
+
+from pcs_test.tools.custom_mock import get_runner_mock
+from pcs_test.tools.misc import get_tmp_dir
+
+
+class RunProbe(TestCase):
+    def setUp(self):
+        self.tmp_dir = get_tmp_dir("tier0_lib_tool_probe")
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache.json")
+        self.count_path = os.path.join(self.tmp_dir.name, "count")
+        patcher = mock.patch.object(
+            settings, "pcs_tool_probe_cache_location", self.cache_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tool_probe._memory_cache.clear()
+        self.addCleanup(tool_probe._memory_cache.clear)
+        self.runner = CommandRunner(mock.Mock(), mock.Mock())
+
+    def write_tool(self, name, output, retval=0):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as tool_file:
+            tool_file.write(
+                "#!/bin/sh\n"
+                f"echo run >> '{self.count_path}'\n"
+                f"echo '{output}'\n"
+                f"exit {retval}\n"
+            )
+        os.chmod(path, stat.S_IRWXU)
+        return path
+
+    def get_run_count(self):
+        if not os.path.exists(self.count_path):
+            return 0
+        with open(self.count_path) as count_file:
+            return len(count_file.readlines())
+
+    def test_cached(self):
+        tool = self.write_tool("tool", "version 1")
+        self.assertEqual(
+            ("version 1\n", "", 0),
+            tool_probe.run_probe(self.runner, [tool, "--version"]),
+        )
+        self.assertEqual(
+            ("version 1\n", "", 0),
+            tool_probe.run_probe(self.runner, [tool, "--version"]),
+        )
+        self.assertEqual(1, self.get_run_count())
+        # different arguments are probed separately
+        tool_probe.run_probe(self.runner, [tool, "--help-all"])
+        self.assertEqual(2, self.get_run_count())
+
+    def test_cached_in_file(self):
+        tool = self.write_tool("tool", "version 1")
+        tool_probe.run_probe(self.runner, [tool, "--version"])
+        # a new process starts with an empty memory cache
+        tool_probe._memory_cache.clear()
+        self.assertEqual(
+            ("version 1\n", "", 0),
+            tool_probe.run_probe(self.runner, [tool, "--version"]),
+        )
+        self.assertEqual(1, self.get_run_count())
+
+    def test_tool_changed(self):
+        tool = self.write_tool("tool", "version 1")
+        tool_probe.run_probe(self.runner, [tool, "--version"])
+        tool = self.write_tool("tool", "version 2")
+        os.utime(tool, ns=(0, 0))
+        self.assertEqual(
+            ("version 2\n", "", 0),
+            tool_probe.run_probe(self.runner, [tool, "--version"]),
+        )
+        self.assertEqual(2, self.get_run_count())
+
+    def test_failure_not_cached(self):
+        tool = self.write_tool("tool", "error", retval=1)
+        tool_probe.run_probe(self.runner, [tool, "--version"])
+        self.assertEqual(
+            ("error\n", "", 1),
+            tool_probe.run_probe(self.runner, [tool, "--version"]),
+        )
+        self.assertEqual(2, self.get_run_count())
+
+    def test_unwritable_cache_file(self):
+        settings.pcs_tool_probe_cache_location = os.path.join(
+            self.tmp_dir.name, "missing", "cache.json"
+        )
+        tool = self.write_tool("tool", "version 1")
+        tool_probe.run_probe(self.runner, [tool, "--version"])
+        tool_probe.run_probe(self.runner, [tool, "--version"])
+        self.assertEqual(1, self.get_run_count())
+
+    def test_mocked_runner_not_cached(self):
+        tool = self.write_tool("tool", "version 1")
+        runner = get_runner_mock("version 0")
+        for _ in range(2):
+            self.assertEqual(
+                ("version 0", "", 0),
+                tool_probe.run_probe(runner, [tool, "--version"]),
+            )
+        self.assertEqual(2, runner.run.call_count)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_prefetch(self):
+        tool1 = self.write_tool("tool1", "version 1")
+        tool2 = self.write_tool("tool2", "version 2")
+        tool_probe.prefetch(
+            self.runner, [[tool1, "--version"], [tool2, "--version"]]
+        )
+        self.assertEqual(2, self.get_run_count())
+        tool_probe.run_probe(self.runner, [tool1, "--version"])
+        tool_probe.run_probe(self.runner, [tool2, "--version"])
+        self.assertEqual(2, self.get_run_count())
@@ -0,0 +1,247 @@
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from pcs import settings
+from pcs.lib.corosync.config_facade import ConfigFacade
+from pcs.lib.corosync.config_parser import Parser
+from pcs.snmp.cluster_status import (
+    ClusterStatus,
+    ClusterStatusCache,
+    build_cluster_status,
+)
+
+from pcs_test.tools.fixture_crm_mon import complete_state
+from pcs_test.tools.misc import get_test_resource as rc
+
+COROSYNC_CONF = dedent(
+    """\
+    totem {
+        cluster_name: test-cluster
+    }
+
+    nodelist {
+        node {
+            ring0_addr: 10.0.0.3
+            name: node3
+            nodeid: 3
+        }
+
+        node {
+            ring0_addr: 10.0.0.1
+            name: node1
+            nodeid: 1
+        }
+
+        node {
+            ring0_addr: 10.0.0.2
+            name: node2
+            nodeid: 2
+        }
+    }
+    """
+)
+
+
+def fixture_corosync_conf():
+    return ConfigFacade(Parser.parse(COROSYNC_CONF.encode("utf-8")))
+
+
+def fixture_status_dom(resources_xml=None, nodes_xml=None, quorate=True):
+    with open(rc("crm_mon.minimal.xml")) as crm_mon_file:
+        status_dom = complete_state(
+            crm_mon_file.read(),
+            resources_xml=resources_xml,
+            nodes_xml=nodes_xml,
+        )
+    current_dc = status_dom.find("summary/current_dc")
+    current_dc.set("present", "true")
+    current_dc.set("with_quorum", "true" if quorate else "false")
+    return status_dom
+
+
+def fixture_status(**kwargs):
+    status = dict(
+        cluster_name="test-cluster",
+        quorate=False,
+        known_nodes=["node1", "node2", "node3"],
+        corosync_online=[],
+        corosync_offline=["node1", "node2", "node3"],
+        pacemaker_online=[],
+        pacemaker_standby=[],
+        pacemaker_offline=[],
+        resources_all=[],
+        resources_running=[],
+        resources_stopped=[],
+        resources_failed=[],
+    )
+    status.update(kwargs)
+    return ClusterStatus(**status)
+
+
+@mock.patch.object(
+    settings, "pacemaker_api_result_schema", rc("pcmk_rng/api/api-result.rng")
+)
+class BuildClusterStatus(TestCase):
+    def test_cluster_not_running(self):
+        self.assertEqual(
+            fixture_status(),
+            build_cluster_status(fixture_corosync_conf(), [], None),
+        )
+
+    def test_nodes(self):
+        status_dom = fixture_status_dom(
+            nodes_xml="""
+                <nodes>
+                    <node name="node1" id="1" online="true" />
+                    <node name="node2" id="2" online="true" standby="true" />
+                    <node name="node3" id="3" online="false" />
+                    <node name="node4" id="4" online="true" standby="true"
+                        resources_running="1"
+                    />
+                    <node name="node5" id="5" online="true"
+                        maintenance="true"
+                    />
+                    <node name="remote1" id="remote1" online="true"
+                        type="remote"
+                    />
+                </nodes>
+            """,
+        )
+        self.assertEqual(
+            fixture_status(
+                quorate=True,
+                known_nodes=["node1", "node2", "node3", "node5", "node4"],
+                corosync_online=["node1", "node2"],
+                corosync_offline=["node3"],
+                pacemaker_online=["node1", "node5"],
+                pacemaker_standby=["node2"],
+                pacemaker_offline=["node3", "node4"],
+            ),
+            build_cluster_status(
+                fixture_corosync_conf(), ["node2", "node1"], status_dom
+            ),
+        )
+
+    def test_not_quorate(self):
+        self.assertFalse(
+            build_cluster_status(
+                fixture_corosync_conf(), [], fixture_status_dom(quorate=False)
+            ).quorate
+        )
+
+    def test_resources(self):
+        status_dom = fixture_status_dom(
+            resources_xml="""
+                <resources>
+                    <resource id="R1" resource_agent="ocf:pacemaker:Dummy"
+                        role="Started" active="true" nodes_running_on="1"
+                    >
+                        <node name="node1" id="1" cached="true"/>
+                    </resource>
+                    <resource id="R2" resource_agent="ocf:pacemaker:Dummy"
+                        role="Stopped" target_role="Stopped" active="false"
+                    />
+                    <resource id="R3" resource_agent="ocf:pacemaker:Dummy"
+                        role="Stopped" active="false"
+                    />
+                    <resource id="S1" resource_agent="stonith:fence_xvm"
+                        role="Stopped" target_role="Stopped" active="false"
+                    />
+                    <resource id="R4" resource_agent="ocf:pacemaker:Dummy"
+                        role="Started" active="true" orphaned="true"
+                        nodes_running_on="1"
+                    >
+                        <node name="node1" id="1" cached="true"/>
+                    </resource>
+                    <group id="G1" number_resources="1" disabled="true">
+                        <resource id="R5" resource_agent="ocf:pacemaker:Dummy"
+                            role="Stopped" active="false"
+                        />
+                    </group>
+                    <clone id="R6-clone" multi_state="false" unique="false">
+                        <resource id="R6" resource_agent="ocf:pacemaker:Dummy"
+                            role="Stopped" active="false"
+                        />
+                        <resource id="R6" resource_agent="ocf:pacemaker:Dummy"
+                            role="Started" active="true" nodes_running_on="1"
+                        >
+                            <node name="node2" id="2" cached="true"/>
+                        </resource>
+                    </clone>
+                    <clone id="G2-clone" multi_state="false" unique="false"
+                        disabled="true"
+                    >
+                        <group id="G2:0" number_resources="1">
+                            <resource id="R7"
+                                resource_agent="ocf:pacemaker:Dummy"
+                                role="Stopped" active="false"
+                            />
+                        </group>
+                        <group id="G2:1" number_resources="1">
+                            <resource id="R7"
+                                resource_agent="ocf:pacemaker:Dummy"
+                                role="Stopped" active="false"
+                            />
+                        </group>
+                    </clone>
+                    <bundle id="B1" type="podman" image="pcs:test"
+                        unique="false" failed="false"
+                    >
+                        <replica id="0">
+                            <resource id="B1-podman-0"
+                                resource_agent="ocf:heartbeat:podman"
+                                role="Stopped" active="false"
+                            />
+                        </replica>
+                    </bundle>
+                </resources>
+            """,
+        )
+        status = build_cluster_status(fixture_corosync_conf(), [], status_dom)
+        self.assertEqual(
+            ["R1", "R2", "R3", "S1", "R5", "R6", "R7"], status.resources_all
+        )
+        self.assertEqual(["R1", "R6"], status.resources_running)
+        self.assertEqual(["R2", "R5", "R7"], status.resources_stopped)
+        self.assertEqual(["R3", "S1"], status.resources_failed)
+
+
+class ClusterStatusCacheTest(TestCase):
+    def setUp(self):
+        self.time = 0.0
+        self.loader = mock.Mock(
+            side_effect=lambda: fixture_status(cluster_name=str(self.time))
+        )
+        self.cache = ClusterStatusCache(self.loader, 10, lambda: self.time)
+
+    def test_reuse_fresh_status(self):
+        self.assertEqual("0.0", self.cache.get().cluster_name)
+        self.time = 9.0
+        self.assertEqual("0.0", self.cache.get().cluster_name)
+        self.time = 10.0
+        self.assertEqual("10.0", self.cache.get().cluster_name)
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_age_measured_after_loading(self):
+        def slow_loader():
+            self.time += 25
+            return fixture_status()
+
+        self.loader.side_effect = slow_loader
+        self.cache.get()
+        # updates missed while loading the status do not load it again
+        self.cache.get()
+        self.assertEqual(1, self.loader.call_count)
+
+    def test_failure_not_cached(self):
+        self.loader.side_effect = [
+            fixture_status(cluster_name="first"),
+            RuntimeError("error"),
+            fixture_status(cluster_name="second"),
+        ]
+        self.assertEqual("first", self.cache.get().cluster_name)
+        self.time = 10.0
+        with self.assertRaises(RuntimeError):
+            self.cache.get()
+        self.time = 11.0
+        self.assertEqual("second", self.cache.get().cluster_name)
@@ -1,12 +1,14 @@
 import sys
 import xml.dom.minidom
-from io import StringIO
-from time import sleep
+from io import BytesIO, StringIO
 from unittest import TestCase, mock
 
 from pcs import utils
 from pcs.common import const
+from pcs.common import pcs_pycurl as pycurl
+from pcs.common.host import Destination, PcsKnownHost
 
+from pcs_test.tools.custom_mock import MockCurl, MockCurlMulti
 from pcs_test.tools.misc import get_test_resource as rc
 from pcs_test.tools.xml import dom_get_child_elements
 
@@ -1604,42 +1606,268 @@ class UtilsTest(TestCase):
             self.assertEqual(node.tagName, tag)
 
 
-class RunParallelTest(TestCase):
-    @staticmethod
-    def fixture_create_worker(log, name, sleepSeconds=0):
-        def worker():
-            sleep(sleepSeconds)
-            log.append(name)
+class SendHttpRequestsMixin:
+    def setUp(self):
+        utils._get_node_communicator.cache_clear()
+        self.addCleanup(utils._get_node_communicator.cache_clear)
+        patcher = mock.patch(
+            "pcs.utils.read_known_hosts_file", mock.Mock(return_value={})
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.handle_list = []
+
+    def _call(self, handle_kwargs_list, performed_list, send):
+        handle_kwargs_iter = iter(handle_kwargs_list)
+
+        def create_handle(request, cookies, timeout):
+            del cookies
+            handle = MockCurl(request=request, **next(handle_kwargs_iter))
+            handle.output_buffer = BytesIO()
+            handle.debug_buffer = BytesIO()
+            handle.setopt(pycurl.WRITEFUNCTION, handle.output_buffer.write)
+            self.handle_list.append((handle, timeout))
+            return handle
+
+        with (
+            mock.patch(
+                "pcs.common.node_communicator._create_request_handle",
+                side_effect=create_handle,
+            ),
+            mock.patch(
+                "pcs.common.node_communicator.pycurl.CurlMulti",
+                side_effect=lambda: MockCurlMulti(performed_list),
+            ),
+        ):
+            return send()
+
+
+class SendHttpRequestToNodesTest(SendHttpRequestsMixin, TestCase):
+    def _send(self, handle_kwargs_list, performed_list, **kwargs):
+        return self._call(
+            handle_kwargs_list,
+            performed_list,
+            lambda: list(
+                utils.send_http_request_to_nodes(
+                    ["node1", "node2", "node1"], "remote/status", **kwargs
+                )
+            ),
+        )
+
+    def test_results(self):
+        results = self._send(
+            [
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok"),
+                dict(info={pycurl.RESPONSE_CODE: 401}),
+            ],
+            [2],
+            timeout=10,
+        )
+        self.assertEqual(
+            [
+                ("node1", (0, "ok")),
+                (
+                    "node2",
+                    (
+                        3,
+                        "Unable to authenticate to node2 - (HTTP error: 401), "
+                        "try running 'pcs host auth node2'",
+                    ),
+                ),
+            ],
+            results,
+        )
+        self.assertEqual([10, 10], [timeout for _, timeout in self.handle_list])
+
+    def test_repeat_if_timeout(self):
+        results = self._send(
+            [
+                dict(error=(pycurl.E_OPERATION_TIMEDOUT, "Timed out")),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok2"),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok1"),
+            ],
+            [2, 1],
+            repeat_if_timeout=1,
+        )
+        self.assertEqual(
+            [("node2", (0, "ok2")), ("node1", (0, "ok1"))], results
+        )
+
+    def test_connection_error(self):
+        results = self._send(
+            [
+                dict(error=(pycurl.E_OPERATION_TIMEDOUT, "Timed out")),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok2"),
+            ],
+            [2],
+        )
+        self.assertEqual(
+            [
+                ("node2", (0, "ok2")),
+                (
+                    "node1",
+                    (
+                        2,
+                        "Unable to connect to node1, check if pcsd is running "
+                        "there or try setting higher timeout with "
+                        "--request-timeout option (Timed out)",
+                    ),
+                ),
+            ],
+            results,
+        )
+
+
+class SendHttpRequestsTest(SendHttpRequestsMixin, TestCase):
+    def test_requests_to_one_node(self):
+        results = self._call(
+            [
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok1"),
+                dict(info={pycurl.RESPONSE_CODE: 404}),
+            ],
+            [2],
+            lambda: list(
+                utils.send_http_requests(
+                    [
+                        ("node1", "remote/status", ""),
+                        ("node1", "remote/set_sync_options", "a=b"),
+                    ]
+                )
+            ),
+        )
+        self.assertEqual(
+            [
+                (("node1", "remote/status", ""), (0, "ok1")),
+                (
+                    ("node1", "remote/set_sync_options", "a=b"),
+                    (1, "Error connecting to node1 - (HTTP error: 404)"),
+                ),
+            ],
+            results,
+        )
+        self.assertEqual(
+            [
+                "https://node1:2224/remote/status",
+                "https://node1:2224/remote/set_sync_options",
+            ],
+            [handle.request_obj.url for handle, _ in self.handle_list],
+        )
+        self.assertEqual("a=b", self.handle_list[1][0].request_obj.data)
 
-        return worker
+    def test_communicator_reused(self):
+        communicator_list = []
+
+        def send():
+            list(utils.send_http_requests([("node1", "remote/status", "")]))
+            communicator_list.append(utils._get_node_communicator())
+            results = list(
+                utils.send_http_requests([("node2", "remote/status", "")])
+            )
+            communicator_list.append(utils._get_node_communicator())
+            return results
 
-    def test_run_all_workers(self):
-        log = []
-        utils.run_parallel(
+        results = self._call(
             [
-                self.fixture_create_worker(log, "first"),
-                self.fixture_create_worker(log, "second"),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok1"),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok2"),
             ],
-            wait_seconds=0.1,
+            [1, 1],
+            send,
         )
+        self.assertEqual(
+            [(("node2", "remote/status", ""), (0, "ok2"))], results
+        )
+        self.assertIs(communicator_list[0], communicator_list[1])
 
-        self.assertEqual(sorted(log), sorted(["first", "second"]))
+    def test_generator_not_exhausted(self):
+        communicator_list = []
 
+        def send():
+            communicator_list.append(utils._get_node_communicator())
+            for _ in utils.send_http_requests(
+                [("node1", "remote/status", ""), ("node2", "remote/status", "")]
+            ):
+                break
+            communicator_list.append(utils._get_node_communicator())
 
-class NodeActionTaskTest(TestCase):
-    def test_can_run_action(self):
-        def action(node, arg, kwarg=None):
-            return (0, ":".join([node, arg, kwarg]))
+        self._call(
+            [
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok1"),
+                dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok2"),
+            ],
+            [1],
+            send,
+        )
+        self.assertIsNot(communicator_list[0], communicator_list[1])
 
-        report_list = []
 
-        def report(node, returncode, output):
-            report_list.append("|".join([node, str(returncode), output]))
+@mock.patch("pcs.utils.print_to_stderr")
+class SendHttpRequestTest(SendHttpRequestsMixin, TestCase):
+    def _send(self, handle_kwargs, **kwargs):
+        return self._call(
+            [handle_kwargs],
+            [1],
+            lambda: utils.sendHTTPRequest(
+                "node1", "remote/status", "a=b", **kwargs
+            ),
+        )
 
-        task = utils.create_task(report, action, "node", "arg", kwarg="kwarg")
-        task()
+    def test_success(self, mock_print):
+        self.assertEqual(
+            (0, "ok\n"),
+            self._send(dict(info={pycurl.RESPONSE_CODE: 200}, output=b"ok\n")),
+        )
+        mock_print.assert_called_once_with("node1: ok")
 
-        self.assertEqual(["node|0|node:arg:kwarg"], report_list)
+    def test_http_error(self, mock_print):
+        self.assertEqual(
+            (4, "node1: Permission denied - (HTTP error: 403)"),
+            self._send(
+                dict(info={pycurl.RESPONSE_CODE: 403}, output=b"denied"),
+            ),
+        )
+        mock_print.assert_has_calls(
+            [
+                mock.call("node1: denied"),
+                mock.call("node1: Permission denied - (HTTP error: 403)"),
+            ]
+        )
+
+    def test_connection_error_quiet(self, mock_print):
+        self.assertEqual(
+            (
+                2,
+                "Unable to connect to node1, check if pcsd is running there "
+                "or try setting higher timeout with --request-timeout option "
+                "(Timed out)",
+            ),
+            self._send(
+                dict(error=(pycurl.E_OPERATION_TIMEDOUT, "Timed out")),
+                printResult=False,
+                printSuccess=False,
+            ),
+        )
+        mock_print.assert_not_called()
+
+
+class GetLocalPcsdToken(TestCase):
+    @mock.patch("pcs.utils.read_known_hosts_file")
+    def test_token(self, mock_read):
+        mock_read.return_value = {
+            "localhost": PcsKnownHost(
+                "localhost", "a-token", [Destination("localhost", 2224)]
+            ),
+        }
+        self.assertEqual("a-token", utils.get_local_pcsd_token())
+
+    @mock.patch("pcs.utils.read_known_hosts_file")
+    def test_no_token(self, mock_read):
+        mock_read.return_value = {
+            "node1": PcsKnownHost(
+                "node1", "a-token", [Destination("node1", 2224)]
+            ),
+        }
+        self.assertIsNone(utils.get_local_pcsd_token())
 
 
 class TouchCibFile(TestCase):
@@ -0,0 +1,99 @@
+import logging
+from unittest import TestCase, mock
+
+from pcs.lib.external import CommandRunner
+from pcs.lib.pacemaker.digest import calculate_resource_digests
+from pcs.lib.pacemaker.live import get_resource_digests
+
+from pcs_test.tools.custom_mock import MockLibraryReportProcessor
+from pcs_test.tools.fixture_cib import modify_cib
+from pcs_test.tools.misc import get_test_resource as rc
+from pcs_test.tools.misc import get_tmp_file, skip_unless_pacemaker_version
+
+RESOURCE_ID = "S"
+NODE_NAME = "node1"
+FIXTURE_NODES = f'<nodes><node id="1" uname="{NODE_NAME}"/></nodes>'
+
+
+def fixture_resources(instance_attrs):
+    nvpairs = "".join(
+        f'<nvpair id="{RESOURCE_ID}-{name}" name="{name}" value="{value}"/>'
+        for name, value in instance_attrs.items()
+    )
+    return f"""
+        <resources>
+            <primitive id="{RESOURCE_ID}" class="stonith" type="fence_scsi">
+                <instance_attributes id="{RESOURCE_ID}-instance_attributes">
+                    {nvpairs}
+                </instance_attributes>
+                <operations>
+                    <op id="{RESOURCE_ID}-monitor" name="monitor"
+                        interval="60s" timeout="30s"
+                    />
+                </operations>
+            </primitive>
+        </resources>
+    """
+
+
+@skip_unless_pacemaker_version((2, 1, 0), "crm_resource --digests")
+class CalculateResourceDigestsConformance(TestCase):
+    """
+    Check that digests calculated in-process match digests calculated by
+    crm_resource
+    """
+
+    def assert_digests_match(self, instance_attrs, crm_meta_attributes=None):
+        temp_cib = get_tmp_file("tier1_resource_digest")
+        self.addCleanup(temp_cib.close)
+        with open(rc("cib-empty.xml")) as cib_file:
+            temp_cib.write(
+                modify_cib(
+                    cib_file.read(),
+                    nodes=FIXTURE_NODES,
+                    resources=fixture_resources(instance_attrs),
+                )
+            )
+        temp_cib.flush()
+        runner = CommandRunner(
+            mock.MagicMock(logging.Logger),
+            MockLibraryReportProcessor(),
+            {"CIB_file": temp_cib.name},
+        )
+        pacemaker_digests = get_resource_digests(
+            runner,
+            RESOURCE_ID,
+            NODE_NAME,
+            instance_attrs,
+            crm_meta_attributes=crm_meta_attributes,
+        )
+        native_digests = calculate_resource_digests(
+            instance_attrs, crm_meta_attributes
+        )
+        self.assertIsNotNone(native_digests)
+        for digest_type in ("all", "nonprivate"):
+            self.assertEqual(
+                pacemaker_digests[digest_type],
+                native_digests[digest_type],
+                digest_type,
+            )
+
+    def test_start(self):
+        self.assert_digests_match(
+            {
+                "devices": "/dev/sda,/dev/sdb",
+                "pcmk_host_check": "static-list",
+                "pcmk_host_list": "node1 node2 node3",
+            }
+        )
+
+    def test_monitor(self):
+        self.assert_digests_match(
+            {"devices": "/dev/sda", "pcmk_host_map": "node1:1;node2:2"},
+            {"interval": "60000", "timeout": "30000"},
+        )
+
+    def test_private_params(self):
+        self.assert_digests_match(
+            {"devices": "/dev/sda", "password": "secret", "user": "admin"}
+        )
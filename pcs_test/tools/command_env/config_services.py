@@ -164,6 +164,7 @@ class ServiceManagerConfig:
         name="services.is_enabled",
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -172,6 +173,7 @@ class ServiceManagerConfig:
                 service=service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
             ),
             before=before,
             instead=instead,
@@ -185,6 +187,7 @@ class ServiceManagerConfig:
         return_value=True,
         before=None,
         instead=None,
+        exception=None,
     ):
         self.__calls.place(
             name,
@@ -193,6 +196,32 @@ class ServiceManagerConfig:
                 service,
                 instance=instance,
                 return_value=return_value,
+                exception=exception,
+            ),
+            before=before,
+            instead=instead,
+        )
+
+    def get_states(
+        self,
+        states,
+        name="services.get_states",
+        before=None,
+        instead=None,
+        exception=None,
+    ):
+        """
+        dict states -- ServiceState for each checked service, services are
+            expected to be checked in the order of the dict keys
+        Exception exception -- raised instead of returning the states
+        """
+        self.__calls.place(
+            name,
+            Call(
+                "get_states",
+                service=list(states),
+                return_value=None if exception else states,
+                exception=exception,
             ),
             before=before,
             instead=instead,
@@ -90,6 +90,9 @@ def get_push_cib(call_queue):
         if expected_call.exception:
             raise expected_call.exception
 
+        # the real push makes the loaded cluster status outdated
+        lib_env.invalidate_cluster_status()
+
     return push_cib
 
 
@@ -68,6 +68,9 @@ class ServiceManagerMock(ServiceManagerInterface):
     def is_installed(self, service):
         return self._assert_call("is_installed", service)
 
+    def get_states(self, services):
+        return self._assert_call("get_states", list(services))
+
     def get_available_services(self):
         return self._assert_call("get_available_services")
 
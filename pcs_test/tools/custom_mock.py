@@ -199,6 +199,9 @@ class MockCurl:
         self._error = error
         self._exception = exception
         self.request_obj = request
+        self.accepts_compressed_request = False
+        self.request_compressed = False
+        self.response_compressed = False
 
     @property
     def opts(self):
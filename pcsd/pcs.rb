@@ -14,6 +14,7 @@ require 'base64'
 require 'curb'
 require 'openssl'
 require 'stringio'
+require 'socket'
 
 require 'config.rb'
 require 'corosyncconf.rb'
@@ -627,6 +628,73 @@ def run_cmd_options(auth_user, options, *args)
   cib_groups = (auth_user[:usergroups] || []).join(' ')
   $logger.info("CIB USER: #{cib_user}, groups: #{cib_groups}")
 
+  start = Time.now
+  result = run_cmd_in_fork_server(cib_user, cib_groups, options, args)
+  if result
+    output, error_output, retval = result
+  else
+    output, error_output, retval = run_cmd_in_child_process(
+      cib_user, cib_groups, options, args
+    )
+  end
+  duration = Time.now - start
+
+  $logger.debug(output.join(""))
+  $logger.debug(error_output.join(""))
+  $logger.debug("Duration: " + duration.to_s + "s")
+  $logger.info("Return Value: " + retval.to_s)
+
+  return output, error_output, retval
+end
+
+# Run pcs in the fork server of pcsd, which saves starting a new python
+# interpreter. Return nil if the command has not been run and should be run
+# another way.
+def run_cmd_in_fork_server(cib_user, cib_groups, options, args)
+  executable = {PCS => 'pcs', PCS_INTERNAL => 'pcs_internal'}[args[0]]
+  return nil if not executable or not File.socket?(PCSD_FORK_SERVER_SOCKET)
+
+  # the same input as written to stdin of a child process
+  stdin = StringIO.new
+  stdin.puts(options['stdin']) if options and options.key?('stdin')
+  request = {
+    'executable' => executable,
+    'argv' => args[1..-1],
+    'stdin' => stdin.string,
+    'env' => {
+      'CIB_user' => cib_user,
+      'CIB_user_groups' => cib_groups,
+      'LC_ALL' => 'C',
+    },
+  }
+  begin
+    socket = UNIXSocket.new(PCSD_FORK_SERVER_SOCKET)
+  rescue SystemCallError => e
+    $logger.debug("Unable to connect to the fork server: #{e}")
+    return nil
+  end
+  begin
+    socket.write(JSON.generate(request) + "\n")
+    response = JSON.parse(socket.read)
+  rescue SystemCallError, IOError, JSON::ParserError => e
+    # the command may have been run, do not run it again
+    $logger.error("Unable to get a result from the fork server: #{e}")
+    return [[], ["Error: Unable to get a result of the command: #{e}\n"], 1]
+  ensure
+    socket.close
+  end
+  if response.key?('error')
+    $logger.info("The fork server has not run the command: #{response['error']}")
+    return nil
+  end
+  return [
+    StringIO.new(response['stdout']).readlines,
+    StringIO.new(response['stderr']).readlines,
+    response['retval'],
+  ]
+end
+
+def run_cmd_in_child_process(cib_user, cib_groups, options, args)
   read_stdout, write_stdout = IO.pipe
   read_stderr, write_stderr = IO.pipe
   begin
@@ -637,7 +705,6 @@ def run_cmd_options(auth_user, options, *args)
     cmd.environment['CIB_user'] = cib_user
     cmd.environment['CIB_user_groups'] = cib_groups
     cmd.environment['LC_ALL'] = 'C'
-    start = Time.now
     cmd.start
 
     # close parent's copy of the write end of the pipe
@@ -675,19 +742,9 @@ def run_cmd_options(auth_user, options, *args)
     read_stderr.close
   end
 
-  duration = Time.now - start
-  retval = cmd.exit_code
-
   output_io.rewind
-  output = output_io.readlines
   error_output_io.rewind
-  error_output = error_output_io.readlines
-  $logger.debug(output.join(""))
-  $logger.debug(error_output.join(""))
-  $logger.debug("Duration: " + duration.to_s + "s")
-  $logger.info("Return Value: " + retval.to_s)
-
-  return output, error_output, retval
+  return output_io.readlines, error_output_io.readlines, cmd.exit_code
 end
 
 def is_score(score)
@@ -1,4 +1,5 @@
 require 'base64'
+require 'digest'
 require 'pcs.rb' #write_file_lock, read_file_lock
 require 'settings.rb'
 require 'pcsd_exchange_format.rb'
@@ -12,7 +13,17 @@ module PcsdFile
     end
 
     def validate()
-      PcsdFile::validate_file_key_with_string(@id, @file, :data)
+      if self.hash_check?
+        PcsdFile::validate_file_key_with_string(@id, @file, :data_sha256)
+      else
+        PcsdFile::validate_file_key_with_string(@id, @file, :data)
+      end
+    end
+
+    def hash_check?()
+      # the client sent only a hash of the file to find out whether it needs
+      # to send the file
+      return (not @file.has_key?(:data) and @file.has_key?(:data_sha256))
     end
 
     def rewrite_existing()
@@ -39,11 +50,12 @@ module PcsdFile
         return false
       end
 
-      if self.binary?
-        return Base64.strict_encode64(self.read()) == @file[:data]
+      # the file is compared in the same format it is sent in
+      content = self.binary? ? Base64.strict_encode64(self.read()) : self.read()
+      if self.hash_check?
+        return Digest::SHA256.hexdigest(content) == @file[:data_sha256]
       end
-
-      return self.read() == @file[:data]
+      return content == @file[:data]
     end
 
     def write()
@@ -76,6 +88,16 @@ module PcsdFile
     def process()
       self.validate()
       begin
+        if self.hash_check?
+          if self.exists_with_same_content()
+            return PcsdExchangeFormat::result(:same_content)
+          end
+          if not self.exists? or self.rewrite_existing
+            return PcsdExchangeFormat::result(:content_needed)
+          end
+          return PcsdExchangeFormat::result(:conflict)
+        end
+
         unless self.exists?
           self.write()
           return PcsdExchangeFormat::result(:written)